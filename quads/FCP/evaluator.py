@@ -1,10 +1,20 @@
+import bisect
+import functools
 import itertools
 from typing import Sequence
 
-from ..card import Card
 from .lookup import LookupTable
 
 
+# the worst rank of each hand class, best class first, so bisecting a hand
+# rank into them finds its class
+_RANK_BOUNDS: list[int] = sorted(LookupTable.MAX_TO_RANK_CLASS)
+_RANK_CLASSES: list[int] = [LookupTable.MAX_TO_RANK_CLASS[hr] for hr in _RANK_BOUNDS]
+
+# number of pools of more than 4 cards whose ranks are remembered
+CACHE_SIZE: int = 1 << 16
+
+
 class Evaluator:
     """
     Evaluates hand strengths using a variant of Cactus Kev's algorithm:
@@ -18,19 +28,30 @@ class Evaluator:
 
     def __init__(self) -> None:
 
-        self.table = LookupTable()
+        self.table = self.get_table()
+
+    @staticmethod
+    @functools.cache
+    def get_table() -> LookupTable:
+        """
+        The lookup table, loaded once and shared by every Evaluator
+        """
+        return LookupTable()
 
     def evaluate(self, cards: list[int]) -> int:
         """
         This is the function that the user calls to get a hand rank.
 
         No input validation because that's cycles!
+
+        Pools of more than 4 cards are memoized on their sorted cards, which
+        pays off in equity calculations that see the same pool many times.
         """
         poolSize = len(cards)
         if poolSize == 4:
             return self._rank(cards)
         elif poolSize > 4:
-            return self._poolrank(cards)
+            return _evaluate_cached(tuple(sorted(cards)))
 
     def _rank(self, cards: Sequence[int]) -> int:
         """
@@ -40,16 +61,21 @@ class Evaluator:
         Variant of Cactus Kev's 5 card evaluator, though I saved a lot of
         memory space using a hash table and condensing some of the calculations
         """
-        # if flush
-        if cards[0] & cards[1] & cards[2] & cards[3] & 0xF000:
-            handOR = (cards[0] | cards[1] | cards[2] | cards[3]) >> 16
-            prime = Card.prime_product_from_rankbits(handOR)
-            return self.table.flush_lookup[prime]
-
-        # otherwise
-        else:
-            prime = Card.prime_product_from_hand(cards)
-            return self.table.unsuited_lookup[prime]
+        table = self.table
+        handOR = (cards[0] | cards[1] | cards[2] | cards[3]) >> 16
+
+        # if all ranks are unique, a straight or high card, unless it's a
+        # flush: paired hands can't be flushes and skip the suit test
+        rank = table.unique_table[handOR]
+        if rank:
+            if cards[0] & cards[1] & cards[2] & cards[3] & 0xF000:
+                return table.flush_table[handOR]
+            return rank
+
+        # otherwise there are multiples, the prime of each card's rank being
+        # its low byte
+        prime = (cards[0] & 0xFF) * (cards[1] & 0xFF) * (cards[2] & 0xFF) * (cards[3] & 0xFF)
+        return table.unsuited_table[prime % table.unsuited_modulus]
 
     def _poolrank(self, cards: Sequence[int]) -> int:
         """
@@ -58,10 +84,11 @@ class Evaluator:
         and returns this ranking.
         """
         minimum = LookupTable.MAX_HIGH_CARD
+        rank = self._rank
 
         for combo in itertools.combinations(cards, 4):
 
-            score = self._rank(combo)
+            score = rank(combo)
             if score < minimum:
                 minimum = score
 
@@ -72,24 +99,9 @@ class Evaluator:
         Returns the class of hand given the hand hand_rank
         returned from evaluate.
         """
-        if hr >= 0 and hr <= LookupTable.MAX_FOUR_OF_A_KIND:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_FOUR_OF_A_KIND]
-        elif hr <= LookupTable.MAX_STRAIGHT_FLUSH:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_STRAIGHT_FLUSH]
-        elif hr <= LookupTable.MAX_THREE_OF_A_KIND:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_THREE_OF_A_KIND]
-        elif hr <= LookupTable.MAX_FLUSH:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_FLUSH]
-        elif hr <= LookupTable.MAX_STRAIGHT:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_STRAIGHT]
-        elif hr <= LookupTable.MAX_TWO_PAIR:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_TWO_PAIR]
-        elif hr <= LookupTable.MAX_PAIR:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_PAIR]
-        elif hr <= LookupTable.MAX_HIGH_CARD:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_HIGH_CARD]
-        else:
-            raise Exception("Inavlid hand rank, cannot return rank class")
+        if 0 <= hr <= LookupTable.MAX_HIGH_CARD:
+            return _RANK_CLASSES[bisect.bisect_left(_RANK_BOUNDS, hr)]
+        raise Exception("Inavlid hand rank, cannot return rank class")
 
     def class_to_string(self, class_int: int) -> str:
         """
@@ -104,6 +116,24 @@ class Evaluator:
         return float(hand_rank) / float(LookupTable.MAX_HIGH_CARD)
 
 
+@functools.cache
+def _pool_evaluator() -> Evaluator:
+    """
+    The Evaluator ranking the pools missing from the cache
+    """
+    return Evaluator()
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _evaluate_cached(cards: tuple[int, ...]) -> int:
+    """
+    Evaluator._poolrank() memoized on the sorted cards. Ranks only depend
+    on the LookupTable every Evaluator shares, so one cache serves them all
+    and holds on to none of them
+    """
+    return _pool_evaluator()._poolrank(cards)
+
+
 class PLOEvaluator(Evaluator):
 
     HAND_LENGTH = 4
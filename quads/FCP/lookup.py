@@ -1,7 +1,8 @@
-from collections.abc import Iterator
+from array import array
 import itertools
 from typing import Sequence
 
+from .._common_lookup import build_flush_table
 from ..card import Card
 
 
@@ -20,8 +21,17 @@ class LookupTable:
     -------------------------
     TOTAL            2613
 
-    Here we create a lookup table which maps:
-        5 card hand's unique prime product => rank in range [1, 7462]
+    Here we create lookup tables which map:
+        flush's 13 bit rank mask                 => rank
+        unsuited unique ranks' 13 bit rank mask  => rank
+        4 card hand's unique prime product       => rank
+    with ranks in range [1, 2613]. The ranks of flushes, straights and high
+    cards are all unique, so their rank mask identifies them without a prime
+    product and indexes a dense table of 2^13 ranks. Every mask has a slot,
+    the ones that aren't a hand of that kind holding 0, so no lookup misses.
+
+    The prime products are laid out densely too, indexed by prime % modulus
+    where the modulus is a perfect hash chosen by tools/gen_tables.py
 
     Examples:
     * Four aces (best hand possible)            => 1
@@ -58,12 +68,23 @@ class LookupTable:
         7: "High Card"
     }
 
-    def __init__(self) -> None:
+    def __init__(self, precomputed: bool = True) -> None:
         """
-        Calculates lookup tables
+        Loads the lookup tables precomputed into quads/_tables.py by
+        tools/gen_tables.py as compact arrays of ranks, or calculates
+        them from scratch as dictionaries to generate those from
         """
+        if precomputed:
+            from .. import _tables
+            self.flush_table: array = _tables.FCP_FLUSH_TABLE
+            self.unique_table: array = _tables.FCP_UNIQUE_TABLE
+            self.unsuited_table: array = _tables.FCP_UNSUITED_TABLE
+            self.unsuited_modulus: int = _tables.FCP_UNSUITED_MODULUS
+            return
+
         # create dictionaries
         self.flush_lookup: dict[int, int] = {}
+        self.unique_lookup: dict[int, int] = {}
         self.unsuited_lookup: dict[int, int] = {}
 
         # create the lookup table in piecewise fashion
@@ -95,50 +116,11 @@ class LookupTable:
             4103   # int('0b1000000000111', 2) # 4 high
         ]
 
-        # now we'll dynamically generate all the other
-        # flushes (including straight flushes)
-        flushes = []
-        gen = self.get_lexographically_next_bit_sequence(int('0b1111', 2))
-
-        # 704 = number of high cards
-        # 704 + len(str_flushes) is number of hands with all cards unique rank
-        for i in range(704 + len(straight_flushes) - 1):   # we also iterate over SFs
-            # pull the next flush pattern from our generator
-            f = next(gen)
-
-            # if this flush matches perfectly any
-            # straight flush, do not add it
-            notSF = True
-            for sf in straight_flushes:
-                # if f XOR sf == 0, then bit pattern 
-                # is same, and we should not add
-                if not f ^ sf:
-                    notSF = False
-
-            if notSF:
-                flushes.append(f)
-
-        # we started from the lowest straight pattern, now we want to start ranking from
-        # the most powerful hands, so we reverse
-        flushes.reverse()
-
-        # now add to the lookup map:
-        # start with straight flushes and the rank of 1
-        # since it is the best hand in poker
-        # rank 1 = Royal Flush!
-        rank = LookupTable.MAX_FOUR_OF_A_KIND+1
-        for sf in straight_flushes:
-            prime_product = Card.prime_product_from_rankbits(sf)
-            self.flush_lookup[prime_product] = rank
-            rank += 1
-
-        # we start the counting for flushes on max three of a kind, which
-        # is the worst rank that a three of a kind can have (2,2,2,2,3)
-        rank = LookupTable.MAX_THREE_OF_A_KIND + 1
-        for f in flushes:
-            prime_product = Card.prime_product_from_rankbits(f)
-            self.flush_lookup[prime_product] = rank
-            rank += 1
+        # straight flushes rank right after four of a kind, and the other
+        # flushes right after three of a kind (2,2,2,3)
+        self.flush_lookup, flushes = build_flush_table(
+            4, straight_flushes, LookupTable.MAX_FOUR_OF_A_KIND + 1,
+            LookupTable.MAX_THREE_OF_A_KIND + 1)
 
         # we can reuse these bit sequences for straights
         # and high cards since they are inherently related
@@ -154,14 +136,12 @@ class LookupTable:
         rank = LookupTable.MAX_FLUSH + 1
 
         for s in straights:
-            prime_product = Card.prime_product_from_rankbits(s)
-            self.unsuited_lookup[prime_product] = rank
+            self.unique_lookup[s] = rank
             rank += 1
 
         rank = LookupTable.MAX_PAIR + 1
         for h in highcards:
-            prime_product = Card.prime_product_from_rankbits(h)
-            self.unsuited_lookup[prime_product] = rank
+            self.unique_lookup[h] = rank
             rank += 1
 
     def multiples(self) -> None:
@@ -226,24 +206,23 @@ class LookupTable:
 
     def write_table_to_disk(self, table: dict[int, int], filepath: str) -> None:
         """
-        Writes lookup table to disk
+        Writes lookup table to disk as two packed binary arrays, all of its
+        keys as 32 bit integers followed by all of its 16 bit ranks
         """
-        with open(filepath, 'w') as f:
-            for prime_prod, rank in table.items():
-                f.write(str(prime_prod) + "," + str(rank) + '\n')
+        with open(filepath, 'wb') as f:
+            array('I', table.keys()).tofile(f)
+            array('H', table.values()).tofile(f)
 
-    def get_lexographically_next_bit_sequence(self, bits: int) -> Iterator[int]:
+    @staticmethod
+    def load_table_from_disk(filepath: str) -> dict[int, int]:
         """
-        Bit hack from here:
-        http://www-graphics.stanford.edu/~seander/bithacks.html#NextBitPermutation
-
-        Generator even does this in poker order rank 
-        so no need to sort when done! Perfect.
+        Reads back a lookup table written by write_table_to_disk
         """
-        t = int((bits | (bits - 1))) + 1
-        next = t | ((int(((t & -t) / (bits & -bits))) >> 1) - 1)
-        yield next
-        while True:
-            t = (next | (next - 1)) + 1 
-            next = t | ((((t & -t) // (next & -next)) >> 1) - 1)
-            yield next
+        keys, ranks = array('I'), array('H')
+        with open(filepath, 'rb') as f:
+            data = f.read()
+
+        split = len(data) // (keys.itemsize + ranks.itemsize) * keys.itemsize
+        keys.frombytes(data[:split])
+        ranks.frombytes(data[split:])
+        return dict(zip(keys, ranks))
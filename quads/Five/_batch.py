@@ -0,0 +1,77 @@
+"""
+NumPy version of the Evaluator hot path, ranking a whole batch of hands at
+once, see Evaluator.evaluate_batch.
+
+Each 5 card subset of the hands is ranked as a column at a time, with the
+flush test and table lookups done for every hand in the batch by array
+operations and the right one picked with np.where. Prime products can't
+index an array, so the multiples are found by binary search in their
+sorted prime products instead.
+
+Malformed hands, such as five cards of one rank, rank 0 instead of raising,
+so a batch can be checked for them once with (ranks == 0).any().
+"""
+import itertools
+
+import numpy as np
+
+from .. import _tables
+from .lookup import LookupTable
+
+
+FLUSH_TABLE = np.frombuffer(_tables.FIVE_FLUSH_TABLE, dtype=np.uint16)
+UNIQUE_TABLE = np.frombuffer(_tables.FIVE_UNIQUE_TABLE, dtype=np.uint16)
+
+UNSUITED_PRIMES = np.array(sorted(_tables.FIVE_UNSUITED), dtype=np.int64)
+UNSUITED_RANKS = np.array([_tables.FIVE_UNSUITED[p] for p in UNSUITED_PRIMES.tolist()],
+                          dtype=np.uint16)
+
+
+def _rank5(c0: np.ndarray, c1: np.ndarray, c2: np.ndarray, c3: np.ndarray,
+           c4: np.ndarray) -> np.ndarray:
+    """
+    Evaluator._rank5 over arrays holding one card of each hand
+    """
+    handOR = (c0 | c1 | c2 | c3 | c4) >> 16
+    flush = (c0 & c1 & c2 & c3 & c4 & 0xF000) != 0
+    unique = UNIQUE_TABLE[handOR]
+
+    prime = ((c0 & 0xFF).astype(np.int64) * (c1 & 0xFF) * (c2 & 0xFF)
+             * (c3 & 0xFF) * (c4 & 0xFF))
+    # products of flushes and unique ranks may fall past the last multiple,
+    # where they are masked out by np.where anyway. A product that isn't a
+    # hand at all ranks 0, like the empty slots of the dense tables
+    index = np.searchsorted(UNSUITED_PRIMES, prime)
+    np.minimum(index, len(UNSUITED_PRIMES) - 1, out=index)
+    multiples = np.where(UNSUITED_PRIMES[index] == prime, UNSUITED_RANKS[index], 0)
+
+    return np.where(flush, FLUSH_TABLE[handOR], np.where(unique, unique, multiples))
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """
+    Ranks an (n, k) array of n hands of k >= 5 cards each, taking the best
+    of the (k choose 5) subsets of each hand
+    """
+    columns = np.ascontiguousarray(np.asarray(cards, dtype=np.uint32).T)
+
+    ranks = np.full(columns.shape[1], LookupTable.MAX_HIGH_CARD, dtype=np.uint16)
+    for combo in itertools.combinations(columns, 5):
+        np.minimum(ranks, _rank5(*combo), out=ranks)
+    return ranks
+
+
+def evaluate_plo_batch(hands: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    Ranks n Omaha hands given as an (n, 4) array of hole cards and an
+    (n, 5) array of boards, taking the best of the 2 hole and 3 board
+    card subsets of each
+    """
+    hand_columns = np.ascontiguousarray(np.asarray(hands, dtype=np.uint32).T)
+    board_columns = np.ascontiguousarray(np.asarray(boards, dtype=np.uint32).T)
+
+    ranks = np.full(hand_columns.shape[1], LookupTable.MAX_HIGH_CARD, dtype=np.uint16)
+    for hand_combo in itertools.combinations(hand_columns, 2):
+        for board_combo in itertools.combinations(board_columns, 3):
+            np.minimum(ranks, _rank5(*board_combo, *hand_combo), out=ranks)
+    return ranks
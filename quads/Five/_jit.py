@@ -0,0 +1,201 @@
+"""
+Numba compiled version of the Evaluator hot path. Only imported the first
+time a 6 or 7 card hand or a batch is ranked, as importing numba takes far
+longer than the rest of quads, see Evaluator.evaluate.
+
+The kernels take cards as packed integers and the lookup tables as numpy
+arrays. Instead of a prime product, hands with multiples are keyed on a
+histogram of their ranks, one 4 bit count per rank:
+
+    rank     A    K    Q    J    T    9    8    7    6    5    4    3    2
+          +----+----+----+----+----+----+----+----+----+----+----+----+----+
+          |cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|cccc|
+          +----+----+----+----+----+----+----+----+----+----+----+----+----+
+
+which takes shifts and adds to build rather than multiplications, and maps
+onto a dense table with one slot for each of the 6175 multisets of 5 ranks.
+The histogram is only used by the compiled kernels, here and in
+quads/_ceval.c: in the interpreter the extra shifts cost more than the
+multiplications they replace.
+"""
+import numpy as np
+from numba import njit
+
+from .. import _tables
+from .._common_lookup import HAND_SIZE, MAX_COUNT, MULTISETS, histogram_offsets
+from ..card import Card
+
+
+FLUSH_TABLE = np.frombuffer(_tables.FIVE_FLUSH_TABLE, dtype=np.uint16)
+UNIQUE_TABLE = np.frombuffer(_tables.FIVE_UNIQUE_TABLE, dtype=np.uint16)
+HISTOGRAM_TABLE = np.frombuffer(_tables.FIVE_HISTOGRAM_TABLE, dtype=np.uint16)
+
+RANKS = len(Card.INT_RANKS)
+
+# per suit card counts, see Evaluator.SUIT_COUNTS
+SUIT_COUNTS = np.array([0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000], dtype=np.uint32)
+
+OFFSETS = np.array(histogram_offsets(), dtype=np.int64)
+
+
+@njit(cache=True)
+def _histogram_index(hist):
+    """
+    Maps the rank histogram of a 5 card hand to its index among all the
+    multisets of 5 ranks, from the highest rank down. 5 cards of one rank
+    would index past OFFSETS, they map on the 0 after the last multiset
+    """
+    index = 0
+    k = HAND_SIZE
+    r = RANKS - 1
+    while k:
+        q = (hist >> (r << 2)) & 0xF
+        if q > MAX_COUNT:
+            return MULTISETS
+        index += OFFSETS[r, k, q]
+        k -= q
+        r -= 1
+    return index
+
+
+@njit(cache=True)
+def _rank5(c0, c1, c2, c3, c4):
+    handOR = (c0 | c1 | c2 | c3 | c4) >> 16
+
+    # if flush. Compiled, a branchless select measures slower too: flushes
+    # are rare enough to predict, and always building the histogram index
+    # costs more than the mispredicted unique/multiples branch it'd save
+    if c0 & c1 & c2 & c3 & c4 & 0xF000:
+        return FLUSH_TABLE[handOR]
+
+    # if all ranks are unique, a straight or high card
+    rank = UNIQUE_TABLE[handOR]
+    if rank:
+        return rank
+
+    # otherwise there are multiples, (c >> 6) & 0x3C is 4 * rank
+    hist = ((1 << ((c0 >> 6) & 0x3C)) + (1 << ((c1 >> 6) & 0x3C))
+            + (1 << ((c2 >> 6) & 0x3C)) + (1 << ((c3 >> 6) & 0x3C))
+            + (1 << ((c4 >> 6) & 0x3C)))
+    return HISTOGRAM_TABLE[_histogram_index(hist)]
+
+
+@njit(cache=True)
+def _unsuited5(c0, c1, c2, c3, c4):
+    handOR = (c0 | c1 | c2 | c3 | c4) >> 16
+
+    rank = UNIQUE_TABLE[handOR]
+    if rank:
+        return rank
+
+    hist = ((1 << ((c0 >> 6) & 0x3C)) + (1 << ((c1 >> 6) & 0x3C))
+            + (1 << ((c2 >> 6) & 0x3C)) + (1 << ((c3 >> 6) & 0x3C))
+            + (1 << ((c4 >> 6) & 0x3C)))
+    return HISTOGRAM_TABLE[_histogram_index(hist)]
+
+
+@njit(cache=True)
+def _flush_suit(c):
+    """
+    The suit bits of the suit holding 5 or more of the cards, or 0
+    """
+    counts = 0
+    for i in range(len(c)):
+        counts += SUIT_COUNTS[(c[i] >> 12) & 0xF]
+    flush = (counts + 0x3333) & 0x8888
+    if flush == 0:
+        return 0
+    # the flag sits in bit 3 of the suit's nibble
+    suit = 0x1000
+    while not flush & 0x8:
+        flush >>= 4
+        suit <<= 1
+    return suit
+
+
+@njit(cache=True)
+def _suited(c, suit):
+    handOR = 0
+    for i in range(len(c)):
+        if c[i] & suit:
+            handOR |= c[i]
+    return FLUSH_TABLE[handOR >> 16]
+
+
+@njit(cache=True)
+def _rank6(c):
+    suit = _flush_suit(c)
+    if suit:
+        return _suited(c, suit)
+    return min(
+        _unsuited5(c[0], c[1], c[2], c[3], c[4]),
+        _unsuited5(c[0], c[1], c[2], c[3], c[5]),
+        _unsuited5(c[0], c[1], c[2], c[4], c[5]),
+        _unsuited5(c[0], c[1], c[3], c[4], c[5]),
+        _unsuited5(c[0], c[2], c[3], c[4], c[5]),
+        _unsuited5(c[1], c[2], c[3], c[4], c[5]),
+    )
+
+
+@njit(cache=True)
+def _rank7(c):
+    suit = _flush_suit(c)
+    if suit:
+        return _suited(c, suit)
+    return min(
+        _unsuited5(c[0], c[1], c[2], c[3], c[4]),
+        _unsuited5(c[0], c[1], c[2], c[3], c[5]),
+        _unsuited5(c[0], c[1], c[2], c[3], c[6]),
+        _unsuited5(c[0], c[1], c[2], c[4], c[5]),
+        _unsuited5(c[0], c[1], c[2], c[4], c[6]),
+        _unsuited5(c[0], c[1], c[2], c[5], c[6]),
+        _unsuited5(c[0], c[1], c[3], c[4], c[5]),
+        _unsuited5(c[0], c[1], c[3], c[4], c[6]),
+        _unsuited5(c[0], c[1], c[3], c[5], c[6]),
+        _unsuited5(c[0], c[1], c[4], c[5], c[6]),
+        _unsuited5(c[0], c[2], c[3], c[4], c[5]),
+        _unsuited5(c[0], c[2], c[3], c[4], c[6]),
+        _unsuited5(c[0], c[2], c[3], c[5], c[6]),
+        _unsuited5(c[0], c[2], c[4], c[5], c[6]),
+        _unsuited5(c[0], c[3], c[4], c[5], c[6]),
+        _unsuited5(c[1], c[2], c[3], c[4], c[5]),
+        _unsuited5(c[1], c[2], c[3], c[4], c[6]),
+        _unsuited5(c[1], c[2], c[3], c[5], c[6]),
+        _unsuited5(c[1], c[2], c[4], c[5], c[6]),
+        _unsuited5(c[1], c[3], c[4], c[5], c[6]),
+        _unsuited5(c[2], c[3], c[4], c[5], c[6]),
+    )
+
+
+@njit(cache=True)
+def _evaluate(c):
+    if len(c) == 5:
+        return _rank5(c[0], c[1], c[2], c[3], c[4])
+    elif len(c) == 6:
+        return _rank6(c)
+    else:
+        return _rank7(c)
+
+
+def evaluate(cards: list[int]) -> int:
+    """
+    Compiled equivalent of Evaluator.evaluate for 5, 6 and 7 cards
+    """
+    c = np.asarray(cards, dtype=np.uint32)
+    return int(_evaluate(c))
+
+
+@njit(cache=True)
+def _evaluate_batch(cards):
+    ranks = np.empty(len(cards), dtype=np.uint16)
+    for i in range(len(cards)):
+        ranks[i] = _evaluate(cards[i])
+    return ranks
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """
+    Compiled equivalent of Evaluator.evaluate_batch for 5, 6 and 7 cards
+    """
+    c = np.ascontiguousarray(cards, dtype=np.uint32)
+    return _evaluate_batch(c)
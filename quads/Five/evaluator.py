@@ -1,9 +1,43 @@
+import bisect
+import functools
 import itertools
-from typing import Sequence
+from typing import Optional, Sequence, TYPE_CHECKING
 
-from ..card import Card
 from .lookup import LookupTable
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# the C extension and numba are both optional, without either everything
+# runs in pure Python
+try:
+    from .. import _ceval
+except ImportError:
+    _ceval = None
+
+
+@functools.cache
+def _load_jit():
+    """
+    The numba kernels in _jit.py, or None without numba. Imported on first
+    use rather than with quads, as importing numba and numpy takes many
+    times longer than the rest of the package
+    """
+    try:
+        from . import _jit
+    except ImportError:
+        return None
+    return _jit
+
+
+# the worst rank of each hand class, best class first, so bisecting a hand
+# rank into them finds its class
+_RANK_BOUNDS: list[int] = sorted(LookupTable.MAX_TO_RANK_CLASS)
+_RANK_CLASSES: list[int] = [LookupTable.MAX_TO_RANK_CLASS[hr] for hr in _RANK_BOUNDS]
+
+# number of pools of more than 5 cards whose ranks are remembered
+CACHE_SIZE: int = 1 << 16
+
 
 class Evaluator:
     """
@@ -19,23 +53,115 @@ class Evaluator:
     HAND_LENGTH = 2
     BOARD_LENGTH = 5
 
+    # a card's suit bits, (card >> 12) & 0xF, mapped to a count of one
+    # in that suit's nibble, so adding them up counts the cards per suit
+    SUIT_COUNTS: list[int] = [0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000]
+
+    # adding 3 to each count carries into its top bit when there are 5 or
+    # more cards of that suit, the flagged bit then picks the suit
+    FLUSH_SUITS: dict[int, int] = {0x8: 0x1000, 0x80: 0x2000, 0x800: 0x4000, 0x8000: 0x8000}
+
     def __init__(self) -> None:
 
-        self.table = LookupTable()
+        self.table = self.get_table()
+
+    @staticmethod
+    @functools.cache
+    def get_table() -> LookupTable:
+        """
+        The lookup table, loaded once and shared by every Evaluator
+        """
+        return LookupTable()
 
     def evaluate(self, cards: list[int]) -> int:
         """
         This is the function that the user calls to get a hand rank. 
 
-        No input validation because that's cycles!
+        No input validation because that's cycles! Malformed hands holding
+        5 cards of one rank rank 0 on every path though, as they cost none.
+
+        Hands of 5 to 7 cards are evaluated by the C extension in
+        quads/_ceval.c when it was built, which is faster than any other
+        path including a cache hit. Without it 6 and 7 cards go to the
+        numba kernels in _jit.py when numba is installed, which also rank
+        a hand quicker than it is sorted and looked up.
+
+        Otherwise pools of more than 5 cards are memoized on their sorted
+        cards, which pays off in equity calculations that see the same pool
+        many times. A 5 card hand is ranked quicker than it is sorted, so it
+        isn't.
         """
         poolSize = len(cards)
+        if _ceval is not None and 5 <= poolSize <= 7:
+            return _ceval.eval7(cards)
         if poolSize == 5:
-            return self._rank(cards)
-        elif poolSize > 5:
+            return self._rank5(cards[0], cards[1], cards[2], cards[3], cards[4])
+        if 5 < poolSize <= 7:
+            jit = _load_jit()
+            if jit is not None:
+                return jit.evaluate(cards)
+        return _evaluate_cached(tuple(sorted(cards)))
+
+    def evaluate_cards(self, c0: int, c1: int, c2: int, c3: int, c4: int,
+                       c5: Optional[int] = None, c6: Optional[int] = None, /) -> int:
+        """
+        evaluate() for 5 to 7 cards passed one by one, as in
+        evaluate_cards(*board, *hand), which saves building a list of the
+        hand and board for every call. Skips the cache of evaluate().
+
+        With the C extension this is _ceval.eval_cards itself, see below,
+        as a Python method in front of it costs more than the list saved.
+        Both take their cards positionally only.
+        """
+        if c5 is None:
+            if c6 is not None:
+                raise TypeError("evaluate_cards() got a card after None")
+            return self._rank5(c0, c1, c2, c3, c4)
+
+        jit = _load_jit()
+        if jit is not None:
+            # the kernels take an array, which needs a sequence to build
+            if c6 is None:
+                return jit.evaluate((c0, c1, c2, c3, c4, c5))
+            return jit.evaluate((c0, c1, c2, c3, c4, c5, c6))
+        elif c6 is None:
+            return self._rank6(c0, c1, c2, c3, c4, c5)
+        return self._rank7(c0, c1, c2, c3, c4, c5, c6)
+
+    if _ceval is not None:
+        # called as it is, with no Python frame in front of the C kernel
+        evaluate_cards = staticmethod(_ceval.eval_cards)
+
+    def evaluate_batch(self, cards: "np.ndarray") -> "np.ndarray":
+        """
+        Vectorized evaluate() for an (n, k) array of n hands of k >= 5
+        cards each, returning an array of their n ranks. Takes one pass
+        over the batch per 5 card subset instead of a Python call per
+        hand, or a compiled loop when numba is installed. Requires numpy.
+
+        Malformed hands holding 5 cards of one rank rank 0 on either path.
+        """
+        jit = _load_jit()
+        if jit is not None and 5 <= cards.shape[1] <= 7:
+            return jit.evaluate_batch(cards)
+
+        from . import _batch
+        return _batch.evaluate_batch(cards)
+
+    def _evaluate_pool(self, cards: tuple[int, ...]) -> int:
+        """
+        Ranks a pool of more than 5 cards in pure Python, behind the cache
+        of evaluate()
+        """
+        poolSize = len(cards)
+        if poolSize == 6:
+            return self._rank6(*cards)
+        elif poolSize == 7:
+            return self._rank7(*cards)
+        elif poolSize > 7:
             return self._poolrank(cards)
 
-    def _rank(self, cards: Sequence[int]) -> int:
+    def _rank5(self, c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
         """
         Performs an evalution given cards in integer form, mapping them to
         a rank in the range [1, 7462], with lower ranks being more powerful.
@@ -43,28 +169,127 @@ class Evaluator:
         Variant of Cactus Kev's 5 card evaluator, though I saved a lot of memory
         space using a hash table and condensing some of the calculations. 
         """
-        # if flush
-        if cards[0] & cards[1] & cards[2] & cards[3] & cards[4] & 0xF000:
-            handOR = (cards[0] | cards[1] | cards[2] | cards[3] | cards[4]) >> 16
-            prime = Card.prime_product_from_rankbits(handOR)
-            return self.table.flush_lookup[prime]
+        table = self.table
+        handOR = (c0 | c1 | c2 | c3 | c4) >> 16
+
+        # if all ranks are unique, a straight or high card, unless it's a
+        # flush. The unique table holds every mask of 5 ranks, so paired
+        # hands, which can't be flushes, skip the suit test altogether
+        rank = table.unique_table[handOR]
+        if rank:
+            # branching is cheaper than looking up every table and selecting
+            # arithmetically: the interpreter pays per operation, not per
+            # mispredicted branch, and flush primes aren't in unsuited_lookup
+            if c0 & c1 & c2 & c3 & c4 & 0xF000:
+                return table.flush_table[handOR]
+            return rank
+
+        # otherwise there are multiples
+        prime = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+        return table.unsuited_lookup[prime]
+
+    def _unsuited5(self, c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+        """
+        _rank5() for 5 cards known not to be a flush
+        """
+        table = self.table
+        handOR = (c0 | c1 | c2 | c3 | c4) >> 16
 
-        # otherwise
-        else:
-            prime = Card.prime_product_from_hand(cards)
-            return self.table.unsuited_lookup[prime]
+        # if all ranks are unique, a straight or high card
+        rank = table.unique_table[handOR]
+        if rank:
+            return rank
+
+        # otherwise there are multiples
+        prime = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+        return table.unsuited_lookup[prime]
+
+    def _suited(self, cards: Sequence[int], suit: int) -> int:
+        """
+        Ranks the best flush among the cards of the given suit, of which
+        there are at least 5. The flush table also holds the best flush
+        of any 6 or 7 ranks.
+        """
+        handOR = 0
+        for c in cards:
+            if c & suit:
+                handOR |= c
+        return self.table.flush_table[handOR >> 16]
+
+    def _rank6(self, c0: int, c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+        """
+        Counts the cards of each suit first: 5 or more of one suit can't
+        also hold quads or a full house, so a flush is ranked straight from
+        that suit's rank mask. Otherwise performs _unsuited5() on all
+        (6 choose 5) = 6 subsets of 5 cards in the set of 6, spelled out
+        rather than generated by itertools, and returns the best ranking.
+        """
+        counts = self.SUIT_COUNTS
+        flush = (counts[c0 >> 12 & 0xF] + counts[c1 >> 12 & 0xF] + counts[c2 >> 12 & 0xF]
+                 + counts[c3 >> 12 & 0xF] + counts[c4 >> 12 & 0xF] + counts[c5 >> 12 & 0xF]
+                 + 0x3333) & 0x8888
+        if flush:
+            return self._suited((c0, c1, c2, c3, c4, c5), self.FLUSH_SUITS[flush])
+
+        rank5 = self._unsuited5
+        return min(
+            rank5(c0, c1, c2, c3, c4),
+            rank5(c0, c1, c2, c3, c5),
+            rank5(c0, c1, c2, c4, c5),
+            rank5(c0, c1, c3, c4, c5),
+            rank5(c0, c2, c3, c4, c5),
+            rank5(c1, c2, c3, c4, c5),
+        )
+
+    def _rank7(self, c0: int, c1: int, c2: int, c3: int, c4: int, c5: int, c6: int) -> int:
+        """
+        Same as _rank6() for the (7 choose 5) = 21 subsets of 5 cards in
+        the set of 7.
+        """
+        counts = self.SUIT_COUNTS
+        flush = (counts[c0 >> 12 & 0xF] + counts[c1 >> 12 & 0xF] + counts[c2 >> 12 & 0xF]
+                 + counts[c3 >> 12 & 0xF] + counts[c4 >> 12 & 0xF] + counts[c5 >> 12 & 0xF]
+                 + counts[c6 >> 12 & 0xF] + 0x3333) & 0x8888
+        if flush:
+            return self._suited((c0, c1, c2, c3, c4, c5, c6), self.FLUSH_SUITS[flush])
+
+        rank5 = self._unsuited5
+        return min(
+            rank5(c0, c1, c2, c3, c4),
+            rank5(c0, c1, c2, c3, c5),
+            rank5(c0, c1, c2, c3, c6),
+            rank5(c0, c1, c2, c4, c5),
+            rank5(c0, c1, c2, c4, c6),
+            rank5(c0, c1, c2, c5, c6),
+            rank5(c0, c1, c3, c4, c5),
+            rank5(c0, c1, c3, c4, c6),
+            rank5(c0, c1, c3, c5, c6),
+            rank5(c0, c1, c4, c5, c6),
+            rank5(c0, c2, c3, c4, c5),
+            rank5(c0, c2, c3, c4, c6),
+            rank5(c0, c2, c3, c5, c6),
+            rank5(c0, c2, c4, c5, c6),
+            rank5(c0, c3, c4, c5, c6),
+            rank5(c1, c2, c3, c4, c5),
+            rank5(c1, c2, c3, c4, c6),
+            rank5(c1, c2, c3, c5, c6),
+            rank5(c1, c2, c4, c5, c6),
+            rank5(c1, c3, c4, c5, c6),
+            rank5(c2, c3, c4, c5, c6),
+        )
 
     def _poolrank(self, cards: Sequence[int]) -> int:
         """
-        Performs five_card_eval() on all (6 choose 5) = 6 subsets
-        of 5 cards in the set of 6 to determine the best ranking, 
-        and returns this ranking.
+        Performs _rank5() on all (n choose 5) subsets of 5 cards in
+        the set of n to determine the best ranking, and returns this
+        ranking.
         """
         minimum = LookupTable.MAX_HIGH_CARD
+        rank5 = self._rank5
 
         for combo in itertools.combinations(cards, 5):
 
-            score = self._rank(combo)
+            score = rank5(*combo)
             if score < minimum:
                 minimum = score
 
@@ -75,28 +300,9 @@ class Evaluator:
         Returns the class of hand given the hand hand_rank
         returned from evaluate. 
         """
-        if hr >= 0 and hr <= LookupTable.MAX_ROYAL_FLUSH:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_ROYAL_FLUSH]
-        elif hr <= LookupTable.MAX_STRAIGHT_FLUSH:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_STRAIGHT_FLUSH]
-        elif hr <= LookupTable.MAX_FOUR_OF_A_KIND:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_FOUR_OF_A_KIND]
-        elif hr <= LookupTable.MAX_FULL_HOUSE:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_FULL_HOUSE]
-        elif hr <= LookupTable.MAX_FLUSH:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_FLUSH]
-        elif hr <= LookupTable.MAX_STRAIGHT:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_STRAIGHT]
-        elif hr <= LookupTable.MAX_THREE_OF_A_KIND:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_THREE_OF_A_KIND]
-        elif hr <= LookupTable.MAX_TWO_PAIR:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_TWO_PAIR]
-        elif hr <= LookupTable.MAX_PAIR:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_PAIR]
-        elif hr <= LookupTable.MAX_HIGH_CARD:
-            return LookupTable.MAX_TO_RANK_CLASS[LookupTable.MAX_HIGH_CARD]
-        else:
-            raise Exception("Inavlid hand rank, cannot return rank class")
+        if 0 <= hr <= LookupTable.MAX_HIGH_CARD:
+            return _RANK_CLASSES[bisect.bisect_left(_RANK_BOUNDS, hr)]
+        raise Exception("Inavlid hand rank, cannot return rank class")
 
     def class_to_string(self, class_int: int) -> str:
         """
@@ -166,6 +372,24 @@ class Evaluator:
                     print("Players {} tied for the win with a {}\n".format([x + 1 for x in winners],hand_result))
 
 
+@functools.cache
+def _pool_evaluator() -> Evaluator:
+    """
+    The Evaluator ranking the pools missing from the cache
+    """
+    return Evaluator()
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _evaluate_cached(cards: tuple[int, ...]) -> int:
+    """
+    Evaluator._evaluate_pool() memoized on the sorted cards. Ranks only depend
+    on the LookupTable every Evaluator shares, so one cache serves them all
+    and holds on to none of them
+    """
+    return _pool_evaluator()._evaluate_pool(cards)
+
+
 class PLOEvaluator(Evaluator):
 
     HAND_LENGTH = 4
@@ -175,8 +399,34 @@ class PLOEvaluator(Evaluator):
 
         for hand_combo in itertools.combinations(hand, 2):
             for board_combo in itertools.combinations(board, 3):
-                score = Evaluator._five(self, list(board_combo) + list(hand_combo))
+                score = self._rank5(*board_combo, *hand_combo)
                 if score < minimum:
                     minimum = score
 
         return minimum
+
+    def evaluate_cards(self, h0: int, h1: int, h2: int, h3: int, b0: int, b1: int, b2: int,
+                       b3: Optional[int] = None, b4: Optional[int] = None, /) -> int:
+        """
+        evaluate() for the 4 hole cards and a board of 3 to 5 cards passed
+        one by one, as in evaluate_cards(*hand, *board), ranking the best
+        2 hole cards with the best 3 from the board
+        """
+        if b3 is None:
+            if b4 is not None:
+                raise TypeError("evaluate_cards() got a card after None")
+            board = (b0, b1, b2)
+        elif b4 is None:
+            board = (b0, b1, b2, b3)
+        else:
+            board = (b0, b1, b2, b3, b4)
+        return self.evaluate((h0, h1, h2, h3), board)
+
+    def evaluate_batch(self, hands: "np.ndarray", boards: "np.ndarray") -> "np.ndarray":
+        """
+        Vectorized evaluate() for an (n, 4) array of hole cards and an
+        (n, 5) array of boards, returning an array of their n ranks.
+        Requires numpy.
+        """
+        from . import _batch
+        return _batch.evaluate_plo_batch(hands, boards)
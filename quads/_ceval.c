@@ -0,0 +1,270 @@
+/*
+ * C version of the Five Evaluator hot path, built by setup.py as an optional
+ * extension and used by quads/Five/evaluator.py whenever it imports.
+ *
+ * Same algorithm as quads/Five/_jit.py: 6 and 7 card hands with 5 or more
+ * cards of one suit are ranked as a flush straight from that suit's rank
+ * mask, other hands take the best of their 5 card subsets, each looked up
+ * by rank mask or, when it holds multiples, by the histogram of its ranks.
+ * The tables are compiled in from _ceval_tables.h.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#ifdef __SSE2__
+#include <emmintrin.h>
+#endif
+
+#include "_ceval_tables.h"
+
+#define HAND_SIZE 5
+#define MAX_COUNT 4
+#define RANKS 13
+
+/* the 5 card subsets of 6 and 7 cards */
+static const uint8_t SUBSETS6[6][5] = {
+    {0, 1, 2, 3, 4}, {0, 1, 2, 3, 5}, {0, 1, 2, 4, 5}, {0, 1, 3, 4, 5},
+    {0, 2, 3, 4, 5}, {1, 2, 3, 4, 5},
+};
+
+static const uint8_t SUBSETS7[21][5] = {
+    {0, 1, 2, 3, 4}, {0, 1, 2, 3, 5}, {0, 1, 2, 3, 6}, {0, 1, 2, 4, 5},
+    {0, 1, 2, 4, 6}, {0, 1, 2, 5, 6}, {0, 1, 3, 4, 5}, {0, 1, 3, 4, 6},
+    {0, 1, 3, 5, 6}, {0, 1, 4, 5, 6}, {0, 2, 3, 4, 5}, {0, 2, 3, 4, 6},
+    {0, 2, 3, 5, 6}, {0, 2, 4, 5, 6}, {0, 3, 4, 5, 6}, {1, 2, 3, 4, 5},
+    {1, 2, 3, 4, 6}, {1, 2, 3, 5, 6}, {1, 2, 4, 5, 6}, {1, 3, 4, 5, 6},
+    {2, 3, 4, 5, 6},
+};
+
+#ifndef __SSE2__
+/* a card's suit bits mapped to a count of one in that suit's nibble */
+static const uint32_t SUIT_COUNTS[9] = {0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000};
+#endif
+
+/* the last slot of HISTOGRAM_TABLE, a 0 for malformed hands */
+#define MULTISETS (sizeof(HISTOGRAM_TABLE) / sizeof(HISTOGRAM_TABLE[0]) - 1)
+
+/*
+ * Index of a 5 card rank histogram among all the multisets of 5 ranks, or
+ * MULTISETS for 5 cards of one rank, which would index past the offsets
+ */
+static inline uint16_t
+histogram_index(uint64_t hist)
+{
+    uint16_t index = 0;
+    int k = HAND_SIZE;
+    int r = RANKS - 1;
+    while (k) {
+        int q = (int)((hist >> (r << 2)) & 0xF);
+        if (q > MAX_COUNT)
+            return MULTISETS;
+        index += HISTOGRAM_OFFSETS[(r * (HAND_SIZE + 1) + k) * (MAX_COUNT + 1) + q];
+        k -= q;
+        r--;
+    }
+    return index;
+}
+
+/* rank of 5 cards known not to be a flush */
+static inline uint16_t
+unsuited5(uint32_t c0, uint32_t c1, uint32_t c2, uint32_t c3, uint32_t c4)
+{
+    uint16_t rank = FIVE_UNIQUE_TABLE[(c0 | c1 | c2 | c3 | c4) >> 16];
+    if (rank)
+        return rank;
+
+    /* (c >> 6) & 0x3C is 4 * rank */
+    uint64_t hist = (1ULL << ((c0 >> 6) & 0x3C)) + (1ULL << ((c1 >> 6) & 0x3C))
+                  + (1ULL << ((c2 >> 6) & 0x3C)) + (1ULL << ((c3 >> 6) & 0x3C))
+                  + (1ULL << ((c4 >> 6) & 0x3C));
+    return HISTOGRAM_TABLE[histogram_index(hist)];
+}
+
+static inline uint16_t
+rank5(uint32_t c0, uint32_t c1, uint32_t c2, uint32_t c3, uint32_t c4)
+{
+    if (c0 & c1 & c2 & c3 & c4 & 0xF000)
+        return FIVE_FLUSH_TABLE[(c0 | c1 | c2 | c3 | c4) >> 16];
+    return unsuited5(c0, c1, c2, c3, c4);
+}
+
+/*
+ * Rank mask of the suit holding 5 or more of the cards, 0 if none does. With
+ * SSE2 the masks of all 4 suits are built at once, one suit to a lane.
+ */
+static inline uint32_t
+flush_mask(const uint32_t *c, Py_ssize_t n)
+{
+#ifdef __SSE2__
+    const __m128i suits = _mm_set_epi32(0x8000, 0x4000, 0x2000, 0x1000);
+    __m128i counts = _mm_setzero_si128();
+    __m128i masks = _mm_setzero_si128();
+    for (Py_ssize_t i = 0; i < n; i++) {
+        __m128i card = _mm_set1_epi32((int)c[i]);
+        /* all ones in the lane of the card's suit */
+        __m128i in_suit = _mm_cmpeq_epi32(_mm_and_si128(card, suits), suits);
+        counts = _mm_sub_epi32(counts, in_suit);
+        masks = _mm_or_si128(masks, _mm_and_si128(in_suit, _mm_srli_epi32(card, 16)));
+    }
+
+    int flush = _mm_movemask_epi8(_mm_cmpgt_epi32(counts, _mm_set1_epi32(4)));
+    if (!flush)
+        return 0;
+
+    /* movemask gives 4 bits per lane */
+    uint32_t m[4];
+    _mm_storeu_si128((__m128i *)m, masks);
+    return m[__builtin_ctz(flush) >> 2];
+#else
+    /* 5 or more cards of one suit carry into the top bit of its count */
+    uint32_t counts = 0;
+    for (Py_ssize_t i = 0; i < n; i++)
+        counts += SUIT_COUNTS[(c[i] >> 12) & 0xF];
+    uint32_t flush = (counts + 0x3333) & 0x8888;
+    if (!flush)
+        return 0;
+
+    /* the flag is bit 3 of the suit's nibble, suit bits start at 12 */
+    uint32_t suit = 0x1000;
+    while (!(flush & 0x8)) {
+        flush >>= 4;
+        suit <<= 1;
+    }
+    uint32_t handOR = 0;
+    for (Py_ssize_t i = 0; i < n; i++)
+        if (c[i] & suit)
+            handOR |= c[i];
+    return handOR >> 16;
+#endif
+}
+
+/* rank of 5 to 7 cards */
+static uint16_t
+rank7(const uint32_t *c, Py_ssize_t n)
+{
+    if (n == 5)
+        return rank5(c[0], c[1], c[2], c[3], c[4]);
+
+    uint32_t mask = flush_mask(c, n);
+    if (mask)
+        return FIVE_FLUSH_TABLE[mask];
+
+    const uint8_t (*subsets)[5] = n == 6 ? SUBSETS6 : SUBSETS7;
+    int count = n == 6 ? 6 : 21;
+    uint16_t best = UINT16_MAX;
+    for (int i = 0; i < count; i++) {
+        const uint8_t *s = subsets[i];
+        uint16_t rank = unsuited5(c[s[0]], c[s[1]], c[s[2]], c[s[3]], c[s[4]]);
+        if (rank < best)
+            best = rank;
+    }
+    return best;
+}
+
+static int
+card_from_object(PyObject *obj, uint32_t *card)
+{
+    unsigned long value = PyLong_AsUnsignedLongMask(obj);
+    if (value == (unsigned long)-1 && PyErr_Occurred())
+        return -1;
+    *card = (uint32_t)value;
+    return 0;
+}
+
+static PyObject *
+eval5(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    uint32_t c[5];
+
+    if (nargs != 5) {
+        PyErr_Format(PyExc_TypeError, "eval5() takes 5 cards (%zd given)", nargs);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < 5; i++)
+        if (card_from_object(args[i], &c[i]) < 0)
+            return NULL;
+
+    return PyLong_FromLong(rank5(c[0], c[1], c[2], c[3], c[4]));
+}
+
+/*
+ * eval7() on 5 to 7 cards passed as arguments, with no sequence to build.
+ * Bound as Evaluator.evaluate_cards, so trailing Nones are a c5 and c6
+ * left out, but a card can't follow a None.
+ */
+static PyObject *
+eval_cards(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    uint32_t c[7];
+
+    while (nargs > 5 && args[nargs - 1] == Py_None)
+        nargs--;
+    if (nargs < 5 || nargs > 7) {
+        PyErr_Format(PyExc_TypeError, "eval_cards() takes 5 to 7 cards (%zd given)", nargs);
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < nargs; i++) {
+        if (args[i] == Py_None) {
+            PyErr_SetString(PyExc_TypeError, "eval_cards() got a card after None");
+            return NULL;
+        }
+        if (card_from_object(args[i], &c[i]) < 0)
+            return NULL;
+    }
+
+    return PyLong_FromLong(rank7(c, nargs));
+}
+
+static PyObject *
+eval7(PyObject *module, PyObject *cards)
+{
+    uint32_t c[7];
+
+    PyObject *seq = PySequence_Fast(cards, "eval7() takes a sequence of cards");
+    if (seq == NULL)
+        return NULL;
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    if (n < 5 || n > 7) {
+        Py_DECREF(seq);
+        PyErr_Format(PyExc_ValueError, "eval7() takes 5 to 7 cards (%zd given)", n);
+        return NULL;
+    }
+
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (card_from_object(items[i], &c[i]) < 0) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+    }
+    Py_DECREF(seq);
+
+    return PyLong_FromLong(rank7(c, n));
+}
+
+static PyMethodDef ceval_methods[] = {
+    {"eval5", (PyCFunction)(void (*)(void))eval5, METH_FASTCALL,
+     "eval5(c0, c1, c2, c3, c4)\n--\n\nRank of a 5 card hand."},
+    {"eval_cards", (PyCFunction)(void (*)(void))eval_cards, METH_FASTCALL,
+     "eval_cards($module, c0, c1, c2, c3, c4, c5=None, c6=None, /)\n--\n\n"
+     "Rank of the best 5 card hand among 5 to 7 cards passed one by one."},
+    {"eval7", eval7, METH_O,
+     "eval7(cards)\n--\n\nRank of the best 5 card hand among 5 to 7 cards."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef ceval_module = {
+    PyModuleDef_HEAD_INIT,
+    "quads._ceval",
+    "C version of the Five Evaluator hot path.",
+    -1,
+    ceval_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__ceval(void)
+{
+    return PyModule_Create(&ceval_module);
+}
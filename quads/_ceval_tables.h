@@ -0,0 +1,1398 @@
+/*
+ * Precomputed lookup tables for quads/_ceval.c, see quads/_tables.py and
+ * quads/Five/_jit.py.
+ *
+ * Generated by tools/gen_tables.py, do not edit by hand.
+ */
+#include <stdint.h>
+
+static const uint16_t FIVE_FLUSH_TABLE[8192] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1599, 0,
+    0, 0, 0, 0, 0, 0, 1598, 0, 0, 0, 1597, 0, 1596, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 1595, 0, 0, 0, 0, 0, 0, 0, 1594, 0, 0, 0, 1593, 0,
+    1592, 1591, 9, 0, 0, 0, 0, 0, 0, 0, 1590, 0, 0, 0, 1589, 0, 1588, 1587,
+    1587, 0, 0, 0, 1586, 0, 1585, 1584, 1584, 0, 1583, 1582, 1582, 7, 7, 7, 7,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1581, 0, 0, 0, 0, 0, 0, 0,
+    1580, 0, 0, 0, 1579, 0, 1578, 1577, 9, 0, 0, 0, 0, 0, 0, 0, 1576, 0, 0, 0,
+    1575, 0, 1574, 1573, 1573, 0, 0, 0, 1572, 0, 1571, 1570, 1570, 0, 1569,
+    1568, 1568, 1567, 1567, 8, 8, 0, 0, 0, 0, 0, 0, 0, 1566, 0, 0, 0, 1565, 0,
+    1564, 1563, 1563, 0, 0, 0, 1562, 0, 1561, 1560, 1560, 0, 1559, 1558, 1558,
+    1557, 1557, 1557, 9, 0, 0, 0, 1556, 0, 1555, 1554, 1554, 0, 1553, 1552,
+    1552, 1551, 1551, 1551, 1551, 0, 1550, 1549, 1549, 1548, 1548, 1548, 1548,
+    6, 6, 6, 6, 6, 6, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1547,
+    0, 0, 0, 0, 0, 0, 0, 1546, 0, 0, 0, 1545, 0, 1544, 1543, 9, 0, 0, 0, 0, 0,
+    0, 0, 1542, 0, 0, 0, 1541, 0, 1540, 1539, 1539, 0, 0, 0, 1538, 0, 1537,
+    1536, 1536, 0, 1535, 1534, 1534, 1533, 1533, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+    1532, 0, 0, 0, 1531, 0, 1530, 1529, 1529, 0, 0, 0, 1528, 0, 1527, 1526,
+    1526, 0, 1525, 1524, 1524, 1523, 1523, 1523, 9, 0, 0, 0, 1522, 0, 1521,
+    1520, 1520, 0, 1519, 1518, 1518, 1517, 1517, 1517, 1517, 0, 1516, 1515,
+    1515, 1514, 1514, 1514, 1514, 1513, 1513, 1513, 1513, 7, 7, 7, 0, 0, 0, 0,
+    0, 0, 0, 0, 1512, 0, 0, 0, 1511, 0, 1510, 1509, 1509, 0, 0, 0, 1508, 0,
+    1507, 1506, 1506, 0, 1505, 1504, 1504, 1503, 1503, 1503, 9, 0, 0, 0, 1502,
+    0, 1501, 1500, 1500, 0, 1499, 1498, 1498, 1497, 1497, 1497, 1497, 0, 1496,
+    1495, 1495, 1494, 1494, 1494, 1494, 1493, 1493, 1493, 1493, 1493, 1493, 8,
+    0, 0, 0, 0, 1492, 0, 1491, 1490, 1490, 0, 1489, 1488, 1488, 1487, 1487,
+    1487, 1487, 0, 1486, 1485, 1485, 1484, 1484, 1484, 1484, 1483, 1483, 1483,
+    1483, 1483, 1483, 1483, 0, 0, 1482, 1481, 1481, 1480, 1480, 1480, 1480,
+    1479, 1479, 1479, 1479, 1479, 1479, 1479, 0, 5, 5, 5, 5, 5, 5, 5, 0, 5, 5,
+    5, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1478, 0, 0,
+    0, 0, 0, 0, 0, 1477, 0, 0, 0, 1476, 0, 1475, 1474, 9, 0, 0, 0, 0, 0, 0, 0,
+    1473, 0, 0, 0, 1472, 0, 1471, 1470, 1470, 0, 0, 0, 1469, 0, 1468, 1467,
+    1467, 0, 1466, 1465, 1465, 1464, 1464, 8, 8, 0, 0, 0, 0, 0, 0, 0, 1463, 0,
+    0, 0, 1462, 0, 1461, 1460, 1460, 0, 0, 0, 1459, 0, 1458, 1457, 1457, 0,
+    1456, 1455, 1455, 1454, 1454, 1454, 9, 0, 0, 0, 1453, 0, 1452, 1451, 1451,
+    0, 1450, 1449, 1449, 1448, 1448, 1448, 1448, 0, 1447, 1446, 1446, 1445,
+    1445, 1445, 1445, 1444, 1444, 1444, 1444, 7, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0,
+    1443, 0, 0, 0, 1442, 0, 1441, 1440, 1440, 0, 0, 0, 1439, 0, 1438, 1437,
+    1437, 0, 1436, 1435, 1435, 1434, 1434, 1434, 9, 0, 0, 0, 1433, 0, 1432,
+    1431, 1431, 0, 1430, 1429, 1429, 1428, 1428, 1428, 1428, 0, 1427, 1426,
+    1426, 1425, 1425, 1425, 1425, 1424, 1424, 1424, 1424, 1424, 1424, 8, 0, 0,
+    0, 0, 1423, 0, 1422, 1421, 1421, 0, 1420, 1419, 1419, 1418, 1418, 1418,
+    1418, 0, 1417, 1416, 1416, 1415, 1415, 1415, 1415, 1414, 1414, 1414, 1414,
+    1414, 1414, 1414, 0, 0, 1413, 1412, 1412, 1411, 1411, 1411, 1411, 1410,
+    1410, 1410, 1410, 1410, 1410, 1410, 0, 1409, 1409, 1409, 1409, 1409, 1409,
+    1409, 0, 6, 6, 6, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1408, 0, 0, 0, 1407,
+    0, 1406, 1405, 1405, 0, 0, 0, 1404, 0, 1403, 1402, 1402, 0, 1401, 1400,
+    1400, 1399, 1399, 1399, 9, 0, 0, 0, 1398, 0, 1397, 1396, 1396, 0, 1395,
+    1394, 1394, 1393, 1393, 1393, 1393, 0, 1392, 1391, 1391, 1390, 1390, 1390,
+    1390, 1389, 1389, 1389, 1389, 1389, 1389, 8, 0, 0, 0, 0, 1388, 0, 1387,
+    1386, 1386, 0, 1385, 1384, 1384, 1383, 1383, 1383, 1383, 0, 1382, 1381,
+    1381, 1380, 1380, 1380, 1380, 1379, 1379, 1379, 1379, 1379, 1379, 1379, 0,
+    0, 1378, 1377, 1377, 1376, 1376, 1376, 1376, 1375, 1375, 1375, 1375, 1375,
+    1375, 1375, 0, 1374, 1374, 1374, 1374, 1374, 1374, 1374, 0, 1374, 1374,
+    1374, 0, 7, 0, 0, 0, 0, 0, 0, 1373, 0, 1372, 1371, 1371, 0, 1370, 1369,
+    1369, 1368, 1368, 1368, 1368, 0, 1367, 1366, 1366, 1365, 1365, 1365, 1365,
+    1364, 1364, 1364, 1364, 1364, 1364, 1364, 0, 0, 1363, 1362, 1362, 1361,
+    1361, 1361, 1361, 1360, 1360, 1360, 1360, 1360, 1360, 1360, 0, 1359, 1359,
+    1359, 1359, 1359, 1359, 1359, 0, 1359, 1359, 1359, 0, 1359, 0, 0, 0, 0,
+    1358, 1357, 1357, 1356, 1356, 1356, 1356, 1355, 1355, 1355, 1355, 1355,
+    1355, 1355, 0, 1354, 1354, 1354, 1354, 1354, 1354, 1354, 0, 1354, 1354,
+    1354, 0, 1354, 0, 0, 0, 4, 4, 4, 4, 4, 4, 4, 0, 4, 4, 4, 0, 4, 0, 0, 0, 4,
+    4, 4, 0, 4, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 1353, 0, 0, 0, 0, 0, 0, 0, 1352, 0, 0, 0, 1351, 0, 1350,
+    1349, 9, 0, 0, 0, 0, 0, 0, 0, 1348, 0, 0, 0, 1347, 0, 1346, 1345, 1345, 0,
+    0, 0, 1344, 0, 1343, 1342, 1342, 0, 1341, 1340, 1340, 1339, 1339, 8, 8, 0,
+    0, 0, 0, 0, 0, 0, 1338, 0, 0, 0, 1337, 0, 1336, 1335, 1335, 0, 0, 0, 1334,
+    0, 1333, 1332, 1332, 0, 1331, 1330, 1330, 1329, 1329, 1329, 9, 0, 0, 0,
+    1328, 0, 1327, 1326, 1326, 0, 1325, 1324, 1324, 1323, 1323, 1323, 1323, 0,
+    1322, 1321, 1321, 1320, 1320, 1320, 1320, 1319, 1319, 1319, 1319, 7, 7, 7,
+    0, 0, 0, 0, 0, 0, 0, 0, 1318, 0, 0, 0, 1317, 0, 1316, 1315, 1315, 0, 0, 0,
+    1314, 0, 1313, 1312, 1312, 0, 1311, 1310, 1310, 1309, 1309, 1309, 9, 0, 0,
+    0, 1308, 0, 1307, 1306, 1306, 0, 1305, 1304, 1304, 1303, 1303, 1303, 1303,
+    0, 1302, 1301, 1301, 1300, 1300, 1300, 1300, 1299, 1299, 1299, 1299, 1299,
+    1299, 8, 0, 0, 0, 0, 1298, 0, 1297, 1296, 1296, 0, 1295, 1294, 1294, 1293,
+    1293, 1293, 1293, 0, 1292, 1291, 1291, 1290, 1290, 1290, 1290, 1289, 1289,
+    1289, 1289, 1289, 1289, 1289, 0, 0, 1288, 1287, 1287, 1286, 1286, 1286,
+    1286, 1285, 1285, 1285, 1285, 1285, 1285, 1285, 0, 1284, 1284, 1284, 1284,
+    1284, 1284, 1284, 0, 6, 6, 6, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1283, 0,
+    0, 0, 1282, 0, 1281, 1280, 1280, 0, 0, 0, 1279, 0, 1278, 1277, 1277, 0,
+    1276, 1275, 1275, 1274, 1274, 1274, 9, 0, 0, 0, 1273, 0, 1272, 1271, 1271,
+    0, 1270, 1269, 1269, 1268, 1268, 1268, 1268, 0, 1267, 1266, 1266, 1265,
+    1265, 1265, 1265, 1264, 1264, 1264, 1264, 1264, 1264, 8, 0, 0, 0, 0, 1263,
+    0, 1262, 1261, 1261, 0, 1260, 1259, 1259, 1258, 1258, 1258, 1258, 0, 1257,
+    1256, 1256, 1255, 1255, 1255, 1255, 1254, 1254, 1254, 1254, 1254, 1254,
+    1254, 0, 0, 1253, 1252, 1252, 1251, 1251, 1251, 1251, 1250, 1250, 1250,
+    1250, 1250, 1250, 1250, 0, 1249, 1249, 1249, 1249, 1249, 1249, 1249, 0,
+    1249, 1249, 1249, 0, 7, 0, 0, 0, 0, 0, 0, 1248, 0, 1247, 1246, 1246, 0,
+    1245, 1244, 1244, 1243, 1243, 1243, 1243, 0, 1242, 1241, 1241, 1240, 1240,
+    1240, 1240, 1239, 1239, 1239, 1239, 1239, 1239, 1239, 0, 0, 1238, 1237,
+    1237, 1236, 1236, 1236, 1236, 1235, 1235, 1235, 1235, 1235, 1235, 1235, 0,
+    1234, 1234, 1234, 1234, 1234, 1234, 1234, 0, 1234, 1234, 1234, 0, 1234, 0,
+    0, 0, 0, 1233, 1232, 1232, 1231, 1231, 1231, 1231, 1230, 1230, 1230, 1230,
+    1230, 1230, 1230, 0, 1229, 1229, 1229, 1229, 1229, 1229, 1229, 0, 1229,
+    1229, 1229, 0, 1229, 0, 0, 0, 1228, 1228, 1228, 1228, 1228, 1228, 1228, 0,
+    1228, 1228, 1228, 0, 1228, 0, 0, 0, 5, 5, 5, 0, 5, 0, 0, 0, 5, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1227, 0, 0, 0, 1226, 0, 1225, 1224, 1224, 0,
+    0, 0, 1223, 0, 1222, 1221, 1221, 0, 1220, 1219, 1219, 1218, 1218, 1218, 9,
+    0, 0, 0, 1217, 0, 1216, 1215, 1215, 0, 1214, 1213, 1213, 1212, 1212, 1212,
+    1212, 0, 1211, 1210, 1210, 1209, 1209, 1209, 1209, 1208, 1208, 1208, 1208,
+    1208, 1208, 8, 0, 0, 0, 0, 1207, 0, 1206, 1205, 1205, 0, 1204, 1203, 1203,
+    1202, 1202, 1202, 1202, 0, 1201, 1200, 1200, 1199, 1199, 1199, 1199, 1198,
+    1198, 1198, 1198, 1198, 1198, 1198, 0, 0, 1197, 1196, 1196, 1195, 1195,
+    1195, 1195, 1194, 1194, 1194, 1194, 1194, 1194, 1194, 0, 1193, 1193, 1193,
+    1193, 1193, 1193, 1193, 0, 1193, 1193, 1193, 0, 7, 0, 0, 0, 0, 0, 0, 1192,
+    0, 1191, 1190, 1190, 0, 1189, 1188, 1188, 1187, 1187, 1187, 1187, 0, 1186,
+    1185, 1185, 1184, 1184, 1184, 1184, 1183, 1183, 1183, 1183, 1183, 1183,
+    1183, 0, 0, 1182, 1181, 1181, 1180, 1180, 1180, 1180, 1179, 1179, 1179,
+    1179, 1179, 1179, 1179, 0, 1178, 1178, 1178, 1178, 1178, 1178, 1178, 0,
+    1178, 1178, 1178, 0, 1178, 0, 0, 0, 0, 1177, 1176, 1176, 1175, 1175, 1175,
+    1175, 1174, 1174, 1174, 1174, 1174, 1174, 1174, 0, 1173, 1173, 1173, 1173,
+    1173, 1173, 1173, 0, 1173, 1173, 1173, 0, 1173, 0, 0, 0, 1172, 1172, 1172,
+    1172, 1172, 1172, 1172, 0, 1172, 1172, 1172, 0, 1172, 0, 0, 0, 1172, 1172,
+    1172, 0, 1172, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1171, 0, 1170,
+    1169, 1169, 0, 1168, 1167, 1167, 1166, 1166, 1166, 1166, 0, 1165, 1164,
+    1164, 1163, 1163, 1163, 1163, 1162, 1162, 1162, 1162, 1162, 1162, 1162, 0,
+    0, 1161, 1160, 1160, 1159, 1159, 1159, 1159, 1158, 1158, 1158, 1158, 1158,
+    1158, 1158, 0, 1157, 1157, 1157, 1157, 1157, 1157, 1157, 0, 1157, 1157,
+    1157, 0, 1157, 0, 0, 0, 0, 1156, 1155, 1155, 1154, 1154, 1154, 1154, 1153,
+    1153, 1153, 1153, 1153, 1153, 1153, 0, 1152, 1152, 1152, 1152, 1152, 1152,
+    1152, 0, 1152, 1152, 1152, 0, 1152, 0, 0, 0, 1151, 1151, 1151, 1151, 1151,
+    1151, 1151, 0, 1151, 1151, 1151, 0, 1151, 0, 0, 0, 1151, 1151, 1151, 0,
+    1151, 0, 0, 0, 1151, 0, 0, 0, 0, 0, 0, 0, 0, 1150, 1149, 1149, 1148, 1148,
+    1148, 1148, 1147, 1147, 1147, 1147, 1147, 1147, 1147, 0, 1146, 1146, 1146,
+    1146, 1146, 1146, 1146, 0, 1146, 1146, 1146, 0, 1146, 0, 0, 0, 1145, 1145,
+    1145, 1145, 1145, 1145, 1145, 0, 1145, 1145, 1145, 0, 1145, 0, 0, 0, 1145,
+    1145, 1145, 0, 1145, 0, 0, 0, 1145, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 3, 3,
+    3, 0, 3, 3, 3, 0, 3, 0, 0, 0, 3, 3, 3, 0, 3, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0,
+    0, 3, 3, 3, 0, 3, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1144,
+    0, 0, 0, 0, 0, 0, 0, 1143, 0, 0, 0, 1142, 0, 1141, 1140, 9, 0, 0, 0, 0, 0,
+    0, 0, 1139, 0, 0, 0, 1138, 0, 1137, 1136, 1136, 0, 0, 0, 1135, 0, 1134,
+    1133, 1133, 0, 1132, 1131, 1131, 1130, 1130, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+    1129, 0, 0, 0, 1128, 0, 1127, 1126, 1126, 0, 0, 0, 1125, 0, 1124, 1123,
+    1123, 0, 1122, 1121, 1121, 1120, 1120, 1120, 9, 0, 0, 0, 1119, 0, 1118,
+    1117, 1117, 0, 1116, 1115, 1115, 1114, 1114, 1114, 1114, 0, 1113, 1112,
+    1112, 1111, 1111, 1111, 1111, 1110, 1110, 1110, 1110, 7, 7, 7, 0, 0, 0, 0,
+    0, 0, 0, 0, 1109, 0, 0, 0, 1108, 0, 1107, 1106, 1106, 0, 0, 0, 1105, 0,
+    1104, 1103, 1103, 0, 1102, 1101, 1101, 1100, 1100, 1100, 9, 0, 0, 0, 1099,
+    0, 1098, 1097, 1097, 0, 1096, 1095, 1095, 1094, 1094, 1094, 1094, 0, 1093,
+    1092, 1092, 1091, 1091, 1091, 1091, 1090, 1090, 1090, 1090, 1090, 1090, 8,
+    0, 0, 0, 0, 1089, 0, 1088, 1087, 1087, 0, 1086, 1085, 1085, 1084, 1084,
+    1084, 1084, 0, 1083, 1082, 1082, 1081, 1081, 1081, 1081, 1080, 1080, 1080,
+    1080, 1080, 1080, 1080, 0, 0, 1079, 1078, 1078, 1077, 1077, 1077, 1077,
+    1076, 1076, 1076, 1076, 1076, 1076, 1076, 0, 1075, 1075, 1075, 1075, 1075,
+    1075, 1075, 0, 6, 6, 6, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1074, 0, 0, 0,
+    1073, 0, 1072, 1071, 1071, 0, 0, 0, 1070, 0, 1069, 1068, 1068, 0, 1067,
+    1066, 1066, 1065, 1065, 1065, 9, 0, 0, 0, 1064, 0, 1063, 1062, 1062, 0,
+    1061, 1060, 1060, 1059, 1059, 1059, 1059, 0, 1058, 1057, 1057, 1056, 1056,
+    1056, 1056, 1055, 1055, 1055, 1055, 1055, 1055, 8, 0, 0, 0, 0, 1054, 0,
+    1053, 1052, 1052, 0, 1051, 1050, 1050, 1049, 1049, 1049, 1049, 0, 1048,
+    1047, 1047, 1046, 1046, 1046, 1046, 1045, 1045, 1045, 1045, 1045, 1045,
+    1045, 0, 0, 1044, 1043, 1043, 1042, 1042, 1042, 1042, 1041, 1041, 1041,
+    1041, 1041, 1041, 1041, 0, 1040, 1040, 1040, 1040, 1040, 1040, 1040, 0,
+    1040, 1040, 1040, 0, 7, 0, 0, 0, 0, 0, 0, 1039, 0, 1038, 1037, 1037, 0,
+    1036, 1035, 1035, 1034, 1034, 1034, 1034, 0, 1033, 1032, 1032, 1031, 1031,
+    1031, 1031, 1030, 1030, 1030, 1030, 1030, 1030, 1030, 0, 0, 1029, 1028,
+    1028, 1027, 1027, 1027, 1027, 1026, 1026, 1026, 1026, 1026, 1026, 1026, 0,
+    1025, 1025, 1025, 1025, 1025, 1025, 1025, 0, 1025, 1025, 1025, 0, 1025, 0,
+    0, 0, 0, 1024, 1023, 1023, 1022, 1022, 1022, 1022, 1021, 1021, 1021, 1021,
+    1021, 1021, 1021, 0, 1020, 1020, 1020, 1020, 1020, 1020, 1020, 0, 1020,
+    1020, 1020, 0, 1020, 0, 0, 0, 1019, 1019, 1019, 1019, 1019, 1019, 1019, 0,
+    1019, 1019, 1019, 0, 1019, 0, 0, 0, 5, 5, 5, 0, 5, 0, 0, 0, 5, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1018, 0, 0, 0, 1017, 0, 1016, 1015, 1015, 0,
+    0, 0, 1014, 0, 1013, 1012, 1012, 0, 1011, 1010, 1010, 1009, 1009, 1009, 9,
+    0, 0, 0, 1008, 0, 1007, 1006, 1006, 0, 1005, 1004, 1004, 1003, 1003, 1003,
+    1003, 0, 1002, 1001, 1001, 1000, 1000, 1000, 1000, 999, 999, 999, 999, 999,
+    999, 8, 0, 0, 0, 0, 998, 0, 997, 996, 996, 0, 995, 994, 994, 993, 993, 993,
+    993, 0, 992, 991, 991, 990, 990, 990, 990, 989, 989, 989, 989, 989, 989,
+    989, 0, 0, 988, 987, 987, 986, 986, 986, 986, 985, 985, 985, 985, 985, 985,
+    985, 0, 984, 984, 984, 984, 984, 984, 984, 0, 984, 984, 984, 0, 7, 0, 0, 0,
+    0, 0, 0, 983, 0, 982, 981, 981, 0, 980, 979, 979, 978, 978, 978, 978, 0,
+    977, 976, 976, 975, 975, 975, 975, 974, 974, 974, 974, 974, 974, 974, 0, 0,
+    973, 972, 972, 971, 971, 971, 971, 970, 970, 970, 970, 970, 970, 970, 0,
+    969, 969, 969, 969, 969, 969, 969, 0, 969, 969, 969, 0, 969, 0, 0, 0, 0,
+    968, 967, 967, 966, 966, 966, 966, 965, 965, 965, 965, 965, 965, 965, 0,
+    964, 964, 964, 964, 964, 964, 964, 0, 964, 964, 964, 0, 964, 0, 0, 0, 963,
+    963, 963, 963, 963, 963, 963, 0, 963, 963, 963, 0, 963, 0, 0, 0, 963, 963,
+    963, 0, 963, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 962, 0, 961, 960,
+    960, 0, 959, 958, 958, 957, 957, 957, 957, 0, 956, 955, 955, 954, 954, 954,
+    954, 953, 953, 953, 953, 953, 953, 953, 0, 0, 952, 951, 951, 950, 950, 950,
+    950, 949, 949, 949, 949, 949, 949, 949, 0, 948, 948, 948, 948, 948, 948,
+    948, 0, 948, 948, 948, 0, 948, 0, 0, 0, 0, 947, 946, 946, 945, 945, 945,
+    945, 944, 944, 944, 944, 944, 944, 944, 0, 943, 943, 943, 943, 943, 943,
+    943, 0, 943, 943, 943, 0, 943, 0, 0, 0, 942, 942, 942, 942, 942, 942, 942,
+    0, 942, 942, 942, 0, 942, 0, 0, 0, 942, 942, 942, 0, 942, 0, 0, 0, 942, 0,
+    0, 0, 0, 0, 0, 0, 0, 941, 940, 940, 939, 939, 939, 939, 938, 938, 938, 938,
+    938, 938, 938, 0, 937, 937, 937, 937, 937, 937, 937, 0, 937, 937, 937, 0,
+    937, 0, 0, 0, 936, 936, 936, 936, 936, 936, 936, 0, 936, 936, 936, 0, 936,
+    0, 0, 0, 936, 936, 936, 0, 936, 0, 0, 0, 936, 0, 0, 0, 0, 0, 0, 0, 935,
+    935, 935, 935, 935, 935, 935, 0, 935, 935, 935, 0, 935, 0, 0, 0, 935, 935,
+    935, 0, 935, 0, 0, 0, 935, 0, 0, 0, 0, 0, 0, 0, 4, 4, 4, 0, 4, 0, 0, 0, 4,
+    0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 934, 0, 0, 0, 933, 0, 932, 931, 931, 0, 0, 0, 930, 0, 929,
+    928, 928, 0, 927, 926, 926, 925, 925, 925, 9, 0, 0, 0, 924, 0, 923, 922,
+    922, 0, 921, 920, 920, 919, 919, 919, 919, 0, 918, 917, 917, 916, 916, 916,
+    916, 915, 915, 915, 915, 915, 915, 8, 0, 0, 0, 0, 914, 0, 913, 912, 912, 0,
+    911, 910, 910, 909, 909, 909, 909, 0, 908, 907, 907, 906, 906, 906, 906,
+    905, 905, 905, 905, 905, 905, 905, 0, 0, 904, 903, 903, 902, 902, 902, 902,
+    901, 901, 901, 901, 901, 901, 901, 0, 900, 900, 900, 900, 900, 900, 900, 0,
+    900, 900, 900, 0, 7, 0, 0, 0, 0, 0, 0, 899, 0, 898, 897, 897, 0, 896, 895,
+    895, 894, 894, 894, 894, 0, 893, 892, 892, 891, 891, 891, 891, 890, 890,
+    890, 890, 890, 890, 890, 0, 0, 889, 888, 888, 887, 887, 887, 887, 886, 886,
+    886, 886, 886, 886, 886, 0, 885, 885, 885, 885, 885, 885, 885, 0, 885, 885,
+    885, 0, 885, 0, 0, 0, 0, 884, 883, 883, 882, 882, 882, 882, 881, 881, 881,
+    881, 881, 881, 881, 0, 880, 880, 880, 880, 880, 880, 880, 0, 880, 880, 880,
+    0, 880, 0, 0, 0, 879, 879, 879, 879, 879, 879, 879, 0, 879, 879, 879, 0,
+    879, 0, 0, 0, 879, 879, 879, 0, 879, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 878, 0, 877, 876, 876, 0, 875, 874, 874, 873, 873, 873, 873, 0, 872,
+    871, 871, 870, 870, 870, 870, 869, 869, 869, 869, 869, 869, 869, 0, 0, 868,
+    867, 867, 866, 866, 866, 866, 865, 865, 865, 865, 865, 865, 865, 0, 864,
+    864, 864, 864, 864, 864, 864, 0, 864, 864, 864, 0, 864, 0, 0, 0, 0, 863,
+    862, 862, 861, 861, 861, 861, 860, 860, 860, 860, 860, 860, 860, 0, 859,
+    859, 859, 859, 859, 859, 859, 0, 859, 859, 859, 0, 859, 0, 0, 0, 858, 858,
+    858, 858, 858, 858, 858, 0, 858, 858, 858, 0, 858, 0, 0, 0, 858, 858, 858,
+    0, 858, 0, 0, 0, 858, 0, 0, 0, 0, 0, 0, 0, 0, 857, 856, 856, 855, 855, 855,
+    855, 854, 854, 854, 854, 854, 854, 854, 0, 853, 853, 853, 853, 853, 853,
+    853, 0, 853, 853, 853, 0, 853, 0, 0, 0, 852, 852, 852, 852, 852, 852, 852,
+    0, 852, 852, 852, 0, 852, 0, 0, 0, 852, 852, 852, 0, 852, 0, 0, 0, 852, 0,
+    0, 0, 0, 0, 0, 0, 851, 851, 851, 851, 851, 851, 851, 0, 851, 851, 851, 0,
+    851, 0, 0, 0, 851, 851, 851, 0, 851, 0, 0, 0, 851, 0, 0, 0, 0, 0, 0, 0,
+    851, 851, 851, 0, 851, 0, 0, 0, 851, 0, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 850, 0, 849, 848, 848, 0, 847, 846,
+    846, 845, 845, 845, 845, 0, 844, 843, 843, 842, 842, 842, 842, 841, 841,
+    841, 841, 841, 841, 841, 0, 0, 840, 839, 839, 838, 838, 838, 838, 837, 837,
+    837, 837, 837, 837, 837, 0, 836, 836, 836, 836, 836, 836, 836, 0, 836, 836,
+    836, 0, 836, 0, 0, 0, 0, 835, 834, 834, 833, 833, 833, 833, 832, 832, 832,
+    832, 832, 832, 832, 0, 831, 831, 831, 831, 831, 831, 831, 0, 831, 831, 831,
+    0, 831, 0, 0, 0, 830, 830, 830, 830, 830, 830, 830, 0, 830, 830, 830, 0,
+    830, 0, 0, 0, 830, 830, 830, 0, 830, 0, 0, 0, 830, 0, 0, 0, 0, 0, 0, 0, 0,
+    829, 828, 828, 827, 827, 827, 827, 826, 826, 826, 826, 826, 826, 826, 0,
+    825, 825, 825, 825, 825, 825, 825, 0, 825, 825, 825, 0, 825, 0, 0, 0, 824,
+    824, 824, 824, 824, 824, 824, 0, 824, 824, 824, 0, 824, 0, 0, 0, 824, 824,
+    824, 0, 824, 0, 0, 0, 824, 0, 0, 0, 0, 0, 0, 0, 823, 823, 823, 823, 823,
+    823, 823, 0, 823, 823, 823, 0, 823, 0, 0, 0, 823, 823, 823, 0, 823, 0, 0,
+    0, 823, 0, 0, 0, 0, 0, 0, 0, 823, 823, 823, 0, 823, 0, 0, 0, 823, 0, 0, 0,
+    0, 0, 0, 0, 823, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 822, 821,
+    821, 820, 820, 820, 820, 819, 819, 819, 819, 819, 819, 819, 0, 818, 818,
+    818, 818, 818, 818, 818, 0, 818, 818, 818, 0, 818, 0, 0, 0, 817, 817, 817,
+    817, 817, 817, 817, 0, 817, 817, 817, 0, 817, 0, 0, 0, 817, 817, 817, 0,
+    817, 0, 0, 0, 817, 0, 0, 0, 0, 0, 0, 0, 816, 816, 816, 816, 816, 816, 816,
+    0, 816, 816, 816, 0, 816, 0, 0, 0, 816, 816, 816, 0, 816, 0, 0, 0, 816, 0,
+    0, 0, 0, 0, 0, 0, 816, 816, 816, 0, 816, 0, 0, 0, 816, 0, 0, 0, 0, 0, 0, 0,
+    816, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 0,
+    2, 2, 2, 0, 2, 0, 0, 0, 2, 2, 2, 0, 2, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2,
+    2, 2, 0, 2, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 2, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0, 0, 0, 815, 0, 0, 0, 814,
+    0, 813, 812, 9, 0, 0, 0, 0, 0, 0, 0, 811, 0, 0, 0, 810, 0, 809, 808, 10, 0,
+    0, 0, 807, 0, 806, 805, 805, 0, 804, 803, 803, 802, 802, 8, 8, 0, 0, 0, 0,
+    0, 0, 0, 801, 0, 0, 0, 800, 0, 799, 798, 10, 0, 0, 0, 797, 0, 796, 795,
+    795, 0, 794, 793, 793, 792, 792, 792, 9, 0, 0, 0, 791, 0, 790, 789, 789, 0,
+    788, 787, 787, 786, 786, 786, 10, 0, 785, 784, 784, 783, 783, 783, 783,
+    782, 782, 782, 782, 7, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 781, 0, 0, 0, 780, 0,
+    779, 778, 10, 0, 0, 0, 777, 0, 776, 775, 775, 0, 774, 773, 773, 772, 772,
+    772, 9, 0, 0, 0, 771, 0, 770, 769, 769, 0, 768, 767, 767, 766, 766, 766,
+    10, 0, 765, 764, 764, 763, 763, 763, 763, 762, 762, 762, 762, 762, 762, 8,
+    0, 0, 0, 0, 761, 0, 760, 759, 759, 0, 758, 757, 757, 756, 756, 756, 10, 0,
+    755, 754, 754, 753, 753, 753, 753, 752, 752, 752, 752, 752, 752, 752, 0, 0,
+    751, 750, 750, 749, 749, 749, 749, 748, 748, 748, 748, 748, 748, 748, 0,
+    747, 747, 747, 747, 747, 747, 747, 0, 6, 6, 6, 0, 6, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 746, 0, 0, 0, 745, 0, 744, 743, 10, 0, 0, 0, 742, 0, 741, 740,
+    740, 0, 739, 738, 738, 737, 737, 737, 9, 0, 0, 0, 736, 0, 735, 734, 734, 0,
+    733, 732, 732, 731, 731, 731, 10, 0, 730, 729, 729, 728, 728, 728, 728,
+    727, 727, 727, 727, 727, 727, 8, 0, 0, 0, 0, 726, 0, 725, 724, 724, 0, 723,
+    722, 722, 721, 721, 721, 10, 0, 720, 719, 719, 718, 718, 718, 718, 717,
+    717, 717, 717, 717, 717, 717, 0, 0, 716, 715, 715, 714, 714, 714, 714, 713,
+    713, 713, 713, 713, 713, 713, 0, 712, 712, 712, 712, 712, 712, 712, 0, 712,
+    712, 712, 0, 7, 0, 0, 0, 0, 0, 0, 711, 0, 710, 709, 709, 0, 708, 707, 707,
+    706, 706, 706, 10, 0, 705, 704, 704, 703, 703, 703, 703, 702, 702, 702,
+    702, 702, 702, 702, 0, 0, 701, 700, 700, 699, 699, 699, 699, 698, 698, 698,
+    698, 698, 698, 698, 0, 697, 697, 697, 697, 697, 697, 697, 0, 697, 697, 697,
+    0, 697, 0, 0, 0, 0, 696, 695, 695, 694, 694, 694, 694, 693, 693, 693, 693,
+    693, 693, 693, 0, 692, 692, 692, 692, 692, 692, 692, 0, 692, 692, 692, 0,
+    692, 0, 0, 0, 691, 691, 691, 691, 691, 691, 691, 0, 691, 691, 691, 0, 691,
+    0, 0, 0, 5, 5, 5, 0, 5, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 690, 0, 0, 0, 689, 0, 688, 687, 10, 0, 0, 0, 686, 0, 685, 684, 684, 0,
+    683, 682, 682, 681, 681, 681, 9, 0, 0, 0, 680, 0, 679, 678, 678, 0, 677,
+    676, 676, 675, 675, 675, 10, 0, 674, 673, 673, 672, 672, 672, 672, 671,
+    671, 671, 671, 671, 671, 8, 0, 0, 0, 0, 670, 0, 669, 668, 668, 0, 667, 666,
+    666, 665, 665, 665, 10, 0, 664, 663, 663, 662, 662, 662, 662, 661, 661,
+    661, 661, 661, 661, 661, 0, 0, 660, 659, 659, 658, 658, 658, 658, 657, 657,
+    657, 657, 657, 657, 657, 0, 656, 656, 656, 656, 656, 656, 656, 0, 656, 656,
+    656, 0, 7, 0, 0, 0, 0, 0, 0, 655, 0, 654, 653, 653, 0, 652, 651, 651, 650,
+    650, 650, 10, 0, 649, 648, 648, 647, 647, 647, 647, 646, 646, 646, 646,
+    646, 646, 646, 0, 0, 645, 644, 644, 643, 643, 643, 643, 642, 642, 642, 642,
+    642, 642, 642, 0, 641, 641, 641, 641, 641, 641, 641, 0, 641, 641, 641, 0,
+    641, 0, 0, 0, 0, 640, 639, 639, 638, 638, 638, 638, 637, 637, 637, 637,
+    637, 637, 637, 0, 636, 636, 636, 636, 636, 636, 636, 0, 636, 636, 636, 0,
+    636, 0, 0, 0, 635, 635, 635, 635, 635, 635, 635, 0, 635, 635, 635, 0, 635,
+    0, 0, 0, 635, 635, 635, 0, 635, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    634, 0, 633, 632, 632, 0, 631, 630, 630, 629, 629, 629, 10, 0, 628, 627,
+    627, 626, 626, 626, 626, 625, 625, 625, 625, 625, 625, 625, 0, 0, 624, 623,
+    623, 622, 622, 622, 622, 621, 621, 621, 621, 621, 621, 621, 0, 620, 620,
+    620, 620, 620, 620, 620, 0, 620, 620, 620, 0, 620, 0, 0, 0, 0, 619, 618,
+    618, 617, 617, 617, 617, 616, 616, 616, 616, 616, 616, 616, 0, 615, 615,
+    615, 615, 615, 615, 615, 0, 615, 615, 615, 0, 615, 0, 0, 0, 614, 614, 614,
+    614, 614, 614, 614, 0, 614, 614, 614, 0, 614, 0, 0, 0, 614, 614, 614, 0,
+    614, 0, 0, 0, 614, 0, 0, 0, 0, 0, 0, 0, 0, 613, 612, 612, 611, 611, 611,
+    611, 610, 610, 610, 610, 610, 610, 610, 0, 609, 609, 609, 609, 609, 609,
+    609, 0, 609, 609, 609, 0, 609, 0, 0, 0, 608, 608, 608, 608, 608, 608, 608,
+    0, 608, 608, 608, 0, 608, 0, 0, 0, 608, 608, 608, 0, 608, 0, 0, 0, 608, 0,
+    0, 0, 0, 0, 0, 0, 607, 607, 607, 607, 607, 607, 607, 0, 607, 607, 607, 0,
+    607, 0, 0, 0, 607, 607, 607, 0, 607, 0, 0, 0, 607, 0, 0, 0, 0, 0, 0, 0, 4,
+    4, 4, 0, 4, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 606, 0, 0, 0, 605, 0, 604, 603, 10,
+    0, 0, 0, 602, 0, 601, 600, 600, 0, 599, 598, 598, 597, 597, 597, 9, 0, 0,
+    0, 596, 0, 595, 594, 594, 0, 593, 592, 592, 591, 591, 591, 10, 0, 590, 589,
+    589, 588, 588, 588, 588, 587, 587, 587, 587, 587, 587, 8, 0, 0, 0, 0, 586,
+    0, 585, 584, 584, 0, 583, 582, 582, 581, 581, 581, 10, 0, 580, 579, 579,
+    578, 578, 578, 578, 577, 577, 577, 577, 577, 577, 577, 0, 0, 576, 575, 575,
+    574, 574, 574, 574, 573, 573, 573, 573, 573, 573, 573, 0, 572, 572, 572,
+    572, 572, 572, 572, 0, 572, 572, 572, 0, 7, 0, 0, 0, 0, 0, 0, 571, 0, 570,
+    569, 569, 0, 568, 567, 567, 566, 566, 566, 10, 0, 565, 564, 564, 563, 563,
+    563, 563, 562, 562, 562, 562, 562, 562, 562, 0, 0, 561, 560, 560, 559, 559,
+    559, 559, 558, 558, 558, 558, 558, 558, 558, 0, 557, 557, 557, 557, 557,
+    557, 557, 0, 557, 557, 557, 0, 557, 0, 0, 0, 0, 556, 555, 555, 554, 554,
+    554, 554, 553, 553, 553, 553, 553, 553, 553, 0, 552, 552, 552, 552, 552,
+    552, 552, 0, 552, 552, 552, 0, 552, 0, 0, 0, 551, 551, 551, 551, 551, 551,
+    551, 0, 551, 551, 551, 0, 551, 0, 0, 0, 551, 551, 551, 0, 551, 0, 0, 0, 6,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 550, 0, 549, 548, 548, 0, 547, 546, 546, 545,
+    545, 545, 10, 0, 544, 543, 543, 542, 542, 542, 542, 541, 541, 541, 541,
+    541, 541, 541, 0, 0, 540, 539, 539, 538, 538, 538, 538, 537, 537, 537, 537,
+    537, 537, 537, 0, 536, 536, 536, 536, 536, 536, 536, 0, 536, 536, 536, 0,
+    536, 0, 0, 0, 0, 535, 534, 534, 533, 533, 533, 533, 532, 532, 532, 532,
+    532, 532, 532, 0, 531, 531, 531, 531, 531, 531, 531, 0, 531, 531, 531, 0,
+    531, 0, 0, 0, 530, 530, 530, 530, 530, 530, 530, 0, 530, 530, 530, 0, 530,
+    0, 0, 0, 530, 530, 530, 0, 530, 0, 0, 0, 530, 0, 0, 0, 0, 0, 0, 0, 0, 529,
+    528, 528, 527, 527, 527, 527, 526, 526, 526, 526, 526, 526, 526, 0, 525,
+    525, 525, 525, 525, 525, 525, 0, 525, 525, 525, 0, 525, 0, 0, 0, 524, 524,
+    524, 524, 524, 524, 524, 0, 524, 524, 524, 0, 524, 0, 0, 0, 524, 524, 524,
+    0, 524, 0, 0, 0, 524, 0, 0, 0, 0, 0, 0, 0, 523, 523, 523, 523, 523, 523,
+    523, 0, 523, 523, 523, 0, 523, 0, 0, 0, 523, 523, 523, 0, 523, 0, 0, 0,
+    523, 0, 0, 0, 0, 0, 0, 0, 523, 523, 523, 0, 523, 0, 0, 0, 523, 0, 0, 0, 0,
+    0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 522, 0,
+    521, 520, 520, 0, 519, 518, 518, 517, 517, 517, 10, 0, 516, 515, 515, 514,
+    514, 514, 514, 513, 513, 513, 513, 513, 513, 513, 0, 0, 512, 511, 511, 510,
+    510, 510, 510, 509, 509, 509, 509, 509, 509, 509, 0, 508, 508, 508, 508,
+    508, 508, 508, 0, 508, 508, 508, 0, 508, 0, 0, 0, 0, 507, 506, 506, 505,
+    505, 505, 505, 504, 504, 504, 504, 504, 504, 504, 0, 503, 503, 503, 503,
+    503, 503, 503, 0, 503, 503, 503, 0, 503, 0, 0, 0, 502, 502, 502, 502, 502,
+    502, 502, 0, 502, 502, 502, 0, 502, 0, 0, 0, 502, 502, 502, 0, 502, 0, 0,
+    0, 502, 0, 0, 0, 0, 0, 0, 0, 0, 501, 500, 500, 499, 499, 499, 499, 498,
+    498, 498, 498, 498, 498, 498, 0, 497, 497, 497, 497, 497, 497, 497, 0, 497,
+    497, 497, 0, 497, 0, 0, 0, 496, 496, 496, 496, 496, 496, 496, 0, 496, 496,
+    496, 0, 496, 0, 0, 0, 496, 496, 496, 0, 496, 0, 0, 0, 496, 0, 0, 0, 0, 0,
+    0, 0, 495, 495, 495, 495, 495, 495, 495, 0, 495, 495, 495, 0, 495, 0, 0, 0,
+    495, 495, 495, 0, 495, 0, 0, 0, 495, 0, 0, 0, 0, 0, 0, 0, 495, 495, 495, 0,
+    495, 0, 0, 0, 495, 0, 0, 0, 0, 0, 0, 0, 495, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 494, 493, 493, 492, 492, 492, 492, 491, 491, 491, 491,
+    491, 491, 491, 0, 490, 490, 490, 490, 490, 490, 490, 0, 490, 490, 490, 0,
+    490, 0, 0, 0, 489, 489, 489, 489, 489, 489, 489, 0, 489, 489, 489, 0, 489,
+    0, 0, 0, 489, 489, 489, 0, 489, 0, 0, 0, 489, 0, 0, 0, 0, 0, 0, 0, 488,
+    488, 488, 488, 488, 488, 488, 0, 488, 488, 488, 0, 488, 0, 0, 0, 488, 488,
+    488, 0, 488, 0, 0, 0, 488, 0, 0, 0, 0, 0, 0, 0, 488, 488, 488, 0, 488, 0,
+    0, 0, 488, 0, 0, 0, 0, 0, 0, 0, 488, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 487, 487, 487, 487, 487, 487, 487, 0, 487, 487, 487, 0, 487, 0, 0, 0,
+    487, 487, 487, 0, 487, 0, 0, 0, 487, 0, 0, 0, 0, 0, 0, 0, 487, 487, 487, 0,
+    487, 0, 0, 0, 487, 0, 0, 0, 0, 0, 0, 0, 487, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 3, 3, 3, 0, 3, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 486, 0, 0, 0, 485, 0, 484, 483, 10, 0, 0, 0, 482, 0, 481, 480, 480, 0,
+    479, 478, 478, 477, 477, 477, 9, 0, 0, 0, 476, 0, 475, 474, 474, 0, 473,
+    472, 472, 471, 471, 471, 10, 0, 470, 469, 469, 468, 468, 468, 468, 467,
+    467, 467, 467, 467, 467, 8, 0, 0, 0, 0, 466, 0, 465, 464, 464, 0, 463, 462,
+    462, 461, 461, 461, 10, 0, 460, 459, 459, 458, 458, 458, 458, 457, 457,
+    457, 457, 457, 457, 457, 0, 0, 456, 455, 455, 454, 454, 454, 454, 453, 453,
+    453, 453, 453, 453, 453, 0, 452, 452, 452, 452, 452, 452, 452, 0, 452, 452,
+    452, 0, 7, 0, 0, 0, 0, 0, 0, 451, 0, 450, 449, 449, 0, 448, 447, 447, 446,
+    446, 446, 10, 0, 445, 444, 444, 443, 443, 443, 443, 442, 442, 442, 442,
+    442, 442, 442, 0, 0, 441, 440, 440, 439, 439, 439, 439, 438, 438, 438, 438,
+    438, 438, 438, 0, 437, 437, 437, 437, 437, 437, 437, 0, 437, 437, 437, 0,
+    437, 0, 0, 0, 0, 436, 435, 435, 434, 434, 434, 434, 433, 433, 433, 433,
+    433, 433, 433, 0, 432, 432, 432, 432, 432, 432, 432, 0, 432, 432, 432, 0,
+    432, 0, 0, 0, 431, 431, 431, 431, 431, 431, 431, 0, 431, 431, 431, 0, 431,
+    0, 0, 0, 431, 431, 431, 0, 431, 0, 0, 0, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    430, 0, 429, 428, 428, 0, 427, 426, 426, 425, 425, 425, 10, 0, 424, 423,
+    423, 422, 422, 422, 422, 421, 421, 421, 421, 421, 421, 421, 0, 0, 420, 419,
+    419, 418, 418, 418, 418, 417, 417, 417, 417, 417, 417, 417, 0, 416, 416,
+    416, 416, 416, 416, 416, 0, 416, 416, 416, 0, 416, 0, 0, 0, 0, 415, 414,
+    414, 413, 413, 413, 413, 412, 412, 412, 412, 412, 412, 412, 0, 411, 411,
+    411, 411, 411, 411, 411, 0, 411, 411, 411, 0, 411, 0, 0, 0, 410, 410, 410,
+    410, 410, 410, 410, 0, 410, 410, 410, 0, 410, 0, 0, 0, 410, 410, 410, 0,
+    410, 0, 0, 0, 410, 0, 0, 0, 0, 0, 0, 0, 0, 409, 408, 408, 407, 407, 407,
+    407, 406, 406, 406, 406, 406, 406, 406, 0, 405, 405, 405, 405, 405, 405,
+    405, 0, 405, 405, 405, 0, 405, 0, 0, 0, 404, 404, 404, 404, 404, 404, 404,
+    0, 404, 404, 404, 0, 404, 0, 0, 0, 404, 404, 404, 0, 404, 0, 0, 0, 404, 0,
+    0, 0, 0, 0, 0, 0, 403, 403, 403, 403, 403, 403, 403, 0, 403, 403, 403, 0,
+    403, 0, 0, 0, 403, 403, 403, 0, 403, 0, 0, 0, 403, 0, 0, 0, 0, 0, 0, 0,
+    403, 403, 403, 0, 403, 0, 0, 0, 403, 0, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 402, 0, 401, 400, 400, 0, 399, 398,
+    398, 397, 397, 397, 10, 0, 396, 395, 395, 394, 394, 394, 394, 393, 393,
+    393, 393, 393, 393, 393, 0, 0, 392, 391, 391, 390, 390, 390, 390, 389, 389,
+    389, 389, 389, 389, 389, 0, 388, 388, 388, 388, 388, 388, 388, 0, 388, 388,
+    388, 0, 388, 0, 0, 0, 0, 387, 386, 386, 385, 385, 385, 385, 384, 384, 384,
+    384, 384, 384, 384, 0, 383, 383, 383, 383, 383, 383, 383, 0, 383, 383, 383,
+    0, 383, 0, 0, 0, 382, 382, 382, 382, 382, 382, 382, 0, 382, 382, 382, 0,
+    382, 0, 0, 0, 382, 382, 382, 0, 382, 0, 0, 0, 382, 0, 0, 0, 0, 0, 0, 0, 0,
+    381, 380, 380, 379, 379, 379, 379, 378, 378, 378, 378, 378, 378, 378, 0,
+    377, 377, 377, 377, 377, 377, 377, 0, 377, 377, 377, 0, 377, 0, 0, 0, 376,
+    376, 376, 376, 376, 376, 376, 0, 376, 376, 376, 0, 376, 0, 0, 0, 376, 376,
+    376, 0, 376, 0, 0, 0, 376, 0, 0, 0, 0, 0, 0, 0, 375, 375, 375, 375, 375,
+    375, 375, 0, 375, 375, 375, 0, 375, 0, 0, 0, 375, 375, 375, 0, 375, 0, 0,
+    0, 375, 0, 0, 0, 0, 0, 0, 0, 375, 375, 375, 0, 375, 0, 0, 0, 375, 0, 0, 0,
+    0, 0, 0, 0, 375, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 374, 373,
+    373, 372, 372, 372, 372, 371, 371, 371, 371, 371, 371, 371, 0, 370, 370,
+    370, 370, 370, 370, 370, 0, 370, 370, 370, 0, 370, 0, 0, 0, 369, 369, 369,
+    369, 369, 369, 369, 0, 369, 369, 369, 0, 369, 0, 0, 0, 369, 369, 369, 0,
+    369, 0, 0, 0, 369, 0, 0, 0, 0, 0, 0, 0, 368, 368, 368, 368, 368, 368, 368,
+    0, 368, 368, 368, 0, 368, 0, 0, 0, 368, 368, 368, 0, 368, 0, 0, 0, 368, 0,
+    0, 0, 0, 0, 0, 0, 368, 368, 368, 0, 368, 0, 0, 0, 368, 0, 0, 0, 0, 0, 0, 0,
+    368, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 367, 367, 367, 367, 367,
+    367, 367, 0, 367, 367, 367, 0, 367, 0, 0, 0, 367, 367, 367, 0, 367, 0, 0,
+    0, 367, 0, 0, 0, 0, 0, 0, 0, 367, 367, 367, 0, 367, 0, 0, 0, 367, 0, 0, 0,
+    0, 0, 0, 0, 367, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 367, 367,
+    367, 0, 367, 0, 0, 0, 367, 0, 0, 0, 0, 0, 0, 0, 367, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 366, 0, 365, 364,
+    364, 0, 363, 362, 362, 361, 361, 361, 10, 0, 360, 359, 359, 358, 358, 358,
+    358, 357, 357, 357, 357, 357, 357, 357, 0, 0, 356, 355, 355, 354, 354, 354,
+    354, 353, 353, 353, 353, 353, 353, 353, 0, 352, 352, 352, 352, 352, 352,
+    352, 0, 352, 352, 352, 0, 352, 0, 0, 0, 0, 351, 350, 350, 349, 349, 349,
+    349, 348, 348, 348, 348, 348, 348, 348, 0, 347, 347, 347, 347, 347, 347,
+    347, 0, 347, 347, 347, 0, 347, 0, 0, 0, 346, 346, 346, 346, 346, 346, 346,
+    0, 346, 346, 346, 0, 346, 0, 0, 0, 346, 346, 346, 0, 346, 0, 0, 0, 346, 0,
+    0, 0, 0, 0, 0, 0, 0, 345, 344, 344, 343, 343, 343, 343, 342, 342, 342, 342,
+    342, 342, 342, 0, 341, 341, 341, 341, 341, 341, 341, 0, 341, 341, 341, 0,
+    341, 0, 0, 0, 340, 340, 340, 340, 340, 340, 340, 0, 340, 340, 340, 0, 340,
+    0, 0, 0, 340, 340, 340, 0, 340, 0, 0, 0, 340, 0, 0, 0, 0, 0, 0, 0, 339,
+    339, 339, 339, 339, 339, 339, 0, 339, 339, 339, 0, 339, 0, 0, 0, 339, 339,
+    339, 0, 339, 0, 0, 0, 339, 0, 0, 0, 0, 0, 0, 0, 339, 339, 339, 0, 339, 0,
+    0, 0, 339, 0, 0, 0, 0, 0, 0, 0, 339, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 338, 337, 337, 336, 336, 336, 336, 335, 335, 335, 335, 335, 335,
+    335, 0, 334, 334, 334, 334, 334, 334, 334, 0, 334, 334, 334, 0, 334, 0, 0,
+    0, 333, 333, 333, 333, 333, 333, 333, 0, 333, 333, 333, 0, 333, 0, 0, 0,
+    333, 333, 333, 0, 333, 0, 0, 0, 333, 0, 0, 0, 0, 0, 0, 0, 332, 332, 332,
+    332, 332, 332, 332, 0, 332, 332, 332, 0, 332, 0, 0, 0, 332, 332, 332, 0,
+    332, 0, 0, 0, 332, 0, 0, 0, 0, 0, 0, 0, 332, 332, 332, 0, 332, 0, 0, 0,
+    332, 0, 0, 0, 0, 0, 0, 0, 332, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    331, 331, 331, 331, 331, 331, 331, 0, 331, 331, 331, 0, 331, 0, 0, 0, 331,
+    331, 331, 0, 331, 0, 0, 0, 331, 0, 0, 0, 0, 0, 0, 0, 331, 331, 331, 0, 331,
+    0, 0, 0, 331, 0, 0, 0, 0, 0, 0, 0, 331, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 331, 331, 331, 0, 331, 0, 0, 0, 331, 0, 0, 0, 0, 0, 0, 0, 331, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 331, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 330,
+    329, 329, 328, 328, 328, 328, 327, 327, 327, 327, 327, 327, 327, 0, 326,
+    326, 326, 326, 326, 326, 326, 0, 326, 326, 326, 0, 326, 0, 0, 0, 325, 325,
+    325, 325, 325, 325, 325, 0, 325, 325, 325, 0, 325, 0, 0, 0, 325, 325, 325,
+    0, 325, 0, 0, 0, 325, 0, 0, 0, 0, 0, 0, 0, 324, 324, 324, 324, 324, 324,
+    324, 0, 324, 324, 324, 0, 324, 0, 0, 0, 324, 324, 324, 0, 324, 0, 0, 0,
+    324, 0, 0, 0, 0, 0, 0, 0, 324, 324, 324, 0, 324, 0, 0, 0, 324, 0, 0, 0, 0,
+    0, 0, 0, 324, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 323, 323, 323,
+    323, 323, 323, 323, 0, 323, 323, 323, 0, 323, 0, 0, 0, 323, 323, 323, 0,
+    323, 0, 0, 0, 323, 0, 0, 0, 0, 0, 0, 0, 323, 323, 323, 0, 323, 0, 0, 0,
+    323, 0, 0, 0, 0, 0, 0, 0, 323, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    323, 323, 323, 0, 323, 0, 0, 0, 323, 0, 0, 0, 0, 0, 0, 0, 323, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 323, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1,
+    1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0,
+    0, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1,
+    0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+};
+
+static const uint16_t FIVE_UNIQUE_TABLE[8192] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 1608, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7462,
+    0, 0, 0, 0, 0, 0, 0, 7461, 0, 0, 0, 7460, 0, 7459, 1607, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7458, 0, 0, 0, 0, 0, 0, 0, 7457, 0, 0, 0,
+    7456, 0, 7455, 7454, 0, 0, 0, 0, 0, 0, 0, 0, 7453, 0, 0, 0, 7452, 0, 7451,
+    7450, 0, 0, 0, 0, 7449, 0, 7448, 7447, 0, 0, 7446, 7445, 0, 1606, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7444, 0, 0, 0, 0, 0, 0, 0,
+    7443, 0, 0, 0, 7442, 0, 7441, 7440, 0, 0, 0, 0, 0, 0, 0, 0, 7439, 0, 0, 0,
+    7438, 0, 7437, 7436, 0, 0, 0, 0, 7435, 0, 7434, 7433, 0, 0, 7432, 7431, 0,
+    7430, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7429, 0, 0, 0, 7428, 0, 7427, 7426, 0,
+    0, 0, 0, 7425, 0, 7424, 7423, 0, 0, 7422, 7421, 0, 7420, 0, 0, 0, 0, 0, 0,
+    7419, 0, 7418, 7417, 0, 0, 7416, 7415, 0, 7414, 0, 0, 0, 0, 7413, 7412, 0,
+    7411, 0, 0, 0, 1605, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 7410, 0, 0, 0, 0, 0, 0, 0, 7409, 0, 0, 0, 7408, 0, 7407, 7406,
+    0, 0, 0, 0, 0, 0, 0, 0, 7405, 0, 0, 0, 7404, 0, 7403, 7402, 0, 0, 0, 0,
+    7401, 0, 7400, 7399, 0, 0, 7398, 7397, 0, 7396, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 7395, 0, 0, 0, 7394, 0, 7393, 7392, 0, 0, 0, 0, 7391, 0, 7390, 7389, 0,
+    0, 7388, 7387, 0, 7386, 0, 0, 0, 0, 0, 0, 7385, 0, 7384, 7383, 0, 0, 7382,
+    7381, 0, 7380, 0, 0, 0, 0, 7379, 7378, 0, 7377, 0, 0, 0, 7376, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7375, 0, 0, 0, 7374, 0, 7373, 7372, 0, 0, 0,
+    0, 7371, 0, 7370, 7369, 0, 0, 7368, 7367, 0, 7366, 0, 0, 0, 0, 0, 0, 7365,
+    0, 7364, 7363, 0, 0, 7362, 7361, 0, 7360, 0, 0, 0, 0, 7359, 7358, 0, 7357,
+    0, 0, 0, 7356, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7355, 0, 7354, 7353, 0, 0,
+    7352, 7351, 0, 7350, 0, 0, 0, 0, 7349, 7348, 0, 7347, 0, 0, 0, 7346, 0, 0,
+    0, 0, 0, 0, 0, 0, 7345, 7344, 0, 7343, 0, 0, 0, 7342, 0, 0, 0, 0, 0, 0, 0,
+    1604, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 7341, 0, 0, 0, 0, 0, 0, 0, 7340, 0, 0, 0, 7339, 0,
+    7338, 7337, 0, 0, 0, 0, 0, 0, 0, 0, 7336, 0, 0, 0, 7335, 0, 7334, 7333, 0,
+    0, 0, 0, 7332, 0, 7331, 7330, 0, 0, 7329, 7328, 0, 7327, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 7326, 0, 0, 0, 7325, 0, 7324, 7323, 0, 0, 0, 0, 7322, 0, 7321,
+    7320, 0, 0, 7319, 7318, 0, 7317, 0, 0, 0, 0, 0, 0, 7316, 0, 7315, 7314, 0,
+    0, 7313, 7312, 0, 7311, 0, 0, 0, 0, 7310, 7309, 0, 7308, 0, 0, 0, 7307, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7306, 0, 0, 0, 7305, 0, 7304, 7303,
+    0, 0, 0, 0, 7302, 0, 7301, 7300, 0, 0, 7299, 7298, 0, 7297, 0, 0, 0, 0, 0,
+    0, 7296, 0, 7295, 7294, 0, 0, 7293, 7292, 0, 7291, 0, 0, 0, 0, 7290, 7289,
+    0, 7288, 0, 0, 0, 7287, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7286, 0, 7285, 7284,
+    0, 0, 7283, 7282, 0, 7281, 0, 0, 0, 0, 7280, 7279, 0, 7278, 0, 0, 0, 7277,
+    0, 0, 0, 0, 0, 0, 0, 0, 7276, 7275, 0, 7274, 0, 0, 0, 7273, 0, 0, 0, 0, 0,
+    0, 0, 7272, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 7271, 0, 0, 0, 7270, 0, 7269, 7268, 0, 0, 0, 0, 7267, 0, 7266, 7265, 0,
+    0, 7264, 7263, 0, 7262, 0, 0, 0, 0, 0, 0, 7261, 0, 7260, 7259, 0, 0, 7258,
+    7257, 0, 7256, 0, 0, 0, 0, 7255, 7254, 0, 7253, 0, 0, 0, 7252, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 7251, 0, 7250, 7249, 0, 0, 7248, 7247, 0, 7246, 0, 0, 0,
+    0, 7245, 7244, 0, 7243, 0, 0, 0, 7242, 0, 0, 0, 0, 0, 0, 0, 0, 7241, 7240,
+    0, 7239, 0, 0, 0, 7238, 0, 0, 0, 0, 0, 0, 0, 7237, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7236, 0, 7235, 7234, 0, 0, 7233, 7232, 0,
+    7231, 0, 0, 0, 0, 7230, 7229, 0, 7228, 0, 0, 0, 7227, 0, 0, 0, 0, 0, 0, 0,
+    0, 7226, 7225, 0, 7224, 0, 0, 0, 7223, 0, 0, 0, 0, 0, 0, 0, 7222, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7221, 7220, 0, 7219, 0, 0, 0, 7218,
+    0, 0, 0, 0, 0, 0, 0, 7217, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1603, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7216,
+    0, 0, 0, 0, 0, 0, 0, 7215, 0, 0, 0, 7214, 0, 7213, 7212, 0, 0, 0, 0, 0, 0,
+    0, 0, 7211, 0, 0, 0, 7210, 0, 7209, 7208, 0, 0, 0, 0, 7207, 0, 7206, 7205,
+    0, 0, 7204, 7203, 0, 7202, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7201, 0, 0, 0,
+    7200, 0, 7199, 7198, 0, 0, 0, 0, 7197, 0, 7196, 7195, 0, 0, 7194, 7193, 0,
+    7192, 0, 0, 0, 0, 0, 0, 7191, 0, 7190, 7189, 0, 0, 7188, 7187, 0, 7186, 0,
+    0, 0, 0, 7185, 7184, 0, 7183, 0, 0, 0, 7182, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 7181, 0, 0, 0, 7180, 0, 7179, 7178, 0, 0, 0, 0, 7177, 0, 7176,
+    7175, 0, 0, 7174, 7173, 0, 7172, 0, 0, 0, 0, 0, 0, 7171, 0, 7170, 7169, 0,
+    0, 7168, 7167, 0, 7166, 0, 0, 0, 0, 7165, 7164, 0, 7163, 0, 0, 0, 7162, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 7161, 0, 7160, 7159, 0, 0, 7158, 7157, 0, 7156,
+    0, 0, 0, 0, 7155, 7154, 0, 7153, 0, 0, 0, 7152, 0, 0, 0, 0, 0, 0, 0, 0,
+    7151, 7150, 0, 7149, 0, 0, 0, 7148, 0, 0, 0, 0, 0, 0, 0, 7147, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7146, 0, 0, 0, 7145,
+    0, 7144, 7143, 0, 0, 0, 0, 7142, 0, 7141, 7140, 0, 0, 7139, 7138, 0, 7137,
+    0, 0, 0, 0, 0, 0, 7136, 0, 7135, 7134, 0, 0, 7133, 7132, 0, 7131, 0, 0, 0,
+    0, 7130, 7129, 0, 7128, 0, 0, 0, 7127, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7126,
+    0, 7125, 7124, 0, 0, 7123, 7122, 0, 7121, 0, 0, 0, 0, 7120, 7119, 0, 7118,
+    0, 0, 0, 7117, 0, 0, 0, 0, 0, 0, 0, 0, 7116, 7115, 0, 7114, 0, 0, 0, 7113,
+    0, 0, 0, 0, 0, 0, 0, 7112, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 7111, 0, 7110, 7109, 0, 0, 7108, 7107, 0, 7106, 0, 0, 0, 0, 7105,
+    7104, 0, 7103, 0, 0, 0, 7102, 0, 0, 0, 0, 0, 0, 0, 0, 7101, 7100, 0, 7099,
+    0, 0, 0, 7098, 0, 0, 0, 0, 0, 0, 0, 7097, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 7096, 7095, 0, 7094, 0, 0, 0, 7093, 0, 0, 0, 0, 0, 0, 0,
+    7092, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7091, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 7090, 0, 0, 0, 7089, 0, 7088, 7087, 0, 0, 0, 0, 7086,
+    0, 7085, 7084, 0, 0, 7083, 7082, 0, 7081, 0, 0, 0, 0, 0, 0, 7080, 0, 7079,
+    7078, 0, 0, 7077, 7076, 0, 7075, 0, 0, 0, 0, 7074, 7073, 0, 7072, 0, 0, 0,
+    7071, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7070, 0, 7069, 7068, 0, 0, 7067, 7066,
+    0, 7065, 0, 0, 0, 0, 7064, 7063, 0, 7062, 0, 0, 0, 7061, 0, 0, 0, 0, 0, 0,
+    0, 0, 7060, 7059, 0, 7058, 0, 0, 0, 7057, 0, 0, 0, 0, 0, 0, 0, 7056, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7055, 0, 7054, 7053, 0, 0,
+    7052, 7051, 0, 7050, 0, 0, 0, 0, 7049, 7048, 0, 7047, 0, 0, 0, 7046, 0, 0,
+    0, 0, 0, 0, 0, 0, 7045, 7044, 0, 7043, 0, 0, 0, 7042, 0, 0, 0, 0, 0, 0, 0,
+    7041, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7040, 7039, 0, 7038,
+    0, 0, 0, 7037, 0, 0, 0, 0, 0, 0, 0, 7036, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 7035, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7034, 0, 7033, 7032, 0, 0,
+    7031, 7030, 0, 7029, 0, 0, 0, 0, 7028, 7027, 0, 7026, 0, 0, 0, 7025, 0, 0,
+    0, 0, 0, 0, 0, 0, 7024, 7023, 0, 7022, 0, 0, 0, 7021, 0, 0, 0, 0, 0, 0, 0,
+    7020, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7019, 7018, 0, 7017,
+    0, 0, 0, 7016, 0, 0, 0, 0, 0, 0, 0, 7015, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 7014, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7013, 7012, 0, 7011, 0, 0, 0, 7010,
+    0, 0, 0, 0, 0, 0, 0, 7009, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    7008, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 1602, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7007, 0, 0, 0, 0, 0, 0, 0, 7006, 0,
+    0, 0, 7005, 0, 7004, 7003, 0, 0, 0, 0, 0, 0, 0, 0, 7002, 0, 0, 0, 7001, 0,
+    7000, 6999, 0, 0, 0, 0, 6998, 0, 6997, 6996, 0, 0, 6995, 6994, 0, 6993, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 6992, 0, 0, 0, 6991, 0, 6990, 6989, 0, 0, 0, 0,
+    6988, 0, 6987, 6986, 0, 0, 6985, 6984, 0, 6983, 0, 0, 0, 0, 0, 0, 6982, 0,
+    6981, 6980, 0, 0, 6979, 6978, 0, 6977, 0, 0, 0, 0, 6976, 6975, 0, 6974, 0,
+    0, 0, 6973, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6972, 0, 0, 0, 6971,
+    0, 6970, 6969, 0, 0, 0, 0, 6968, 0, 6967, 6966, 0, 0, 6965, 6964, 0, 6963,
+    0, 0, 0, 0, 0, 0, 6962, 0, 6961, 6960, 0, 0, 6959, 6958, 0, 6957, 0, 0, 0,
+    0, 6956, 6955, 0, 6954, 0, 0, 0, 6953, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6952,
+    0, 6951, 6950, 0, 0, 6949, 6948, 0, 6947, 0, 0, 0, 0, 6946, 6945, 0, 6944,
+    0, 0, 0, 6943, 0, 0, 0, 0, 0, 0, 0, 0, 6942, 6941, 0, 6940, 0, 0, 0, 6939,
+    0, 0, 0, 0, 0, 0, 0, 6938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6937, 0, 0, 0, 6936, 0, 6935, 6934, 0, 0, 0, 0, 6933, 0,
+    6932, 6931, 0, 0, 6930, 6929, 0, 6928, 0, 0, 0, 0, 0, 0, 6927, 0, 6926,
+    6925, 0, 0, 6924, 6923, 0, 6922, 0, 0, 0, 0, 6921, 6920, 0, 6919, 0, 0, 0,
+    6918, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6917, 0, 6916, 6915, 0, 0, 6914, 6913,
+    0, 6912, 0, 0, 0, 0, 6911, 6910, 0, 6909, 0, 0, 0, 6908, 0, 0, 0, 0, 0, 0,
+    0, 0, 6907, 6906, 0, 6905, 0, 0, 0, 6904, 0, 0, 0, 0, 0, 0, 0, 6903, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6902, 0, 6901, 6900, 0, 0,
+    6899, 6898, 0, 6897, 0, 0, 0, 0, 6896, 6895, 0, 6894, 0, 0, 0, 6893, 0, 0,
+    0, 0, 0, 0, 0, 0, 6892, 6891, 0, 6890, 0, 0, 0, 6889, 0, 0, 0, 0, 0, 0, 0,
+    6888, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6887, 6886, 0, 6885,
+    0, 0, 0, 6884, 0, 0, 0, 0, 0, 0, 0, 6883, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6882, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6881, 0, 0, 0,
+    6880, 0, 6879, 6878, 0, 0, 0, 0, 6877, 0, 6876, 6875, 0, 0, 6874, 6873, 0,
+    6872, 0, 0, 0, 0, 0, 0, 6871, 0, 6870, 6869, 0, 0, 6868, 6867, 0, 6866, 0,
+    0, 0, 0, 6865, 6864, 0, 6863, 0, 0, 0, 6862, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6861, 0, 6860, 6859, 0, 0, 6858, 6857, 0, 6856, 0, 0, 0, 0, 6855, 6854, 0,
+    6853, 0, 0, 0, 6852, 0, 0, 0, 0, 0, 0, 0, 0, 6851, 6850, 0, 6849, 0, 0, 0,
+    6848, 0, 0, 0, 0, 0, 0, 0, 6847, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6846, 0, 6845, 6844, 0, 0, 6843, 6842, 0, 6841, 0, 0, 0, 0,
+    6840, 6839, 0, 6838, 0, 0, 0, 6837, 0, 0, 0, 0, 0, 0, 0, 0, 6836, 6835, 0,
+    6834, 0, 0, 0, 6833, 0, 0, 0, 0, 0, 0, 0, 6832, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 6831, 6830, 0, 6829, 0, 0, 0, 6828, 0, 0, 0, 0, 0, 0,
+    0, 6827, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6826, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6825, 0, 6824, 6823, 0, 0, 6822, 6821, 0, 6820, 0, 0, 0, 0,
+    6819, 6818, 0, 6817, 0, 0, 0, 6816, 0, 0, 0, 0, 0, 0, 0, 0, 6815, 6814, 0,
+    6813, 0, 0, 0, 6812, 0, 0, 0, 0, 0, 0, 0, 6811, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 6810, 6809, 0, 6808, 0, 0, 0, 6807, 0, 0, 0, 0, 0, 0,
+    0, 6806, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6805, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6804, 6803, 0, 6802, 0, 0, 0, 6801, 0, 0, 0, 0, 0, 0, 0, 6800, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6798, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6797, 0, 0, 0, 6796,
+    0, 6795, 6794, 0, 0, 0, 0, 6793, 0, 6792, 6791, 0, 0, 6790, 6789, 0, 6788,
+    0, 0, 0, 0, 0, 0, 6787, 0, 6786, 6785, 0, 0, 6784, 6783, 0, 6782, 0, 0, 0,
+    0, 6781, 6780, 0, 6779, 0, 0, 0, 6778, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6777,
+    0, 6776, 6775, 0, 0, 6774, 6773, 0, 6772, 0, 0, 0, 0, 6771, 6770, 0, 6769,
+    0, 0, 0, 6768, 0, 0, 0, 0, 0, 0, 0, 0, 6767, 6766, 0, 6765, 0, 0, 0, 6764,
+    0, 0, 0, 0, 0, 0, 0, 6763, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6762, 0, 6761, 6760, 0, 0, 6759, 6758, 0, 6757, 0, 0, 0, 0, 6756,
+    6755, 0, 6754, 0, 0, 0, 6753, 0, 0, 0, 0, 0, 0, 0, 0, 6752, 6751, 0, 6750,
+    0, 0, 0, 6749, 0, 0, 0, 0, 0, 0, 0, 6748, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6747, 6746, 0, 6745, 0, 0, 0, 6744, 0, 0, 0, 0, 0, 0, 0,
+    6743, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6742, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 6741, 0, 6740, 6739, 0, 0, 6738, 6737, 0, 6736, 0, 0, 0, 0, 6735,
+    6734, 0, 6733, 0, 0, 0, 6732, 0, 0, 0, 0, 0, 0, 0, 0, 6731, 6730, 0, 6729,
+    0, 0, 0, 6728, 0, 0, 0, 0, 0, 0, 0, 6727, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6726, 6725, 0, 6724, 0, 0, 0, 6723, 0, 0, 0, 0, 0, 0, 0,
+    6722, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6721, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 6720, 6719, 0, 6718, 0, 0, 0, 6717, 0, 0, 0, 0, 0, 0, 0, 6716, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6715, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6714, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6713, 0, 6712, 6711, 0, 0, 6710,
+    6709, 0, 6708, 0, 0, 0, 0, 6707, 6706, 0, 6705, 0, 0, 0, 6704, 0, 0, 0, 0,
+    0, 0, 0, 0, 6703, 6702, 0, 6701, 0, 0, 0, 6700, 0, 0, 0, 0, 0, 0, 0, 6699,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6698, 6697, 0, 6696, 0, 0,
+    0, 6695, 0, 0, 0, 0, 0, 0, 0, 6694, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6693, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6692, 6691, 0, 6690, 0, 0, 0, 6689, 0, 0,
+    0, 0, 0, 0, 0, 6688, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6687, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6686, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6685, 6684,
+    0, 6683, 0, 0, 0, 6682, 0, 0, 0, 0, 0, 0, 0, 6681, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 6680, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6679, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 1601, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1609, 0, 0, 0, 0, 0, 0, 0, 6678, 0, 0, 0, 6677, 0, 6676, 6675, 0, 0, 0, 0,
+    0, 0, 0, 0, 6674, 0, 0, 0, 6673, 0, 6672, 6671, 0, 0, 0, 0, 6670, 0, 6669,
+    6668, 0, 0, 6667, 6666, 0, 6665, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6664, 0, 0,
+    0, 6663, 0, 6662, 6661, 0, 0, 0, 0, 6660, 0, 6659, 6658, 0, 0, 6657, 6656,
+    0, 6655, 0, 0, 0, 0, 0, 0, 6654, 0, 6653, 6652, 0, 0, 6651, 6650, 0, 6649,
+    0, 0, 0, 0, 6648, 6647, 0, 6646, 0, 0, 0, 6645, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6644, 0, 0, 0, 6643, 0, 6642, 6641, 0, 0, 0, 0, 6640, 0,
+    6639, 6638, 0, 0, 6637, 6636, 0, 6635, 0, 0, 0, 0, 0, 0, 6634, 0, 6633,
+    6632, 0, 0, 6631, 6630, 0, 6629, 0, 0, 0, 0, 6628, 6627, 0, 6626, 0, 0, 0,
+    6625, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6624, 0, 6623, 6622, 0, 0, 6621, 6620,
+    0, 6619, 0, 0, 0, 0, 6618, 6617, 0, 6616, 0, 0, 0, 6615, 0, 0, 0, 0, 0, 0,
+    0, 0, 6614, 6613, 0, 6612, 0, 0, 0, 6611, 0, 0, 0, 0, 0, 0, 0, 6610, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6609, 0, 0, 0,
+    6608, 0, 6607, 6606, 0, 0, 0, 0, 6605, 0, 6604, 6603, 0, 0, 6602, 6601, 0,
+    6600, 0, 0, 0, 0, 0, 0, 6599, 0, 6598, 6597, 0, 0, 6596, 6595, 0, 6594, 0,
+    0, 0, 0, 6593, 6592, 0, 6591, 0, 0, 0, 6590, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6589, 0, 6588, 6587, 0, 0, 6586, 6585, 0, 6584, 0, 0, 0, 0, 6583, 6582, 0,
+    6581, 0, 0, 0, 6580, 0, 0, 0, 0, 0, 0, 0, 0, 6579, 6578, 0, 6577, 0, 0, 0,
+    6576, 0, 0, 0, 0, 0, 0, 0, 6575, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6574, 0, 6573, 6572, 0, 0, 6571, 6570, 0, 6569, 0, 0, 0, 0,
+    6568, 6567, 0, 6566, 0, 0, 0, 6565, 0, 0, 0, 0, 0, 0, 0, 0, 6564, 6563, 0,
+    6562, 0, 0, 0, 6561, 0, 0, 0, 0, 0, 0, 0, 6560, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 6559, 6558, 0, 6557, 0, 0, 0, 6556, 0, 0, 0, 0, 0, 0,
+    0, 6555, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6554, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 6553, 0, 0, 0, 6552, 0, 6551, 6550, 0, 0, 0, 0,
+    6549, 0, 6548, 6547, 0, 0, 6546, 6545, 0, 6544, 0, 0, 0, 0, 0, 0, 6543, 0,
+    6542, 6541, 0, 0, 6540, 6539, 0, 6538, 0, 0, 0, 0, 6537, 6536, 0, 6535, 0,
+    0, 0, 6534, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6533, 0, 6532, 6531, 0, 0, 6530,
+    6529, 0, 6528, 0, 0, 0, 0, 6527, 6526, 0, 6525, 0, 0, 0, 6524, 0, 0, 0, 0,
+    0, 0, 0, 0, 6523, 6522, 0, 6521, 0, 0, 0, 6520, 0, 0, 0, 0, 0, 0, 0, 6519,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6518, 0, 6517, 6516,
+    0, 0, 6515, 6514, 0, 6513, 0, 0, 0, 0, 6512, 6511, 0, 6510, 0, 0, 0, 6509,
+    0, 0, 0, 0, 0, 0, 0, 0, 6508, 6507, 0, 6506, 0, 0, 0, 6505, 0, 0, 0, 0, 0,
+    0, 0, 6504, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6503, 6502, 0,
+    6501, 0, 0, 0, 6500, 0, 0, 0, 0, 0, 0, 0, 6499, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6498, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6497, 0, 6496, 6495, 0,
+    0, 6494, 6493, 0, 6492, 0, 0, 0, 0, 6491, 6490, 0, 6489, 0, 0, 0, 6488, 0,
+    0, 0, 0, 0, 0, 0, 0, 6487, 6486, 0, 6485, 0, 0, 0, 6484, 0, 0, 0, 0, 0, 0,
+    0, 6483, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6482, 6481, 0,
+    6480, 0, 0, 0, 6479, 0, 0, 0, 0, 0, 0, 0, 6478, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6477, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6476, 6475, 0, 6474, 0, 0, 0,
+    6473, 0, 0, 0, 0, 0, 0, 0, 6472, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 6471, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 6470, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6469, 0, 0, 0, 6468, 0, 6467, 6466, 0, 0, 0, 0, 6465, 0,
+    6464, 6463, 0, 0, 6462, 6461, 0, 6460, 0, 0, 0, 0, 0, 0, 6459, 0, 6458,
+    6457, 0, 0, 6456, 6455, 0, 6454, 0, 0, 0, 0, 6453, 6452, 0, 6451, 0, 0, 0,
+    6450, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6449, 0, 6448, 6447, 0, 0, 6446, 6445,
+    0, 6444, 0, 0, 0, 0, 6443, 6442, 0, 6441, 0, 0, 0, 6440, 0, 0, 0, 0, 0, 0,
+    0, 0, 6439, 6438, 0, 6437, 0, 0, 0, 6436, 0, 0, 0, 0, 0, 0, 0, 6435, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6434, 0, 6433, 6432, 0, 0,
+    6431, 6430, 0, 6429, 0, 0, 0, 0, 6428, 6427, 0, 6426, 0, 0, 0, 6425, 0, 0,
+    0, 0, 0, 0, 0, 0, 6424, 6423, 0, 6422, 0, 0, 0, 6421, 0, 0, 0, 0, 0, 0, 0,
+    6420, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6419, 6418, 0, 6417,
+    0, 0, 0, 6416, 0, 0, 0, 0, 0, 0, 0, 6415, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6414, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6413, 0, 6412, 6411, 0, 0,
+    6410, 6409, 0, 6408, 0, 0, 0, 0, 6407, 6406, 0, 6405, 0, 0, 0, 6404, 0, 0,
+    0, 0, 0, 0, 0, 0, 6403, 6402, 0, 6401, 0, 0, 0, 6400, 0, 0, 0, 0, 0, 0, 0,
+    6399, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6398, 6397, 0, 6396,
+    0, 0, 0, 6395, 0, 0, 0, 0, 0, 0, 0, 6394, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6393, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6392, 6391, 0, 6390, 0, 0, 0, 6389,
+    0, 0, 0, 0, 0, 0, 0, 6388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6387, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 6386, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 6385, 0, 6384, 6383, 0, 0, 6382, 6381, 0, 6380, 0, 0, 0, 0, 6379, 6378,
+    0, 6377, 0, 0, 0, 6376, 0, 0, 0, 0, 0, 0, 0, 0, 6375, 6374, 0, 6373, 0, 0,
+    0, 6372, 0, 0, 0, 0, 0, 0, 0, 6371, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 6370, 6369, 0, 6368, 0, 0, 0, 6367, 0, 0, 0, 0, 0, 0, 0, 6366, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6365, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6364,
+    6363, 0, 6362, 0, 0, 0, 6361, 0, 0, 0, 0, 0, 0, 0, 6360, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 6359, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6358, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 6357, 6356, 0, 6355, 0, 0, 0, 6354, 0, 0, 0, 0, 0,
+    0, 0, 6353, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6352, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6351, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6350, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 6349, 0, 0, 0, 6348, 0, 6347, 6346, 0, 0, 0, 0, 6345, 0, 6344,
+    6343, 0, 0, 6342, 6341, 0, 6340, 0, 0, 0, 0, 0, 0, 6339, 0, 6338, 6337, 0,
+    0, 6336, 6335, 0, 6334, 0, 0, 0, 0, 6333, 6332, 0, 6331, 0, 0, 0, 6330, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 6329, 0, 6328, 6327, 0, 0, 6326, 6325, 0, 6324,
+    0, 0, 0, 0, 6323, 6322, 0, 6321, 0, 0, 0, 6320, 0, 0, 0, 0, 0, 0, 0, 0,
+    6319, 6318, 0, 6317, 0, 0, 0, 6316, 0, 0, 0, 0, 0, 0, 0, 6315, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6314, 0, 6313, 6312, 0, 0, 6311,
+    6310, 0, 6309, 0, 0, 0, 0, 6308, 6307, 0, 6306, 0, 0, 0, 6305, 0, 0, 0, 0,
+    0, 0, 0, 0, 6304, 6303, 0, 6302, 0, 0, 0, 6301, 0, 0, 0, 0, 0, 0, 0, 6300,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6299, 6298, 0, 6297, 0, 0,
+    0, 6296, 0, 0, 0, 0, 0, 0, 0, 6295, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6294, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6293, 0, 6292, 6291, 0, 0, 6290,
+    6289, 0, 6288, 0, 0, 0, 0, 6287, 6286, 0, 6285, 0, 0, 0, 6284, 0, 0, 0, 0,
+    0, 0, 0, 0, 6283, 6282, 0, 6281, 0, 0, 0, 6280, 0, 0, 0, 0, 0, 0, 0, 6279,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6278, 6277, 0, 6276, 0, 0,
+    0, 6275, 0, 0, 0, 0, 0, 0, 0, 6274, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 6273, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6272, 6271, 0, 6270, 0, 0, 0, 6269, 0, 0,
+    0, 0, 0, 0, 0, 6268, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6267, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6266, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6265,
+    0, 6264, 6263, 0, 0, 6262, 6261, 0, 6260, 0, 0, 0, 0, 6259, 6258, 0, 6257,
+    0, 0, 0, 6256, 0, 0, 0, 0, 0, 0, 0, 0, 6255, 6254, 0, 6253, 0, 0, 0, 6252,
+    0, 0, 0, 0, 0, 0, 0, 6251, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6250, 6249, 0, 6248, 0, 0, 0, 6247, 0, 0, 0, 0, 0, 0, 0, 6246, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6245, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6244, 6243, 0,
+    6242, 0, 0, 0, 6241, 0, 0, 0, 0, 0, 0, 0, 6240, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6239, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6238, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6237, 6236, 0, 6235, 0, 0, 0, 6234, 0, 0, 0, 0, 0, 0, 0,
+    6233, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6232, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6231, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6230, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6229, 0,
+    6228, 6227, 0, 0, 6226, 6225, 0, 6224, 0, 0, 0, 0, 6223, 6222, 0, 6221, 0,
+    0, 0, 6220, 0, 0, 0, 0, 0, 0, 0, 0, 6219, 6218, 0, 6217, 0, 0, 0, 6216, 0,
+    0, 0, 0, 0, 0, 0, 6215, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6214, 6213, 0, 6212, 0, 0, 0, 6211, 0, 0, 0, 0, 0, 0, 0, 6210, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6209, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6208, 6207, 0,
+    6206, 0, 0, 0, 6205, 0, 0, 0, 0, 0, 0, 0, 6204, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6203, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6202, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6201, 6200, 0, 6199, 0, 0, 0, 6198, 0, 0, 0, 0, 0, 0, 0,
+    6197, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6196, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6195, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6194, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6193, 6192, 0,
+    6191, 0, 0, 0, 6190, 0, 0, 0, 0, 0, 0, 0, 6189, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 6188, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6187, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 6186, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 1600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+};
+
+/* offsets[rank][cards left][count], flattened */
+static const uint16_t HISTOGRAM_OFFSETS[390] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 2, 0, 0, 0, 1, 2, 3, 0,
+    0, 1, 2, 3, 4, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 3, 5, 0, 0,
+    0, 4, 7, 9, 0, 0, 5, 9, 12, 14, 0, 4, 9, 13, 16, 0, 0, 0, 0, 0, 0, 3, 0, 0,
+    0, 0, 6, 9, 0, 0, 0, 10, 16, 19, 0, 0, 15, 25, 31, 34, 0, 18, 33, 43, 49,
+    0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 10, 14, 0, 0, 0, 20, 30, 34, 0, 0, 35, 55,
+    65, 69, 0, 52, 87, 107, 117, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 15, 20, 0, 0,
+    0, 35, 50, 55, 0, 0, 70, 105, 120, 125, 0, 121, 191, 226, 241, 0, 0, 0, 0,
+    0, 0, 6, 0, 0, 0, 0, 21, 27, 0, 0, 0, 56, 77, 83, 0, 0, 126, 182, 203, 209,
+    0, 246, 372, 428, 449, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0, 0, 28, 35, 0, 0, 0,
+    84, 112, 119, 0, 0, 210, 294, 322, 329, 0, 455, 665, 749, 777, 0, 0, 0, 0,
+    0, 0, 8, 0, 0, 0, 0, 36, 44, 0, 0, 0, 120, 156, 164, 0, 0, 330, 450, 486,
+    494, 0, 784, 1114, 1234, 1270, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 45, 54, 0,
+    0, 0, 165, 210, 219, 0, 0, 495, 660, 705, 714, 0, 1278, 1773, 1938, 1983,
+    0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 55, 65, 0, 0, 0, 220, 275, 285, 0, 0,
+    715, 935, 990, 1000, 0, 1992, 2707, 2927, 2982, 0, 0, 0, 0, 0, 0, 11, 0, 0,
+    0, 0, 66, 77, 0, 0, 0, 286, 352, 363, 0, 0, 1001, 1287, 1353, 1364, 0,
+    2992, 3993, 4279, 4345, 0, 0, 0, 0, 0, 0, 12, 0, 0, 0, 0, 78, 90, 0, 0, 0,
+    364, 442, 454, 0, 0, 1365, 1729, 1807, 1819, 0, 4356, 5721, 6085, 6163,
+};
+
+static const uint16_t HISTOGRAM_TABLE[6176] = {
+    166, 322, 310, 154, 165, 2467, 3325, 2401, 153, 321, 3314, 3303, 309, 298,
+    2335, 297, 142, 141, 164, 2466, 3324, 2400, 152, 2465, 6185, 5965, 2399,
+    3313, 5745, 3302, 2334, 2333, 140, 320, 3292, 3281, 308, 3291, 5525, 3280,
+    3270, 3269, 296, 286, 2269, 285, 2268, 2267, 284, 130, 129, 128, 163, 2464,
+    3323, 2398, 151, 2463, 6184, 5964, 2397, 3312, 5744, 3301, 2332, 2331, 139,
+    2462, 6183, 5963, 2396, 6182, 1608, 5962, 5743, 5742, 2330, 3290, 5524,
+    3279, 5523, 5522, 3268, 2266, 2265, 2264, 127, 319, 3259, 3248, 307, 3258,
+    5305, 3247, 3237, 3236, 295, 3257, 5304, 3246, 5303, 5302, 3235, 3226,
+    3225, 3224, 283, 274, 2203, 273, 2202, 2201, 272, 2200, 2199, 2198, 271,
+    118, 117, 116, 115, 162, 2461, 3322, 2395, 150, 2460, 6181, 5961, 2394,
+    3311, 5741, 3300, 2329, 2328, 138, 2459, 6180, 5960, 2393, 6179, 7462,
+    5959, 5740, 5739, 2327, 3289, 5521, 3278, 5520, 5519, 3267, 2263, 2262,
+    2261, 126, 2458, 6178, 5958, 2392, 6177, 7461, 5957, 5738, 5737, 2326,
+    6176, 7460, 5956, 7459, 1607, 5736, 5518, 5517, 5516, 2260, 3256, 5301,
+    3245, 5300, 5299, 3234, 5298, 5297, 5296, 3223, 2197, 2196, 2195, 2194,
+    114, 318, 3215, 3204, 306, 3214, 5085, 3203, 3193, 3192, 294, 3213, 5084,
+    3202, 5083, 5082, 3191, 3182, 3181, 3180, 282, 3212, 5081, 3201, 5080,
+    5079, 3190, 5078, 5077, 5076, 3179, 3171, 3170, 3169, 3168, 270, 262, 2137,
+    261, 2136, 2135, 260, 2134, 2133, 2132, 259, 2131, 2130, 2129, 2128, 258,
+    106, 105, 104, 103, 102, 161, 2457, 3321, 2391, 149, 2456, 6175, 5955,
+    2390, 3310, 5735, 3299, 2325, 2324, 137, 2455, 6174, 5954, 2389, 6173,
+    7458, 5953, 5734, 5733, 2323, 3288, 5515, 3277, 5514, 5513, 3266, 2259,
+    2258, 2257, 125, 2454, 6172, 5952, 2388, 6171, 7457, 5951, 5732, 5731,
+    2322, 6170, 7456, 5950, 7455, 7454, 5730, 5512, 5511, 5510, 2256, 3255,
+    5295, 3244, 5294, 5293, 3233, 5292, 5291, 5290, 3222, 2193, 2192, 2191,
+    2190, 113, 2453, 6169, 5949, 2387, 6168, 7453, 5948, 5729, 5728, 2321,
+    6167, 7452, 5947, 7451, 7450, 5727, 5509, 5508, 5507, 2255, 6166, 7449,
+    5946, 7448, 7447, 5726, 7446, 7445, 1606, 5506, 5289, 5288, 5287, 5286,
+    2189, 3211, 5075, 3200, 5074, 5073, 3189, 5072, 5071, 5070, 3178, 5069,
+    5068, 5067, 5066, 3167, 2127, 2126, 2125, 2124, 2123, 101, 317, 3160, 3149,
+    305, 3159, 4865, 3148, 3138, 3137, 293, 3158, 4864, 3147, 4863, 4862, 3136,
+    3127, 3126, 3125, 281, 3157, 4861, 3146, 4860, 4859, 3135, 4858, 4857,
+    4856, 3124, 3116, 3115, 3114, 3113, 269, 3156, 4855, 3145, 4854, 4853,
+    3134, 4852, 4851, 4850, 3123, 4849, 4848, 4847, 4846, 3112, 3105, 3104,
+    3103, 3102, 3101, 257, 250, 2071, 249, 2070, 2069, 248, 2068, 2067, 2066,
+    247, 2065, 2064, 2063, 2062, 246, 2061, 2060, 2059, 2058, 2057, 245, 94,
+    93, 92, 91, 90, 89, 160, 2452, 3320, 2386, 148, 2451, 6165, 5945, 2385,
+    3309, 5725, 3298, 2320, 2319, 136, 2450, 6164, 5944, 2384, 6163, 7444,
+    5943, 5724, 5723, 2318, 3287, 5505, 3276, 5504, 5503, 3265, 2254, 2253,
+    2252, 124, 2449, 6162, 5942, 2383, 6161, 7443, 5941, 5722, 5721, 2317,
+    6160, 7442, 5940, 7441, 7440, 5720, 5502, 5501, 5500, 2251, 3254, 5285,
+    3243, 5284, 5283, 3232, 5282, 5281, 5280, 3221, 2188, 2187, 2186, 2185,
+    112, 2448, 6159, 5939, 2382, 6158, 7439, 5938, 5719, 5718, 2316, 6157,
+    7438, 5937, 7437, 7436, 5717, 5499, 5498, 5497, 2250, 6156, 7435, 5936,
+    7434, 7433, 5716, 7432, 7431, 7430, 5496, 5279, 5278, 5277, 5276, 2184,
+    3210, 5065, 3199, 5064, 5063, 3188, 5062, 5061, 5060, 3177, 5059, 5058,
+    5057, 5056, 3166, 2122, 2121, 2120, 2119, 2118, 100, 2447, 6155, 5935,
+    2381, 6154, 7429, 5934, 5715, 5714, 2315, 6153, 7428, 5933, 7427, 7426,
+    5713, 5495, 5494, 5493, 2249, 6152, 7425, 5932, 7424, 7423, 5712, 7422,
+    7421, 7420, 5492, 5275, 5274, 5273, 5272, 2183, 6151, 7419, 5931, 7418,
+    7417, 5711, 7416, 7415, 7414, 5491, 7413, 7412, 7411, 1605, 5271, 5055,
+    5054, 5053, 5052, 5051, 2117, 3155, 4845, 3144, 4844, 4843, 3133, 4842,
+    4841, 4840, 3122, 4839, 4838, 4837, 4836, 3111, 4835, 4834, 4833, 4832,
+    4831, 3100, 2056, 2055, 2054, 2053, 2052, 2051, 88, 316, 3094, 3083, 304,
+    3093, 4645, 3082, 3072, 3071, 292, 3092, 4644, 3081, 4643, 4642, 3070,
+    3061, 3060, 3059, 280, 3091, 4641, 3080, 4640, 4639, 3069, 4638, 4637,
+    4636, 3058, 3050, 3049, 3048, 3047, 268, 3090, 4635, 3079, 4634, 4633,
+    3068, 4632, 4631, 4630, 3057, 4629, 4628, 4627, 4626, 3046, 3039, 3038,
+    3037, 3036, 3035, 256, 3089, 4625, 3078, 4624, 4623, 3067, 4622, 4621,
+    4620, 3056, 4619, 4618, 4617, 4616, 3045, 4615, 4614, 4613, 4612, 4611,
+    3034, 3028, 3027, 3026, 3025, 3024, 3023, 244, 238, 2005, 237, 2004, 2003,
+    236, 2002, 2001, 2000, 235, 1999, 1998, 1997, 1996, 234, 1995, 1994, 1993,
+    1992, 1991, 233, 1990, 1989, 1988, 1987, 1986, 1985, 232, 82, 81, 80, 79,
+    78, 77, 76, 159, 2446, 3319, 2380, 147, 2445, 6150, 5930, 2379, 3308, 5710,
+    3297, 2314, 2313, 135, 2444, 6149, 5929, 2378, 6148, 7410, 5928, 5709,
+    5708, 2312, 3286, 5490, 3275, 5489, 5488, 3264, 2248, 2247, 2246, 123,
+    2443, 6147, 5927, 2377, 6146, 7409, 5926, 5707, 5706, 2311, 6145, 7408,
+    5925, 7407, 7406, 5705, 5487, 5486, 5485, 2245, 3253, 5270, 3242, 5269,
+    5268, 3231, 5267, 5266, 5265, 3220, 2182, 2181, 2180, 2179, 111, 2442,
+    6144, 5924, 2376, 6143, 7405, 5923, 5704, 5703, 2310, 6142, 7404, 5922,
+    7403, 7402, 5702, 5484, 5483, 5482, 2244, 6141, 7401, 5921, 7400, 7399,
+    5701, 7398, 7397, 7396, 5481, 5264, 5263, 5262, 5261, 2178, 3209, 5050,
+    3198, 5049, 5048, 3187, 5047, 5046, 5045, 3176, 5044, 5043, 5042, 5041,
+    3165, 2116, 2115, 2114, 2113, 2112, 99, 2441, 6140, 5920, 2375, 6139, 7395,
+    5919, 5700, 5699, 2309, 6138, 7394, 5918, 7393, 7392, 5698, 5480, 5479,
+    5478, 2243, 6137, 7391, 5917, 7390, 7389, 5697, 7388, 7387, 7386, 5477,
+    5260, 5259, 5258, 5257, 2177, 6136, 7385, 5916, 7384, 7383, 5696, 7382,
+    7381, 7380, 5476, 7379, 7378, 7377, 7376, 5256, 5040, 5039, 5038, 5037,
+    5036, 2111, 3154, 4830, 3143, 4829, 4828, 3132, 4827, 4826, 4825, 3121,
+    4824, 4823, 4822, 4821, 3110, 4820, 4819, 4818, 4817, 4816, 3099, 2050,
+    2049, 2048, 2047, 2046, 2045, 87, 2440, 6135, 5915, 2374, 6134, 7375, 5914,
+    5695, 5694, 2308, 6133, 7374, 5913, 7373, 7372, 5693, 5475, 5474, 5473,
+    2242, 6132, 7371, 5912, 7370, 7369, 5692, 7368, 7367, 7366, 5472, 5255,
+    5254, 5253, 5252, 2176, 6131, 7365, 5911, 7364, 7363, 5691, 7362, 7361,
+    7360, 5471, 7359, 7358, 7357, 7356, 5251, 5035, 5034, 5033, 5032, 5031,
+    2110, 6130, 7355, 5910, 7354, 7353, 5690, 7352, 7351, 7350, 5470, 7349,
+    7348, 7347, 7346, 5250, 7345, 7344, 7343, 7342, 1604, 5030, 4815, 4814,
+    4813, 4812, 4811, 4810, 2044, 3088, 4610, 3077, 4609, 4608, 3066, 4607,
+    4606, 4605, 3055, 4604, 4603, 4602, 4601, 3044, 4600, 4599, 4598, 4597,
+    4596, 3033, 4595, 4594, 4593, 4592, 4591, 4590, 3022, 1984, 1983, 1982,
+    1981, 1980, 1979, 1978, 75, 315, 3017, 3006, 303, 3016, 4425, 3005, 2995,
+    2994, 291, 3015, 4424, 3004, 4423, 4422, 2993, 2984, 2983, 2982, 279, 3014,
+    4421, 3003, 4420, 4419, 2992, 4418, 4417, 4416, 2981, 2973, 2972, 2971,
+    2970, 267, 3013, 4415, 3002, 4414, 4413, 2991, 4412, 4411, 4410, 2980,
+    4409, 4408, 4407, 4406, 2969, 2962, 2961, 2960, 2959, 2958, 255, 3012,
+    4405, 3001, 4404, 4403, 2990, 4402, 4401, 4400, 2979, 4399, 4398, 4397,
+    4396, 2968, 4395, 4394, 4393, 4392, 4391, 2957, 2951, 2950, 2949, 2948,
+    2947, 2946, 243, 3011, 4390, 3000, 4389, 4388, 2989, 4387, 4386, 4385,
+    2978, 4384, 4383, 4382, 4381, 2967, 4380, 4379, 4378, 4377, 4376, 2956,
+    4375, 4374, 4373, 4372, 4371, 4370, 2945, 2940, 2939, 2938, 2937, 2936,
+    2935, 2934, 231, 226, 1939, 225, 1938, 1937, 224, 1936, 1935, 1934, 223,
+    1933, 1932, 1931, 1930, 222, 1929, 1928, 1927, 1926, 1925, 221, 1924, 1923,
+    1922, 1921, 1920, 1919, 220, 1918, 1917, 1916, 1915, 1914, 1913, 1912, 219,
+    70, 69, 68, 67, 66, 65, 64, 63, 158, 2439, 3318, 2373, 146, 2438, 6129,
+    5909, 2372, 3307, 5689, 3296, 2307, 2306, 134, 2437, 6128, 5908, 2371,
+    6127, 7341, 5907, 5688, 5687, 2305, 3285, 5469, 3274, 5468, 5467, 3263,
+    2241, 2240, 2239, 122, 2436, 6126, 5906, 2370, 6125, 7340, 5905, 5686,
+    5685, 2304, 6124, 7339, 5904, 7338, 7337, 5684, 5466, 5465, 5464, 2238,
+    3252, 5249, 3241, 5248, 5247, 3230, 5246, 5245, 5244, 3219, 2175, 2174,
+    2173, 2172, 110, 2435, 6123, 5903, 2369, 6122, 7336, 5902, 5683, 5682,
+    2303, 6121, 7335, 5901, 7334, 7333, 5681, 5463, 5462, 5461, 2237, 6120,
+    7332, 5900, 7331, 7330, 5680, 7329, 7328, 7327, 5460, 5243, 5242, 5241,
+    5240, 2171, 3208, 5029, 3197, 5028, 5027, 3186, 5026, 5025, 5024, 3175,
+    5023, 5022, 5021, 5020, 3164, 2109, 2108, 2107, 2106, 2105, 98, 2434, 6119,
+    5899, 2368, 6118, 7326, 5898, 5679, 5678, 2302, 6117, 7325, 5897, 7324,
+    7323, 5677, 5459, 5458, 5457, 2236, 6116, 7322, 5896, 7321, 7320, 5676,
+    7319, 7318, 7317, 5456, 5239, 5238, 5237, 5236, 2170, 6115, 7316, 5895,
+    7315, 7314, 5675, 7313, 7312, 7311, 5455, 7310, 7309, 7308, 7307, 5235,
+    5019, 5018, 5017, 5016, 5015, 2104, 3153, 4809, 3142, 4808, 4807, 3131,
+    4806, 4805, 4804, 3120, 4803, 4802, 4801, 4800, 3109, 4799, 4798, 4797,
+    4796, 4795, 3098, 2043, 2042, 2041, 2040, 2039, 2038, 86, 2433, 6114, 5894,
+    2367, 6113, 7306, 5893, 5674, 5673, 2301, 6112, 7305, 5892, 7304, 7303,
+    5672, 5454, 5453, 5452, 2235, 6111, 7302, 5891, 7301, 7300, 5671, 7299,
+    7298, 7297, 5451, 5234, 5233, 5232, 5231, 2169, 6110, 7296, 5890, 7295,
+    7294, 5670, 7293, 7292, 7291, 5450, 7290, 7289, 7288, 7287, 5230, 5014,
+    5013, 5012, 5011, 5010, 2103, 6109, 7286, 5889, 7285, 7284, 5669, 7283,
+    7282, 7281, 5449, 7280, 7279, 7278, 7277, 5229, 7276, 7275, 7274, 7273,
+    7272, 5009, 4794, 4793, 4792, 4791, 4790, 4789, 2037, 3087, 4589, 3076,
+    4588, 4587, 3065, 4586, 4585, 4584, 3054, 4583, 4582, 4581, 4580, 3043,
+    4579, 4578, 4577, 4576, 4575, 3032, 4574, 4573, 4572, 4571, 4570, 4569,
+    3021, 1977, 1976, 1975, 1974, 1973, 1972, 1971, 74, 2432, 6108, 5888, 2366,
+    6107, 7271, 5887, 5668, 5667, 2300, 6106, 7270, 5886, 7269, 7268, 5666,
+    5448, 5447, 5446, 2234, 6105, 7267, 5885, 7266, 7265, 5665, 7264, 7263,
+    7262, 5445, 5228, 5227, 5226, 5225, 2168, 6104, 7261, 5884, 7260, 7259,
+    5664, 7258, 7257, 7256, 5444, 7255, 7254, 7253, 7252, 5224, 5008, 5007,
+    5006, 5005, 5004, 2102, 6103, 7251, 5883, 7250, 7249, 5663, 7248, 7247,
+    7246, 5443, 7245, 7244, 7243, 7242, 5223, 7241, 7240, 7239, 7238, 7237,
+    5003, 4788, 4787, 4786, 4785, 4784, 4783, 2036, 6102, 7236, 5882, 7235,
+    7234, 5662, 7233, 7232, 7231, 5442, 7230, 7229, 7228, 7227, 5222, 7226,
+    7225, 7224, 7223, 7222, 5002, 7221, 7220, 7219, 7218, 7217, 1603, 4782,
+    4568, 4567, 4566, 4565, 4564, 4563, 4562, 1970, 3010, 4369, 2999, 4368,
+    4367, 2988, 4366, 4365, 4364, 2977, 4363, 4362, 4361, 4360, 2966, 4359,
+    4358, 4357, 4356, 4355, 2955, 4354, 4353, 4352, 4351, 4350, 4349, 2944,
+    4348, 4347, 4346, 4345, 4344, 4343, 4342, 2933, 1911, 1910, 1909, 1908,
+    1907, 1906, 1905, 1904, 62, 314, 2929, 2918, 302, 2928, 4205, 2917, 2907,
+    2906, 290, 2927, 4204, 2916, 4203, 4202, 2905, 2896, 2895, 2894, 278, 2926,
+    4201, 2915, 4200, 4199, 2904, 4198, 4197, 4196, 2893, 2885, 2884, 2883,
+    2882, 266, 2925, 4195, 2914, 4194, 4193, 2903, 4192, 4191, 4190, 2892,
+    4189, 4188, 4187, 4186, 2881, 2874, 2873, 2872, 2871, 2870, 254, 2924,
+    4185, 2913, 4184, 4183, 2902, 4182, 4181, 4180, 2891, 4179, 4178, 4177,
+    4176, 2880, 4175, 4174, 4173, 4172, 4171, 2869, 2863, 2862, 2861, 2860,
+    2859, 2858, 242, 2923, 4170, 2912, 4169, 4168, 2901, 4167, 4166, 4165,
+    2890, 4164, 4163, 4162, 4161, 2879, 4160, 4159, 4158, 4157, 4156, 2868,
+    4155, 4154, 4153, 4152, 4151, 4150, 2857, 2852, 2851, 2850, 2849, 2848,
+    2847, 2846, 230, 2922, 4149, 2911, 4148, 4147, 2900, 4146, 4145, 4144,
+    2889, 4143, 4142, 4141, 4140, 2878, 4139, 4138, 4137, 4136, 4135, 2867,
+    4134, 4133, 4132, 4131, 4130, 4129, 2856, 4128, 4127, 4126, 4125, 4124,
+    4123, 4122, 2845, 2841, 2840, 2839, 2838, 2837, 2836, 2835, 2834, 218, 214,
+    1873, 213, 1872, 1871, 212, 1870, 1869, 1868, 211, 1867, 1866, 1865, 1864,
+    210, 1863, 1862, 1861, 1860, 1859, 209, 1858, 1857, 1856, 1855, 1854, 1853,
+    208, 1852, 1851, 1850, 1849, 1848, 1847, 1846, 207, 1845, 1844, 1843, 1842,
+    1841, 1840, 1839, 1838, 206, 58, 57, 56, 55, 54, 53, 52, 51, 50, 157, 2431,
+    3317, 2365, 145, 2430, 6101, 5881, 2364, 3306, 5661, 3295, 2299, 2298, 133,
+    2429, 6100, 5880, 2363, 6099, 7216, 5879, 5660, 5659, 2297, 3284, 5441,
+    3273, 5440, 5439, 3262, 2233, 2232, 2231, 121, 2428, 6098, 5878, 2362,
+    6097, 7215, 5877, 5658, 5657, 2296, 6096, 7214, 5876, 7213, 7212, 5656,
+    5438, 5437, 5436, 2230, 3251, 5221, 3240, 5220, 5219, 3229, 5218, 5217,
+    5216, 3218, 2167, 2166, 2165, 2164, 109, 2427, 6095, 5875, 2361, 6094,
+    7211, 5874, 5655, 5654, 2295, 6093, 7210, 5873, 7209, 7208, 5653, 5435,
+    5434, 5433, 2229, 6092, 7207, 5872, 7206, 7205, 5652, 7204, 7203, 7202,
+    5432, 5215, 5214, 5213, 5212, 2163, 3207, 5001, 3196, 5000, 4999, 3185,
+    4998, 4997, 4996, 3174, 4995, 4994, 4993, 4992, 3163, 2101, 2100, 2099,
+    2098, 2097, 97, 2426, 6091, 5871, 2360, 6090, 7201, 5870, 5651, 5650, 2294,
+    6089, 7200, 5869, 7199, 7198, 5649, 5431, 5430, 5429, 2228, 6088, 7197,
+    5868, 7196, 7195, 5648, 7194, 7193, 7192, 5428, 5211, 5210, 5209, 5208,
+    2162, 6087, 7191, 5867, 7190, 7189, 5647, 7188, 7187, 7186, 5427, 7185,
+    7184, 7183, 7182, 5207, 4991, 4990, 4989, 4988, 4987, 2096, 3152, 4781,
+    3141, 4780, 4779, 3130, 4778, 4777, 4776, 3119, 4775, 4774, 4773, 4772,
+    3108, 4771, 4770, 4769, 4768, 4767, 3097, 2035, 2034, 2033, 2032, 2031,
+    2030, 85, 2425, 6086, 5866, 2359, 6085, 7181, 5865, 5646, 5645, 2293, 6084,
+    7180, 5864, 7179, 7178, 5644, 5426, 5425, 5424, 2227, 6083, 7177, 5863,
+    7176, 7175, 5643, 7174, 7173, 7172, 5423, 5206, 5205, 5204, 5203, 2161,
+    6082, 7171, 5862, 7170, 7169, 5642, 7168, 7167, 7166, 5422, 7165, 7164,
+    7163, 7162, 5202, 4986, 4985, 4984, 4983, 4982, 2095, 6081, 7161, 5861,
+    7160, 7159, 5641, 7158, 7157, 7156, 5421, 7155, 7154, 7153, 7152, 5201,
+    7151, 7150, 7149, 7148, 7147, 4981, 4766, 4765, 4764, 4763, 4762, 4761,
+    2029, 3086, 4561, 3075, 4560, 4559, 3064, 4558, 4557, 4556, 3053, 4555,
+    4554, 4553, 4552, 3042, 4551, 4550, 4549, 4548, 4547, 3031, 4546, 4545,
+    4544, 4543, 4542, 4541, 3020, 1969, 1968, 1967, 1966, 1965, 1964, 1963, 73,
+    2424, 6080, 5860, 2358, 6079, 7146, 5859, 5640, 5639, 2292, 6078, 7145,
+    5858, 7144, 7143, 5638, 5420, 5419, 5418, 2226, 6077, 7142, 5857, 7141,
+    7140, 5637, 7139, 7138, 7137, 5417, 5200, 5199, 5198, 5197, 2160, 6076,
+    7136, 5856, 7135, 7134, 5636, 7133, 7132, 7131, 5416, 7130, 7129, 7128,
+    7127, 5196, 4980, 4979, 4978, 4977, 4976, 2094, 6075, 7126, 5855, 7125,
+    7124, 5635, 7123, 7122, 7121, 5415, 7120, 7119, 7118, 7117, 5195, 7116,
+    7115, 7114, 7113, 7112, 4975, 4760, 4759, 4758, 4757, 4756, 4755, 2028,
+    6074, 7111, 5854, 7110, 7109, 5634, 7108, 7107, 7106, 5414, 7105, 7104,
+    7103, 7102, 5194, 7101, 7100, 7099, 7098, 7097, 4974, 7096, 7095, 7094,
+    7093, 7092, 7091, 4754, 4540, 4539, 4538, 4537, 4536, 4535, 4534, 1962,
+    3009, 4341, 2998, 4340, 4339, 2987, 4338, 4337, 4336, 2976, 4335, 4334,
+    4333, 4332, 2965, 4331, 4330, 4329, 4328, 4327, 2954, 4326, 4325, 4324,
+    4323, 4322, 4321, 2943, 4320, 4319, 4318, 4317, 4316, 4315, 4314, 2932,
+    1903, 1902, 1901, 1900, 1899, 1898, 1897, 1896, 61, 2423, 6073, 5853, 2357,
+    6072, 7090, 5852, 5633, 5632, 2291, 6071, 7089, 5851, 7088, 7087, 5631,
+    5413, 5412, 5411, 2225, 6070, 7086, 5850, 7085, 7084, 5630, 7083, 7082,
+    7081, 5410, 5193, 5192, 5191, 5190, 2159, 6069, 7080, 5849, 7079, 7078,
+    5629, 7077, 7076, 7075, 5409, 7074, 7073, 7072, 7071, 5189, 4973, 4972,
+    4971, 4970, 4969, 2093, 6068, 7070, 5848, 7069, 7068, 5628, 7067, 7066,
+    7065, 5408, 7064, 7063, 7062, 7061, 5188, 7060, 7059, 7058, 7057, 7056,
+    4968, 4753, 4752, 4751, 4750, 4749, 4748, 2027, 6067, 7055, 5847, 7054,
+    7053, 5627, 7052, 7051, 7050, 5407, 7049, 7048, 7047, 7046, 5187, 7045,
+    7044, 7043, 7042, 7041, 4967, 7040, 7039, 7038, 7037, 7036, 7035, 4747,
+    4533, 4532, 4531, 4530, 4529, 4528, 4527, 1961, 6066, 7034, 5846, 7033,
+    7032, 5626, 7031, 7030, 7029, 5406, 7028, 7027, 7026, 7025, 5186, 7024,
+    7023, 7022, 7021, 7020, 4966, 7019, 7018, 7017, 7016, 7015, 7014, 4746,
+    7013, 7012, 7011, 7010, 7009, 7008, 1602, 4526, 4313, 4312, 4311, 4310,
+    4309, 4308, 4307, 4306, 1895, 2921, 4121, 2910, 4120, 4119, 2899, 4118,
+    4117, 4116, 2888, 4115, 4114, 4113, 4112, 2877, 4111, 4110, 4109, 4108,
+    4107, 2866, 4106, 4105, 4104, 4103, 4102, 4101, 2855, 4100, 4099, 4098,
+    4097, 4096, 4095, 4094, 2844, 4093, 4092, 4091, 4090, 4089, 4088, 4087,
+    4086, 2833, 1837, 1836, 1835, 1834, 1833, 1832, 1831, 1830, 1829, 49, 313,
+    2830, 2819, 301, 2829, 3985, 2818, 2808, 2807, 289, 2828, 3984, 2817, 3983,
+    3982, 2806, 2797, 2796, 2795, 277, 2827, 3981, 2816, 3980, 3979, 2805,
+    3978, 3977, 3976, 2794, 2786, 2785, 2784, 2783, 265, 2826, 3975, 2815,
+    3974, 3973, 2804, 3972, 3971, 3970, 2793, 3969, 3968, 3967, 3966, 2782,
+    2775, 2774, 2773, 2772, 2771, 253, 2825, 3965, 2814, 3964, 3963, 2803,
+    3962, 3961, 3960, 2792, 3959, 3958, 3957, 3956, 2781, 3955, 3954, 3953,
+    3952, 3951, 2770, 2764, 2763, 2762, 2761, 2760, 2759, 241, 2824, 3950,
+    2813, 3949, 3948, 2802, 3947, 3946, 3945, 2791, 3944, 3943, 3942, 3941,
+    2780, 3940, 3939, 3938, 3937, 3936, 2769, 3935, 3934, 3933, 3932, 3931,
+    3930, 2758, 2753, 2752, 2751, 2750, 2749, 2748, 2747, 229, 2823, 3929,
+    2812, 3928, 3927, 2801, 3926, 3925, 3924, 2790, 3923, 3922, 3921, 3920,
+    2779, 3919, 3918, 3917, 3916, 3915, 2768, 3914, 3913, 3912, 3911, 3910,
+    3909, 2757, 3908, 3907, 3906, 3905, 3904, 3903, 3902, 2746, 2742, 2741,
+    2740, 2739, 2738, 2737, 2736, 2735, 217, 2822, 3901, 2811, 3900, 3899,
+    2800, 3898, 3897, 3896, 2789, 3895, 3894, 3893, 3892, 2778, 3891, 3890,
+    3889, 3888, 3887, 2767, 3886, 3885, 3884, 3883, 3882, 3881, 2756, 3880,
+    3879, 3878, 3877, 3876, 3875, 3874, 2745, 3873, 3872, 3871, 3870, 3869,
+    3868, 3867, 3866, 2734, 2731, 2730, 2729, 2728, 2727, 2726, 2725, 2724,
+    2723, 205, 202, 1807, 201, 1806, 1805, 200, 1804, 1803, 1802, 199, 1801,
+    1800, 1799, 1798, 198, 1797, 1796, 1795, 1794, 1793, 197, 1792, 1791, 1790,
+    1789, 1788, 1787, 196, 1786, 1785, 1784, 1783, 1782, 1781, 1780, 195, 1779,
+    1778, 1777, 1776, 1775, 1774, 1773, 1772, 194, 1771, 1770, 1769, 1768,
+    1767, 1766, 1765, 1764, 1763, 193, 46, 45, 44, 43, 42, 41, 40, 39, 38, 37,
+    156, 2422, 3316, 2356, 144, 2421, 6065, 5845, 2355, 3305, 5625, 3294, 2290,
+    2289, 132, 2420, 6064, 5844, 2354, 6063, 7007, 5843, 5624, 5623, 2288,
+    3283, 5405, 3272, 5404, 5403, 3261, 2224, 2223, 2222, 120, 2419, 6062,
+    5842, 2353, 6061, 7006, 5841, 5622, 5621, 2287, 6060, 7005, 5840, 7004,
+    7003, 5620, 5402, 5401, 5400, 2221, 3250, 5185, 3239, 5184, 5183, 3228,
+    5182, 5181, 5180, 3217, 2158, 2157, 2156, 2155, 108, 2418, 6059, 5839,
+    2352, 6058, 7002, 5838, 5619, 5618, 2286, 6057, 7001, 5837, 7000, 6999,
+    5617, 5399, 5398, 5397, 2220, 6056, 6998, 5836, 6997, 6996, 5616, 6995,
+    6994, 6993, 5396, 5179, 5178, 5177, 5176, 2154, 3206, 4965, 3195, 4964,
+    4963, 3184, 4962, 4961, 4960, 3173, 4959, 4958, 4957, 4956, 3162, 2092,
+    2091, 2090, 2089, 2088, 96, 2417, 6055, 5835, 2351, 6054, 6992, 5834, 5615,
+    5614, 2285, 6053, 6991, 5833, 6990, 6989, 5613, 5395, 5394, 5393, 2219,
+    6052, 6988, 5832, 6987, 6986, 5612, 6985, 6984, 6983, 5392, 5175, 5174,
+    5173, 5172, 2153, 6051, 6982, 5831, 6981, 6980, 5611, 6979, 6978, 6977,
+    5391, 6976, 6975, 6974, 6973, 5171, 4955, 4954, 4953, 4952, 4951, 2087,
+    3151, 4745, 3140, 4744, 4743, 3129, 4742, 4741, 4740, 3118, 4739, 4738,
+    4737, 4736, 3107, 4735, 4734, 4733, 4732, 4731, 3096, 2026, 2025, 2024,
+    2023, 2022, 2021, 84, 2416, 6050, 5830, 2350, 6049, 6972, 5829, 5610, 5609,
+    2284, 6048, 6971, 5828, 6970, 6969, 5608, 5390, 5389, 5388, 2218, 6047,
+    6968, 5827, 6967, 6966, 5607, 6965, 6964, 6963, 5387, 5170, 5169, 5168,
+    5167, 2152, 6046, 6962, 5826, 6961, 6960, 5606, 6959, 6958, 6957, 5386,
+    6956, 6955, 6954, 6953, 5166, 4950, 4949, 4948, 4947, 4946, 2086, 6045,
+    6952, 5825, 6951, 6950, 5605, 6949, 6948, 6947, 5385, 6946, 6945, 6944,
+    6943, 5165, 6942, 6941, 6940, 6939, 6938, 4945, 4730, 4729, 4728, 4727,
+    4726, 4725, 2020, 3085, 4525, 3074, 4524, 4523, 3063, 4522, 4521, 4520,
+    3052, 4519, 4518, 4517, 4516, 3041, 4515, 4514, 4513, 4512, 4511, 3030,
+    4510, 4509, 4508, 4507, 4506, 4505, 3019, 1960, 1959, 1958, 1957, 1956,
+    1955, 1954, 72, 2415, 6044, 5824, 2349, 6043, 6937, 5823, 5604, 5603, 2283,
+    6042, 6936, 5822, 6935, 6934, 5602, 5384, 5383, 5382, 2217, 6041, 6933,
+    5821, 6932, 6931, 5601, 6930, 6929, 6928, 5381, 5164, 5163, 5162, 5161,
+    2151, 6040, 6927, 5820, 6926, 6925, 5600, 6924, 6923, 6922, 5380, 6921,
+    6920, 6919, 6918, 5160, 4944, 4943, 4942, 4941, 4940, 2085, 6039, 6917,
+    5819, 6916, 6915, 5599, 6914, 6913, 6912, 5379, 6911, 6910, 6909, 6908,
+    5159, 6907, 6906, 6905, 6904, 6903, 4939, 4724, 4723, 4722, 4721, 4720,
+    4719, 2019, 6038, 6902, 5818, 6901, 6900, 5598, 6899, 6898, 6897, 5378,
+    6896, 6895, 6894, 6893, 5158, 6892, 6891, 6890, 6889, 6888, 4938, 6887,
+    6886, 6885, 6884, 6883, 6882, 4718, 4504, 4503, 4502, 4501, 4500, 4499,
+    4498, 1953, 3008, 4305, 2997, 4304, 4303, 2986, 4302, 4301, 4300, 2975,
+    4299, 4298, 4297, 4296, 2964, 4295, 4294, 4293, 4292, 4291, 2953, 4290,
+    4289, 4288, 4287, 4286, 4285, 2942, 4284, 4283, 4282, 4281, 4280, 4279,
+    4278, 2931, 1894, 1893, 1892, 1891, 1890, 1889, 1888, 1887, 60, 2414, 6037,
+    5817, 2348, 6036, 6881, 5816, 5597, 5596, 2282, 6035, 6880, 5815, 6879,
+    6878, 5595, 5377, 5376, 5375, 2216, 6034, 6877, 5814, 6876, 6875, 5594,
+    6874, 6873, 6872, 5374, 5157, 5156, 5155, 5154, 2150, 6033, 6871, 5813,
+    6870, 6869, 5593, 6868, 6867, 6866, 5373, 6865, 6864, 6863, 6862, 5153,
+    4937, 4936, 4935, 4934, 4933, 2084, 6032, 6861, 5812, 6860, 6859, 5592,
+    6858, 6857, 6856, 5372, 6855, 6854, 6853, 6852, 5152, 6851, 6850, 6849,
+    6848, 6847, 4932, 4717, 4716, 4715, 4714, 4713, 4712, 2018, 6031, 6846,
+    5811, 6845, 6844, 5591, 6843, 6842, 6841, 5371, 6840, 6839, 6838, 6837,
+    5151, 6836, 6835, 6834, 6833, 6832, 4931, 6831, 6830, 6829, 6828, 6827,
+    6826, 4711, 4497, 4496, 4495, 4494, 4493, 4492, 4491, 1952, 6030, 6825,
+    5810, 6824, 6823, 5590, 6822, 6821, 6820, 5370, 6819, 6818, 6817, 6816,
+    5150, 6815, 6814, 6813, 6812, 6811, 4930, 6810, 6809, 6808, 6807, 6806,
+    6805, 4710, 6804, 6803, 6802, 6801, 6800, 6799, 6798, 4490, 4277, 4276,
+    4275, 4274, 4273, 4272, 4271, 4270, 1886, 2920, 4085, 2909, 4084, 4083,
+    2898, 4082, 4081, 4080, 2887, 4079, 4078, 4077, 4076, 2876, 4075, 4074,
+    4073, 4072, 4071, 2865, 4070, 4069, 4068, 4067, 4066, 4065, 2854, 4064,
+    4063, 4062, 4061, 4060, 4059, 4058, 2843, 4057, 4056, 4055, 4054, 4053,
+    4052, 4051, 4050, 2832, 1828, 1827, 1826, 1825, 1824, 1823, 1822, 1821,
+    1820, 48, 2413, 6029, 5809, 2347, 6028, 6797, 5808, 5589, 5588, 2281, 6027,
+    6796, 5807, 6795, 6794, 5587, 5369, 5368, 5367, 2215, 6026, 6793, 5806,
+    6792, 6791, 5586, 6790, 6789, 6788, 5366, 5149, 5148, 5147, 5146, 2149,
+    6025, 6787, 5805, 6786, 6785, 5585, 6784, 6783, 6782, 5365, 6781, 6780,
+    6779, 6778, 5145, 4929, 4928, 4927, 4926, 4925, 2083, 6024, 6777, 5804,
+    6776, 6775, 5584, 6774, 6773, 6772, 5364, 6771, 6770, 6769, 6768, 5144,
+    6767, 6766, 6765, 6764, 6763, 4924, 4709, 4708, 4707, 4706, 4705, 4704,
+    2017, 6023, 6762, 5803, 6761, 6760, 5583, 6759, 6758, 6757, 5363, 6756,
+    6755, 6754, 6753, 5143, 6752, 6751, 6750, 6749, 6748, 4923, 6747, 6746,
+    6745, 6744, 6743, 6742, 4703, 4489, 4488, 4487, 4486, 4485, 4484, 4483,
+    1951, 6022, 6741, 5802, 6740, 6739, 5582, 6738, 6737, 6736, 5362, 6735,
+    6734, 6733, 6732, 5142, 6731, 6730, 6729, 6728, 6727, 4922, 6726, 6725,
+    6724, 6723, 6722, 6721, 4702, 6720, 6719, 6718, 6717, 6716, 6715, 6714,
+    4482, 4269, 4268, 4267, 4266, 4265, 4264, 4263, 4262, 1885, 6021, 6713,
+    5801, 6712, 6711, 5581, 6710, 6709, 6708, 5361, 6707, 6706, 6705, 6704,
+    5141, 6703, 6702, 6701, 6700, 6699, 4921, 6698, 6697, 6696, 6695, 6694,
+    6693, 4701, 6692, 6691, 6690, 6689, 6688, 6687, 6686, 4481, 6685, 6684,
+    6683, 6682, 6681, 6680, 6679, 1601, 4261, 4049, 4048, 4047, 4046, 4045,
+    4044, 4043, 4042, 4041, 1819, 2821, 3865, 2810, 3864, 3863, 2799, 3862,
+    3861, 3860, 2788, 3859, 3858, 3857, 3856, 2777, 3855, 3854, 3853, 3852,
+    3851, 2766, 3850, 3849, 3848, 3847, 3846, 3845, 2755, 3844, 3843, 3842,
+    3841, 3840, 3839, 3838, 2744, 3837, 3836, 3835, 3834, 3833, 3832, 3831,
+    3830, 2733, 3829, 3828, 3827, 3826, 3825, 3824, 3823, 3822, 3821, 2722,
+    1762, 1761, 1760, 1759, 1758, 1757, 1756, 1755, 1754, 1753, 36, 312, 2720,
+    2709, 300, 2719, 3765, 2708, 2698, 2697, 288, 2718, 3764, 2707, 3763, 3762,
+    2696, 2687, 2686, 2685, 276, 2717, 3761, 2706, 3760, 3759, 2695, 3758,
+    3757, 3756, 2684, 2676, 2675, 2674, 2673, 264, 2716, 3755, 2705, 3754,
+    3753, 2694, 3752, 3751, 3750, 2683, 3749, 3748, 3747, 3746, 2672, 2665,
+    2664, 2663, 2662, 2661, 252, 2715, 3745, 2704, 3744, 3743, 2693, 3742,
+    3741, 3740, 2682, 3739, 3738, 3737, 3736, 2671, 3735, 3734, 3733, 3732,
+    3731, 2660, 2654, 2653, 2652, 2651, 2650, 2649, 240, 2714, 3730, 2703,
+    3729, 3728, 2692, 3727, 3726, 3725, 2681, 3724, 3723, 3722, 3721, 2670,
+    3720, 3719, 3718, 3717, 3716, 2659, 3715, 3714, 3713, 3712, 3711, 3710,
+    2648, 2643, 2642, 2641, 2640, 2639, 2638, 2637, 228, 2713, 3709, 2702,
+    3708, 3707, 2691, 3706, 3705, 3704, 2680, 3703, 3702, 3701, 3700, 2669,
+    3699, 3698, 3697, 3696, 3695, 2658, 3694, 3693, 3692, 3691, 3690, 3689,
+    2647, 3688, 3687, 3686, 3685, 3684, 3683, 3682, 2636, 2632, 2631, 2630,
+    2629, 2628, 2627, 2626, 2625, 216, 2712, 3681, 2701, 3680, 3679, 2690,
+    3678, 3677, 3676, 2679, 3675, 3674, 3673, 3672, 2668, 3671, 3670, 3669,
+    3668, 3667, 2657, 3666, 3665, 3664, 3663, 3662, 3661, 2646, 3660, 3659,
+    3658, 3657, 3656, 3655, 3654, 2635, 3653, 3652, 3651, 3650, 3649, 3648,
+    3647, 3646, 2624, 2621, 2620, 2619, 2618, 2617, 2616, 2615, 2614, 2613,
+    204, 2711, 3645, 2700, 3644, 3643, 2689, 3642, 3641, 3640, 2678, 3639,
+    3638, 3637, 3636, 2667, 3635, 3634, 3633, 3632, 3631, 2656, 3630, 3629,
+    3628, 3627, 3626, 3625, 2645, 3624, 3623, 3622, 3621, 3620, 3619, 3618,
+    2634, 3617, 3616, 3615, 3614, 3613, 3612, 3611, 3610, 2623, 3609, 3608,
+    3607, 3606, 3605, 3604, 3603, 3602, 3601, 2612, 2610, 2609, 2608, 2607,
+    2606, 2605, 2604, 2603, 2602, 2601, 192, 190, 1741, 189, 1740, 1739, 188,
+    1738, 1737, 1736, 187, 1735, 1734, 1733, 1732, 186, 1731, 1730, 1729, 1728,
+    1727, 185, 1726, 1725, 1724, 1723, 1722, 1721, 184, 1720, 1719, 1718, 1717,
+    1716, 1715, 1714, 183, 1713, 1712, 1711, 1710, 1709, 1708, 1707, 1706, 182,
+    1705, 1704, 1703, 1702, 1701, 1700, 1699, 1698, 1697, 181, 1696, 1695,
+    1694, 1693, 1692, 1691, 1690, 1689, 1688, 1687, 180, 34, 33, 32, 31, 30,
+    29, 28, 27, 26, 25, 24, 155, 2412, 3315, 2346, 143, 2411, 6020, 5800, 2345,
+    3304, 5580, 3293, 2280, 2279, 131, 2410, 6019, 5799, 2344, 6018, 1609,
+    5798, 5579, 5578, 2278, 3282, 5360, 3271, 5359, 5358, 3260, 2214, 2213,
+    2212, 119, 2409, 6017, 5797, 2343, 6016, 6678, 5796, 5577, 5576, 2277,
+    6015, 6677, 5795, 6676, 6675, 5575, 5357, 5356, 5355, 2211, 3249, 5140,
+    3238, 5139, 5138, 3227, 5137, 5136, 5135, 3216, 2148, 2147, 2146, 2145,
+    107, 2408, 6014, 5794, 2342, 6013, 6674, 5793, 5574, 5573, 2276, 6012,
+    6673, 5792, 6672, 6671, 5572, 5354, 5353, 5352, 2210, 6011, 6670, 5791,
+    6669, 6668, 5571, 6667, 6666, 6665, 5351, 5134, 5133, 5132, 5131, 2144,
+    3205, 4920, 3194, 4919, 4918, 3183, 4917, 4916, 4915, 3172, 4914, 4913,
+    4912, 4911, 3161, 2082, 2081, 2080, 2079, 2078, 95, 2407, 6010, 5790, 2341,
+    6009, 6664, 5789, 5570, 5569, 2275, 6008, 6663, 5788, 6662, 6661, 5568,
+    5350, 5349, 5348, 2209, 6007, 6660, 5787, 6659, 6658, 5567, 6657, 6656,
+    6655, 5347, 5130, 5129, 5128, 5127, 2143, 6006, 6654, 5786, 6653, 6652,
+    5566, 6651, 6650, 6649, 5346, 6648, 6647, 6646, 6645, 5126, 4910, 4909,
+    4908, 4907, 4906, 2077, 3150, 4700, 3139, 4699, 4698, 3128, 4697, 4696,
+    4695, 3117, 4694, 4693, 4692, 4691, 3106, 4690, 4689, 4688, 4687, 4686,
+    3095, 2016, 2015, 2014, 2013, 2012, 2011, 83, 2406, 6005, 5785, 2340, 6004,
+    6644, 5784, 5565, 5564, 2274, 6003, 6643, 5783, 6642, 6641, 5563, 5345,
+    5344, 5343, 2208, 6002, 6640, 5782, 6639, 6638, 5562, 6637, 6636, 6635,
+    5342, 5125, 5124, 5123, 5122, 2142, 6001, 6634, 5781, 6633, 6632, 5561,
+    6631, 6630, 6629, 5341, 6628, 6627, 6626, 6625, 5121, 4905, 4904, 4903,
+    4902, 4901, 2076, 6000, 6624, 5780, 6623, 6622, 5560, 6621, 6620, 6619,
+    5340, 6618, 6617, 6616, 6615, 5120, 6614, 6613, 6612, 6611, 6610, 4900,
+    4685, 4684, 4683, 4682, 4681, 4680, 2010, 3084, 4480, 3073, 4479, 4478,
+    3062, 4477, 4476, 4475, 3051, 4474, 4473, 4472, 4471, 3040, 4470, 4469,
+    4468, 4467, 4466, 3029, 4465, 4464, 4463, 4462, 4461, 4460, 3018, 1950,
+    1949, 1948, 1947, 1946, 1945, 1944, 71, 2405, 5999, 5779, 2339, 5998, 6609,
+    5778, 5559, 5558, 2273, 5997, 6608, 5777, 6607, 6606, 5557, 5339, 5338,
+    5337, 2207, 5996, 6605, 5776, 6604, 6603, 5556, 6602, 6601, 6600, 5336,
+    5119, 5118, 5117, 5116, 2141, 5995, 6599, 5775, 6598, 6597, 5555, 6596,
+    6595, 6594, 5335, 6593, 6592, 6591, 6590, 5115, 4899, 4898, 4897, 4896,
+    4895, 2075, 5994, 6589, 5774, 6588, 6587, 5554, 6586, 6585, 6584, 5334,
+    6583, 6582, 6581, 6580, 5114, 6579, 6578, 6577, 6576, 6575, 4894, 4679,
+    4678, 4677, 4676, 4675, 4674, 2009, 5993, 6574, 5773, 6573, 6572, 5553,
+    6571, 6570, 6569, 5333, 6568, 6567, 6566, 6565, 5113, 6564, 6563, 6562,
+    6561, 6560, 4893, 6559, 6558, 6557, 6556, 6555, 6554, 4673, 4459, 4458,
+    4457, 4456, 4455, 4454, 4453, 1943, 3007, 4260, 2996, 4259, 4258, 2985,
+    4257, 4256, 4255, 2974, 4254, 4253, 4252, 4251, 2963, 4250, 4249, 4248,
+    4247, 4246, 2952, 4245, 4244, 4243, 4242, 4241, 4240, 2941, 4239, 4238,
+    4237, 4236, 4235, 4234, 4233, 2930, 1884, 1883, 1882, 1881, 1880, 1879,
+    1878, 1877, 59, 2404, 5992, 5772, 2338, 5991, 6553, 5771, 5552, 5551, 2272,
+    5990, 6552, 5770, 6551, 6550, 5550, 5332, 5331, 5330, 2206, 5989, 6549,
+    5769, 6548, 6547, 5549, 6546, 6545, 6544, 5329, 5112, 5111, 5110, 5109,
+    2140, 5988, 6543, 5768, 6542, 6541, 5548, 6540, 6539, 6538, 5328, 6537,
+    6536, 6535, 6534, 5108, 4892, 4891, 4890, 4889, 4888, 2074, 5987, 6533,
+    5767, 6532, 6531, 5547, 6530, 6529, 6528, 5327, 6527, 6526, 6525, 6524,
+    5107, 6523, 6522, 6521, 6520, 6519, 4887, 4672, 4671, 4670, 4669, 4668,
+    4667, 2008, 5986, 6518, 5766, 6517, 6516, 5546, 6515, 6514, 6513, 5326,
+    6512, 6511, 6510, 6509, 5106, 6508, 6507, 6506, 6505, 6504, 4886, 6503,
+    6502, 6501, 6500, 6499, 6498, 4666, 4452, 4451, 4450, 4449, 4448, 4447,
+    4446, 1942, 5985, 6497, 5765, 6496, 6495, 5545, 6494, 6493, 6492, 5325,
+    6491, 6490, 6489, 6488, 5105, 6487, 6486, 6485, 6484, 6483, 4885, 6482,
+    6481, 6480, 6479, 6478, 6477, 4665, 6476, 6475, 6474, 6473, 6472, 6471,
+    6470, 4445, 4232, 4231, 4230, 4229, 4228, 4227, 4226, 4225, 1876, 2919,
+    4040, 2908, 4039, 4038, 2897, 4037, 4036, 4035, 2886, 4034, 4033, 4032,
+    4031, 2875, 4030, 4029, 4028, 4027, 4026, 2864, 4025, 4024, 4023, 4022,
+    4021, 4020, 2853, 4019, 4018, 4017, 4016, 4015, 4014, 4013, 2842, 4012,
+    4011, 4010, 4009, 4008, 4007, 4006, 4005, 2831, 1818, 1817, 1816, 1815,
+    1814, 1813, 1812, 1811, 1810, 47, 2403, 5984, 5764, 2337, 5983, 6469, 5763,
+    5544, 5543, 2271, 5982, 6468, 5762, 6467, 6466, 5542, 5324, 5323, 5322,
+    2205, 5981, 6465, 5761, 6464, 6463, 5541, 6462, 6461, 6460, 5321, 5104,
+    5103, 5102, 5101, 2139, 5980, 6459, 5760, 6458, 6457, 5540, 6456, 6455,
+    6454, 5320, 6453, 6452, 6451, 6450, 5100, 4884, 4883, 4882, 4881, 4880,
+    2073, 5979, 6449, 5759, 6448, 6447, 5539, 6446, 6445, 6444, 5319, 6443,
+    6442, 6441, 6440, 5099, 6439, 6438, 6437, 6436, 6435, 4879, 4664, 4663,
+    4662, 4661, 4660, 4659, 2007, 5978, 6434, 5758, 6433, 6432, 5538, 6431,
+    6430, 6429, 5318, 6428, 6427, 6426, 6425, 5098, 6424, 6423, 6422, 6421,
+    6420, 4878, 6419, 6418, 6417, 6416, 6415, 6414, 4658, 4444, 4443, 4442,
+    4441, 4440, 4439, 4438, 1941, 5977, 6413, 5757, 6412, 6411, 5537, 6410,
+    6409, 6408, 5317, 6407, 6406, 6405, 6404, 5097, 6403, 6402, 6401, 6400,
+    6399, 4877, 6398, 6397, 6396, 6395, 6394, 6393, 4657, 6392, 6391, 6390,
+    6389, 6388, 6387, 6386, 4437, 4224, 4223, 4222, 4221, 4220, 4219, 4218,
+    4217, 1875, 5976, 6385, 5756, 6384, 6383, 5536, 6382, 6381, 6380, 5316,
+    6379, 6378, 6377, 6376, 5096, 6375, 6374, 6373, 6372, 6371, 4876, 6370,
+    6369, 6368, 6367, 6366, 6365, 4656, 6364, 6363, 6362, 6361, 6360, 6359,
+    6358, 4436, 6357, 6356, 6355, 6354, 6353, 6352, 6351, 6350, 4216, 4004,
+    4003, 4002, 4001, 4000, 3999, 3998, 3997, 3996, 1809, 2820, 3820, 2809,
+    3819, 3818, 2798, 3817, 3816, 3815, 2787, 3814, 3813, 3812, 3811, 2776,
+    3810, 3809, 3808, 3807, 3806, 2765, 3805, 3804, 3803, 3802, 3801, 3800,
+    2754, 3799, 3798, 3797, 3796, 3795, 3794, 3793, 2743, 3792, 3791, 3790,
+    3789, 3788, 3787, 3786, 3785, 2732, 3784, 3783, 3782, 3781, 3780, 3779,
+    3778, 3777, 3776, 2721, 1752, 1751, 1750, 1749, 1748, 1747, 1746, 1745,
+    1744, 1743, 35, 2402, 5975, 5755, 2336, 5974, 6349, 5754, 5535, 5534, 2270,
+    5973, 6348, 5753, 6347, 6346, 5533, 5315, 5314, 5313, 2204, 5972, 6345,
+    5752, 6344, 6343, 5532, 6342, 6341, 6340, 5312, 5095, 5094, 5093, 5092,
+    2138, 5971, 6339, 5751, 6338, 6337, 5531, 6336, 6335, 6334, 5311, 6333,
+    6332, 6331, 6330, 5091, 4875, 4874, 4873, 4872, 4871, 2072, 5970, 6329,
+    5750, 6328, 6327, 5530, 6326, 6325, 6324, 5310, 6323, 6322, 6321, 6320,
+    5090, 6319, 6318, 6317, 6316, 6315, 4870, 4655, 4654, 4653, 4652, 4651,
+    4650, 2006, 5969, 6314, 5749, 6313, 6312, 5529, 6311, 6310, 6309, 5309,
+    6308, 6307, 6306, 6305, 5089, 6304, 6303, 6302, 6301, 6300, 4869, 6299,
+    6298, 6297, 6296, 6295, 6294, 4649, 4435, 4434, 4433, 4432, 4431, 4430,
+    4429, 1940, 5968, 6293, 5748, 6292, 6291, 5528, 6290, 6289, 6288, 5308,
+    6287, 6286, 6285, 6284, 5088, 6283, 6282, 6281, 6280, 6279, 4868, 6278,
+    6277, 6276, 6275, 6274, 6273, 4648, 6272, 6271, 6270, 6269, 6268, 6267,
+    6266, 4428, 4215, 4214, 4213, 4212, 4211, 4210, 4209, 4208, 1874, 5967,
+    6265, 5747, 6264, 6263, 5527, 6262, 6261, 6260, 5307, 6259, 6258, 6257,
+    6256, 5087, 6255, 6254, 6253, 6252, 6251, 4867, 6250, 6249, 6248, 6247,
+    6246, 6245, 4647, 6244, 6243, 6242, 6241, 6240, 6239, 6238, 4427, 6237,
+    6236, 6235, 6234, 6233, 6232, 6231, 6230, 4207, 3995, 3994, 3993, 3992,
+    3991, 3990, 3989, 3988, 3987, 1808, 5966, 6229, 5746, 6228, 6227, 5526,
+    6226, 6225, 6224, 5306, 6223, 6222, 6221, 6220, 5086, 6219, 6218, 6217,
+    6216, 6215, 4866, 6214, 6213, 6212, 6211, 6210, 6209, 4646, 6208, 6207,
+    6206, 6205, 6204, 6203, 6202, 4426, 6201, 6200, 6199, 6198, 6197, 6196,
+    6195, 6194, 4206, 6193, 6192, 6191, 6190, 6189, 6188, 6187, 6186, 1600,
+    3986, 3775, 3774, 3773, 3772, 3771, 3770, 3769, 3768, 3767, 3766, 1742,
+    2710, 3600, 2699, 3599, 3598, 2688, 3597, 3596, 3595, 2677, 3594, 3593,
+    3592, 3591, 2666, 3590, 3589, 3588, 3587, 3586, 2655, 3585, 3584, 3583,
+    3582, 3581, 3580, 2644, 3579, 3578, 3577, 3576, 3575, 3574, 3573, 2633,
+    3572, 3571, 3570, 3569, 3568, 3567, 3566, 3565, 2622, 3564, 3563, 3562,
+    3561, 3560, 3559, 3558, 3557, 3556, 2611, 3555, 3554, 3553, 3552, 3551,
+    3550, 3549, 3548, 3547, 3546, 2600, 1686, 1685, 1684, 1683, 1682, 1681,
+    1680, 1679, 1678, 1677, 1676, 23, 311, 2599, 2588, 299, 2598, 3545, 2587,
+    2577, 2576, 287, 2597, 3544, 2586, 3543, 3542, 2575, 2566, 2565, 2564, 275,
+    2596, 3541, 2585, 3540, 3539, 2574, 3538, 3537, 3536, 2563, 2555, 2554,
+    2553, 2552, 263, 2595, 3535, 2584, 3534, 3533, 2573, 3532, 3531, 3530,
+    2562, 3529, 3528, 3527, 3526, 2551, 2544, 2543, 2542, 2541, 2540, 251,
+    2594, 3525, 2583, 3524, 3523, 2572, 3522, 3521, 3520, 2561, 3519, 3518,
+    3517, 3516, 2550, 3515, 3514, 3513, 3512, 3511, 2539, 2533, 2532, 2531,
+    2530, 2529, 2528, 239, 2593, 3510, 2582, 3509, 3508, 2571, 3507, 3506,
+    3505, 2560, 3504, 3503, 3502, 3501, 2549, 3500, 3499, 3498, 3497, 3496,
+    2538, 3495, 3494, 3493, 3492, 3491, 3490, 2527, 2522, 2521, 2520, 2519,
+    2518, 2517, 2516, 227, 2592, 3489, 2581, 3488, 3487, 2570, 3486, 3485,
+    3484, 2559, 3483, 3482, 3481, 3480, 2548, 3479, 3478, 3477, 3476, 3475,
+    2537, 3474, 3473, 3472, 3471, 3470, 3469, 2526, 3468, 3467, 3466, 3465,
+    3464, 3463, 3462, 2515, 2511, 2510, 2509, 2508, 2507, 2506, 2505, 2504,
+    215, 2591, 3461, 2580, 3460, 3459, 2569, 3458, 3457, 3456, 2558, 3455,
+    3454, 3453, 3452, 2547, 3451, 3450, 3449, 3448, 3447, 2536, 3446, 3445,
+    3444, 3443, 3442, 3441, 2525, 3440, 3439, 3438, 3437, 3436, 3435, 3434,
+    2514, 3433, 3432, 3431, 3430, 3429, 3428, 3427, 3426, 2503, 2500, 2499,
+    2498, 2497, 2496, 2495, 2494, 2493, 2492, 203, 2590, 3425, 2579, 3424,
+    3423, 2568, 3422, 3421, 3420, 2557, 3419, 3418, 3417, 3416, 2546, 3415,
+    3414, 3413, 3412, 3411, 2535, 3410, 3409, 3408, 3407, 3406, 3405, 2524,
+    3404, 3403, 3402, 3401, 3400, 3399, 3398, 2513, 3397, 3396, 3395, 3394,
+    3393, 3392, 3391, 3390, 2502, 3389, 3388, 3387, 3386, 3385, 3384, 3383,
+    3382, 3381, 2491, 2489, 2488, 2487, 2486, 2485, 2484, 2483, 2482, 2481,
+    2480, 191, 2589, 3380, 2578, 3379, 3378, 2567, 3377, 3376, 3375, 2556,
+    3374, 3373, 3372, 3371, 2545, 3370, 3369, 3368, 3367, 3366, 2534, 3365,
+    3364, 3363, 3362, 3361, 3360, 2523, 3359, 3358, 3357, 3356, 3355, 3354,
+    3353, 2512, 3352, 3351, 3350, 3349, 3348, 3347, 3346, 3345, 2501, 3344,
+    3343, 3342, 3341, 3340, 3339, 3338, 3337, 3336, 2490, 3335, 3334, 3333,
+    3332, 3331, 3330, 3329, 3328, 3327, 3326, 2479, 2478, 2477, 2476, 2475,
+    2474, 2473, 2472, 2471, 2470, 2469, 2468, 179, 178, 1675, 177, 1674, 1673,
+    176, 1672, 1671, 1670, 175, 1669, 1668, 1667, 1666, 174, 1665, 1664, 1663,
+    1662, 1661, 173, 1660, 1659, 1658, 1657, 1656, 1655, 172, 1654, 1653, 1652,
+    1651, 1650, 1649, 1648, 171, 1647, 1646, 1645, 1644, 1643, 1642, 1641,
+    1640, 170, 1639, 1638, 1637, 1636, 1635, 1634, 1633, 1632, 1631, 169, 1630,
+    1629, 1628, 1627, 1626, 1625, 1624, 1623, 1622, 1621, 168, 1620, 1619,
+    1618, 1617, 1616, 1615, 1614, 1613, 1612, 1611, 1610, 167, 22, 21, 20, 19,
+    18, 17, 16, 15, 14, 13, 12, 11, 0,
+};
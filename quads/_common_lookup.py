@@ -0,0 +1,118 @@
+"""
+Lookup table generation shared by the Five, FCP and TCP LookupTables, which
+only differ in how many cards make a hand and where each class of hand
+starts ranking.
+"""
+import itertools
+from typing import Sequence
+
+from .card import Card
+
+
+def rank_masks(width: int) -> list[int]:
+    """
+    Every 13 bit rank mask with width ranks set, from the best down: comparing
+    masks compares their ranks from the top one down
+    """
+    return sorted((sum(1 << r for r in ranks)
+                   for ranks in itertools.combinations(Card.INT_RANKS, width)), reverse=True)
+
+
+def build_flush_table(width: int, straight_flushes: Sequence[int], straight_flush_rank: int,
+                      flush_rank: int) -> tuple[dict[int, int], list[int]]:
+    """
+    Ranks every flush of width cards by its rank mask, the straight flushes
+    in the order given from straight_flush_rank and all the other masks from
+    flush_rank, best first.
+
+    Also returns those other masks, which rank the unsuited high cards in
+    the same order.
+    """
+    flushes = [f for f in rank_masks(width) if f not in straight_flushes]
+
+    flush_lookup = dict(zip(straight_flushes, itertools.count(straight_flush_rank)))
+    flush_lookup.update(zip(flushes, itertools.count(flush_rank)))
+    return flush_lookup, flushes
+
+
+# hands with multiples can also be keyed on the histogram of their ranks,
+# see Five/_jit.py, with at most 4 cards of a rank in a 5 card hand
+HAND_SIZE = 5
+MAX_COUNT = 4
+
+
+def histogram_spreads() -> list[list[int]]:
+    """
+    spreads[r][k] is the number of ways to spread k cards over the r lowest
+    ranks, spreads[13][5] being the number of unsuited 5 card hands
+    """
+    ranks = len(Card.INT_RANKS)
+    spreads = [[0] * (HAND_SIZE + 1) for _ in range(ranks + 1)]
+    spreads[0][0] = 1
+    for r in range(1, ranks + 1):
+        for k in range(HAND_SIZE + 1):
+            spreads[r][k] = sum(spreads[r - 1][k - q] for q in range(min(MAX_COUNT, k) + 1))
+    return spreads
+
+
+# number of multisets of 5 ranks, histogram_table() ranks each of them and
+# keeps a last slot of 0 for malformed hands with 5 cards of one rank
+MULTISETS = histogram_spreads()[len(Card.INT_RANKS)][HAND_SIZE]
+
+
+def histogram_offsets() -> list[list[list[int]]]:
+    """
+    offsets[r][k][q] is how many multisets of k ranks up to rank r come
+    before the ones putting q of the k ranks on rank r, the lower ranks
+    being spread in spreads[r][k - q] ways
+    """
+    spreads = histogram_spreads()
+    offsets = [[[0] * (MAX_COUNT + 1) for _ in range(HAND_SIZE + 1)] for _ in Card.INT_RANKS]
+    for r in Card.INT_RANKS:
+        for k in range(HAND_SIZE + 1):
+            for q in range(1, min(MAX_COUNT, k) + 1):
+                offsets[r][k][q] = offsets[r][k][q - 1] + spreads[r][k - q + 1]
+    return offsets
+
+
+def histogram_index(hist: int, offsets: list[list[list[int]]]) -> int:
+    """
+    Maps the rank histogram of a 5 card hand, a 4 bit count per rank, to
+    its index among all the multisets of 5 ranks, from the highest rank down,
+    or to MULTISETS if it holds more than MAX_COUNT cards of a rank
+    """
+    index = 0
+    k = HAND_SIZE
+    r = len(Card.INT_RANKS) - 1
+    while k:
+        q = (hist >> (r << 2)) & 0xF
+        if q > MAX_COUNT:
+            return MULTISETS
+        index += offsets[r][k][q]
+        k -= q
+        r -= 1
+    return index
+
+
+def histogram_table(unique_lookup: dict[int, int], unsuited_lookup: dict[int, int]) -> list[int]:
+    """
+    Ranks of all unsuited 5 card hands indexed by histogram_index(), from
+    the rank masks of the hands with unique ranks and the prime products
+    of the hands with multiples, followed by the 0 of malformed hands
+    """
+    offsets = histogram_offsets()
+    table = [0] * (MULTISETS + 1)
+
+    for mask, rank in unique_lookup.items():
+        hist = sum(1 << (r << 2) for r in Card.INT_RANKS if mask & (1 << r))
+        table[histogram_index(hist, offsets)] = rank
+
+    for prime_product, rank in unsuited_lookup.items():
+        hist = 0
+        for r in Card.INT_RANKS:
+            while prime_product % Card.PRIMES[r] == 0:
+                prime_product //= Card.PRIMES[r]
+                hist += 1 << (r << 2)
+        table[histogram_index(hist, offsets)] = rank
+
+    return table
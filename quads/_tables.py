@@ -0,0 +1,3071 @@
+"""
+Precomputed lookup tables for the Five, FCP and TCP evaluators.
+
+Generated by tools/gen_tables.py, do not edit by hand.
+"""
+from array import array
+
+
+def _dense(table: dict[int, int], modulus: int) -> array:
+    """
+    Lays a lookup table out as an array indexed by key % modulus
+    """
+    dense = array('H', bytes(2 * modulus))
+    for key, rank in table.items():
+        dense[key % modulus] = rank
+    return dense
+
+
+FIVE_FLUSH_TABLE: array = _dense({
+    7936: 1, 3968: 2, 1984: 3, 992: 4, 496: 5, 248: 6, 124: 7, 62: 8, 31: 9,
+    4111: 10, 7808: 323, 7744: 324, 7712: 325, 7696: 326, 7688: 327, 7684: 328,
+    7682: 329, 7681: 330, 7552: 331, 7488: 332, 7456: 333, 7440: 334,
+    7432: 335, 7428: 336, 7426: 337, 7425: 338, 7360: 339, 7328: 340,
+    7312: 341, 7304: 342, 7300: 343, 7298: 344, 7297: 345, 7264: 346,
+    7248: 347, 7240: 348, 7236: 349, 7234: 350, 7233: 351, 7216: 352,
+    7208: 353, 7204: 354, 7202: 355, 7201: 356, 7192: 357, 7188: 358,
+    7186: 359, 7185: 360, 7180: 361, 7178: 362, 7177: 363, 7174: 364,
+    7173: 365, 7171: 366, 7040: 367, 6976: 368, 6944: 369, 6928: 370,
+    6920: 371, 6916: 372, 6914: 373, 6913: 374, 6848: 375, 6816: 376,
+    6800: 377, 6792: 378, 6788: 379, 6786: 380, 6785: 381, 6752: 382,
+    6736: 383, 6728: 384, 6724: 385, 6722: 386, 6721: 387, 6704: 388,
+    6696: 389, 6692: 390, 6690: 391, 6689: 392, 6680: 393, 6676: 394,
+    6674: 395, 6673: 396, 6668: 397, 6666: 398, 6665: 399, 6662: 400,
+    6661: 401, 6659: 402, 6592: 403, 6560: 404, 6544: 405, 6536: 406,
+    6532: 407, 6530: 408, 6529: 409, 6496: 410, 6480: 411, 6472: 412,
+    6468: 413, 6466: 414, 6465: 415, 6448: 416, 6440: 417, 6436: 418,
+    6434: 419, 6433: 420, 6424: 421, 6420: 422, 6418: 423, 6417: 424,
+    6412: 425, 6410: 426, 6409: 427, 6406: 428, 6405: 429, 6403: 430,
+    6368: 431, 6352: 432, 6344: 433, 6340: 434, 6338: 435, 6337: 436,
+    6320: 437, 6312: 438, 6308: 439, 6306: 440, 6305: 441, 6296: 442,
+    6292: 443, 6290: 444, 6289: 445, 6284: 446, 6282: 447, 6281: 448,
+    6278: 449, 6277: 450, 6275: 451, 6256: 452, 6248: 453, 6244: 454,
+    6242: 455, 6241: 456, 6232: 457, 6228: 458, 6226: 459, 6225: 460,
+    6220: 461, 6218: 462, 6217: 463, 6214: 464, 6213: 465, 6211: 466,
+    6200: 467, 6196: 468, 6194: 469, 6193: 470, 6188: 471, 6186: 472,
+    6185: 473, 6182: 474, 6181: 475, 6179: 476, 6172: 477, 6170: 478,
+    6169: 479, 6166: 480, 6165: 481, 6163: 482, 6158: 483, 6157: 484,
+    6155: 485, 6151: 486, 6016: 487, 5952: 488, 5920: 489, 5904: 490,
+    5896: 491, 5892: 492, 5890: 493, 5889: 494, 5824: 495, 5792: 496,
+    5776: 497, 5768: 498, 5764: 499, 5762: 500, 5761: 501, 5728: 502,
+    5712: 503, 5704: 504, 5700: 505, 5698: 506, 5697: 507, 5680: 508,
+    5672: 509, 5668: 510, 5666: 511, 5665: 512, 5656: 513, 5652: 514,
+    5650: 515, 5649: 516, 5644: 517, 5642: 518, 5641: 519, 5638: 520,
+    5637: 521, 5635: 522, 5568: 523, 5536: 524, 5520: 525, 5512: 526,
+    5508: 527, 5506: 528, 5505: 529, 5472: 530, 5456: 531, 5448: 532,
+    5444: 533, 5442: 534, 5441: 535, 5424: 536, 5416: 537, 5412: 538,
+    5410: 539, 5409: 540, 5400: 541, 5396: 542, 5394: 543, 5393: 544,
+    5388: 545, 5386: 546, 5385: 547, 5382: 548, 5381: 549, 5379: 550,
+    5344: 551, 5328: 552, 5320: 553, 5316: 554, 5314: 555, 5313: 556,
+    5296: 557, 5288: 558, 5284: 559, 5282: 560, 5281: 561, 5272: 562,
+    5268: 563, 5266: 564, 5265: 565, 5260: 566, 5258: 567, 5257: 568,
+    5254: 569, 5253: 570, 5251: 571, 5232: 572, 5224: 573, 5220: 574,
+    5218: 575, 5217: 576, 5208: 577, 5204: 578, 5202: 579, 5201: 580,
+    5196: 581, 5194: 582, 5193: 583, 5190: 584, 5189: 585, 5187: 586,
+    5176: 587, 5172: 588, 5170: 589, 5169: 590, 5164: 591, 5162: 592,
+    5161: 593, 5158: 594, 5157: 595, 5155: 596, 5148: 597, 5146: 598,
+    5145: 599, 5142: 600, 5141: 601, 5139: 602, 5134: 603, 5133: 604,
+    5131: 605, 5127: 606, 5056: 607, 5024: 608, 5008: 609, 5000: 610,
+    4996: 611, 4994: 612, 4993: 613, 4960: 614, 4944: 615, 4936: 616,
+    4932: 617, 4930: 618, 4929: 619, 4912: 620, 4904: 621, 4900: 622,
+    4898: 623, 4897: 624, 4888: 625, 4884: 626, 4882: 627, 4881: 628,
+    4876: 629, 4874: 630, 4873: 631, 4870: 632, 4869: 633, 4867: 634,
+    4832: 635, 4816: 636, 4808: 637, 4804: 638, 4802: 639, 4801: 640,
+    4784: 641, 4776: 642, 4772: 643, 4770: 644, 4769: 645, 4760: 646,
+    4756: 647, 4754: 648, 4753: 649, 4748: 650, 4746: 651, 4745: 652,
+    4742: 653, 4741: 654, 4739: 655, 4720: 656, 4712: 657, 4708: 658,
+    4706: 659, 4705: 660, 4696: 661, 4692: 662, 4690: 663, 4689: 664,
+    4684: 665, 4682: 666, 4681: 667, 4678: 668, 4677: 669, 4675: 670,
+    4664: 671, 4660: 672, 4658: 673, 4657: 674, 4652: 675, 4650: 676,
+    4649: 677, 4646: 678, 4645: 679, 4643: 680, 4636: 681, 4634: 682,
+    4633: 683, 4630: 684, 4629: 685, 4627: 686, 4622: 687, 4621: 688,
+    4619: 689, 4615: 690, 4576: 691, 4560: 692, 4552: 693, 4548: 694,
+    4546: 695, 4545: 696, 4528: 697, 4520: 698, 4516: 699, 4514: 700,
+    4513: 701, 4504: 702, 4500: 703, 4498: 704, 4497: 705, 4492: 706,
+    4490: 707, 4489: 708, 4486: 709, 4485: 710, 4483: 711, 4464: 712,
+    4456: 713, 4452: 714, 4450: 715, 4449: 716, 4440: 717, 4436: 718,
+    4434: 719, 4433: 720, 4428: 721, 4426: 722, 4425: 723, 4422: 724,
+    4421: 725, 4419: 726, 4408: 727, 4404: 728, 4402: 729, 4401: 730,
+    4396: 731, 4394: 732, 4393: 733, 4390: 734, 4389: 735, 4387: 736,
+    4380: 737, 4378: 738, 4377: 739, 4374: 740, 4373: 741, 4371: 742,
+    4366: 743, 4365: 744, 4363: 745, 4359: 746, 4336: 747, 4328: 748,
+    4324: 749, 4322: 750, 4321: 751, 4312: 752, 4308: 753, 4306: 754,
+    4305: 755, 4300: 756, 4298: 757, 4297: 758, 4294: 759, 4293: 760,
+    4291: 761, 4280: 762, 4276: 763, 4274: 764, 4273: 765, 4268: 766,
+    4266: 767, 4265: 768, 4262: 769, 4261: 770, 4259: 771, 4252: 772,
+    4250: 773, 4249: 774, 4246: 775, 4245: 776, 4243: 777, 4238: 778,
+    4237: 779, 4235: 780, 4231: 781, 4216: 782, 4212: 783, 4210: 784,
+    4209: 785, 4204: 786, 4202: 787, 4201: 788, 4198: 789, 4197: 790,
+    4195: 791, 4188: 792, 4186: 793, 4185: 794, 4182: 795, 4181: 796,
+    4179: 797, 4174: 798, 4173: 799, 4171: 800, 4167: 801, 4156: 802,
+    4154: 803, 4153: 804, 4150: 805, 4149: 806, 4147: 807, 4142: 808,
+    4141: 809, 4139: 810, 4135: 811, 4126: 812, 4125: 813, 4123: 814,
+    4119: 815, 3904: 816, 3872: 817, 3856: 818, 3848: 819, 3844: 820,
+    3842: 821, 3841: 822, 3776: 823, 3744: 824, 3728: 825, 3720: 826,
+    3716: 827, 3714: 828, 3713: 829, 3680: 830, 3664: 831, 3656: 832,
+    3652: 833, 3650: 834, 3649: 835, 3632: 836, 3624: 837, 3620: 838,
+    3618: 839, 3617: 840, 3608: 841, 3604: 842, 3602: 843, 3601: 844,
+    3596: 845, 3594: 846, 3593: 847, 3590: 848, 3589: 849, 3587: 850,
+    3520: 851, 3488: 852, 3472: 853, 3464: 854, 3460: 855, 3458: 856,
+    3457: 857, 3424: 858, 3408: 859, 3400: 860, 3396: 861, 3394: 862,
+    3393: 863, 3376: 864, 3368: 865, 3364: 866, 3362: 867, 3361: 868,
+    3352: 869, 3348: 870, 3346: 871, 3345: 872, 3340: 873, 3338: 874,
+    3337: 875, 3334: 876, 3333: 877, 3331: 878, 3296: 879, 3280: 880,
+    3272: 881, 3268: 882, 3266: 883, 3265: 884, 3248: 885, 3240: 886,
+    3236: 887, 3234: 888, 3233: 889, 3224: 890, 3220: 891, 3218: 892,
+    3217: 893, 3212: 894, 3210: 895, 3209: 896, 3206: 897, 3205: 898,
+    3203: 899, 3184: 900, 3176: 901, 3172: 902, 3170: 903, 3169: 904,
+    3160: 905, 3156: 906, 3154: 907, 3153: 908, 3148: 909, 3146: 910,
+    3145: 911, 3142: 912, 3141: 913, 3139: 914, 3128: 915, 3124: 916,
+    3122: 917, 3121: 918, 3116: 919, 3114: 920, 3113: 921, 3110: 922,
+    3109: 923, 3107: 924, 3100: 925, 3098: 926, 3097: 927, 3094: 928,
+    3093: 929, 3091: 930, 3086: 931, 3085: 932, 3083: 933, 3079: 934,
+    3008: 935, 2976: 936, 2960: 937, 2952: 938, 2948: 939, 2946: 940,
+    2945: 941, 2912: 942, 2896: 943, 2888: 944, 2884: 945, 2882: 946,
+    2881: 947, 2864: 948, 2856: 949, 2852: 950, 2850: 951, 2849: 952,
+    2840: 953, 2836: 954, 2834: 955, 2833: 956, 2828: 957, 2826: 958,
+    2825: 959, 2822: 960, 2821: 961, 2819: 962, 2784: 963, 2768: 964,
+    2760: 965, 2756: 966, 2754: 967, 2753: 968, 2736: 969, 2728: 970,
+    2724: 971, 2722: 972, 2721: 973, 2712: 974, 2708: 975, 2706: 976,
+    2705: 977, 2700: 978, 2698: 979, 2697: 980, 2694: 981, 2693: 982,
+    2691: 983, 2672: 984, 2664: 985, 2660: 986, 2658: 987, 2657: 988,
+    2648: 989, 2644: 990, 2642: 991, 2641: 992, 2636: 993, 2634: 994,
+    2633: 995, 2630: 996, 2629: 997, 2627: 998, 2616: 999, 2612: 1000,
+    2610: 1001, 2609: 1002, 2604: 1003, 2602: 1004, 2601: 1005, 2598: 1006,
+    2597: 1007, 2595: 1008, 2588: 1009, 2586: 1010, 2585: 1011, 2582: 1012,
+    2581: 1013, 2579: 1014, 2574: 1015, 2573: 1016, 2571: 1017, 2567: 1018,
+    2528: 1019, 2512: 1020, 2504: 1021, 2500: 1022, 2498: 1023, 2497: 1024,
+    2480: 1025, 2472: 1026, 2468: 1027, 2466: 1028, 2465: 1029, 2456: 1030,
+    2452: 1031, 2450: 1032, 2449: 1033, 2444: 1034, 2442: 1035, 2441: 1036,
+    2438: 1037, 2437: 1038, 2435: 1039, 2416: 1040, 2408: 1041, 2404: 1042,
+    2402: 1043, 2401: 1044, 2392: 1045, 2388: 1046, 2386: 1047, 2385: 1048,
+    2380: 1049, 2378: 1050, 2377: 1051, 2374: 1052, 2373: 1053, 2371: 1054,
+    2360: 1055, 2356: 1056, 2354: 1057, 2353: 1058, 2348: 1059, 2346: 1060,
+    2345: 1061, 2342: 1062, 2341: 1063, 2339: 1064, 2332: 1065, 2330: 1066,
+    2329: 1067, 2326: 1068, 2325: 1069, 2323: 1070, 2318: 1071, 2317: 1072,
+    2315: 1073, 2311: 1074, 2288: 1075, 2280: 1076, 2276: 1077, 2274: 1078,
+    2273: 1079, 2264: 1080, 2260: 1081, 2258: 1082, 2257: 1083, 2252: 1084,
+    2250: 1085, 2249: 1086, 2246: 1087, 2245: 1088, 2243: 1089, 2232: 1090,
+    2228: 1091, 2226: 1092, 2225: 1093, 2220: 1094, 2218: 1095, 2217: 1096,
+    2214: 1097, 2213: 1098, 2211: 1099, 2204: 1100, 2202: 1101, 2201: 1102,
+    2198: 1103, 2197: 1104, 2195: 1105, 2190: 1106, 2189: 1107, 2187: 1108,
+    2183: 1109, 2168: 1110, 2164: 1111, 2162: 1112, 2161: 1113, 2156: 1114,
+    2154: 1115, 2153: 1116, 2150: 1117, 2149: 1118, 2147: 1119, 2140: 1120,
+    2138: 1121, 2137: 1122, 2134: 1123, 2133: 1124, 2131: 1125, 2126: 1126,
+    2125: 1127, 2123: 1128, 2119: 1129, 2108: 1130, 2106: 1131, 2105: 1132,
+    2102: 1133, 2101: 1134, 2099: 1135, 2094: 1136, 2093: 1137, 2091: 1138,
+    2087: 1139, 2078: 1140, 2077: 1141, 2075: 1142, 2071: 1143, 2063: 1144,
+    1952: 1145, 1936: 1146, 1928: 1147, 1924: 1148, 1922: 1149, 1921: 1150,
+    1888: 1151, 1872: 1152, 1864: 1153, 1860: 1154, 1858: 1155, 1857: 1156,
+    1840: 1157, 1832: 1158, 1828: 1159, 1826: 1160, 1825: 1161, 1816: 1162,
+    1812: 1163, 1810: 1164, 1809: 1165, 1804: 1166, 1802: 1167, 1801: 1168,
+    1798: 1169, 1797: 1170, 1795: 1171, 1760: 1172, 1744: 1173, 1736: 1174,
+    1732: 1175, 1730: 1176, 1729: 1177, 1712: 1178, 1704: 1179, 1700: 1180,
+    1698: 1181, 1697: 1182, 1688: 1183, 1684: 1184, 1682: 1185, 1681: 1186,
+    1676: 1187, 1674: 1188, 1673: 1189, 1670: 1190, 1669: 1191, 1667: 1192,
+    1648: 1193, 1640: 1194, 1636: 1195, 1634: 1196, 1633: 1197, 1624: 1198,
+    1620: 1199, 1618: 1200, 1617: 1201, 1612: 1202, 1610: 1203, 1609: 1204,
+    1606: 1205, 1605: 1206, 1603: 1207, 1592: 1208, 1588: 1209, 1586: 1210,
+    1585: 1211, 1580: 1212, 1578: 1213, 1577: 1214, 1574: 1215, 1573: 1216,
+    1571: 1217, 1564: 1218, 1562: 1219, 1561: 1220, 1558: 1221, 1557: 1222,
+    1555: 1223, 1550: 1224, 1549: 1225, 1547: 1226, 1543: 1227, 1504: 1228,
+    1488: 1229, 1480: 1230, 1476: 1231, 1474: 1232, 1473: 1233, 1456: 1234,
+    1448: 1235, 1444: 1236, 1442: 1237, 1441: 1238, 1432: 1239, 1428: 1240,
+    1426: 1241, 1425: 1242, 1420: 1243, 1418: 1244, 1417: 1245, 1414: 1246,
+    1413: 1247, 1411: 1248, 1392: 1249, 1384: 1250, 1380: 1251, 1378: 1252,
+    1377: 1253, 1368: 1254, 1364: 1255, 1362: 1256, 1361: 1257, 1356: 1258,
+    1354: 1259, 1353: 1260, 1350: 1261, 1349: 1262, 1347: 1263, 1336: 1264,
+    1332: 1265, 1330: 1266, 1329: 1267, 1324: 1268, 1322: 1269, 1321: 1270,
+    1318: 1271, 1317: 1272, 1315: 1273, 1308: 1274, 1306: 1275, 1305: 1276,
+    1302: 1277, 1301: 1278, 1299: 1279, 1294: 1280, 1293: 1281, 1291: 1282,
+    1287: 1283, 1264: 1284, 1256: 1285, 1252: 1286, 1250: 1287, 1249: 1288,
+    1240: 1289, 1236: 1290, 1234: 1291, 1233: 1292, 1228: 1293, 1226: 1294,
+    1225: 1295, 1222: 1296, 1221: 1297, 1219: 1298, 1208: 1299, 1204: 1300,
+    1202: 1301, 1201: 1302, 1196: 1303, 1194: 1304, 1193: 1305, 1190: 1306,
+    1189: 1307, 1187: 1308, 1180: 1309, 1178: 1310, 1177: 1311, 1174: 1312,
+    1173: 1313, 1171: 1314, 1166: 1315, 1165: 1316, 1163: 1317, 1159: 1318,
+    1144: 1319, 1140: 1320, 1138: 1321, 1137: 1322, 1132: 1323, 1130: 1324,
+    1129: 1325, 1126: 1326, 1125: 1327, 1123: 1328, 1116: 1329, 1114: 1330,
+    1113: 1331, 1110: 1332, 1109: 1333, 1107: 1334, 1102: 1335, 1101: 1336,
+    1099: 1337, 1095: 1338, 1084: 1339, 1082: 1340, 1081: 1341, 1078: 1342,
+    1077: 1343, 1075: 1344, 1070: 1345, 1069: 1346, 1067: 1347, 1063: 1348,
+    1054: 1349, 1053: 1350, 1051: 1351, 1047: 1352, 1039: 1353, 976: 1354,
+    968: 1355, 964: 1356, 962: 1357, 961: 1358, 944: 1359, 936: 1360,
+    932: 1361, 930: 1362, 929: 1363, 920: 1364, 916: 1365, 914: 1366,
+    913: 1367, 908: 1368, 906: 1369, 905: 1370, 902: 1371, 901: 1372,
+    899: 1373, 880: 1374, 872: 1375, 868: 1376, 866: 1377, 865: 1378,
+    856: 1379, 852: 1380, 850: 1381, 849: 1382, 844: 1383, 842: 1384,
+    841: 1385, 838: 1386, 837: 1387, 835: 1388, 824: 1389, 820: 1390,
+    818: 1391, 817: 1392, 812: 1393, 810: 1394, 809: 1395, 806: 1396,
+    805: 1397, 803: 1398, 796: 1399, 794: 1400, 793: 1401, 790: 1402,
+    789: 1403, 787: 1404, 782: 1405, 781: 1406, 779: 1407, 775: 1408,
+    752: 1409, 744: 1410, 740: 1411, 738: 1412, 737: 1413, 728: 1414,
+    724: 1415, 722: 1416, 721: 1417, 716: 1418, 714: 1419, 713: 1420,
+    710: 1421, 709: 1422, 707: 1423, 696: 1424, 692: 1425, 690: 1426,
+    689: 1427, 684: 1428, 682: 1429, 681: 1430, 678: 1431, 677: 1432,
+    675: 1433, 668: 1434, 666: 1435, 665: 1436, 662: 1437, 661: 1438,
+    659: 1439, 654: 1440, 653: 1441, 651: 1442, 647: 1443, 632: 1444,
+    628: 1445, 626: 1446, 625: 1447, 620: 1448, 618: 1449, 617: 1450,
+    614: 1451, 613: 1452, 611: 1453, 604: 1454, 602: 1455, 601: 1456,
+    598: 1457, 597: 1458, 595: 1459, 590: 1460, 589: 1461, 587: 1462,
+    583: 1463, 572: 1464, 570: 1465, 569: 1466, 566: 1467, 565: 1468,
+    563: 1469, 558: 1470, 557: 1471, 555: 1472, 551: 1473, 542: 1474,
+    541: 1475, 539: 1476, 535: 1477, 527: 1478, 488: 1479, 484: 1480,
+    482: 1481, 481: 1482, 472: 1483, 468: 1484, 466: 1485, 465: 1486,
+    460: 1487, 458: 1488, 457: 1489, 454: 1490, 453: 1491, 451: 1492,
+    440: 1493, 436: 1494, 434: 1495, 433: 1496, 428: 1497, 426: 1498,
+    425: 1499, 422: 1500, 421: 1501, 419: 1502, 412: 1503, 410: 1504,
+    409: 1505, 406: 1506, 405: 1507, 403: 1508, 398: 1509, 397: 1510,
+    395: 1511, 391: 1512, 376: 1513, 372: 1514, 370: 1515, 369: 1516,
+    364: 1517, 362: 1518, 361: 1519, 358: 1520, 357: 1521, 355: 1522,
+    348: 1523, 346: 1524, 345: 1525, 342: 1526, 341: 1527, 339: 1528,
+    334: 1529, 333: 1530, 331: 1531, 327: 1532, 316: 1533, 314: 1534,
+    313: 1535, 310: 1536, 309: 1537, 307: 1538, 302: 1539, 301: 1540,
+    299: 1541, 295: 1542, 286: 1543, 285: 1544, 283: 1545, 279: 1546,
+    271: 1547, 244: 1548, 242: 1549, 241: 1550, 236: 1551, 234: 1552,
+    233: 1553, 230: 1554, 229: 1555, 227: 1556, 220: 1557, 218: 1558,
+    217: 1559, 214: 1560, 213: 1561, 211: 1562, 206: 1563, 205: 1564,
+    203: 1565, 199: 1566, 188: 1567, 186: 1568, 185: 1569, 182: 1570,
+    181: 1571, 179: 1572, 174: 1573, 173: 1574, 171: 1575, 167: 1576,
+    158: 1577, 157: 1578, 155: 1579, 151: 1580, 143: 1581, 122: 1582,
+    121: 1583, 118: 1584, 117: 1585, 115: 1586, 110: 1587, 109: 1588,
+    107: 1589, 103: 1590, 94: 1591, 93: 1592, 91: 1593, 87: 1594, 79: 1595,
+    61: 1596, 59: 1597, 55: 1598, 47: 1599, 63: 8, 95: 9, 159: 9, 287: 9,
+    543: 9, 1055: 9, 2079: 9, 4127: 9, 111: 1587, 175: 1573, 303: 1539,
+    559: 1470, 1071: 1345, 2095: 1136, 4143: 10, 207: 1563, 335: 1529,
+    591: 1460, 1103: 1335, 2127: 1126, 4175: 10, 399: 1509, 655: 1440,
+    1167: 1315, 2191: 1106, 4239: 10, 783: 1405, 1295: 1280, 2319: 1071,
+    4367: 10, 1551: 1224, 2575: 1015, 4623: 10, 3087: 931, 5135: 10, 6159: 10,
+    119: 1584, 183: 1570, 311: 1536, 567: 1467, 1079: 1342, 2103: 1133,
+    4151: 805, 215: 1560, 343: 1526, 599: 1457, 1111: 1332, 2135: 1123,
+    4183: 795, 407: 1506, 663: 1437, 1175: 1312, 2199: 1103, 4247: 775,
+    791: 1402, 1303: 1277, 2327: 1068, 4375: 740, 1559: 1221, 2583: 1012,
+    4631: 684, 3095: 928, 5143: 600, 6167: 480, 231: 1554, 359: 1520,
+    615: 1451, 1127: 1326, 2151: 1117, 4199: 789, 423: 1500, 679: 1431,
+    1191: 1306, 2215: 1097, 4263: 769, 807: 1396, 1319: 1271, 2343: 1062,
+    4391: 734, 1575: 1215, 2599: 1006, 4647: 678, 3111: 922, 5159: 594,
+    6183: 474, 455: 1490, 711: 1421, 1223: 1296, 2247: 1087, 4295: 759,
+    839: 1386, 1351: 1261, 2375: 1052, 4423: 724, 1607: 1205, 2631: 996,
+    4679: 668, 3143: 912, 5191: 584, 6215: 464, 903: 1371, 1415: 1246,
+    2439: 1037, 4487: 709, 1671: 1190, 2695: 981, 4743: 653, 3207: 897,
+    5255: 569, 6279: 449, 1799: 1169, 2823: 960, 4871: 632, 3335: 876,
+    5383: 548, 6407: 428, 3591: 848, 5639: 520, 6663: 400, 7175: 364,
+    123: 1582, 187: 1568, 315: 1534, 571: 1465, 1083: 1340, 2107: 1131,
+    4155: 803, 219: 1558, 347: 1524, 603: 1455, 1115: 1330, 2139: 1121,
+    4187: 793, 411: 1504, 667: 1435, 1179: 1310, 2203: 1101, 4251: 773,
+    795: 1400, 1307: 1275, 2331: 1066, 4379: 738, 1563: 1219, 2587: 1010,
+    4635: 682, 3099: 926, 5147: 598, 6171: 478, 235: 1552, 363: 1518,
+    619: 1449, 1131: 1324, 2155: 1115, 4203: 787, 427: 1498, 683: 1429,
+    1195: 1304, 2219: 1095, 4267: 767, 811: 1394, 1323: 1269, 2347: 1060,
+    4395: 732, 1579: 1213, 2603: 1004, 4651: 676, 3115: 920, 5163: 592,
+    6187: 472, 459: 1488, 715: 1419, 1227: 1294, 2251: 1085, 4299: 757,
+    843: 1384, 1355: 1259, 2379: 1050, 4427: 722, 1611: 1203, 2635: 994,
+    4683: 666, 3147: 910, 5195: 582, 6219: 462, 907: 1369, 1419: 1244,
+    2443: 1035, 4491: 707, 1675: 1188, 2699: 979, 4747: 651, 3211: 895,
+    5259: 567, 6283: 447, 1803: 1167, 2827: 958, 4875: 630, 3339: 874,
+    5387: 546, 6411: 426, 3595: 846, 5643: 518, 6667: 398, 7179: 362,
+    243: 1549, 371: 1515, 627: 1446, 1139: 1321, 2163: 1112, 4211: 784,
+    435: 1495, 691: 1426, 1203: 1301, 2227: 1092, 4275: 764, 819: 1391,
+    1331: 1266, 2355: 1057, 4403: 729, 1587: 1210, 2611: 1001, 4659: 673,
+    3123: 917, 5171: 589, 6195: 469, 467: 1485, 723: 1416, 1235: 1291,
+    2259: 1082, 4307: 754, 851: 1381, 1363: 1256, 2387: 1047, 4435: 719,
+    1619: 1200, 2643: 991, 4691: 663, 3155: 907, 5203: 579, 6227: 459,
+    915: 1366, 1427: 1241, 2451: 1032, 4499: 704, 1683: 1185, 2707: 976,
+    4755: 648, 3219: 892, 5267: 564, 6291: 444, 1811: 1164, 2835: 955,
+    4883: 627, 3347: 871, 5395: 543, 6419: 423, 3603: 843, 5651: 515,
+    6675: 395, 7187: 359, 483: 1481, 739: 1412, 1251: 1287, 2275: 1078,
+    4323: 750, 867: 1377, 1379: 1252, 2403: 1043, 4451: 715, 1635: 1196,
+    2659: 987, 4707: 659, 3171: 903, 5219: 575, 6243: 455, 931: 1362,
+    1443: 1237, 2467: 1028, 4515: 700, 1699: 1181, 2723: 972, 4771: 644,
+    3235: 888, 5283: 560, 6307: 440, 1827: 1160, 2851: 951, 4899: 623,
+    3363: 867, 5411: 539, 6435: 419, 3619: 839, 5667: 511, 6691: 391,
+    7203: 355, 963: 1357, 1475: 1232, 2499: 1023, 4547: 695, 1731: 1176,
+    2755: 967, 4803: 639, 3267: 883, 5315: 555, 6339: 435, 1859: 1155,
+    2883: 946, 4931: 618, 3395: 862, 5443: 534, 6467: 414, 3651: 834,
+    5699: 506, 6723: 386, 7235: 350, 1923: 1149, 2947: 940, 4995: 612,
+    3459: 856, 5507: 528, 6531: 408, 3715: 828, 5763: 500, 6787: 380,
+    7299: 344, 3843: 821, 5891: 493, 6915: 373, 7427: 337, 7683: 329, 125: 7,
+    189: 1567, 317: 1533, 573: 1464, 1085: 1339, 2109: 1130, 4157: 802,
+    221: 1557, 349: 1523, 605: 1454, 1117: 1329, 2141: 1120, 4189: 792,
+    413: 1503, 669: 1434, 1181: 1309, 2205: 1100, 4253: 772, 797: 1399,
+    1309: 1274, 2333: 1065, 4381: 737, 1565: 1218, 2589: 1009, 4637: 681,
+    3101: 925, 5149: 597, 6173: 477, 237: 1551, 365: 1517, 621: 1448,
+    1133: 1323, 2157: 1114, 4205: 786, 429: 1497, 685: 1428, 1197: 1303,
+    2221: 1094, 4269: 766, 813: 1393, 1325: 1268, 2349: 1059, 4397: 731,
+    1581: 1212, 2605: 1003, 4653: 675, 3117: 919, 5165: 591, 6189: 471,
+    461: 1487, 717: 1418, 1229: 1293, 2253: 1084, 4301: 756, 845: 1383,
+    1357: 1258, 2381: 1049, 4429: 721, 1613: 1202, 2637: 993, 4685: 665,
+    3149: 909, 5197: 581, 6221: 461, 909: 1368, 1421: 1243, 2445: 1034,
+    4493: 706, 1677: 1187, 2701: 978, 4749: 650, 3213: 894, 5261: 566,
+    6285: 446, 1805: 1166, 2829: 957, 4877: 629, 3341: 873, 5389: 545,
+    6413: 425, 3597: 845, 5645: 517, 6669: 397, 7181: 361, 245: 1548,
+    373: 1514, 629: 1445, 1141: 1320, 2165: 1111, 4213: 783, 437: 1494,
+    693: 1425, 1205: 1300, 2229: 1091, 4277: 763, 821: 1390, 1333: 1265,
+    2357: 1056, 4405: 728, 1589: 1209, 2613: 1000, 4661: 672, 3125: 916,
+    5173: 588, 6197: 468, 469: 1484, 725: 1415, 1237: 1290, 2261: 1081,
+    4309: 753, 853: 1380, 1365: 1255, 2389: 1046, 4437: 718, 1621: 1199,
+    2645: 990, 4693: 662, 3157: 906, 5205: 578, 6229: 458, 917: 1365,
+    1429: 1240, 2453: 1031, 4501: 703, 1685: 1184, 2709: 975, 4757: 647,
+    3221: 891, 5269: 563, 6293: 443, 1813: 1163, 2837: 954, 4885: 626,
+    3349: 870, 5397: 542, 6421: 422, 3605: 842, 5653: 514, 6677: 394,
+    7189: 358, 485: 1480, 741: 1411, 1253: 1286, 2277: 1077, 4325: 749,
+    869: 1376, 1381: 1251, 2405: 1042, 4453: 714, 1637: 1195, 2661: 986,
+    4709: 658, 3173: 902, 5221: 574, 6245: 454, 933: 1361, 1445: 1236,
+    2469: 1027, 4517: 699, 1701: 1180, 2725: 971, 4773: 643, 3237: 887,
+    5285: 559, 6309: 439, 1829: 1159, 2853: 950, 4901: 622, 3365: 866,
+    5413: 538, 6437: 418, 3621: 838, 5669: 510, 6693: 390, 7205: 354,
+    965: 1356, 1477: 1231, 2501: 1022, 4549: 694, 1733: 1175, 2757: 966,
+    4805: 638, 3269: 882, 5317: 554, 6341: 434, 1861: 1154, 2885: 945,
+    4933: 617, 3397: 861, 5445: 533, 6469: 413, 3653: 833, 5701: 505,
+    6725: 385, 7237: 349, 1925: 1148, 2949: 939, 4997: 611, 3461: 855,
+    5509: 527, 6533: 407, 3717: 827, 5765: 499, 6789: 379, 7301: 343,
+    3845: 820, 5893: 492, 6917: 372, 7429: 336, 7685: 328, 249: 6, 377: 1513,
+    633: 1444, 1145: 1319, 2169: 1110, 4217: 782, 441: 1493, 697: 1424,
+    1209: 1299, 2233: 1090, 4281: 762, 825: 1389, 1337: 1264, 2361: 1055,
+    4409: 727, 1593: 1208, 2617: 999, 4665: 671, 3129: 915, 5177: 587,
+    6201: 467, 473: 1483, 729: 1414, 1241: 1289, 2265: 1080, 4313: 752,
+    857: 1379, 1369: 1254, 2393: 1045, 4441: 717, 1625: 1198, 2649: 989,
+    4697: 661, 3161: 905, 5209: 577, 6233: 457, 921: 1364, 1433: 1239,
+    2457: 1030, 4505: 702, 1689: 1183, 2713: 974, 4761: 646, 3225: 890,
+    5273: 562, 6297: 442, 1817: 1162, 2841: 953, 4889: 625, 3353: 869,
+    5401: 541, 6425: 421, 3609: 841, 5657: 513, 6681: 393, 7193: 357,
+    489: 1479, 745: 1410, 1257: 1285, 2281: 1076, 4329: 748, 873: 1375,
+    1385: 1250, 2409: 1041, 4457: 713, 1641: 1194, 2665: 985, 4713: 657,
+    3177: 901, 5225: 573, 6249: 453, 937: 1360, 1449: 1235, 2473: 1026,
+    4521: 698, 1705: 1179, 2729: 970, 4777: 642, 3241: 886, 5289: 558,
+    6313: 438, 1833: 1158, 2857: 949, 4905: 621, 3369: 865, 5417: 537,
+    6441: 417, 3625: 837, 5673: 509, 6697: 389, 7209: 353, 969: 1355,
+    1481: 1230, 2505: 1021, 4553: 693, 1737: 1174, 2761: 965, 4809: 637,
+    3273: 881, 5321: 553, 6345: 433, 1865: 1153, 2889: 944, 4937: 616,
+    3401: 860, 5449: 532, 6473: 412, 3657: 832, 5705: 504, 6729: 384,
+    7241: 348, 1929: 1147, 2953: 938, 5001: 610, 3465: 854, 5513: 526,
+    6537: 406, 3721: 826, 5769: 498, 6793: 378, 7305: 342, 3849: 819,
+    5897: 491, 6921: 371, 7433: 335, 7689: 327, 497: 5, 753: 1409, 1265: 1284,
+    2289: 1075, 4337: 747, 881: 1374, 1393: 1249, 2417: 1040, 4465: 712,
+    1649: 1193, 2673: 984, 4721: 656, 3185: 900, 5233: 572, 6257: 452,
+    945: 1359, 1457: 1234, 2481: 1025, 4529: 697, 1713: 1178, 2737: 969,
+    4785: 641, 3249: 885, 5297: 557, 6321: 437, 1841: 1157, 2865: 948,
+    4913: 620, 3377: 864, 5425: 536, 6449: 416, 3633: 836, 5681: 508,
+    6705: 388, 7217: 352, 977: 1354, 1489: 1229, 2513: 1020, 4561: 692,
+    1745: 1173, 2769: 964, 4817: 636, 3281: 880, 5329: 552, 6353: 432,
+    1873: 1152, 2897: 943, 4945: 615, 3409: 859, 5457: 531, 6481: 411,
+    3665: 831, 5713: 503, 6737: 383, 7249: 347, 1937: 1146, 2961: 937,
+    5009: 609, 3473: 853, 5521: 525, 6545: 405, 3729: 825, 5777: 497,
+    6801: 377, 7313: 341, 3857: 818, 5905: 490, 6929: 370, 7441: 334,
+    7697: 326, 993: 4, 1505: 1228, 2529: 1019, 4577: 691, 1761: 1172,
+    2785: 963, 4833: 635, 3297: 879, 5345: 551, 6369: 431, 1889: 1151,
+    2913: 942, 4961: 614, 3425: 858, 5473: 530, 6497: 410, 3681: 830,
+    5729: 502, 6753: 382, 7265: 346, 1953: 1145, 2977: 936, 5025: 608,
+    3489: 852, 5537: 524, 6561: 404, 3745: 824, 5793: 496, 6817: 376,
+    7329: 340, 3873: 817, 5921: 489, 6945: 369, 7457: 333, 7713: 325, 1985: 3,
+    3009: 935, 5057: 607, 3521: 851, 5569: 523, 6593: 403, 3777: 823,
+    5825: 495, 6849: 375, 7361: 339, 3905: 816, 5953: 488, 6977: 368,
+    7489: 332, 7745: 324, 3969: 2, 6017: 487, 7041: 367, 7553: 331, 7809: 323,
+    7937: 1, 126: 7, 190: 8, 318: 8, 574: 8, 1086: 8, 2110: 8, 4158: 8,
+    222: 1557, 350: 1523, 606: 1454, 1118: 1329, 2142: 1120, 4190: 792,
+    414: 1503, 670: 1434, 1182: 1309, 2206: 1100, 4254: 772, 798: 1399,
+    1310: 1274, 2334: 1065, 4382: 737, 1566: 1218, 2590: 1009, 4638: 681,
+    3102: 925, 5150: 597, 6174: 477, 238: 1551, 366: 1517, 622: 1448,
+    1134: 1323, 2158: 1114, 4206: 786, 430: 1497, 686: 1428, 1198: 1303,
+    2222: 1094, 4270: 766, 814: 1393, 1326: 1268, 2350: 1059, 4398: 731,
+    1582: 1212, 2606: 1003, 4654: 675, 3118: 919, 5166: 591, 6190: 471,
+    462: 1487, 718: 1418, 1230: 1293, 2254: 1084, 4302: 756, 846: 1383,
+    1358: 1258, 2382: 1049, 4430: 721, 1614: 1202, 2638: 993, 4686: 665,
+    3150: 909, 5198: 581, 6222: 461, 910: 1368, 1422: 1243, 2446: 1034,
+    4494: 706, 1678: 1187, 2702: 978, 4750: 650, 3214: 894, 5262: 566,
+    6286: 446, 1806: 1166, 2830: 957, 4878: 629, 3342: 873, 5390: 545,
+    6414: 425, 3598: 845, 5646: 517, 6670: 397, 7182: 361, 246: 1548,
+    374: 1514, 630: 1445, 1142: 1320, 2166: 1111, 4214: 783, 438: 1494,
+    694: 1425, 1206: 1300, 2230: 1091, 4278: 763, 822: 1390, 1334: 1265,
+    2358: 1056, 4406: 728, 1590: 1209, 2614: 1000, 4662: 672, 3126: 916,
+    5174: 588, 6198: 468, 470: 1484, 726: 1415, 1238: 1290, 2262: 1081,
+    4310: 753, 854: 1380, 1366: 1255, 2390: 1046, 4438: 718, 1622: 1199,
+    2646: 990, 4694: 662, 3158: 906, 5206: 578, 6230: 458, 918: 1365,
+    1430: 1240, 2454: 1031, 4502: 703, 1686: 1184, 2710: 975, 4758: 647,
+    3222: 891, 5270: 563, 6294: 443, 1814: 1163, 2838: 954, 4886: 626,
+    3350: 870, 5398: 542, 6422: 422, 3606: 842, 5654: 514, 6678: 394,
+    7190: 358, 486: 1480, 742: 1411, 1254: 1286, 2278: 1077, 4326: 749,
+    870: 1376, 1382: 1251, 2406: 1042, 4454: 714, 1638: 1195, 2662: 986,
+    4710: 658, 3174: 902, 5222: 574, 6246: 454, 934: 1361, 1446: 1236,
+    2470: 1027, 4518: 699, 1702: 1180, 2726: 971, 4774: 643, 3238: 887,
+    5286: 559, 6310: 439, 1830: 1159, 2854: 950, 4902: 622, 3366: 866,
+    5414: 538, 6438: 418, 3622: 838, 5670: 510, 6694: 390, 7206: 354,
+    966: 1356, 1478: 1231, 2502: 1022, 4550: 694, 1734: 1175, 2758: 966,
+    4806: 638, 3270: 882, 5318: 554, 6342: 434, 1862: 1154, 2886: 945,
+    4934: 617, 3398: 861, 5446: 533, 6470: 413, 3654: 833, 5702: 505,
+    6726: 385, 7238: 349, 1926: 1148, 2950: 939, 4998: 611, 3462: 855,
+    5510: 527, 6534: 407, 3718: 827, 5766: 499, 6790: 379, 7302: 343,
+    3846: 820, 5894: 492, 6918: 372, 7430: 336, 7686: 328, 250: 6, 378: 1513,
+    634: 1444, 1146: 1319, 2170: 1110, 4218: 782, 442: 1493, 698: 1424,
+    1210: 1299, 2234: 1090, 4282: 762, 826: 1389, 1338: 1264, 2362: 1055,
+    4410: 727, 1594: 1208, 2618: 999, 4666: 671, 3130: 915, 5178: 587,
+    6202: 467, 474: 1483, 730: 1414, 1242: 1289, 2266: 1080, 4314: 752,
+    858: 1379, 1370: 1254, 2394: 1045, 4442: 717, 1626: 1198, 2650: 989,
+    4698: 661, 3162: 905, 5210: 577, 6234: 457, 922: 1364, 1434: 1239,
+    2458: 1030, 4506: 702, 1690: 1183, 2714: 974, 4762: 646, 3226: 890,
+    5274: 562, 6298: 442, 1818: 1162, 2842: 953, 4890: 625, 3354: 869,
+    5402: 541, 6426: 421, 3610: 841, 5658: 513, 6682: 393, 7194: 357,
+    490: 1479, 746: 1410, 1258: 1285, 2282: 1076, 4330: 748, 874: 1375,
+    1386: 1250, 2410: 1041, 4458: 713, 1642: 1194, 2666: 985, 4714: 657,
+    3178: 901, 5226: 573, 6250: 453, 938: 1360, 1450: 1235, 2474: 1026,
+    4522: 698, 1706: 1179, 2730: 970, 4778: 642, 3242: 886, 5290: 558,
+    6314: 438, 1834: 1158, 2858: 949, 4906: 621, 3370: 865, 5418: 537,
+    6442: 417, 3626: 837, 5674: 509, 6698: 389, 7210: 353, 970: 1355,
+    1482: 1230, 2506: 1021, 4554: 693, 1738: 1174, 2762: 965, 4810: 637,
+    3274: 881, 5322: 553, 6346: 433, 1866: 1153, 2890: 944, 4938: 616,
+    3402: 860, 5450: 532, 6474: 412, 3658: 832, 5706: 504, 6730: 384,
+    7242: 348, 1930: 1147, 2954: 938, 5002: 610, 3466: 854, 5514: 526,
+    6538: 406, 3722: 826, 5770: 498, 6794: 378, 7306: 342, 3850: 819,
+    5898: 491, 6922: 371, 7434: 335, 7690: 327, 498: 5, 754: 1409, 1266: 1284,
+    2290: 1075, 4338: 747, 882: 1374, 1394: 1249, 2418: 1040, 4466: 712,
+    1650: 1193, 2674: 984, 4722: 656, 3186: 900, 5234: 572, 6258: 452,
+    946: 1359, 1458: 1234, 2482: 1025, 4530: 697, 1714: 1178, 2738: 969,
+    4786: 641, 3250: 885, 5298: 557, 6322: 437, 1842: 1157, 2866: 948,
+    4914: 620, 3378: 864, 5426: 536, 6450: 416, 3634: 836, 5682: 508,
+    6706: 388, 7218: 352, 978: 1354, 1490: 1229, 2514: 1020, 4562: 692,
+    1746: 1173, 2770: 964, 4818: 636, 3282: 880, 5330: 552, 6354: 432,
+    1874: 1152, 2898: 943, 4946: 615, 3410: 859, 5458: 531, 6482: 411,
+    3666: 831, 5714: 503, 6738: 383, 7250: 347, 1938: 1146, 2962: 937,
+    5010: 609, 3474: 853, 5522: 525, 6546: 405, 3730: 825, 5778: 497,
+    6802: 377, 7314: 341, 3858: 818, 5906: 490, 6930: 370, 7442: 334,
+    7698: 326, 994: 4, 1506: 1228, 2530: 1019, 4578: 691, 1762: 1172,
+    2786: 963, 4834: 635, 3298: 879, 5346: 551, 6370: 431, 1890: 1151,
+    2914: 942, 4962: 614, 3426: 858, 5474: 530, 6498: 410, 3682: 830,
+    5730: 502, 6754: 382, 7266: 346, 1954: 1145, 2978: 936, 5026: 608,
+    3490: 852, 5538: 524, 6562: 404, 3746: 824, 5794: 496, 6818: 376,
+    7330: 340, 3874: 817, 5922: 489, 6946: 369, 7458: 333, 7714: 325, 1986: 3,
+    3010: 935, 5058: 607, 3522: 851, 5570: 523, 6594: 403, 3778: 823,
+    5826: 495, 6850: 375, 7362: 339, 3906: 816, 5954: 488, 6978: 368,
+    7490: 332, 7746: 324, 3970: 2, 6018: 487, 7042: 367, 7554: 331, 7810: 323,
+    7938: 1, 252: 6, 380: 7, 636: 7, 1148: 7, 2172: 7, 4220: 7, 444: 1493,
+    700: 1424, 1212: 1299, 2236: 1090, 4284: 762, 828: 1389, 1340: 1264,
+    2364: 1055, 4412: 727, 1596: 1208, 2620: 999, 4668: 671, 3132: 915,
+    5180: 587, 6204: 467, 476: 1483, 732: 1414, 1244: 1289, 2268: 1080,
+    4316: 752, 860: 1379, 1372: 1254, 2396: 1045, 4444: 717, 1628: 1198,
+    2652: 989, 4700: 661, 3164: 905, 5212: 577, 6236: 457, 924: 1364,
+    1436: 1239, 2460: 1030, 4508: 702, 1692: 1183, 2716: 974, 4764: 646,
+    3228: 890, 5276: 562, 6300: 442, 1820: 1162, 2844: 953, 4892: 625,
+    3356: 869, 5404: 541, 6428: 421, 3612: 841, 5660: 513, 6684: 393,
+    7196: 357, 492: 1479, 748: 1410, 1260: 1285, 2284: 1076, 4332: 748,
+    876: 1375, 1388: 1250, 2412: 1041, 4460: 713, 1644: 1194, 2668: 985,
+    4716: 657, 3180: 901, 5228: 573, 6252: 453, 940: 1360, 1452: 1235,
+    2476: 1026, 4524: 698, 1708: 1179, 2732: 970, 4780: 642, 3244: 886,
+    5292: 558, 6316: 438, 1836: 1158, 2860: 949, 4908: 621, 3372: 865,
+    5420: 537, 6444: 417, 3628: 837, 5676: 509, 6700: 389, 7212: 353,
+    972: 1355, 1484: 1230, 2508: 1021, 4556: 693, 1740: 1174, 2764: 965,
+    4812: 637, 3276: 881, 5324: 553, 6348: 433, 1868: 1153, 2892: 944,
+    4940: 616, 3404: 860, 5452: 532, 6476: 412, 3660: 832, 5708: 504,
+    6732: 384, 7244: 348, 1932: 1147, 2956: 938, 5004: 610, 3468: 854,
+    5516: 526, 6540: 406, 3724: 826, 5772: 498, 6796: 378, 7308: 342,
+    3852: 819, 5900: 491, 6924: 371, 7436: 335, 7692: 327, 500: 5, 756: 1409,
+    1268: 1284, 2292: 1075, 4340: 747, 884: 1374, 1396: 1249, 2420: 1040,
+    4468: 712, 1652: 1193, 2676: 984, 4724: 656, 3188: 900, 5236: 572,
+    6260: 452, 948: 1359, 1460: 1234, 2484: 1025, 4532: 697, 1716: 1178,
+    2740: 969, 4788: 641, 3252: 885, 5300: 557, 6324: 437, 1844: 1157,
+    2868: 948, 4916: 620, 3380: 864, 5428: 536, 6452: 416, 3636: 836,
+    5684: 508, 6708: 388, 7220: 352, 980: 1354, 1492: 1229, 2516: 1020,
+    4564: 692, 1748: 1173, 2772: 964, 4820: 636, 3284: 880, 5332: 552,
+    6356: 432, 1876: 1152, 2900: 943, 4948: 615, 3412: 859, 5460: 531,
+    6484: 411, 3668: 831, 5716: 503, 6740: 383, 7252: 347, 1940: 1146,
+    2964: 937, 5012: 609, 3476: 853, 5524: 525, 6548: 405, 3732: 825,
+    5780: 497, 6804: 377, 7316: 341, 3860: 818, 5908: 490, 6932: 370,
+    7444: 334, 7700: 326, 996: 4, 1508: 1228, 2532: 1019, 4580: 691,
+    1764: 1172, 2788: 963, 4836: 635, 3300: 879, 5348: 551, 6372: 431,
+    1892: 1151, 2916: 942, 4964: 614, 3428: 858, 5476: 530, 6500: 410,
+    3684: 830, 5732: 502, 6756: 382, 7268: 346, 1956: 1145, 2980: 936,
+    5028: 608, 3492: 852, 5540: 524, 6564: 404, 3748: 824, 5796: 496,
+    6820: 376, 7332: 340, 3876: 817, 5924: 489, 6948: 369, 7460: 333,
+    7716: 325, 1988: 3, 3012: 935, 5060: 607, 3524: 851, 5572: 523, 6596: 403,
+    3780: 823, 5828: 495, 6852: 375, 7364: 339, 3908: 816, 5956: 488,
+    6980: 368, 7492: 332, 7748: 324, 3972: 2, 6020: 487, 7044: 367, 7556: 331,
+    7812: 323, 7940: 1, 504: 5, 760: 6, 1272: 6, 2296: 6, 4344: 6, 888: 1374,
+    1400: 1249, 2424: 1040, 4472: 712, 1656: 1193, 2680: 984, 4728: 656,
+    3192: 900, 5240: 572, 6264: 452, 952: 1359, 1464: 1234, 2488: 1025,
+    4536: 697, 1720: 1178, 2744: 969, 4792: 641, 3256: 885, 5304: 557,
+    6328: 437, 1848: 1157, 2872: 948, 4920: 620, 3384: 864, 5432: 536,
+    6456: 416, 3640: 836, 5688: 508, 6712: 388, 7224: 352, 984: 1354,
+    1496: 1229, 2520: 1020, 4568: 692, 1752: 1173, 2776: 964, 4824: 636,
+    3288: 880, 5336: 552, 6360: 432, 1880: 1152, 2904: 943, 4952: 615,
+    3416: 859, 5464: 531, 6488: 411, 3672: 831, 5720: 503, 6744: 383,
+    7256: 347, 1944: 1146, 2968: 937, 5016: 609, 3480: 853, 5528: 525,
+    6552: 405, 3736: 825, 5784: 497, 6808: 377, 7320: 341, 3864: 818,
+    5912: 490, 6936: 370, 7448: 334, 7704: 326, 1000: 4, 1512: 1228,
+    2536: 1019, 4584: 691, 1768: 1172, 2792: 963, 4840: 635, 3304: 879,
+    5352: 551, 6376: 431, 1896: 1151, 2920: 942, 4968: 614, 3432: 858,
+    5480: 530, 6504: 410, 3688: 830, 5736: 502, 6760: 382, 7272: 346,
+    1960: 1145, 2984: 936, 5032: 608, 3496: 852, 5544: 524, 6568: 404,
+    3752: 824, 5800: 496, 6824: 376, 7336: 340, 3880: 817, 5928: 489,
+    6952: 369, 7464: 333, 7720: 325, 1992: 3, 3016: 935, 5064: 607, 3528: 851,
+    5576: 523, 6600: 403, 3784: 823, 5832: 495, 6856: 375, 7368: 339,
+    3912: 816, 5960: 488, 6984: 368, 7496: 332, 7752: 324, 3976: 2, 6024: 487,
+    7048: 367, 7560: 331, 7816: 323, 7944: 1, 1008: 4, 1520: 5, 2544: 5,
+    4592: 5, 1776: 1172, 2800: 963, 4848: 635, 3312: 879, 5360: 551, 6384: 431,
+    1904: 1151, 2928: 942, 4976: 614, 3440: 858, 5488: 530, 6512: 410,
+    3696: 830, 5744: 502, 6768: 382, 7280: 346, 1968: 1145, 2992: 936,
+    5040: 608, 3504: 852, 5552: 524, 6576: 404, 3760: 824, 5808: 496,
+    6832: 376, 7344: 340, 3888: 817, 5936: 489, 6960: 369, 7472: 333,
+    7728: 325, 2000: 3, 3024: 935, 5072: 607, 3536: 851, 5584: 523, 6608: 403,
+    3792: 823, 5840: 495, 6864: 375, 7376: 339, 3920: 816, 5968: 488,
+    6992: 368, 7504: 332, 7760: 324, 3984: 2, 6032: 487, 7056: 367, 7568: 331,
+    7824: 323, 7952: 1, 2016: 3, 3040: 4, 5088: 4, 3552: 851, 5600: 523,
+    6624: 403, 3808: 823, 5856: 495, 6880: 375, 7392: 339, 3936: 816,
+    5984: 488, 7008: 368, 7520: 332, 7776: 324, 4000: 2, 6048: 487, 7072: 367,
+    7584: 331, 7840: 323, 7968: 1, 4032: 2, 6080: 3, 7104: 367, 7616: 331,
+    7872: 323, 8000: 1, 8064: 1, 127: 7, 191: 8, 319: 8, 575: 8, 1087: 8,
+    2111: 8, 4159: 8, 223: 9, 351: 9, 607: 9, 1119: 9, 2143: 9, 4191: 9,
+    415: 9, 671: 9, 1183: 9, 2207: 9, 4255: 9, 799: 9, 1311: 9, 2335: 9,
+    4383: 9, 1567: 9, 2591: 9, 4639: 9, 3103: 9, 5151: 9, 6175: 9, 239: 1551,
+    367: 1517, 623: 1448, 1135: 1323, 2159: 1114, 4207: 10, 431: 1497,
+    687: 1428, 1199: 1303, 2223: 1094, 4271: 10, 815: 1393, 1327: 1268,
+    2351: 1059, 4399: 10, 1583: 1212, 2607: 1003, 4655: 10, 3119: 919,
+    5167: 10, 6191: 10, 463: 1487, 719: 1418, 1231: 1293, 2255: 1084, 4303: 10,
+    847: 1383, 1359: 1258, 2383: 1049, 4431: 10, 1615: 1202, 2639: 993,
+    4687: 10, 3151: 909, 5199: 10, 6223: 10, 911: 1368, 1423: 1243, 2447: 1034,
+    4495: 10, 1679: 1187, 2703: 978, 4751: 10, 3215: 894, 5263: 10, 6287: 10,
+    1807: 1166, 2831: 957, 4879: 10, 3343: 873, 5391: 10, 6415: 10, 3599: 845,
+    5647: 10, 6671: 10, 7183: 10, 247: 1548, 375: 1514, 631: 1445, 1143: 1320,
+    2167: 1111, 4215: 783, 439: 1494, 695: 1425, 1207: 1300, 2231: 1091,
+    4279: 763, 823: 1390, 1335: 1265, 2359: 1056, 4407: 728, 1591: 1209,
+    2615: 1000, 4663: 672, 3127: 916, 5175: 588, 6199: 468, 471: 1484,
+    727: 1415, 1239: 1290, 2263: 1081, 4311: 753, 855: 1380, 1367: 1255,
+    2391: 1046, 4439: 718, 1623: 1199, 2647: 990, 4695: 662, 3159: 906,
+    5207: 578, 6231: 458, 919: 1365, 1431: 1240, 2455: 1031, 4503: 703,
+    1687: 1184, 2711: 975, 4759: 647, 3223: 891, 5271: 563, 6295: 443,
+    1815: 1163, 2839: 954, 4887: 626, 3351: 870, 5399: 542, 6423: 422,
+    3607: 842, 5655: 514, 6679: 394, 7191: 358, 487: 1480, 743: 1411,
+    1255: 1286, 2279: 1077, 4327: 749, 871: 1376, 1383: 1251, 2407: 1042,
+    4455: 714, 1639: 1195, 2663: 986, 4711: 658, 3175: 902, 5223: 574,
+    6247: 454, 935: 1361, 1447: 1236, 2471: 1027, 4519: 699, 1703: 1180,
+    2727: 971, 4775: 643, 3239: 887, 5287: 559, 6311: 439, 1831: 1159,
+    2855: 950, 4903: 622, 3367: 866, 5415: 538, 6439: 418, 3623: 838,
+    5671: 510, 6695: 390, 7207: 354, 967: 1356, 1479: 1231, 2503: 1022,
+    4551: 694, 1735: 1175, 2759: 966, 4807: 638, 3271: 882, 5319: 554,
+    6343: 434, 1863: 1154, 2887: 945, 4935: 617, 3399: 861, 5447: 533,
+    6471: 413, 3655: 833, 5703: 505, 6727: 385, 7239: 349, 1927: 1148,
+    2951: 939, 4999: 611, 3463: 855, 5511: 527, 6535: 407, 3719: 827,
+    5767: 499, 6791: 379, 7303: 343, 3847: 820, 5895: 492, 6919: 372,
+    7431: 336, 7687: 328, 251: 6, 379: 1513, 635: 1444, 1147: 1319, 2171: 1110,
+    4219: 782, 443: 1493, 699: 1424, 1211: 1299, 2235: 1090, 4283: 762,
+    827: 1389, 1339: 1264, 2363: 1055, 4411: 727, 1595: 1208, 2619: 999,
+    4667: 671, 3131: 915, 5179: 587, 6203: 467, 475: 1483, 731: 1414,
+    1243: 1289, 2267: 1080, 4315: 752, 859: 1379, 1371: 1254, 2395: 1045,
+    4443: 717, 1627: 1198, 2651: 989, 4699: 661, 3163: 905, 5211: 577,
+    6235: 457, 923: 1364, 1435: 1239, 2459: 1030, 4507: 702, 1691: 1183,
+    2715: 974, 4763: 646, 3227: 890, 5275: 562, 6299: 442, 1819: 1162,
+    2843: 953, 4891: 625, 3355: 869, 5403: 541, 6427: 421, 3611: 841,
+    5659: 513, 6683: 393, 7195: 357, 491: 1479, 747: 1410, 1259: 1285,
+    2283: 1076, 4331: 748, 875: 1375, 1387: 1250, 2411: 1041, 4459: 713,
+    1643: 1194, 2667: 985, 4715: 657, 3179: 901, 5227: 573, 6251: 453,
+    939: 1360, 1451: 1235, 2475: 1026, 4523: 698, 1707: 1179, 2731: 970,
+    4779: 642, 3243: 886, 5291: 558, 6315: 438, 1835: 1158, 2859: 949,
+    4907: 621, 3371: 865, 5419: 537, 6443: 417, 3627: 837, 5675: 509,
+    6699: 389, 7211: 353, 971: 1355, 1483: 1230, 2507: 1021, 4555: 693,
+    1739: 1174, 2763: 965, 4811: 637, 3275: 881, 5323: 553, 6347: 433,
+    1867: 1153, 2891: 944, 4939: 616, 3403: 860, 5451: 532, 6475: 412,
+    3659: 832, 5707: 504, 6731: 384, 7243: 348, 1931: 1147, 2955: 938,
+    5003: 610, 3467: 854, 5515: 526, 6539: 406, 3723: 826, 5771: 498,
+    6795: 378, 7307: 342, 3851: 819, 5899: 491, 6923: 371, 7435: 335,
+    7691: 327, 499: 5, 755: 1409, 1267: 1284, 2291: 1075, 4339: 747, 883: 1374,
+    1395: 1249, 2419: 1040, 4467: 712, 1651: 1193, 2675: 984, 4723: 656,
+    3187: 900, 5235: 572, 6259: 452, 947: 1359, 1459: 1234, 2483: 1025,
+    4531: 697, 1715: 1178, 2739: 969, 4787: 641, 3251: 885, 5299: 557,
+    6323: 437, 1843: 1157, 2867: 948, 4915: 620, 3379: 864, 5427: 536,
+    6451: 416, 3635: 836, 5683: 508, 6707: 388, 7219: 352, 979: 1354,
+    1491: 1229, 2515: 1020, 4563: 692, 1747: 1173, 2771: 964, 4819: 636,
+    3283: 880, 5331: 552, 6355: 432, 1875: 1152, 2899: 943, 4947: 615,
+    3411: 859, 5459: 531, 6483: 411, 3667: 831, 5715: 503, 6739: 383,
+    7251: 347, 1939: 1146, 2963: 937, 5011: 609, 3475: 853, 5523: 525,
+    6547: 405, 3731: 825, 5779: 497, 6803: 377, 7315: 341, 3859: 818,
+    5907: 490, 6931: 370, 7443: 334, 7699: 326, 995: 4, 1507: 1228, 2531: 1019,
+    4579: 691, 1763: 1172, 2787: 963, 4835: 635, 3299: 879, 5347: 551,
+    6371: 431, 1891: 1151, 2915: 942, 4963: 614, 3427: 858, 5475: 530,
+    6499: 410, 3683: 830, 5731: 502, 6755: 382, 7267: 346, 1955: 1145,
+    2979: 936, 5027: 608, 3491: 852, 5539: 524, 6563: 404, 3747: 824,
+    5795: 496, 6819: 376, 7331: 340, 3875: 817, 5923: 489, 6947: 369,
+    7459: 333, 7715: 325, 1987: 3, 3011: 935, 5059: 607, 3523: 851, 5571: 523,
+    6595: 403, 3779: 823, 5827: 495, 6851: 375, 7363: 339, 3907: 816,
+    5955: 488, 6979: 368, 7491: 332, 7747: 324, 3971: 2, 6019: 487, 7043: 367,
+    7555: 331, 7811: 323, 7939: 1, 253: 6, 381: 7, 637: 7, 1149: 7, 2173: 7,
+    4221: 7, 445: 1493, 701: 1424, 1213: 1299, 2237: 1090, 4285: 762,
+    829: 1389, 1341: 1264, 2365: 1055, 4413: 727, 1597: 1208, 2621: 999,
+    4669: 671, 3133: 915, 5181: 587, 6205: 467, 477: 1483, 733: 1414,
+    1245: 1289, 2269: 1080, 4317: 752, 861: 1379, 1373: 1254, 2397: 1045,
+    4445: 717, 1629: 1198, 2653: 989, 4701: 661, 3165: 905, 5213: 577,
+    6237: 457, 925: 1364, 1437: 1239, 2461: 1030, 4509: 702, 1693: 1183,
+    2717: 974, 4765: 646, 3229: 890, 5277: 562, 6301: 442, 1821: 1162,
+    2845: 953, 4893: 625, 3357: 869, 5405: 541, 6429: 421, 3613: 841,
+    5661: 513, 6685: 393, 7197: 357, 493: 1479, 749: 1410, 1261: 1285,
+    2285: 1076, 4333: 748, 877: 1375, 1389: 1250, 2413: 1041, 4461: 713,
+    1645: 1194, 2669: 985, 4717: 657, 3181: 901, 5229: 573, 6253: 453,
+    941: 1360, 1453: 1235, 2477: 1026, 4525: 698, 1709: 1179, 2733: 970,
+    4781: 642, 3245: 886, 5293: 558, 6317: 438, 1837: 1158, 2861: 949,
+    4909: 621, 3373: 865, 5421: 537, 6445: 417, 3629: 837, 5677: 509,
+    6701: 389, 7213: 353, 973: 1355, 1485: 1230, 2509: 1021, 4557: 693,
+    1741: 1174, 2765: 965, 4813: 637, 3277: 881, 5325: 553, 6349: 433,
+    1869: 1153, 2893: 944, 4941: 616, 3405: 860, 5453: 532, 6477: 412,
+    3661: 832, 5709: 504, 6733: 384, 7245: 348, 1933: 1147, 2957: 938,
+    5005: 610, 3469: 854, 5517: 526, 6541: 406, 3725: 826, 5773: 498,
+    6797: 378, 7309: 342, 3853: 819, 5901: 491, 6925: 371, 7437: 335,
+    7693: 327, 501: 5, 757: 1409, 1269: 1284, 2293: 1075, 4341: 747, 885: 1374,
+    1397: 1249, 2421: 1040, 4469: 712, 1653: 1193, 2677: 984, 4725: 656,
+    3189: 900, 5237: 572, 6261: 452, 949: 1359, 1461: 1234, 2485: 1025,
+    4533: 697, 1717: 1178, 2741: 969, 4789: 641, 3253: 885, 5301: 557,
+    6325: 437, 1845: 1157, 2869: 948, 4917: 620, 3381: 864, 5429: 536,
+    6453: 416, 3637: 836, 5685: 508, 6709: 388, 7221: 352, 981: 1354,
+    1493: 1229, 2517: 1020, 4565: 692, 1749: 1173, 2773: 964, 4821: 636,
+    3285: 880, 5333: 552, 6357: 432, 1877: 1152, 2901: 943, 4949: 615,
+    3413: 859, 5461: 531, 6485: 411, 3669: 831, 5717: 503, 6741: 383,
+    7253: 347, 1941: 1146, 2965: 937, 5013: 609, 3477: 853, 5525: 525,
+    6549: 405, 3733: 825, 5781: 497, 6805: 377, 7317: 341, 3861: 818,
+    5909: 490, 6933: 370, 7445: 334, 7701: 326, 997: 4, 1509: 1228, 2533: 1019,
+    4581: 691, 1765: 1172, 2789: 963, 4837: 635, 3301: 879, 5349: 551,
+    6373: 431, 1893: 1151, 2917: 942, 4965: 614, 3429: 858, 5477: 530,
+    6501: 410, 3685: 830, 5733: 502, 6757: 382, 7269: 346, 1957: 1145,
+    2981: 936, 5029: 608, 3493: 852, 5541: 524, 6565: 404, 3749: 824,
+    5797: 496, 6821: 376, 7333: 340, 3877: 817, 5925: 489, 6949: 369,
+    7461: 333, 7717: 325, 1989: 3, 3013: 935, 5061: 607, 3525: 851, 5573: 523,
+    6597: 403, 3781: 823, 5829: 495, 6853: 375, 7365: 339, 3909: 816,
+    5957: 488, 6981: 368, 7493: 332, 7749: 324, 3973: 2, 6021: 487, 7045: 367,
+    7557: 331, 7813: 323, 7941: 1, 505: 5, 761: 6, 1273: 6, 2297: 6, 4345: 6,
+    889: 1374, 1401: 1249, 2425: 1040, 4473: 712, 1657: 1193, 2681: 984,
+    4729: 656, 3193: 900, 5241: 572, 6265: 452, 953: 1359, 1465: 1234,
+    2489: 1025, 4537: 697, 1721: 1178, 2745: 969, 4793: 641, 3257: 885,
+    5305: 557, 6329: 437, 1849: 1157, 2873: 948, 4921: 620, 3385: 864,
+    5433: 536, 6457: 416, 3641: 836, 5689: 508, 6713: 388, 7225: 352,
+    985: 1354, 1497: 1229, 2521: 1020, 4569: 692, 1753: 1173, 2777: 964,
+    4825: 636, 3289: 880, 5337: 552, 6361: 432, 1881: 1152, 2905: 943,
+    4953: 615, 3417: 859, 5465: 531, 6489: 411, 3673: 831, 5721: 503,
+    6745: 383, 7257: 347, 1945: 1146, 2969: 937, 5017: 609, 3481: 853,
+    5529: 525, 6553: 405, 3737: 825, 5785: 497, 6809: 377, 7321: 341,
+    3865: 818, 5913: 490, 6937: 370, 7449: 334, 7705: 326, 1001: 4, 1513: 1228,
+    2537: 1019, 4585: 691, 1769: 1172, 2793: 963, 4841: 635, 3305: 879,
+    5353: 551, 6377: 431, 1897: 1151, 2921: 942, 4969: 614, 3433: 858,
+    5481: 530, 6505: 410, 3689: 830, 5737: 502, 6761: 382, 7273: 346,
+    1961: 1145, 2985: 936, 5033: 608, 3497: 852, 5545: 524, 6569: 404,
+    3753: 824, 5801: 496, 6825: 376, 7337: 340, 3881: 817, 5929: 489,
+    6953: 369, 7465: 333, 7721: 325, 1993: 3, 3017: 935, 5065: 607, 3529: 851,
+    5577: 523, 6601: 403, 3785: 823, 5833: 495, 6857: 375, 7369: 339,
+    3913: 816, 5961: 488, 6985: 368, 7497: 332, 7753: 324, 3977: 2, 6025: 487,
+    7049: 367, 7561: 331, 7817: 323, 7945: 1, 1009: 4, 1521: 5, 2545: 5,
+    4593: 5, 1777: 1172, 2801: 963, 4849: 635, 3313: 879, 5361: 551, 6385: 431,
+    1905: 1151, 2929: 942, 4977: 614, 3441: 858, 5489: 530, 6513: 410,
+    3697: 830, 5745: 502, 6769: 382, 7281: 346, 1969: 1145, 2993: 936,
+    5041: 608, 3505: 852, 5553: 524, 6577: 404, 3761: 824, 5809: 496,
+    6833: 376, 7345: 340, 3889: 817, 5937: 489, 6961: 369, 7473: 333,
+    7729: 325, 2001: 3, 3025: 935, 5073: 607, 3537: 851, 5585: 523, 6609: 403,
+    3793: 823, 5841: 495, 6865: 375, 7377: 339, 3921: 816, 5969: 488,
+    6993: 368, 7505: 332, 7761: 324, 3985: 2, 6033: 487, 7057: 367, 7569: 331,
+    7825: 323, 7953: 1, 2017: 3, 3041: 4, 5089: 4, 3553: 851, 5601: 523,
+    6625: 403, 3809: 823, 5857: 495, 6881: 375, 7393: 339, 3937: 816,
+    5985: 488, 7009: 368, 7521: 332, 7777: 324, 4001: 2, 6049: 487, 7073: 367,
+    7585: 331, 7841: 323, 7969: 1, 4033: 2, 6081: 3, 7105: 367, 7617: 331,
+    7873: 323, 8001: 1, 8065: 1, 254: 6, 382: 7, 638: 7, 1150: 7, 2174: 7,
+    4222: 7, 446: 8, 702: 8, 1214: 8, 2238: 8, 4286: 8, 830: 8, 1342: 8,
+    2366: 8, 4414: 8, 1598: 8, 2622: 8, 4670: 8, 3134: 8, 5182: 8, 6206: 8,
+    478: 1483, 734: 1414, 1246: 1289, 2270: 1080, 4318: 752, 862: 1379,
+    1374: 1254, 2398: 1045, 4446: 717, 1630: 1198, 2654: 989, 4702: 661,
+    3166: 905, 5214: 577, 6238: 457, 926: 1364, 1438: 1239, 2462: 1030,
+    4510: 702, 1694: 1183, 2718: 974, 4766: 646, 3230: 890, 5278: 562,
+    6302: 442, 1822: 1162, 2846: 953, 4894: 625, 3358: 869, 5406: 541,
+    6430: 421, 3614: 841, 5662: 513, 6686: 393, 7198: 357, 494: 1479,
+    750: 1410, 1262: 1285, 2286: 1076, 4334: 748, 878: 1375, 1390: 1250,
+    2414: 1041, 4462: 713, 1646: 1194, 2670: 985, 4718: 657, 3182: 901,
+    5230: 573, 6254: 453, 942: 1360, 1454: 1235, 2478: 1026, 4526: 698,
+    1710: 1179, 2734: 970, 4782: 642, 3246: 886, 5294: 558, 6318: 438,
+    1838: 1158, 2862: 949, 4910: 621, 3374: 865, 5422: 537, 6446: 417,
+    3630: 837, 5678: 509, 6702: 389, 7214: 353, 974: 1355, 1486: 1230,
+    2510: 1021, 4558: 693, 1742: 1174, 2766: 965, 4814: 637, 3278: 881,
+    5326: 553, 6350: 433, 1870: 1153, 2894: 944, 4942: 616, 3406: 860,
+    5454: 532, 6478: 412, 3662: 832, 5710: 504, 6734: 384, 7246: 348,
+    1934: 1147, 2958: 938, 5006: 610, 3470: 854, 5518: 526, 6542: 406,
+    3726: 826, 5774: 498, 6798: 378, 7310: 342, 3854: 819, 5902: 491,
+    6926: 371, 7438: 335, 7694: 327, 502: 5, 758: 1409, 1270: 1284, 2294: 1075,
+    4342: 747, 886: 1374, 1398: 1249, 2422: 1040, 4470: 712, 1654: 1193,
+    2678: 984, 4726: 656, 3190: 900, 5238: 572, 6262: 452, 950: 1359,
+    1462: 1234, 2486: 1025, 4534: 697, 1718: 1178, 2742: 969, 4790: 641,
+    3254: 885, 5302: 557, 6326: 437, 1846: 1157, 2870: 948, 4918: 620,
+    3382: 864, 5430: 536, 6454: 416, 3638: 836, 5686: 508, 6710: 388,
+    7222: 352, 982: 1354, 1494: 1229, 2518: 1020, 4566: 692, 1750: 1173,
+    2774: 964, 4822: 636, 3286: 880, 5334: 552, 6358: 432, 1878: 1152,
+    2902: 943, 4950: 615, 3414: 859, 5462: 531, 6486: 411, 3670: 831,
+    5718: 503, 6742: 383, 7254: 347, 1942: 1146, 2966: 937, 5014: 609,
+    3478: 853, 5526: 525, 6550: 405, 3734: 825, 5782: 497, 6806: 377,
+    7318: 341, 3862: 818, 5910: 490, 6934: 370, 7446: 334, 7702: 326, 998: 4,
+    1510: 1228, 2534: 1019, 4582: 691, 1766: 1172, 2790: 963, 4838: 635,
+    3302: 879, 5350: 551, 6374: 431, 1894: 1151, 2918: 942, 4966: 614,
+    3430: 858, 5478: 530, 6502: 410, 3686: 830, 5734: 502, 6758: 382,
+    7270: 346, 1958: 1145, 2982: 936, 5030: 608, 3494: 852, 5542: 524,
+    6566: 404, 3750: 824, 5798: 496, 6822: 376, 7334: 340, 3878: 817,
+    5926: 489, 6950: 369, 7462: 333, 7718: 325, 1990: 3, 3014: 935, 5062: 607,
+    3526: 851, 5574: 523, 6598: 403, 3782: 823, 5830: 495, 6854: 375,
+    7366: 339, 3910: 816, 5958: 488, 6982: 368, 7494: 332, 7750: 324, 3974: 2,
+    6022: 487, 7046: 367, 7558: 331, 7814: 323, 7942: 1, 506: 5, 762: 6,
+    1274: 6, 2298: 6, 4346: 6, 890: 1374, 1402: 1249, 2426: 1040, 4474: 712,
+    1658: 1193, 2682: 984, 4730: 656, 3194: 900, 5242: 572, 6266: 452,
+    954: 1359, 1466: 1234, 2490: 1025, 4538: 697, 1722: 1178, 2746: 969,
+    4794: 641, 3258: 885, 5306: 557, 6330: 437, 1850: 1157, 2874: 948,
+    4922: 620, 3386: 864, 5434: 536, 6458: 416, 3642: 836, 5690: 508,
+    6714: 388, 7226: 352, 986: 1354, 1498: 1229, 2522: 1020, 4570: 692,
+    1754: 1173, 2778: 964, 4826: 636, 3290: 880, 5338: 552, 6362: 432,
+    1882: 1152, 2906: 943, 4954: 615, 3418: 859, 5466: 531, 6490: 411,
+    3674: 831, 5722: 503, 6746: 383, 7258: 347, 1946: 1146, 2970: 937,
+    5018: 609, 3482: 853, 5530: 525, 6554: 405, 3738: 825, 5786: 497,
+    6810: 377, 7322: 341, 3866: 818, 5914: 490, 6938: 370, 7450: 334,
+    7706: 326, 1002: 4, 1514: 1228, 2538: 1019, 4586: 691, 1770: 1172,
+    2794: 963, 4842: 635, 3306: 879, 5354: 551, 6378: 431, 1898: 1151,
+    2922: 942, 4970: 614, 3434: 858, 5482: 530, 6506: 410, 3690: 830,
+    5738: 502, 6762: 382, 7274: 346, 1962: 1145, 2986: 936, 5034: 608,
+    3498: 852, 5546: 524, 6570: 404, 3754: 824, 5802: 496, 6826: 376,
+    7338: 340, 3882: 817, 5930: 489, 6954: 369, 7466: 333, 7722: 325, 1994: 3,
+    3018: 935, 5066: 607, 3530: 851, 5578: 523, 6602: 403, 3786: 823,
+    5834: 495, 6858: 375, 7370: 339, 3914: 816, 5962: 488, 6986: 368,
+    7498: 332, 7754: 324, 3978: 2, 6026: 487, 7050: 367, 7562: 331, 7818: 323,
+    7946: 1, 1010: 4, 1522: 5, 2546: 5, 4594: 5, 1778: 1172, 2802: 963,
+    4850: 635, 3314: 879, 5362: 551, 6386: 431, 1906: 1151, 2930: 942,
+    4978: 614, 3442: 858, 5490: 530, 6514: 410, 3698: 830, 5746: 502,
+    6770: 382, 7282: 346, 1970: 1145, 2994: 936, 5042: 608, 3506: 852,
+    5554: 524, 6578: 404, 3762: 824, 5810: 496, 6834: 376, 7346: 340,
+    3890: 817, 5938: 489, 6962: 369, 7474: 333, 7730: 325, 2002: 3, 3026: 935,
+    5074: 607, 3538: 851, 5586: 523, 6610: 403, 3794: 823, 5842: 495,
+    6866: 375, 7378: 339, 3922: 816, 5970: 488, 6994: 368, 7506: 332,
+    7762: 324, 3986: 2, 6034: 487, 7058: 367, 7570: 331, 7826: 323, 7954: 1,
+    2018: 3, 3042: 4, 5090: 4, 3554: 851, 5602: 523, 6626: 403, 3810: 823,
+    5858: 495, 6882: 375, 7394: 339, 3938: 816, 5986: 488, 7010: 368,
+    7522: 332, 7778: 324, 4002: 2, 6050: 487, 7074: 367, 7586: 331, 7842: 323,
+    7970: 1, 4034: 2, 6082: 3, 7106: 367, 7618: 331, 7874: 323, 8002: 1,
+    8066: 1, 508: 5, 764: 6, 1276: 6, 2300: 6, 4348: 6, 892: 7, 1404: 7,
+    2428: 7, 4476: 7, 1660: 7, 2684: 7, 4732: 7, 3196: 7, 5244: 7, 6268: 7,
+    956: 1359, 1468: 1234, 2492: 1025, 4540: 697, 1724: 1178, 2748: 969,
+    4796: 641, 3260: 885, 5308: 557, 6332: 437, 1852: 1157, 2876: 948,
+    4924: 620, 3388: 864, 5436: 536, 6460: 416, 3644: 836, 5692: 508,
+    6716: 388, 7228: 352, 988: 1354, 1500: 1229, 2524: 1020, 4572: 692,
+    1756: 1173, 2780: 964, 4828: 636, 3292: 880, 5340: 552, 6364: 432,
+    1884: 1152, 2908: 943, 4956: 615, 3420: 859, 5468: 531, 6492: 411,
+    3676: 831, 5724: 503, 6748: 383, 7260: 347, 1948: 1146, 2972: 937,
+    5020: 609, 3484: 853, 5532: 525, 6556: 405, 3740: 825, 5788: 497,
+    6812: 377, 7324: 341, 3868: 818, 5916: 490, 6940: 370, 7452: 334,
+    7708: 326, 1004: 4, 1516: 1228, 2540: 1019, 4588: 691, 1772: 1172,
+    2796: 963, 4844: 635, 3308: 879, 5356: 551, 6380: 431, 1900: 1151,
+    2924: 942, 4972: 614, 3436: 858, 5484: 530, 6508: 410, 3692: 830,
+    5740: 502, 6764: 382, 7276: 346, 1964: 1145, 2988: 936, 5036: 608,
+    3500: 852, 5548: 524, 6572: 404, 3756: 824, 5804: 496, 6828: 376,
+    7340: 340, 3884: 817, 5932: 489, 6956: 369, 7468: 333, 7724: 325, 1996: 3,
+    3020: 935, 5068: 607, 3532: 851, 5580: 523, 6604: 403, 3788: 823,
+    5836: 495, 6860: 375, 7372: 339, 3916: 816, 5964: 488, 6988: 368,
+    7500: 332, 7756: 324, 3980: 2, 6028: 487, 7052: 367, 7564: 331, 7820: 323,
+    7948: 1, 1012: 4, 1524: 5, 2548: 5, 4596: 5, 1780: 1172, 2804: 963,
+    4852: 635, 3316: 879, 5364: 551, 6388: 431, 1908: 1151, 2932: 942,
+    4980: 614, 3444: 858, 5492: 530, 6516: 410, 3700: 830, 5748: 502,
+    6772: 382, 7284: 346, 1972: 1145, 2996: 936, 5044: 608, 3508: 852,
+    5556: 524, 6580: 404, 3764: 824, 5812: 496, 6836: 376, 7348: 340,
+    3892: 817, 5940: 489, 6964: 369, 7476: 333, 7732: 325, 2004: 3, 3028: 935,
+    5076: 607, 3540: 851, 5588: 523, 6612: 403, 3796: 823, 5844: 495,
+    6868: 375, 7380: 339, 3924: 816, 5972: 488, 6996: 368, 7508: 332,
+    7764: 324, 3988: 2, 6036: 487, 7060: 367, 7572: 331, 7828: 323, 7956: 1,
+    2020: 3, 3044: 4, 5092: 4, 3556: 851, 5604: 523, 6628: 403, 3812: 823,
+    5860: 495, 6884: 375, 7396: 339, 3940: 816, 5988: 488, 7012: 368,
+    7524: 332, 7780: 324, 4004: 2, 6052: 487, 7076: 367, 7588: 331, 7844: 323,
+    7972: 1, 4036: 2, 6084: 3, 7108: 367, 7620: 331, 7876: 323, 8004: 1,
+    8068: 1, 1016: 4, 1528: 5, 2552: 5, 4600: 5, 1784: 6, 2808: 6, 4856: 6,
+    3320: 6, 5368: 6, 6392: 6, 1912: 1151, 2936: 942, 4984: 614, 3448: 858,
+    5496: 530, 6520: 410, 3704: 830, 5752: 502, 6776: 382, 7288: 346,
+    1976: 1145, 3000: 936, 5048: 608, 3512: 852, 5560: 524, 6584: 404,
+    3768: 824, 5816: 496, 6840: 376, 7352: 340, 3896: 817, 5944: 489,
+    6968: 369, 7480: 333, 7736: 325, 2008: 3, 3032: 935, 5080: 607, 3544: 851,
+    5592: 523, 6616: 403, 3800: 823, 5848: 495, 6872: 375, 7384: 339,
+    3928: 816, 5976: 488, 7000: 368, 7512: 332, 7768: 324, 3992: 2, 6040: 487,
+    7064: 367, 7576: 331, 7832: 323, 7960: 1, 2024: 3, 3048: 4, 5096: 4,
+    3560: 851, 5608: 523, 6632: 403, 3816: 823, 5864: 495, 6888: 375,
+    7400: 339, 3944: 816, 5992: 488, 7016: 368, 7528: 332, 7784: 324, 4008: 2,
+    6056: 487, 7080: 367, 7592: 331, 7848: 323, 7976: 1, 4040: 2, 6088: 3,
+    7112: 367, 7624: 331, 7880: 323, 8008: 1, 8072: 1, 2032: 3, 3056: 4,
+    5104: 4, 3568: 5, 5616: 5, 6640: 5, 3824: 823, 5872: 495, 6896: 375,
+    7408: 339, 3952: 816, 6000: 488, 7024: 368, 7536: 332, 7792: 324, 4016: 2,
+    6064: 487, 7088: 367, 7600: 331, 7856: 323, 7984: 1, 4048: 2, 6096: 3,
+    7120: 367, 7632: 331, 7888: 323, 8016: 1, 8080: 1, 4064: 2, 6112: 3,
+    7136: 4, 7648: 331, 7904: 323, 8032: 1, 8096: 1, 8128: 1,
+}, 8192)
+
+
+FIVE_UNIQUE_TABLE: array = _dense({
+    7936: 1600, 3968: 1601, 1984: 1602, 992: 1603, 496: 1604, 248: 1605,
+    124: 1606, 62: 1607, 31: 1608, 4111: 1609, 7808: 6186, 7744: 6187,
+    7712: 6188, 7696: 6189, 7688: 6190, 7684: 6191, 7682: 6192, 7681: 6193,
+    7552: 6194, 7488: 6195, 7456: 6196, 7440: 6197, 7432: 6198, 7428: 6199,
+    7426: 6200, 7425: 6201, 7360: 6202, 7328: 6203, 7312: 6204, 7304: 6205,
+    7300: 6206, 7298: 6207, 7297: 6208, 7264: 6209, 7248: 6210, 7240: 6211,
+    7236: 6212, 7234: 6213, 7233: 6214, 7216: 6215, 7208: 6216, 7204: 6217,
+    7202: 6218, 7201: 6219, 7192: 6220, 7188: 6221, 7186: 6222, 7185: 6223,
+    7180: 6224, 7178: 6225, 7177: 6226, 7174: 6227, 7173: 6228, 7171: 6229,
+    7040: 6230, 6976: 6231, 6944: 6232, 6928: 6233, 6920: 6234, 6916: 6235,
+    6914: 6236, 6913: 6237, 6848: 6238, 6816: 6239, 6800: 6240, 6792: 6241,
+    6788: 6242, 6786: 6243, 6785: 6244, 6752: 6245, 6736: 6246, 6728: 6247,
+    6724: 6248, 6722: 6249, 6721: 6250, 6704: 6251, 6696: 6252, 6692: 6253,
+    6690: 6254, 6689: 6255, 6680: 6256, 6676: 6257, 6674: 6258, 6673: 6259,
+    6668: 6260, 6666: 6261, 6665: 6262, 6662: 6263, 6661: 6264, 6659: 6265,
+    6592: 6266, 6560: 6267, 6544: 6268, 6536: 6269, 6532: 6270, 6530: 6271,
+    6529: 6272, 6496: 6273, 6480: 6274, 6472: 6275, 6468: 6276, 6466: 6277,
+    6465: 6278, 6448: 6279, 6440: 6280, 6436: 6281, 6434: 6282, 6433: 6283,
+    6424: 6284, 6420: 6285, 6418: 6286, 6417: 6287, 6412: 6288, 6410: 6289,
+    6409: 6290, 6406: 6291, 6405: 6292, 6403: 6293, 6368: 6294, 6352: 6295,
+    6344: 6296, 6340: 6297, 6338: 6298, 6337: 6299, 6320: 6300, 6312: 6301,
+    6308: 6302, 6306: 6303, 6305: 6304, 6296: 6305, 6292: 6306, 6290: 6307,
+    6289: 6308, 6284: 6309, 6282: 6310, 6281: 6311, 6278: 6312, 6277: 6313,
+    6275: 6314, 6256: 6315, 6248: 6316, 6244: 6317, 6242: 6318, 6241: 6319,
+    6232: 6320, 6228: 6321, 6226: 6322, 6225: 6323, 6220: 6324, 6218: 6325,
+    6217: 6326, 6214: 6327, 6213: 6328, 6211: 6329, 6200: 6330, 6196: 6331,
+    6194: 6332, 6193: 6333, 6188: 6334, 6186: 6335, 6185: 6336, 6182: 6337,
+    6181: 6338, 6179: 6339, 6172: 6340, 6170: 6341, 6169: 6342, 6166: 6343,
+    6165: 6344, 6163: 6345, 6158: 6346, 6157: 6347, 6155: 6348, 6151: 6349,
+    6016: 6350, 5952: 6351, 5920: 6352, 5904: 6353, 5896: 6354, 5892: 6355,
+    5890: 6356, 5889: 6357, 5824: 6358, 5792: 6359, 5776: 6360, 5768: 6361,
+    5764: 6362, 5762: 6363, 5761: 6364, 5728: 6365, 5712: 6366, 5704: 6367,
+    5700: 6368, 5698: 6369, 5697: 6370, 5680: 6371, 5672: 6372, 5668: 6373,
+    5666: 6374, 5665: 6375, 5656: 6376, 5652: 6377, 5650: 6378, 5649: 6379,
+    5644: 6380, 5642: 6381, 5641: 6382, 5638: 6383, 5637: 6384, 5635: 6385,
+    5568: 6386, 5536: 6387, 5520: 6388, 5512: 6389, 5508: 6390, 5506: 6391,
+    5505: 6392, 5472: 6393, 5456: 6394, 5448: 6395, 5444: 6396, 5442: 6397,
+    5441: 6398, 5424: 6399, 5416: 6400, 5412: 6401, 5410: 6402, 5409: 6403,
+    5400: 6404, 5396: 6405, 5394: 6406, 5393: 6407, 5388: 6408, 5386: 6409,
+    5385: 6410, 5382: 6411, 5381: 6412, 5379: 6413, 5344: 6414, 5328: 6415,
+    5320: 6416, 5316: 6417, 5314: 6418, 5313: 6419, 5296: 6420, 5288: 6421,
+    5284: 6422, 5282: 6423, 5281: 6424, 5272: 6425, 5268: 6426, 5266: 6427,
+    5265: 6428, 5260: 6429, 5258: 6430, 5257: 6431, 5254: 6432, 5253: 6433,
+    5251: 6434, 5232: 6435, 5224: 6436, 5220: 6437, 5218: 6438, 5217: 6439,
+    5208: 6440, 5204: 6441, 5202: 6442, 5201: 6443, 5196: 6444, 5194: 6445,
+    5193: 6446, 5190: 6447, 5189: 6448, 5187: 6449, 5176: 6450, 5172: 6451,
+    5170: 6452, 5169: 6453, 5164: 6454, 5162: 6455, 5161: 6456, 5158: 6457,
+    5157: 6458, 5155: 6459, 5148: 6460, 5146: 6461, 5145: 6462, 5142: 6463,
+    5141: 6464, 5139: 6465, 5134: 6466, 5133: 6467, 5131: 6468, 5127: 6469,
+    5056: 6470, 5024: 6471, 5008: 6472, 5000: 6473, 4996: 6474, 4994: 6475,
+    4993: 6476, 4960: 6477, 4944: 6478, 4936: 6479, 4932: 6480, 4930: 6481,
+    4929: 6482, 4912: 6483, 4904: 6484, 4900: 6485, 4898: 6486, 4897: 6487,
+    4888: 6488, 4884: 6489, 4882: 6490, 4881: 6491, 4876: 6492, 4874: 6493,
+    4873: 6494, 4870: 6495, 4869: 6496, 4867: 6497, 4832: 6498, 4816: 6499,
+    4808: 6500, 4804: 6501, 4802: 6502, 4801: 6503, 4784: 6504, 4776: 6505,
+    4772: 6506, 4770: 6507, 4769: 6508, 4760: 6509, 4756: 6510, 4754: 6511,
+    4753: 6512, 4748: 6513, 4746: 6514, 4745: 6515, 4742: 6516, 4741: 6517,
+    4739: 6518, 4720: 6519, 4712: 6520, 4708: 6521, 4706: 6522, 4705: 6523,
+    4696: 6524, 4692: 6525, 4690: 6526, 4689: 6527, 4684: 6528, 4682: 6529,
+    4681: 6530, 4678: 6531, 4677: 6532, 4675: 6533, 4664: 6534, 4660: 6535,
+    4658: 6536, 4657: 6537, 4652: 6538, 4650: 6539, 4649: 6540, 4646: 6541,
+    4645: 6542, 4643: 6543, 4636: 6544, 4634: 6545, 4633: 6546, 4630: 6547,
+    4629: 6548, 4627: 6549, 4622: 6550, 4621: 6551, 4619: 6552, 4615: 6553,
+    4576: 6554, 4560: 6555, 4552: 6556, 4548: 6557, 4546: 6558, 4545: 6559,
+    4528: 6560, 4520: 6561, 4516: 6562, 4514: 6563, 4513: 6564, 4504: 6565,
+    4500: 6566, 4498: 6567, 4497: 6568, 4492: 6569, 4490: 6570, 4489: 6571,
+    4486: 6572, 4485: 6573, 4483: 6574, 4464: 6575, 4456: 6576, 4452: 6577,
+    4450: 6578, 4449: 6579, 4440: 6580, 4436: 6581, 4434: 6582, 4433: 6583,
+    4428: 6584, 4426: 6585, 4425: 6586, 4422: 6587, 4421: 6588, 4419: 6589,
+    4408: 6590, 4404: 6591, 4402: 6592, 4401: 6593, 4396: 6594, 4394: 6595,
+    4393: 6596, 4390: 6597, 4389: 6598, 4387: 6599, 4380: 6600, 4378: 6601,
+    4377: 6602, 4374: 6603, 4373: 6604, 4371: 6605, 4366: 6606, 4365: 6607,
+    4363: 6608, 4359: 6609, 4336: 6610, 4328: 6611, 4324: 6612, 4322: 6613,
+    4321: 6614, 4312: 6615, 4308: 6616, 4306: 6617, 4305: 6618, 4300: 6619,
+    4298: 6620, 4297: 6621, 4294: 6622, 4293: 6623, 4291: 6624, 4280: 6625,
+    4276: 6626, 4274: 6627, 4273: 6628, 4268: 6629, 4266: 6630, 4265: 6631,
+    4262: 6632, 4261: 6633, 4259: 6634, 4252: 6635, 4250: 6636, 4249: 6637,
+    4246: 6638, 4245: 6639, 4243: 6640, 4238: 6641, 4237: 6642, 4235: 6643,
+    4231: 6644, 4216: 6645, 4212: 6646, 4210: 6647, 4209: 6648, 4204: 6649,
+    4202: 6650, 4201: 6651, 4198: 6652, 4197: 6653, 4195: 6654, 4188: 6655,
+    4186: 6656, 4185: 6657, 4182: 6658, 4181: 6659, 4179: 6660, 4174: 6661,
+    4173: 6662, 4171: 6663, 4167: 6664, 4156: 6665, 4154: 6666, 4153: 6667,
+    4150: 6668, 4149: 6669, 4147: 6670, 4142: 6671, 4141: 6672, 4139: 6673,
+    4135: 6674, 4126: 6675, 4125: 6676, 4123: 6677, 4119: 6678, 3904: 6679,
+    3872: 6680, 3856: 6681, 3848: 6682, 3844: 6683, 3842: 6684, 3841: 6685,
+    3776: 6686, 3744: 6687, 3728: 6688, 3720: 6689, 3716: 6690, 3714: 6691,
+    3713: 6692, 3680: 6693, 3664: 6694, 3656: 6695, 3652: 6696, 3650: 6697,
+    3649: 6698, 3632: 6699, 3624: 6700, 3620: 6701, 3618: 6702, 3617: 6703,
+    3608: 6704, 3604: 6705, 3602: 6706, 3601: 6707, 3596: 6708, 3594: 6709,
+    3593: 6710, 3590: 6711, 3589: 6712, 3587: 6713, 3520: 6714, 3488: 6715,
+    3472: 6716, 3464: 6717, 3460: 6718, 3458: 6719, 3457: 6720, 3424: 6721,
+    3408: 6722, 3400: 6723, 3396: 6724, 3394: 6725, 3393: 6726, 3376: 6727,
+    3368: 6728, 3364: 6729, 3362: 6730, 3361: 6731, 3352: 6732, 3348: 6733,
+    3346: 6734, 3345: 6735, 3340: 6736, 3338: 6737, 3337: 6738, 3334: 6739,
+    3333: 6740, 3331: 6741, 3296: 6742, 3280: 6743, 3272: 6744, 3268: 6745,
+    3266: 6746, 3265: 6747, 3248: 6748, 3240: 6749, 3236: 6750, 3234: 6751,
+    3233: 6752, 3224: 6753, 3220: 6754, 3218: 6755, 3217: 6756, 3212: 6757,
+    3210: 6758, 3209: 6759, 3206: 6760, 3205: 6761, 3203: 6762, 3184: 6763,
+    3176: 6764, 3172: 6765, 3170: 6766, 3169: 6767, 3160: 6768, 3156: 6769,
+    3154: 6770, 3153: 6771, 3148: 6772, 3146: 6773, 3145: 6774, 3142: 6775,
+    3141: 6776, 3139: 6777, 3128: 6778, 3124: 6779, 3122: 6780, 3121: 6781,
+    3116: 6782, 3114: 6783, 3113: 6784, 3110: 6785, 3109: 6786, 3107: 6787,
+    3100: 6788, 3098: 6789, 3097: 6790, 3094: 6791, 3093: 6792, 3091: 6793,
+    3086: 6794, 3085: 6795, 3083: 6796, 3079: 6797, 3008: 6798, 2976: 6799,
+    2960: 6800, 2952: 6801, 2948: 6802, 2946: 6803, 2945: 6804, 2912: 6805,
+    2896: 6806, 2888: 6807, 2884: 6808, 2882: 6809, 2881: 6810, 2864: 6811,
+    2856: 6812, 2852: 6813, 2850: 6814, 2849: 6815, 2840: 6816, 2836: 6817,
+    2834: 6818, 2833: 6819, 2828: 6820, 2826: 6821, 2825: 6822, 2822: 6823,
+    2821: 6824, 2819: 6825, 2784: 6826, 2768: 6827, 2760: 6828, 2756: 6829,
+    2754: 6830, 2753: 6831, 2736: 6832, 2728: 6833, 2724: 6834, 2722: 6835,
+    2721: 6836, 2712: 6837, 2708: 6838, 2706: 6839, 2705: 6840, 2700: 6841,
+    2698: 6842, 2697: 6843, 2694: 6844, 2693: 6845, 2691: 6846, 2672: 6847,
+    2664: 6848, 2660: 6849, 2658: 6850, 2657: 6851, 2648: 6852, 2644: 6853,
+    2642: 6854, 2641: 6855, 2636: 6856, 2634: 6857, 2633: 6858, 2630: 6859,
+    2629: 6860, 2627: 6861, 2616: 6862, 2612: 6863, 2610: 6864, 2609: 6865,
+    2604: 6866, 2602: 6867, 2601: 6868, 2598: 6869, 2597: 6870, 2595: 6871,
+    2588: 6872, 2586: 6873, 2585: 6874, 2582: 6875, 2581: 6876, 2579: 6877,
+    2574: 6878, 2573: 6879, 2571: 6880, 2567: 6881, 2528: 6882, 2512: 6883,
+    2504: 6884, 2500: 6885, 2498: 6886, 2497: 6887, 2480: 6888, 2472: 6889,
+    2468: 6890, 2466: 6891, 2465: 6892, 2456: 6893, 2452: 6894, 2450: 6895,
+    2449: 6896, 2444: 6897, 2442: 6898, 2441: 6899, 2438: 6900, 2437: 6901,
+    2435: 6902, 2416: 6903, 2408: 6904, 2404: 6905, 2402: 6906, 2401: 6907,
+    2392: 6908, 2388: 6909, 2386: 6910, 2385: 6911, 2380: 6912, 2378: 6913,
+    2377: 6914, 2374: 6915, 2373: 6916, 2371: 6917, 2360: 6918, 2356: 6919,
+    2354: 6920, 2353: 6921, 2348: 6922, 2346: 6923, 2345: 6924, 2342: 6925,
+    2341: 6926, 2339: 6927, 2332: 6928, 2330: 6929, 2329: 6930, 2326: 6931,
+    2325: 6932, 2323: 6933, 2318: 6934, 2317: 6935, 2315: 6936, 2311: 6937,
+    2288: 6938, 2280: 6939, 2276: 6940, 2274: 6941, 2273: 6942, 2264: 6943,
+    2260: 6944, 2258: 6945, 2257: 6946, 2252: 6947, 2250: 6948, 2249: 6949,
+    2246: 6950, 2245: 6951, 2243: 6952, 2232: 6953, 2228: 6954, 2226: 6955,
+    2225: 6956, 2220: 6957, 2218: 6958, 2217: 6959, 2214: 6960, 2213: 6961,
+    2211: 6962, 2204: 6963, 2202: 6964, 2201: 6965, 2198: 6966, 2197: 6967,
+    2195: 6968, 2190: 6969, 2189: 6970, 2187: 6971, 2183: 6972, 2168: 6973,
+    2164: 6974, 2162: 6975, 2161: 6976, 2156: 6977, 2154: 6978, 2153: 6979,
+    2150: 6980, 2149: 6981, 2147: 6982, 2140: 6983, 2138: 6984, 2137: 6985,
+    2134: 6986, 2133: 6987, 2131: 6988, 2126: 6989, 2125: 6990, 2123: 6991,
+    2119: 6992, 2108: 6993, 2106: 6994, 2105: 6995, 2102: 6996, 2101: 6997,
+    2099: 6998, 2094: 6999, 2093: 7000, 2091: 7001, 2087: 7002, 2078: 7003,
+    2077: 7004, 2075: 7005, 2071: 7006, 2063: 7007, 1952: 7008, 1936: 7009,
+    1928: 7010, 1924: 7011, 1922: 7012, 1921: 7013, 1888: 7014, 1872: 7015,
+    1864: 7016, 1860: 7017, 1858: 7018, 1857: 7019, 1840: 7020, 1832: 7021,
+    1828: 7022, 1826: 7023, 1825: 7024, 1816: 7025, 1812: 7026, 1810: 7027,
+    1809: 7028, 1804: 7029, 1802: 7030, 1801: 7031, 1798: 7032, 1797: 7033,
+    1795: 7034, 1760: 7035, 1744: 7036, 1736: 7037, 1732: 7038, 1730: 7039,
+    1729: 7040, 1712: 7041, 1704: 7042, 1700: 7043, 1698: 7044, 1697: 7045,
+    1688: 7046, 1684: 7047, 1682: 7048, 1681: 7049, 1676: 7050, 1674: 7051,
+    1673: 7052, 1670: 7053, 1669: 7054, 1667: 7055, 1648: 7056, 1640: 7057,
+    1636: 7058, 1634: 7059, 1633: 7060, 1624: 7061, 1620: 7062, 1618: 7063,
+    1617: 7064, 1612: 7065, 1610: 7066, 1609: 7067, 1606: 7068, 1605: 7069,
+    1603: 7070, 1592: 7071, 1588: 7072, 1586: 7073, 1585: 7074, 1580: 7075,
+    1578: 7076, 1577: 7077, 1574: 7078, 1573: 7079, 1571: 7080, 1564: 7081,
+    1562: 7082, 1561: 7083, 1558: 7084, 1557: 7085, 1555: 7086, 1550: 7087,
+    1549: 7088, 1547: 7089, 1543: 7090, 1504: 7091, 1488: 7092, 1480: 7093,
+    1476: 7094, 1474: 7095, 1473: 7096, 1456: 7097, 1448: 7098, 1444: 7099,
+    1442: 7100, 1441: 7101, 1432: 7102, 1428: 7103, 1426: 7104, 1425: 7105,
+    1420: 7106, 1418: 7107, 1417: 7108, 1414: 7109, 1413: 7110, 1411: 7111,
+    1392: 7112, 1384: 7113, 1380: 7114, 1378: 7115, 1377: 7116, 1368: 7117,
+    1364: 7118, 1362: 7119, 1361: 7120, 1356: 7121, 1354: 7122, 1353: 7123,
+    1350: 7124, 1349: 7125, 1347: 7126, 1336: 7127, 1332: 7128, 1330: 7129,
+    1329: 7130, 1324: 7131, 1322: 7132, 1321: 7133, 1318: 7134, 1317: 7135,
+    1315: 7136, 1308: 7137, 1306: 7138, 1305: 7139, 1302: 7140, 1301: 7141,
+    1299: 7142, 1294: 7143, 1293: 7144, 1291: 7145, 1287: 7146, 1264: 7147,
+    1256: 7148, 1252: 7149, 1250: 7150, 1249: 7151, 1240: 7152, 1236: 7153,
+    1234: 7154, 1233: 7155, 1228: 7156, 1226: 7157, 1225: 7158, 1222: 7159,
+    1221: 7160, 1219: 7161, 1208: 7162, 1204: 7163, 1202: 7164, 1201: 7165,
+    1196: 7166, 1194: 7167, 1193: 7168, 1190: 7169, 1189: 7170, 1187: 7171,
+    1180: 7172, 1178: 7173, 1177: 7174, 1174: 7175, 1173: 7176, 1171: 7177,
+    1166: 7178, 1165: 7179, 1163: 7180, 1159: 7181, 1144: 7182, 1140: 7183,
+    1138: 7184, 1137: 7185, 1132: 7186, 1130: 7187, 1129: 7188, 1126: 7189,
+    1125: 7190, 1123: 7191, 1116: 7192, 1114: 7193, 1113: 7194, 1110: 7195,
+    1109: 7196, 1107: 7197, 1102: 7198, 1101: 7199, 1099: 7200, 1095: 7201,
+    1084: 7202, 1082: 7203, 1081: 7204, 1078: 7205, 1077: 7206, 1075: 7207,
+    1070: 7208, 1069: 7209, 1067: 7210, 1063: 7211, 1054: 7212, 1053: 7213,
+    1051: 7214, 1047: 7215, 1039: 7216, 976: 7217, 968: 7218, 964: 7219,
+    962: 7220, 961: 7221, 944: 7222, 936: 7223, 932: 7224, 930: 7225,
+    929: 7226, 920: 7227, 916: 7228, 914: 7229, 913: 7230, 908: 7231,
+    906: 7232, 905: 7233, 902: 7234, 901: 7235, 899: 7236, 880: 7237,
+    872: 7238, 868: 7239, 866: 7240, 865: 7241, 856: 7242, 852: 7243,
+    850: 7244, 849: 7245, 844: 7246, 842: 7247, 841: 7248, 838: 7249,
+    837: 7250, 835: 7251, 824: 7252, 820: 7253, 818: 7254, 817: 7255,
+    812: 7256, 810: 7257, 809: 7258, 806: 7259, 805: 7260, 803: 7261,
+    796: 7262, 794: 7263, 793: 7264, 790: 7265, 789: 7266, 787: 7267,
+    782: 7268, 781: 7269, 779: 7270, 775: 7271, 752: 7272, 744: 7273,
+    740: 7274, 738: 7275, 737: 7276, 728: 7277, 724: 7278, 722: 7279,
+    721: 7280, 716: 7281, 714: 7282, 713: 7283, 710: 7284, 709: 7285,
+    707: 7286, 696: 7287, 692: 7288, 690: 7289, 689: 7290, 684: 7291,
+    682: 7292, 681: 7293, 678: 7294, 677: 7295, 675: 7296, 668: 7297,
+    666: 7298, 665: 7299, 662: 7300, 661: 7301, 659: 7302, 654: 7303,
+    653: 7304, 651: 7305, 647: 7306, 632: 7307, 628: 7308, 626: 7309,
+    625: 7310, 620: 7311, 618: 7312, 617: 7313, 614: 7314, 613: 7315,
+    611: 7316, 604: 7317, 602: 7318, 601: 7319, 598: 7320, 597: 7321,
+    595: 7322, 590: 7323, 589: 7324, 587: 7325, 583: 7326, 572: 7327,
+    570: 7328, 569: 7329, 566: 7330, 565: 7331, 563: 7332, 558: 7333,
+    557: 7334, 555: 7335, 551: 7336, 542: 7337, 541: 7338, 539: 7339,
+    535: 7340, 527: 7341, 488: 7342, 484: 7343, 482: 7344, 481: 7345,
+    472: 7346, 468: 7347, 466: 7348, 465: 7349, 460: 7350, 458: 7351,
+    457: 7352, 454: 7353, 453: 7354, 451: 7355, 440: 7356, 436: 7357,
+    434: 7358, 433: 7359, 428: 7360, 426: 7361, 425: 7362, 422: 7363,
+    421: 7364, 419: 7365, 412: 7366, 410: 7367, 409: 7368, 406: 7369,
+    405: 7370, 403: 7371, 398: 7372, 397: 7373, 395: 7374, 391: 7375,
+    376: 7376, 372: 7377, 370: 7378, 369: 7379, 364: 7380, 362: 7381,
+    361: 7382, 358: 7383, 357: 7384, 355: 7385, 348: 7386, 346: 7387,
+    345: 7388, 342: 7389, 341: 7390, 339: 7391, 334: 7392, 333: 7393,
+    331: 7394, 327: 7395, 316: 7396, 314: 7397, 313: 7398, 310: 7399,
+    309: 7400, 307: 7401, 302: 7402, 301: 7403, 299: 7404, 295: 7405,
+    286: 7406, 285: 7407, 283: 7408, 279: 7409, 271: 7410, 244: 7411,
+    242: 7412, 241: 7413, 236: 7414, 234: 7415, 233: 7416, 230: 7417,
+    229: 7418, 227: 7419, 220: 7420, 218: 7421, 217: 7422, 214: 7423,
+    213: 7424, 211: 7425, 206: 7426, 205: 7427, 203: 7428, 199: 7429,
+    188: 7430, 186: 7431, 185: 7432, 182: 7433, 181: 7434, 179: 7435,
+    174: 7436, 173: 7437, 171: 7438, 167: 7439, 158: 7440, 157: 7441,
+    155: 7442, 151: 7443, 143: 7444, 122: 7445, 121: 7446, 118: 7447,
+    117: 7448, 115: 7449, 110: 7450, 109: 7451, 107: 7452, 103: 7453, 94: 7454,
+    93: 7455, 91: 7456, 87: 7457, 79: 7458, 61: 7459, 59: 7460, 55: 7461,
+    47: 7462,
+}, 8192)
+
+
+FIVE_UNSUITED: dict[int, int] = {
+    104553157: 11, 87598591: 12, 81947069: 13, 64992503: 14, 53689459: 15,
+    48037937: 16, 36734893: 17, 31083371: 18, 19780327: 19, 14128805: 20,
+    8477283: 21, 5651522: 22, 76840601: 23, 58098991: 24, 54350669: 25,
+    43105703: 26, 35609059: 27, 31860737: 28, 24364093: 29, 20615771: 30,
+    13119127: 31, 9370805: 32, 5622483: 33, 3748322: 34, 37864361: 35,
+    34170277: 36, 26782109: 37, 21240983: 38, 17546899: 39, 15699857: 40,
+    12005773: 41, 10158731: 42, 6464647: 43, 4617605: 44, 2770563: 45,
+    1847042: 46, 28998521: 47, 26169397: 48, 21925711: 49, 16267463: 50,
+    13438339: 51, 12023777: 52, 9194653: 53, 7780091: 54, 4950967: 55,
+    3536405: 56, 2121843: 57, 1414562: 58, 11473481: 59, 10354117: 60,
+    8675071: 61, 8115389: 62, 5316979: 63, 4757297: 64, 3637933: 65,
+    3078251: 66, 1958887: 67, 1399205: 68, 839523: 69, 559682: 70, 5343161: 71,
+    4821877: 72, 4039951: 73, 3779309: 74, 2997383: 75, 2215457: 76,
+    1694173: 77, 1433531: 78, 912247: 79, 651605: 80, 390963: 81, 260642: 82,
+    3424361: 83, 3090277: 84, 2589151: 85, 2422109: 86, 1920983: 87,
+    1586899: 88, 1085773: 89, 918731: 90, 584647: 91, 417605: 92, 250563: 93,
+    167042: 94, 1171001: 95, 1056757: 96, 885391: 97, 828269: 98, 656903: 99,
+    542659: 100, 485537: 101, 314171: 102, 199927: 103, 142805: 104,
+    85683: 105, 57122: 106, 600281: 107, 541717: 108, 453871: 109, 424589: 110,
+    336743: 111, 278179: 112, 248897: 113, 190333: 114, 102487: 115,
+    73205: 116, 43923: 117, 29282: 118, 98441: 119, 88837: 120, 74431: 121,
+    69629: 122, 55223: 123, 45619: 124, 40817: 125, 31213: 126, 26411: 127,
+    12005: 128, 7203: 129, 4802: 130, 25625: 131, 23125: 132, 19375: 133,
+    18125: 134, 14375: 135, 11875: 136, 10625: 137, 8125: 138, 6875: 139,
+    4375: 140, 1875: 141, 1250: 142, 3321: 143, 2997: 144, 2511: 145,
+    2349: 146, 1863: 147, 1539: 148, 1377: 149, 1053: 150, 891: 151, 567: 152,
+    405: 153, 162: 154, 656: 155, 592: 156, 496: 157, 464: 158, 368: 159,
+    304: 160, 272: 161, 208: 162, 176: 163, 112: 164, 80: 165, 48: 166,
+    94352849: 167, 66233081: 168, 57962561: 169, 36459209: 170, 24880481: 171,
+    19918169: 172, 11647649: 173, 8339441: 174, 3377129: 175, 1723025: 176,
+    620289: 177, 275684: 178, 85147693: 179, 48677533: 180, 42599173: 181,
+    26795437: 182, 18285733: 183, 14638717: 184, 8560357: 185, 6129013: 186,
+    2481997: 187, 1266325: 188, 455877: 189, 202612: 190, 50078671: 191,
+    40783879: 192, 25054231: 193, 15759439: 194, 10754551: 195, 8609599: 196,
+    5034679: 197, 3604711: 198, 1459759: 199, 744775: 200, 268119: 201,
+    119164: 202, 40997909: 203, 33388541: 204, 23437829: 205, 12901781: 206,
+    8804429: 207, 7048421: 208, 4121741: 209, 2951069: 210, 1195061: 211,
+    609725: 212, 219501: 213, 97556: 214, 20452727: 215, 16656623: 216,
+    11692487: 217, 10232447: 218, 4392287: 219, 3516263: 220, 2056223: 221,
+    1472207: 222, 596183: 223, 304175: 224, 109503: 225, 48668: 226,
+    11529979: 227, 9389971: 228, 6591499: 229, 5768419: 230, 3628411: 231,
+    1982251: 232, 1159171: 233, 829939: 234, 336091: 235, 171475: 236,
+    61731: 237, 27436: 238, 8258753: 239, 6725897: 240, 4721393: 241,
+    4131833: 242, 2598977: 243, 1773593: 244, 830297: 245, 594473: 246,
+    240737: 247, 122825: 248, 44217: 249, 19652: 250, 3693157: 251,
+    3007693: 252, 2111317: 253, 1847677: 254, 1162213: 255, 793117: 256,
+    634933: 257, 265837: 258, 107653: 259, 54925: 260, 19773: 261, 8788: 262,
+    2237411: 263, 1822139: 264, 1279091: 265, 1119371: 266, 704099: 267,
+    480491: 268, 384659: 269, 224939: 270, 65219: 271, 33275: 272, 11979: 273,
+    5324: 274, 576583: 275, 469567: 276, 329623: 277, 288463: 278, 181447: 279,
+    123823: 280, 99127: 281, 57967: 282, 41503: 283, 8575: 284, 3087: 285,
+    1372: 286, 210125: 287, 171125: 288, 120125: 289, 105125: 290, 66125: 291,
+    45125: 292, 36125: 293, 21125: 294, 15125: 295, 6125: 296, 1125: 297,
+    500: 298, 45387: 299, 36963: 300, 25947: 301, 22707: 302, 14283: 303,
+    9747: 304, 7803: 305, 4563: 306, 3267: 307, 1323: 308, 675: 309, 108: 310,
+    13448: 311, 10952: 312, 7688: 313, 6728: 314, 4232: 315, 2888: 316,
+    2312: 317, 1352: 318, 968: 319, 392: 320, 200: 321, 72: 322,
+    79052387: 1610, 73952233: 1611, 58651771: 1612, 48451463: 1613,
+    43351309: 1614, 33151001: 1615, 28050847: 1616, 17850539: 1617,
+    12750385: 1618, 7650231: 1619, 5100154: 1620, 61959979: 1621,
+    49140673: 1622, 40594469: 1623, 36321367: 1624, 27775163: 1625,
+    23502061: 1626, 14955857: 1627, 10682755: 1628, 6409653: 1629,
+    4273102: 1630, 45970307: 1631, 37975471: 1632, 33978053: 1633,
+    25983217: 1634, 21985799: 1635, 13990963: 1636, 9993545: 1637,
+    5996127: 1638, 3997418: 1639, 30118477: 1640, 26948111: 1641,
+    20607379: 1642, 17437013: 1643, 11096281: 1644, 7925915: 1645,
+    4755549: 1646, 3170366: 1647, 22261483: 1648, 17023487: 1649,
+    14404489: 1650, 9166493: 1651, 6547495: 1652, 3928497: 1653, 2618998: 1654,
+    15231541: 1655, 12888227: 1656, 8201599: 1657, 5858285: 1658,
+    3514971: 1659, 2343314: 1660, 9855703: 1661, 6271811: 1662, 4479865: 1663,
+    2687919: 1664, 1791946: 1665, 5306917: 1666, 3790655: 1667, 2274393: 1668,
+    1516262: 1669, 2412235: 1670, 1447341: 1671, 964894: 1672, 1033815: 1673,
+    689210: 1674, 413526: 1675, 64379963: 1676, 60226417: 1677, 47765779: 1678,
+    39458687: 1679, 35305141: 1680, 26998049: 1681, 22844503: 1682,
+    14537411: 1683, 10383865: 1684, 6230319: 1685, 4153546: 1686,
+    45537047: 1687, 36115589: 1688, 29834617: 1689, 26694131: 1690,
+    20413159: 1691, 17272673: 1692, 10991701: 1693, 7851215: 1694,
+    4710729: 1695, 3140486: 1696, 33785551: 1697, 27909803: 1698,
+    24971929: 1699, 19096181: 1700, 16158307: 1701, 10282559: 1702,
+    7344685: 1703, 4406811: 1704, 2937874: 1705, 22135361: 1706,
+    19805323: 1707, 15145247: 1708, 12815209: 1709, 8155133: 1710,
+    5825095: 1711, 3495057: 1712, 2330038: 1713, 16360919: 1714,
+    12511291: 1715, 10586477: 1716, 6736849: 1717, 4812035: 1718,
+    2887221: 1719, 1924814: 1720, 11194313: 1721, 9472111: 1722, 6027707: 1723,
+    4305505: 1724, 2583303: 1725, 1722202: 1726, 7243379: 1727, 4609423: 1728,
+    3292445: 1729, 1975467: 1730, 1316978: 1731, 3900281: 1732, 2785915: 1733,
+    1671549: 1734, 1114366: 1735, 1772855: 1736, 1063713: 1737, 709142: 1738,
+    759795: 1739, 506530: 1740, 303918: 1741, 45192947: 1742, 35421499: 1743,
+    28092913: 1744, 23207189: 1745, 20764327: 1746, 15878603: 1747,
+    13435741: 1748, 8550017: 1749, 6107155: 1750, 3664293: 1751, 2442862: 1752,
+    31965743: 1753, 25352141: 1754, 20943073: 1755, 18738539: 1756,
+    14329471: 1757, 12124937: 1758, 7715869: 1759, 5511335: 1760,
+    3306801: 1761, 2204534: 1762, 19870597: 1763, 16414841: 1764,
+    14686963: 1765, 11231207: 1766, 9503329: 1767, 6047573: 1768,
+    4319695: 1769, 2591817: 1770, 1727878: 1771, 13018667: 1772,
+    11648281: 1773, 8907509: 1774, 7537123: 1775, 4796351: 1776, 3425965: 1777,
+    2055579: 1778, 1370386: 1779, 9622493: 1780, 7358377: 1781, 6226319: 1782,
+    3962203: 1783, 2830145: 1784, 1698087: 1785, 1132058: 1786, 6583811: 1787,
+    5570917: 1788, 3545129: 1789, 2532235: 1790, 1519341: 1791, 1012894: 1792,
+    4260113: 1793, 2710981: 1794, 1936415: 1795, 1161849: 1796, 774566: 1797,
+    2293907: 1798, 1638505: 1799, 983103: 1800, 655402: 1801, 1042685: 1802,
+    625611: 1803, 417074: 1804, 446865: 1805, 297910: 1806, 178746: 1807,
+    36998113: 1808, 30998419: 1809, 22998827: 1810, 18999031: 1811,
+    16999133: 1812, 12999337: 1813, 10999439: 1814, 6999643: 1815,
+    4999745: 1816, 2999847: 1817, 1999898: 1818, 27974183: 1819,
+    20755039: 1820, 17145467: 1821, 15340681: 1822, 11731109: 1823,
+    9926323: 1824, 6316751: 1825, 4511965: 1826, 2707179: 1827, 1804786: 1828,
+    17389357: 1829, 14365121: 1830, 12853003: 1831, 9828767: 1832,
+    8316649: 1833, 5292413: 1834, 3780295: 1835, 2268177: 1836, 1512118: 1837,
+    10657993: 1838, 9536099: 1839, 7292311: 1840, 6170417: 1841, 3926629: 1842,
+    2804735: 1843, 1682841: 1844, 1121894: 1845, 7877647: 1846, 6024083: 1847,
+    5097301: 1848, 3243737: 1849, 2316955: 1850, 1390173: 1851, 926782: 1852,
+    5389969: 1853, 4560743: 1854, 2902291: 1855, 2073065: 1856, 1243839: 1857,
+    829226: 1858, 3487627: 1859, 2219399: 1860, 1585285: 1861, 951171: 1862,
+    634114: 1863, 1877953: 1864, 1341395: 1865, 804837: 1866, 536558: 1867,
+    853615: 1868, 512169: 1869, 341446: 1870, 365835: 1871, 243890: 1872,
+    146334: 1873, 18457339: 1874, 15464257: 1875, 14466563: 1876,
+    9478093: 1877, 8480399: 1878, 6485011: 1879, 5487317: 1880, 3491929: 1881,
+    2494235: 1882, 1496541: 1883, 997694: 1884, 13955549: 1885, 13055191: 1886,
+    8553401: 1887, 7653043: 1888, 5852327: 1889, 4951969: 1890, 3151253: 1891,
+    2250895: 1892, 1350537: 1893, 900358: 1894, 10938133: 1895, 7166363: 1896,
+    6412009: 1897, 4903301: 1898, 4148947: 1899, 2640239: 1900, 1885885: 1901,
+    1131531: 1902, 754354: 1903, 6704017: 1904, 5998331: 1905, 4586959: 1906,
+    3881273: 1907, 2469901: 1908, 1764215: 1909, 1058529: 1910, 705686: 1911,
+    3929941: 1912, 3005249: 1913, 2542903: 1914, 1618211: 1915, 1155865: 1916,
+    693519: 1917, 462346: 1918, 2688907: 1919, 2275229: 1920, 1447873: 1921,
+    1034195: 1922, 620517: 1923, 413678: 1924, 1739881: 1925, 1107197: 1926,
+    790855: 1927, 474513: 1928, 316342: 1929, 936859: 1930, 669185: 1931,
+    401511: 1932, 267674: 1933, 425845: 1934, 255507: 1935, 170338: 1936,
+    182505: 1937, 121670: 1938, 73002: 1939, 10405103: 1940, 8717789: 1941,
+    8155351: 1942, 6468037: 1943, 4780723: 1944, 3655847: 1945, 3093409: 1946,
+    1968533: 1947, 1406095: 1948, 843657: 1949, 562438: 1950, 7867273: 1951,
+    7359707: 1952, 5837009: 1953, 4314311: 1954, 3299179: 1955, 2791613: 1956,
+    1776481: 1957, 1268915: 1958, 761349: 1959, 507566: 1960, 6166241: 1961,
+    4890467: 1962, 3614693: 1963, 2764177: 1964, 2338919: 1965, 1488403: 1966,
+    1063145: 1967, 637887: 1968, 425258: 1969, 4574953: 1970, 3381487: 1971,
+    2585843: 1972, 2188021: 1973, 1392377: 1974, 994555: 1975, 596733: 1976,
+    397822: 1977, 2681869: 1978, 2050841: 1979, 1735327: 1980, 1104299: 1981,
+    788785: 1982, 473271: 1983, 315514: 1984, 1515839: 1985, 1282633: 1986,
+    816221: 1987, 583015: 1988, 349809: 1989, 233206: 1990, 980837: 1991,
+    624169: 1992, 445835: 1993, 267501: 1994, 178334: 1995, 528143: 1996,
+    377245: 1997, 226347: 1998, 150898: 1999, 240065: 2000, 144039: 2001,
+    96026: 2002, 102885: 2003, 68590: 2004, 41154: 2005, 7453021: 2006,
+    6244423: 2007, 5841557: 2008, 4632959: 2009, 3827227: 2010, 2618629: 2011,
+    2215763: 2012, 1410031: 2013, 1007165: 2014, 604299: 2015, 402866: 2016,
+    5635211: 2017, 5271649: 2018, 4180963: 2019, 3453839: 2020, 2363153: 2021,
+    1999591: 2022, 1272467: 2023, 908905: 2024, 545343: 2025, 363562: 2026,
+    4416787: 2027, 3502969: 2028, 2893757: 2029, 1979939: 2030, 1675333: 2031,
+    1066121: 2032, 761515: 2033, 456909: 2034, 304606: 2035, 3276971: 2036,
+    2707063: 2037, 1852201: 2038, 1567247: 2039, 997339: 2040, 712385: 2041,
+    427431: 2042, 284954: 2043, 2146981: 2044, 1468987: 2045, 1242989: 2046,
+    790993: 2047, 564995: 2048, 338997: 2049, 225998: 2050, 1213511: 2051,
+    1026817: 2052, 653429: 2053, 466735: 2054, 280041: 2055, 186694: 2056,
+    702559: 2057, 447083: 2058, 319345: 2059, 191607: 2060, 127738: 2061,
+    378301: 2062, 270215: 2063, 162129: 2064, 108086: 2065, 171955: 2066,
+    103173: 2067, 68782: 2068, 73695: 2069, 49130: 2070, 29478: 2071,
+    3332849: 2072, 2792387: 2073, 2612233: 2074, 2071771: 2075, 1711463: 2076,
+    1531309: 2077, 990847: 2078, 630539: 2079, 450385: 2080, 270231: 2081,
+    180154: 2082, 2519959: 2083, 2357381: 2084, 1869647: 2085, 1544491: 2086,
+    1381913: 2087, 894179: 2088, 569023: 2089, 406445: 2090, 243867: 2091,
+    162578: 2092, 1975103: 2093, 1566461: 2094, 1294033: 2095, 1157819: 2096,
+    749177: 2097, 476749: 2098, 340535: 2099, 204321: 2100, 136214: 2101,
+    1465399: 2102, 1210547: 2103, 1083121: 2104, 700843: 2105, 445991: 2106,
+    318565: 2107, 191139: 2108, 127426: 2109, 960089: 2110, 859027: 2111,
+    555841: 2112, 353717: 2113, 252655: 2114, 151593: 2115, 101062: 2116,
+    709631: 2117, 459173: 2118, 292201: 2119, 208715: 2120, 125229: 2121,
+    83486: 2122, 410839: 2123, 261443: 2124, 186745: 2125, 112047: 2126,
+    74698: 2127, 169169: 2128, 120835: 2129, 72501: 2130, 48334: 2131,
+    76895: 2132, 46137: 2133, 30758: 2134, 32955: 2135, 21970: 2136,
+    13182: 2137, 2019127: 2138, 1691701: 2139, 1582559: 2140, 1255133: 2141,
+    1036849: 2142, 927707: 2143, 709423: 2144, 381997: 2145, 272855: 2146,
+    163713: 2147, 109142: 2148, 1526657: 2149, 1428163: 2150, 1132681: 2151,
+    935693: 2152, 837199: 2153, 640211: 2154, 344729: 2155, 246235: 2156,
+    147741: 2157, 98494: 2158, 1196569: 2159, 949003: 2160, 783959: 2161,
+    701437: 2162, 536393: 2163, 288827: 2164, 206305: 2165, 123783: 2166,
+    82522: 2167, 887777: 2168, 733381: 2169, 656183: 2170, 501787: 2171,
+    270193: 2172, 192995: 2173, 115797: 2174, 77198: 2175, 581647: 2176,
+    520421: 2177, 397969: 2178, 214291: 2179, 153065: 2180, 91839: 2181,
+    61226: 2182, 429913: 2183, 328757: 2184, 177023: 2185, 126445: 2186,
+    75867: 2187, 50578: 2188, 294151: 2189, 158389: 2190, 113135: 2191,
+    67881: 2192, 45254: 2193, 121121: 2194, 86515: 2195, 51909: 2196,
+    34606: 2197, 46585: 2198, 27951: 2199, 18634: 2200, 19965: 2201,
+    13310: 2202, 7986: 2203, 520331: 2204, 435953: 2205, 407827: 2206,
+    323449: 2207, 267197: 2208, 239071: 2209, 182819: 2210, 154693: 2211,
+    70315: 2212, 42189: 2213, 28126: 2214, 393421: 2215, 368039: 2216,
+    291893: 2217, 241129: 2218, 215747: 2219, 164983: 2220, 139601: 2221,
+    63455: 2222, 38073: 2223, 25382: 2224, 308357: 2225, 244559: 2226,
+    202027: 2227, 180761: 2228, 138229: 2229, 116963: 2230, 53165: 2231,
+    31899: 2232, 21266: 2233, 228781: 2234, 188993: 2235, 169099: 2236,
+    129311: 2237, 109417: 2238, 49735: 2239, 29841: 2240, 19894: 2241,
+    149891: 2242, 134113: 2243, 102557: 2244, 86779: 2245, 39445: 2246,
+    23667: 2247, 15778: 2248, 110789: 2249, 84721: 2250, 71687: 2251,
+    32585: 2252, 19551: 2253, 13034: 2254, 75803: 2255, 64141: 2256,
+    29155: 2257, 17493: 2258, 11662: 2259, 49049: 2260, 22295: 2261,
+    13377: 2262, 8918: 2263, 18865: 2264, 11319: 2265, 7546: 2266, 5145: 2267,
+    3430: 2268, 2058: 2269, 189625: 2270, 158875: 2271, 148625: 2272,
+    117875: 2273, 97375: 2274, 87125: 2275, 66625: 2276, 56375: 2277,
+    35875: 2278, 15375: 2279, 10250: 2280, 143375: 2281, 134125: 2282,
+    106375: 2283, 87875: 2284, 78625: 2285, 60125: 2286, 50875: 2287,
+    32375: 2288, 13875: 2289, 9250: 2290, 112375: 2291, 89125: 2292,
+    73625: 2293, 65875: 2294, 50375: 2295, 42625: 2296, 27125: 2297,
+    11625: 2298, 7750: 2299, 83375: 2300, 68875: 2301, 61625: 2302,
+    47125: 2303, 39875: 2304, 25375: 2305, 10875: 2306, 7250: 2307,
+    54625: 2308, 48875: 2309, 37375: 2310, 31625: 2311, 20125: 2312,
+    8625: 2313, 5750: 2314, 40375: 2315, 30875: 2316, 26125: 2317, 16625: 2318,
+    7125: 2319, 4750: 2320, 27625: 2321, 23375: 2322, 14875: 2323, 6375: 2324,
+    4250: 2325, 17875: 2326, 11375: 2327, 4875: 2328, 3250: 2329, 9625: 2330,
+    4125: 2331, 2750: 2332, 2625: 2333, 1750: 2334, 750: 2335, 40959: 2336,
+    34317: 2337, 32103: 2338, 25461: 2339, 21033: 2340, 18819: 2341,
+    14391: 2342, 12177: 2343, 7749: 2344, 5535: 2345, 2214: 2346, 30969: 2347,
+    28971: 2348, 22977: 2349, 18981: 2350, 16983: 2351, 12987: 2352,
+    10989: 2353, 6993: 2354, 4995: 2355, 1998: 2356, 24273: 2357, 19251: 2358,
+    15903: 2359, 14229: 2360, 10881: 2361, 9207: 2362, 5859: 2363, 4185: 2364,
+    1674: 2365, 18009: 2366, 14877: 2367, 13311: 2368, 10179: 2369, 8613: 2370,
+    5481: 2371, 3915: 2372, 1566: 2373, 11799: 2374, 10557: 2375, 8073: 2376,
+    6831: 2377, 4347: 2378, 3105: 2379, 1242: 2380, 8721: 2381, 6669: 2382,
+    5643: 2383, 3591: 2384, 2565: 2385, 1026: 2386, 5967: 2387, 5049: 2388,
+    3213: 2389, 2295: 2390, 918: 2391, 3861: 2392, 2457: 2393, 1755: 2394,
+    702: 2395, 2079: 2396, 1485: 2397, 594: 2398, 945: 2399, 378: 2400,
+    270: 2401, 12136: 2402, 10168: 2403, 9512: 2404, 7544: 2405, 6232: 2406,
+    5576: 2407, 4264: 2408, 3608: 2409, 2296: 2410, 1640: 2411, 984: 2412,
+    9176: 2413, 8584: 2414, 6808: 2415, 5624: 2416, 5032: 2417, 3848: 2418,
+    3256: 2419, 2072: 2420, 1480: 2421, 888: 2422, 7192: 2423, 5704: 2424,
+    4712: 2425, 4216: 2426, 3224: 2427, 2728: 2428, 1736: 2429, 1240: 2430,
+    744: 2431, 5336: 2432, 4408: 2433, 3944: 2434, 3016: 2435, 2552: 2436,
+    1624: 2437, 1160: 2438, 696: 2439, 3496: 2440, 3128: 2441, 2392: 2442,
+    2024: 2443, 1288: 2444, 920: 2445, 552: 2446, 2584: 2447, 1976: 2448,
+    1672: 2449, 1064: 2450, 760: 2451, 456: 2452, 1768: 2453, 1496: 2454,
+    952: 2455, 680: 2456, 408: 2457, 1144: 2458, 728: 2459, 520: 2460,
+    312: 2461, 616: 2462, 440: 2463, 264: 2464, 280: 2465, 168: 2466,
+    120: 2467, 71339959: 2468, 66737381: 2469, 52929647: 2470, 43724491: 2471,
+    39121913: 2472, 29916757: 2473, 25314179: 2474, 16109023: 2475,
+    11506445: 2476, 6903867: 2477, 4602578: 2478, 59771317: 2479,
+    46847789: 2480, 37155143: 2481, 30693379: 2482, 27462497: 2483,
+    21000733: 2484, 17769851: 2485, 11308087: 2486, 8077205: 2487,
+    4846323: 2488, 3230882: 2489, 52307677: 2490, 43825351: 2491,
+    32515583: 2492, 26860699: 2493, 24033257: 2494, 18378373: 2495,
+    15550931: 2496, 9896047: 2497, 7068605: 2498, 4241163: 2499, 2827442: 2500,
+    32902213: 2501, 27566719: 2502, 25788221: 2503, 16895731: 2504,
+    15117233: 2505, 11560237: 2506, 9781739: 2507, 6224743: 2508,
+    4446245: 2509, 2667747: 2510, 1778498: 2511, 22453117: 2512,
+    18812071: 2513, 17598389: 2514, 13957343: 2515, 10316297: 2516,
+    7888933: 2517, 6675251: 2518, 4247887: 2519, 3034205: 2520, 1820523: 2521,
+    1213682: 2522, 17974933: 2523, 15060079: 2524, 14088461: 2525,
+    11173607: 2526, 9230371: 2527, 6315517: 2528, 5343899: 2529, 3400663: 2530,
+    2429045: 2531, 1457427: 2532, 971618: 2533, 10511293: 2534, 8806759: 2535,
+    8238581: 2536, 6534047: 2537, 5397691: 2538, 4829513: 2539, 3124979: 2540,
+    1988623: 2541, 1420445: 2542, 852267: 2543, 568178: 2544, 7525837: 2545,
+    6305431: 2546, 5898629: 2547, 4678223: 2548, 3864619: 2549, 3457817: 2550,
+    2644213: 2551, 1423807: 2552, 1017005: 2553, 610203: 2554, 406802: 2555,
+    3047653: 2556, 2553439: 2557, 2388701: 2558, 1894487: 2559, 1565011: 2560,
+    1400273: 2561, 1070797: 2562, 906059: 2563, 411845: 2564, 247107: 2565,
+    164738: 2566, 1554925: 2567, 1302775: 2568, 1218725: 2569, 966575: 2570,
+    798475: 2571, 714425: 2572, 546325: 2573, 462275: 2574, 294175: 2575,
+    126075: 2576, 84050: 2577, 559773: 2578, 468999: 2579, 438741: 2580,
+    347967: 2581, 287451: 2582, 257193: 2583, 196677: 2584, 166419: 2585,
+    105903: 2586, 75645: 2587, 30258: 2588, 248788: 2589, 208444: 2590,
+    194996: 2591, 154652: 2592, 127756: 2593, 114308: 2594, 87412: 2595,
+    73964: 2596, 47068: 2597, 33620: 2598, 20172: 2599, 53939969: 2600,
+    38152661: 2601, 30259007: 2602, 24996571: 2603, 22365353: 2604,
+    17102917: 2605, 14471699: 2606, 9209263: 2607, 6578045: 2608,
+    3946827: 2609, 2631218: 2610, 47204489: 2611, 35691199: 2612,
+    26480567: 2613, 21875251: 2614, 19572593: 2615, 14967277: 2616,
+    12664619: 2617, 8059303: 2618, 5756645: 2619, 3453987: 2620, 2302658: 2621,
+    29692241: 2622, 22450231: 2623, 21001829: 2624, 13759819: 2625,
+    12311417: 2626, 9414613: 2627, 7966211: 2628, 5069407: 2629, 3621005: 2630,
+    2172603: 2631, 1448402: 2632, 20262569: 2633, 15320479: 2634,
+    14332061: 2635, 11366807: 2636, 8401553: 2637, 6424717: 2638,
+    5436299: 2639, 3459463: 2640, 2471045: 2641, 1482627: 2642, 988418: 2643,
+    16221281: 2644, 12264871: 2645, 11473589: 2646, 9099743: 2647,
+    7517179: 2648, 5143333: 2649, 4352051: 2650, 2769487: 2651, 1978205: 2652,
+    1186923: 2653, 791282: 2654, 9485801: 2655, 7172191: 2656, 6709469: 2657,
+    5321303: 2658, 4395859: 2659, 3933137: 2660, 2544971: 2661, 1619527: 2662,
+    1156805: 2663, 694083: 2664, 462722: 2665, 6791609: 2666, 5135119: 2667,
+    4803821: 2668, 3809927: 2669, 3147331: 2670, 2816033: 2671, 2153437: 2672,
+    1159543: 2673, 828245: 2674, 496947: 2675, 331298: 2676, 2750321: 2677,
+    2079511: 2678, 1945349: 2679, 1542863: 2680, 1274539: 2681, 1140377: 2682,
+    872053: 2683, 737891: 2684, 335405: 2685, 201243: 2686, 134162: 2687,
+    1403225: 2688, 1060975: 2689, 992525: 2690, 787175: 2691, 650275: 2692,
+    581825: 2693, 444925: 2694, 376475: 2695, 239575: 2696, 102675: 2697,
+    68450: 2698, 505161: 2699, 381951: 2700, 357309: 2701, 283383: 2702,
+    234099: 2703, 209457: 2704, 160173: 2705, 135531: 2706, 86247: 2707,
+    61605: 2708, 24642: 2709, 224516: 2710, 169756: 2711, 158804: 2712,
+    125948: 2713, 104044: 2714, 93092: 2715, 71188: 2716, 60236: 2717,
+    38332: 2718, 27380: 2719, 16428: 2720, 33136241: 2721, 29903437: 2722,
+    18588623: 2723, 15355819: 2724, 13739417: 2725, 10506613: 2726,
+    8890211: 2727, 5657407: 2728, 4041005: 2729, 2424603: 2730, 1616402: 2731,
+    20843129: 2732, 18809653: 2733, 14742701: 2734, 9659011: 2735,
+    8642273: 2736, 6608797: 2737, 5592059: 2738, 3558583: 2739, 2541845: 2740,
+    1525107: 2741, 1016738: 2742, 14223761: 2743, 12836077: 2744,
+    10060709: 2745, 7979183: 2746, 5897657: 2747, 4509973: 2748, 3816131: 2749,
+    2428447: 2750, 1734605: 2751, 1040763: 2752, 693842: 2753, 11386889: 2754,
+    10275973: 2755, 8054141: 2756, 6387767: 2757, 5276851: 2758, 3610477: 2759,
+    3055019: 2760, 1944103: 2761, 1388645: 2762, 833187: 2763, 555458: 2764,
+    6658769: 2765, 6009133: 2766, 4709861: 2767, 3735407: 2768, 3085771: 2769,
+    2760953: 2770, 1786499: 2771, 1136863: 2772, 812045: 2773, 487227: 2774,
+    324818: 2775, 4767521: 2776, 4302397: 2777, 3372149: 2778, 2674463: 2779,
+    2209339: 2780, 1976777: 2781, 1511653: 2782, 813967: 2783, 581405: 2784,
+    348843: 2785, 232562: 2786, 1930649: 2787, 1742293: 2788, 1365581: 2789,
+    1083047: 2790, 894691: 2791, 800513: 2792, 612157: 2793, 517979: 2794,
+    235445: 2795, 141267: 2796, 94178: 2797, 985025: 2798, 888925: 2799,
+    696725: 2800, 552575: 2801, 456475: 2802, 408425: 2803, 312325: 2804,
+    264275: 2805, 168175: 2806, 72075: 2807, 48050: 2808, 354609: 2809,
+    320013: 2810, 250821: 2811, 198927: 2812, 164331: 2813, 147033: 2814,
+    112437: 2815, 95139: 2816, 60543: 2817, 43245: 2818, 17298: 2819,
+    157604: 2820, 142228: 2821, 111476: 2822, 88412: 2823, 73036: 2824,
+    65348: 2825, 49972: 2826, 42284: 2827, 26908: 2828, 19220: 2829,
+    11532: 2830, 18240449: 2831, 16460893: 2832, 13791559: 2833, 8452891: 2834,
+    7563113: 2835, 5783557: 2836, 4893779: 2837, 3114223: 2838, 2224445: 2839,
+    1334667: 2840, 889778: 2841, 12447641: 2842, 11233237: 2843, 9411631: 2844,
+    6982823: 2845, 5161217: 2846, 3946813: 2847, 3339611: 2848, 2125207: 2849,
+    1518005: 2850, 910803: 2851, 607202: 2852, 9965009: 2853, 8992813: 2854,
+    7534519: 2855, 5590127: 2856, 4617931: 2857, 3159637: 2858, 2673539: 2859,
+    1701343: 2860, 1215245: 2861, 729147: 2862, 486098: 2863, 5827289: 2864,
+    5258773: 2865, 4405999: 2866, 3268967: 2867, 2700451: 2868, 2416193: 2869,
+    1563419: 2870, 994903: 2871, 710645: 2872, 426387: 2873, 284258: 2874,
+    4172201: 2875, 3765157: 2876, 3154591: 2877, 2340503: 2878, 1933459: 2879,
+    1729937: 2880, 1322893: 2881, 712327: 2882, 508805: 2883, 305283: 2884,
+    203522: 2885, 1689569: 2886, 1524733: 2887, 1277479: 2888, 947807: 2889,
+    782971: 2890, 700553: 2891, 535717: 2892, 453299: 2893, 206045: 2894,
+    123627: 2895, 82418: 2896, 862025: 2897, 777925: 2898, 651775: 2899,
+    483575: 2900, 399475: 2901, 357425: 2902, 273325: 2903, 231275: 2904,
+    147175: 2905, 63075: 2906, 42050: 2907, 310329: 2908, 280053: 2909,
+    234639: 2910, 174087: 2911, 143811: 2912, 128673: 2913, 98397: 2914,
+    83259: 2915, 52983: 2916, 37845: 2917, 15138: 2918, 137924: 2919,
+    124468: 2920, 104284: 2921, 77372: 2922, 63916: 2923, 57188: 2924,
+    43732: 2925, 37004: 2926, 23548: 2927, 16820: 2928, 10092: 2929,
+    7829729: 2930, 7065853: 2931, 5920039: 2932, 5538101: 2933, 3246473: 2934,
+    2482597: 2935, 2100659: 2936, 1336783: 2937, 954845: 2938, 572907: 2939,
+    381938: 2940, 6268121: 2941, 5656597: 2942, 4739311: 2943, 4433549: 2944,
+    2904739: 2945, 1987453: 2946, 1681691: 2947, 1070167: 2948, 764405: 2949,
+    458643: 2950, 305762: 2951, 3665441: 2952, 3307837: 2953, 2771431: 2954,
+    2592629: 2955, 1698619: 2956, 1519817: 2957, 983411: 2958, 625807: 2959,
+    447005: 2960, 268203: 2961, 178802: 2962, 2624369: 2963, 2368333: 2964,
+    1984279: 2965, 1856261: 2966, 1216171: 2967, 1088153: 2968, 832117: 2969,
+    448063: 2970, 320045: 2971, 192027: 2972, 128018: 2973, 1062761: 2974,
+    959077: 2975, 803551: 2976, 751709: 2977, 492499: 2978, 440657: 2979,
+    336973: 2980, 285131: 2981, 129605: 2982, 77763: 2983, 51842: 2984,
+    542225: 2985, 489325: 2986, 409975: 2987, 383525: 2988, 251275: 2989,
+    224825: 2990, 171925: 2991, 145475: 2992, 92575: 2993, 39675: 2994,
+    26450: 2995, 195201: 2996, 176157: 2997, 147591: 2998, 138069: 2999,
+    90459: 3000, 80937: 3001, 61893: 3002, 52371: 3003, 33327: 3004,
+    23805: 3005, 9522: 3006, 86756: 3007, 78292: 3008, 65596: 3009,
+    61364: 3010, 40204: 3011, 35972: 3012, 27508: 3013, 23276: 3014,
+    14812: 3015, 10580: 3016, 6348: 3017, 4277489: 3018, 3860173: 3019,
+    3234199: 3020, 3025541: 3021, 2399567: 3022, 1356277: 3023, 1147619: 3024,
+    730303: 3025, 521645: 3026, 312987: 3027, 208658: 3028, 2501369: 3029,
+    2257333: 3030, 1891279: 3031, 1769261: 3032, 1403207: 3033, 1037153: 3034,
+    671099: 3035, 427063: 3036, 305045: 3037, 183027: 3038, 122018: 3039,
+    1790921: 3040, 1616197: 3041, 1354111: 3042, 1266749: 3043, 1004663: 3044,
+    742577: 3045, 567853: 3046, 305767: 3047, 218405: 3048, 131043: 3049,
+    87362: 3050, 725249: 3051, 654493: 3052, 548359: 3053, 512981: 3054,
+    406847: 3055, 300713: 3056, 229957: 3057, 194579: 3058, 88445: 3059,
+    53067: 3060, 35378: 3061, 370025: 3062, 333925: 3063, 279775: 3064,
+    261725: 3065, 207575: 3066, 153425: 3067, 117325: 3068, 99275: 3069,
+    63175: 3070, 27075: 3071, 18050: 3072, 133209: 3073, 120213: 3074,
+    100719: 3075, 94221: 3076, 74727: 3077, 55233: 3078, 42237: 3079,
+    35739: 3080, 22743: 3081, 16245: 3082, 6498: 3083, 59204: 3084,
+    53428: 3085, 44764: 3086, 41876: 3087, 33212: 3088, 24548: 3089,
+    18772: 3090, 15884: 3091, 10108: 3092, 7220: 3093, 4332: 3094,
+    2002481: 3095, 1807117: 3096, 1514071: 3097, 1416389: 3098, 1123343: 3099,
+    927979: 3100, 537251: 3101, 341887: 3102, 244205: 3103, 146523: 3104,
+    97682: 3105, 1433729: 3106, 1293853: 3107, 1084039: 3108, 1014101: 3109,
+    804287: 3110, 664411: 3111, 454597: 3112, 244783: 3113, 174845: 3114,
+    104907: 3115, 69938: 3116, 580601: 3117, 523957: 3118, 438991: 3119,
+    410669: 3120, 325703: 3121, 269059: 3122, 184093: 3123, 155771: 3124,
+    70805: 3125, 42483: 3126, 28322: 3127, 296225: 3128, 267325: 3129,
+    223975: 3130, 209525: 3131, 166175: 3132, 137275: 3133, 93925: 3134,
+    79475: 3135, 50575: 3136, 21675: 3137, 14450: 3138, 106641: 3139,
+    96237: 3140, 80631: 3141, 75429: 3142, 59823: 3143, 49419: 3144,
+    33813: 3145, 28611: 3146, 18207: 3147, 13005: 3148, 5202: 3149,
+    47396: 3150, 42772: 3151, 35836: 3152, 33524: 3153, 26588: 3154,
+    21964: 3155, 15028: 3156, 12716: 3157, 8092: 3158, 5780: 3159, 3468: 3160,
+    838409: 3161, 756613: 3162, 633919: 3163, 593021: 3164, 470327: 3165,
+    388531: 3166, 347633: 3167, 143143: 3168, 102245: 3169, 61347: 3170,
+    40898: 3171, 339521: 3172, 306397: 3173, 256711: 3174, 240149: 3175,
+    190463: 3176, 157339: 3177, 140777: 3178, 91091: 3179, 41405: 3180,
+    24843: 3181, 16562: 3182, 173225: 3183, 156325: 3184, 130975: 3185,
+    122525: 3186, 97175: 3187, 80275: 3188, 71825: 3189, 46475: 3190,
+    29575: 3191, 12675: 3192, 8450: 3193, 62361: 3194, 56277: 3195,
+    47151: 3196, 44109: 3197, 34983: 3198, 28899: 3199, 25857: 3200,
+    16731: 3201, 10647: 3202, 7605: 3203, 3042: 3204, 27716: 3205, 25012: 3206,
+    20956: 3207, 19604: 3208, 15548: 3209, 12844: 3210, 11492: 3211,
+    7436: 3212, 4732: 3213, 3380: 3214, 2028: 3215, 243089: 3216, 219373: 3217,
+    183799: 3218, 171941: 3219, 136367: 3220, 112651: 3221, 100793: 3222,
+    77077: 3223, 29645: 3224, 17787: 3225, 11858: 3226, 124025: 3227,
+    111925: 3228, 93775: 3229, 87725: 3230, 69575: 3231, 57475: 3232,
+    51425: 3233, 39325: 3234, 21175: 3235, 9075: 3236, 6050: 3237, 44649: 3238,
+    40293: 3239, 33759: 3240, 31581: 3241, 25047: 3242, 20691: 3243,
+    18513: 3244, 14157: 3245, 7623: 3246, 5445: 3247, 2178: 3248, 19844: 3249,
+    17908: 3250, 15004: 3251, 14036: 3252, 11132: 3253, 9196: 3254, 8228: 3255,
+    6292: 3256, 3388: 3257, 2420: 3258, 1452: 3259, 50225: 3260, 45325: 3261,
+    37975: 3262, 35525: 3263, 28175: 3264, 23275: 3265, 20825: 3266,
+    15925: 3267, 13475: 3268, 3675: 3269, 2450: 3270, 18081: 3271, 16317: 3272,
+    13671: 3273, 12789: 3274, 10143: 3275, 8379: 3276, 7497: 3277, 5733: 3278,
+    4851: 3279, 2205: 3280, 882: 3281, 8036: 3282, 7252: 3283, 6076: 3284,
+    5684: 3285, 4508: 3286, 3724: 3287, 3332: 3288, 2548: 3289, 2156: 3290,
+    980: 3291, 588: 3292, 9225: 3293, 8325: 3294, 6975: 3295, 6525: 3296,
+    5175: 3297, 4275: 3298, 3825: 3299, 2925: 3300, 2475: 3301, 1575: 3302,
+    450: 3303, 4100: 3304, 3700: 3305, 3100: 3306, 2900: 3307, 2300: 3308,
+    1900: 3309, 1700: 3310, 1300: 3311, 1100: 3312, 700: 3313, 300: 3314,
+    1476: 3315, 1332: 3316, 1116: 3317, 1044: 3318, 828: 3319, 684: 3320,
+    612: 3321, 468: 3322, 396: 3323, 252: 3324, 180: 3325, 55915103: 3326,
+    44346461: 3327, 36634033: 3328, 32777819: 3329, 25065391: 3330,
+    21209177: 3331, 13496749: 3332, 9640535: 3333, 5784321: 3334,
+    3856214: 3335, 41485399: 3336, 34270547: 3337, 30663121: 3338,
+    23448269: 3339, 19840843: 3340, 12625991: 3341, 9018565: 3342,
+    5411139: 3343, 3607426: 3344, 27180089: 3345, 24319027: 3346,
+    18596903: 3347, 15735841: 3348, 10013717: 3349, 7152655: 3350,
+    4291593: 3351, 2861062: 3352, 20089631: 3353, 15362659: 3354,
+    12999173: 3355, 8272201: 3356, 5908715: 3357, 3545229: 3358, 2363486: 3359,
+    13745537: 3360, 11630839: 3361, 7401443: 3362, 5286745: 3363,
+    3172047: 3364, 2114698: 3365, 8894171: 3366, 5659927: 3367, 4042805: 3368,
+    2425683: 3369, 1617122: 3370, 4789169: 3371, 3420835: 3372, 2052501: 3373,
+    1368334: 3374, 2176895: 3375, 1306137: 3376, 870758: 3377, 932955: 3378,
+    621970: 3379, 373182: 3380, 34758037: 3381, 28713161: 3382, 25690723: 3383,
+    19645847: 3384, 16623409: 3385, 10578533: 3386, 7556095: 3387,
+    4533657: 3388, 3022438: 3389, 22772507: 3390, 20375401: 3391,
+    15581189: 3392, 13184083: 3393, 8389871: 3394, 5992765: 3395,
+    3595659: 3396, 2397106: 3397, 16831853: 3398, 12871417: 3399,
+    10891199: 3400, 6930763: 3401, 4950545: 3402, 2970327: 3403, 1980218: 3404,
+    11516531: 3405, 9744757: 3406, 6201209: 3407, 4429435: 3408, 2657661: 3409,
+    1771774: 3410, 7451873: 3411, 4742101: 3412, 3387215: 3413, 2032329: 3414,
+    1354886: 3415, 4012547: 3416, 2866105: 3417, 1719663: 3418, 1146442: 3419,
+    1823885: 3420, 1094331: 3421, 729554: 3422, 781665: 3423, 521110: 3424,
+    312666: 3425, 21303313: 3426, 19060859: 3427, 14575951: 3428,
+    12333497: 3429, 7848589: 3430, 5606135: 3431, 3363681: 3432, 2242454: 3433,
+    15745927: 3434, 12041003: 3435, 10188541: 3436, 6483617: 3437,
+    4631155: 3438, 2778693: 3439, 1852462: 3440, 10773529: 3441, 9116063: 3442,
+    5801131: 3443, 4143665: 3444, 2486199: 3445, 1657466: 3446, 6971107: 3447,
+    4436159: 3448, 3168685: 3449, 1901211: 3450, 1267474: 3451, 3753673: 3452,
+    2681195: 3453, 1608717: 3454, 1072478: 3455, 1706215: 3456, 1023729: 3457,
+    682486: 3458, 731235: 3459, 487490: 3460, 292494: 3461, 12488149: 3462,
+    9549761: 3463, 8080567: 3464, 5142179: 3465, 3672985: 3466, 2203791: 3467,
+    1469194: 3468, 8544523: 3469, 7229981: 3470, 4600897: 3471, 3286355: 3472,
+    1971813: 3473, 1314542: 3474, 5528809: 3475, 3518333: 3476, 2513095: 3477,
+    1507857: 3478, 1005238: 3479, 2977051: 3480, 2126465: 3481, 1275879: 3482,
+    850586: 3483, 1353205: 3484, 811923: 3485, 541282: 3486, 579945: 3487,
+    386630: 3488, 231978: 3489, 7058519: 3490, 5972593: 3491, 3800741: 3492,
+    2714815: 3493, 1628889: 3494, 1085926: 3495, 4567277: 3496, 2906449: 3497,
+    2076035: 3498, 1245621: 3499, 830414: 3500, 2459303: 3501, 1756645: 3502,
+    1053987: 3503, 702658: 3504, 1117865: 3505, 670719: 3506, 447146: 3507,
+    479085: 3508, 319390: 3509, 191634: 3510, 4086511: 3511, 2600507: 3512,
+    1857505: 3513, 1114503: 3514, 743002: 3515, 2200429: 3516, 1571735: 3517,
+    943041: 3518, 628694: 3519, 1000195: 3520, 600117: 3521, 400078: 3522,
+    428655: 3523, 285770: 3524, 171462: 3525, 1682681: 3526, 1201915: 3527,
+    721149: 3528, 480766: 3529, 764855: 3530, 458913: 3531, 305942: 3532,
+    327795: 3533, 218530: 3534, 131118: 3535, 647185: 3536, 388311: 3537,
+    258874: 3538, 277365: 3539, 184910: 3540, 110946: 3541, 176505: 3542,
+    117670: 3543, 70602: 3544, 50430: 3545, 50459971: 3546, 40019977: 3547,
+    33059981: 3548, 29579983: 3549, 22619987: 3550, 19139989: 3551,
+    12179993: 3552, 8699995: 3553, 5219997: 3554, 3479998: 3555,
+    37438043: 3556, 30927079: 3557, 27671597: 3558, 21160633: 3559,
+    17905151: 3560, 11394187: 3561, 8138705: 3562, 4883223: 3563,
+    3255482: 3564, 24528373: 3565, 21946439: 3566, 16782571: 3567,
+    14200637: 3568, 9036769: 3569, 6454835: 3570, 3872901: 3571, 2581934: 3572,
+    18129667: 3573, 13863863: 3574, 11730961: 3575, 7465157: 3576,
+    5332255: 3577, 3199353: 3578, 2132902: 3579, 12404509: 3580,
+    10496123: 3581, 6679351: 3582, 4770965: 3583, 2862579: 3584, 1908386: 3585,
+    8026447: 3586, 5107739: 3587, 3648385: 3588, 2189031: 3589, 1459354: 3590,
+    4321933: 3591, 3087095: 3592, 1852257: 3593, 1234838: 3594, 1964515: 3595,
+    1178709: 3596, 785806: 3597, 841935: 3598, 561290: 3599, 336774: 3600,
+    28306813: 3601, 23383889: 3602, 20922427: 3603, 15999503: 3604,
+    13538041: 3605, 8615117: 3606, 6153655: 3607, 3692193: 3608, 2461462: 3609,
+    18545843: 3610, 16593649: 3611, 12689261: 3612, 10737067: 3613,
+    6832679: 3614, 4880485: 3615, 2928291: 3616, 1952194: 3617, 13707797: 3618,
+    10482433: 3619, 8869751: 3620, 5644387: 3621, 4031705: 3622, 2419023: 3623,
+    1612682: 3624, 9379019: 3625, 7936093: 3626, 5050241: 3627, 3607315: 3628,
+    2164389: 3629, 1442926: 3630, 6068777: 3631, 3861949: 3632, 2758535: 3633,
+    1655121: 3634, 1103414: 3635, 3267803: 3636, 2334145: 3637, 1400487: 3638,
+    933658: 3639, 1485365: 3640, 891219: 3641, 594146: 3642, 636585: 3643,
+    424390: 3644, 254634: 3645, 17349337: 3646, 15523091: 3647, 11870599: 3648,
+    10044353: 3649, 6391861: 3650, 4565615: 3651, 2739369: 3652, 1826246: 3653,
+    12823423: 3654, 9806147: 3655, 8297509: 3656, 5280233: 3657, 3771595: 3658,
+    2262957: 3659, 1508638: 3660, 8773921: 3661, 7424087: 3662, 4724419: 3663,
+    3374585: 3664, 2024751: 3665, 1349834: 3666, 5677243: 3667, 3612791: 3668,
+    2580565: 3669, 1548339: 3670, 1032226: 3671, 3056977: 3672, 2183555: 3673,
+    1310133: 3674, 873422: 3675, 1389535: 3676, 833721: 3677, 555814: 3678,
+    595515: 3679, 397010: 3680, 238206: 3681, 10170301: 3682, 7777289: 3683,
+    6580783: 3684, 4187771: 3685, 2991265: 3686, 1794759: 3687, 1196506: 3688,
+    6958627: 3689, 5888069: 3690, 3746953: 3691, 2676395: 3692, 1605837: 3693,
+    1070558: 3694, 4502641: 3695, 2865317: 3696, 2046655: 3697, 1227993: 3698,
+    818662: 3699, 2424499: 3700, 1731785: 3701, 1039071: 3702, 692714: 3703,
+    1102045: 3704, 661227: 3705, 440818: 3706, 472305: 3707, 314870: 3708,
+    188922: 3709, 5748431: 3710, 4864057: 3711, 3095309: 3712, 2210935: 3713,
+    1326561: 3714, 884374: 3715, 3719573: 3716, 2367001: 3717, 1690715: 3718,
+    1014429: 3719, 676286: 3720, 2002847: 3721, 1430605: 3722, 858363: 3723,
+    572242: 3724, 910385: 3725, 546231: 3726, 364154: 3727, 390165: 3728,
+    260110: 3729, 156066: 3730, 3328039: 3731, 2117843: 3732, 1512745: 3733,
+    907647: 3734, 605098: 3735, 1792021: 3736, 1280015: 3737, 768009: 3738,
+    512006: 3739, 814555: 3740, 488733: 3741, 325822: 3742, 349095: 3743,
+    232730: 3744, 139638: 3745, 1370369: 3746, 978835: 3747, 587301: 3748,
+    391534: 3749, 622895: 3750, 373737: 3751, 249158: 3752, 266955: 3753,
+    177970: 3754, 106782: 3755, 527065: 3756, 316239: 3757, 210826: 3758,
+    225885: 3759, 150590: 3760, 90354: 3761, 143745: 3762, 95830: 3763,
+    57498: 3764, 41070: 3765, 42277273: 3766, 33530251: 3767, 27698903: 3768,
+    24783229: 3769, 18951881: 3770, 16036207: 3771, 10204859: 3772,
+    7289185: 3773, 4373511: 3774, 2915674: 3775, 26280467: 3776,
+    21709951: 3777, 19424693: 3778, 14854177: 3779, 12568919: 3780,
+    7998403: 3781, 5713145: 3782, 3427887: 3783, 2285258: 3784, 17218237: 3785,
+    15405791: 3786, 11780899: 3787, 9968453: 3788, 6343561: 3789,
+    4531115: 3790, 2718669: 3791, 1812446: 3792, 12726523: 3793, 9732047: 3794,
+    8234809: 3795, 5240333: 3796, 3743095: 3797, 2245857: 3798, 1497238: 3799,
+    8707621: 3800, 7367987: 3801, 4688719: 3802, 3349085: 3803, 2009451: 3804,
+    1339634: 3805, 5634343: 3806, 3585491: 3807, 2561065: 3808, 1536639: 3809,
+    1024426: 3810, 3033877: 3811, 2167055: 3812, 1300233: 3813, 866822: 3814,
+    1379035: 3815, 827421: 3816, 551614: 3817, 591015: 3818, 394010: 3819,
+    236406: 3820, 23716519: 3821, 19591907: 3822, 17529601: 3823,
+    13404989: 3824, 11342683: 3825, 7218071: 3826, 5155765: 3827,
+    3093459: 3828, 2062306: 3829, 15538409: 3830, 13902787: 3831,
+    10631543: 3832, 8995921: 3833, 5724677: 3834, 4089055: 3835, 2453433: 3836,
+    1635622: 3837, 11484911: 3838, 8782579: 3839, 7431413: 3840, 4729081: 3841,
+    3377915: 3842, 2026749: 3843, 1351166: 3844, 7858097: 3845, 6649159: 3846,
+    4231283: 3847, 3022345: 3848, 1813407: 3849, 1208938: 3850, 5084651: 3851,
+    3235687: 3852, 2311205: 3853, 1386723: 3854, 924482: 3855, 2737889: 3856,
+    1955635: 3857, 1173381: 3858, 782254: 3859, 1244495: 3860, 746697: 3861,
+    497798: 3862, 533355: 3863, 355570: 3864, 213342: 3865, 12178753: 3866,
+    10896779: 3867, 8332831: 3868, 7050857: 3869, 4486909: 3870, 3204935: 3871,
+    1922961: 3872, 1281974: 3873, 9001687: 3874, 6883643: 3875, 5824621: 3876,
+    3706577: 3877, 2647555: 3878, 1588533: 3879, 1059022: 3880, 6159049: 3881,
+    5211503: 3882, 3316411: 3883, 2368865: 3884, 1421319: 3885, 947546: 3886,
+    3985267: 3887, 2536079: 3888, 1811485: 3889, 1086891: 3890, 724594: 3891,
+    2145913: 3892, 1532795: 3893, 919677: 3894, 613118: 3895, 975415: 3896,
+    585249: 3897, 390166: 3898, 418035: 3899, 278690: 3900, 167214: 3901,
+    7139269: 3902, 5459441: 3903, 4619527: 3904, 2939699: 3905, 2099785: 3906,
+    1259871: 3907, 839914: 3908, 4884763: 3909, 4133261: 3910, 2630257: 3911,
+    1878755: 3912, 1127253: 3913, 751502: 3914, 3160729: 3915, 2011373: 3916,
+    1436695: 3917, 862017: 3918, 574678: 3919, 1701931: 3920, 1215665: 3921,
+    729399: 3922, 486266: 3923, 773605: 3924, 464163: 3925, 309442: 3926,
+    331545: 3927, 221030: 3928, 132618: 3929, 4035239: 3930, 3414433: 3931,
+    2172821: 3932, 1552015: 3933, 931209: 3934, 620806: 3935, 2611037: 3936,
+    1661569: 3937, 1186835: 3938, 712101: 3939, 474734: 3940, 1405943: 3941,
+    1004245: 3942, 602547: 3943, 401698: 3944, 639065: 3945, 383439: 3946,
+    255626: 3947, 273885: 3948, 182590: 3949, 109554: 3950, 2336191: 3951,
+    1486667: 3952, 1061905: 3953, 637143: 3954, 424762: 3955, 1257949: 3956,
+    898535: 3957, 539121: 3958, 359414: 3959, 571795: 3960, 343077: 3961,
+    228718: 3962, 245055: 3963, 163370: 3964, 98022: 3965, 961961: 3966,
+    687115: 3967, 412269: 3968, 274846: 3969, 437255: 3970, 262353: 3971,
+    174902: 3972, 187395: 3973, 124930: 3974, 74958: 3975, 369985: 3976,
+    221991: 3977, 147994: 3978, 158565: 3979, 105710: 3980, 63426: 3981,
+    100905: 3982, 67270: 3983, 40362: 3984, 28830: 3985, 39549707: 3986,
+    29343331: 3987, 24240143: 3988, 21688549: 3989, 16585361: 3990,
+    14033767: 3991, 8930579: 3992, 6378985: 3993, 3827391: 3994, 2551594: 3995,
+    24584953: 3996, 20309309: 3997, 18171487: 3998, 13895843: 3999,
+    11758021: 4000, 7482377: 4001, 5344555: 4002, 3206733: 4003, 2137822: 4004,
+    15068197: 4005, 13482071: 4006, 10309819: 4007, 8723693: 4008,
+    5551441: 4009, 3965315: 4010, 2379189: 4011, 1586126: 4012, 11137363: 4013,
+    8516807: 4014, 7206529: 4015, 4585973: 4016, 3275695: 4017, 1965417: 4018,
+    1310278: 4019, 7620301: 4020, 6447947: 4021, 4103239: 4022, 2930885: 4023,
+    1758531: 4024, 1172354: 4025, 4930783: 4026, 3137771: 4027, 2241265: 4028,
+    1344759: 4029, 896506: 4030, 2655037: 4031, 1896455: 4032, 1137873: 4033,
+    758582: 4034, 1206835: 4035, 724101: 4036, 482734: 4037, 517215: 4038,
+    344810: 4039, 206886: 4040, 22186421: 4041, 18327913: 4042, 16398659: 4043,
+    12540151: 4044, 10610897: 4045, 6752389: 4046, 4823135: 4047,
+    2893881: 4048, 1929254: 4049, 13598129: 4050, 12166747: 4051,
+    9303983: 4052, 7872601: 4053, 5009837: 4054, 3578455: 4055, 2147073: 4056,
+    1431382: 4057, 10050791: 4058, 7685899: 4059, 6503453: 4060, 4138561: 4061,
+    2956115: 4062, 1773669: 4063, 1182446: 4064, 6876857: 4065, 5818879: 4066,
+    3702923: 4067, 2644945: 4068, 1586967: 4069, 1057978: 4070, 4449731: 4071,
+    2831647: 4072, 2022605: 4073, 1213563: 4074, 809042: 4075, 2396009: 4076,
+    1711435: 4077, 1026861: 4078, 684574: 4079, 1089095: 4080, 653457: 4081,
+    435638: 4082, 466755: 4083, 311170: 4084, 186702: 4085, 11393027: 4086,
+    10193761: 4087, 7795229: 4088, 6595963: 4089, 4197431: 4090, 2998165: 4091,
+    1798899: 4092, 1199266: 4093, 8420933: 4094, 6439537: 4095, 5448839: 4096,
+    3467443: 4097, 2476745: 4098, 1486047: 4099, 990698: 4100, 5761691: 4101,
+    4875277: 4102, 3102449: 4103, 2216035: 4104, 1329621: 4105, 886414: 4106,
+    3728153: 4107, 2372461: 4108, 1694615: 4109, 1016769: 4110, 677846: 4111,
+    2007467: 4112, 1433905: 4113, 860343: 4114, 573562: 4115, 912485: 4116,
+    547491: 4117, 364994: 4118, 391065: 4119, 260710: 4120, 156426: 4121,
+    6247789: 4122, 4777721: 4123, 4042687: 4124, 2572619: 4125, 1837585: 4126,
+    1102551: 4127, 735034: 4128, 4274803: 4129, 3617141: 4130, 2301817: 4131,
+    1644155: 4132, 986493: 4133, 657662: 4134, 2766049: 4135, 1760213: 4136,
+    1257295: 4137, 754377: 4138, 502918: 4139, 1489411: 4140, 1063865: 4141,
+    638319: 4142, 425546: 4143, 677005: 4144, 406203: 4145, 270802: 4146,
+    290145: 4147, 193430: 4148, 116058: 4149, 3531359: 4150, 2988073: 4151,
+    1901501: 4152, 1358215: 4153, 814929: 4154, 543286: 4155, 2284997: 4156,
+    1454089: 4157, 1038635: 4158, 623181: 4159, 415454: 4160, 1230383: 4161,
+    878845: 4162, 527307: 4163, 351538: 4164, 559265: 4165, 335559: 4166,
+    223706: 4167, 239685: 4168, 159790: 4169, 95874: 4170, 2044471: 4171,
+    1301027: 4172, 929305: 4173, 557583: 4174, 371722: 4175, 1100869: 4176,
+    786335: 4177, 471801: 4178, 314534: 4179, 500395: 4180, 300237: 4181,
+    200158: 4182, 214455: 4183, 142970: 4184, 85782: 4185, 841841: 4186,
+    601315: 4187, 360789: 4188, 240526: 4189, 382655: 4190, 229593: 4191,
+    153062: 4192, 163995: 4193, 109330: 4194, 65598: 4195, 323785: 4196,
+    194271: 4197, 129514: 4198, 138765: 4199, 92510: 4200, 55506: 4201,
+    88305: 4202, 58870: 4203, 35322: 4204, 25230: 4205, 24877283: 4206,
+    23272297: 4207, 15247367: 4208, 13642381: 4209, 10432409: 4210,
+    8827423: 4211, 5617451: 4212, 4012465: 4213, 2407479: 4214, 1604986: 4215,
+    19498411: 4216, 12774821: 4217, 11430103: 4218, 8740667: 4219,
+    7395949: 4220, 4706513: 4221, 3361795: 4222, 2017077: 4223, 1344718: 4224,
+    11950639: 4225, 10692677: 4226, 8176753: 4227, 6918791: 4228,
+    4402867: 4229, 3144905: 4230, 1886943: 4231, 1257962: 4232, 7005547: 4233,
+    5357183: 4234, 4533001: 4235, 2884637: 4236, 2060455: 4237, 1236273: 4238,
+    824182: 4239, 4793269: 4240, 4055843: 4241, 2580991: 4242, 1843565: 4243,
+    1106139: 4244, 737426: 4245, 3101527: 4246, 1973699: 4247, 1409785: 4248,
+    845871: 4249, 563914: 4250, 1670053: 4251, 1192895: 4252, 715737: 4253,
+    477158: 4254, 759115: 4255, 455469: 4256, 303646: 4257, 325335: 4258,
+    216890: 4259, 130134: 4260, 17596127: 4261, 11528497: 4262, 10314971: 4263,
+    7887919: 4264, 6674393: 4265, 4247341: 4266, 3033815: 4267, 1820289: 4268,
+    1213526: 4269, 10784723: 4270, 9649489: 4271, 7379021: 4272, 6243787: 4273,
+    3973319: 4274, 2838085: 4275, 1702851: 4276, 1135234: 4277, 6322079: 4278,
+    4834531: 4279, 4090757: 4280, 2603209: 4281, 1859435: 4282, 1115661: 4283,
+    743774: 4284, 4325633: 4285, 3660151: 4286, 2329187: 4287, 1663705: 4288,
+    998223: 4289, 665482: 4290, 2798939: 4291, 1781143: 4292, 1272245: 4293,
+    763347: 4294, 508898: 4295, 1507121: 4296, 1076515: 4297, 645909: 4298,
+    430606: 4299, 685055: 4300, 411033: 4301, 274022: 4302, 293595: 4303,
+    195730: 4304, 117438: 4305, 9035849: 4306, 8084707: 4307, 6182423: 4308,
+    5231281: 4309, 3328997: 4310, 2377855: 4311, 1426713: 4312, 951142: 4313,
+    5296877: 4314, 4050553: 4315, 3427391: 4316, 2181067: 4317, 1557905: 4318,
+    934743: 4319, 623162: 4320, 3624179: 4321, 3066613: 4322, 1951481: 4323,
+    1393915: 4324, 836349: 4325, 557566: 4326, 2345057: 4327, 1492309: 4328,
+    1065935: 4329, 639561: 4330, 426374: 4331, 1262723: 4332, 901945: 4333,
+    541167: 4334, 360778: 4335, 573965: 4336, 344379: 4337, 229586: 4338,
+    245985: 4339, 163990: 4340, 98394: 4341, 4955143: 4342, 3789227: 4343,
+    3206269: 4344, 2040353: 4345, 1457395: 4346, 874437: 4347, 582958: 4348,
+    3390361: 4349, 2868767: 4350, 1825579: 4351, 1303985: 4352, 782391: 4353,
+    521594: 4354, 2193763: 4355, 1396031: 4356, 997165: 4357, 598299: 4358,
+    398866: 4359, 1181257: 4360, 843755: 4361, 506253: 4362, 337502: 4363,
+    536935: 4364, 322161: 4365, 214774: 4366, 230115: 4367, 153410: 4368,
+    92046: 4369, 2221271: 4370, 1879537: 4371, 1196069: 4372, 854335: 4373,
+    512601: 4374, 341734: 4375, 1437293: 4376, 914641: 4377, 653315: 4378,
+    391989: 4379, 261326: 4380, 773927: 4381, 552805: 4382, 331683: 4383,
+    221122: 4384, 351785: 4385, 211071: 4386, 140714: 4387, 150765: 4388,
+    100510: 4389, 60306: 4390, 1285999: 4391, 818363: 4392, 584545: 4393,
+    350727: 4394, 233818: 4395, 692461: 4396, 494615: 4397, 296769: 4398,
+    197846: 4399, 314755: 4400, 188853: 4401, 125902: 4402, 134895: 4403,
+    89930: 4404, 53958: 4405, 529529: 4406, 378235: 4407, 226941: 4408,
+    151294: 4409, 240695: 4410, 144417: 4411, 96278: 4412, 103155: 4413,
+    68770: 4414, 41262: 4415, 203665: 4416, 122199: 4417, 81466: 4418,
+    87285: 4419, 58190: 4420, 34914: 4421, 55545: 4422, 37030: 4423,
+    22218: 4424, 15870: 4425, 16976747: 4426, 15881473: 4427, 12595651: 4428,
+    9309829: 4429, 7119281: 4430, 6024007: 4431, 3833459: 4432, 2738185: 4433,
+    1642911: 4434, 1095274: 4435, 13306099: 4436, 10553113: 4437,
+    7800127: 4438, 5964803: 4439, 5047141: 4440, 3211817: 4441, 2294155: 4442,
+    1376493: 4443, 917662: 4444, 9872267: 4445, 7296893: 4446, 5579977: 4447,
+    4721519: 4448, 3004603: 4449, 2146145: 4450, 1287687: 4451, 858458: 4452,
+    5787191: 4453, 4425499: 4454, 3744653: 4455, 2382961: 4456, 1702115: 4457,
+    1021269: 4458, 680846: 4459, 3271021: 4460, 2767787: 4461, 1761319: 4462,
+    1258085: 4463, 754851: 4464, 503234: 4465, 2116543: 4466, 1346891: 4467,
+    962065: 4468, 577239: 4469, 384826: 4470, 1139677: 4471, 814055: 4472,
+    488433: 4473, 325622: 4474, 518035: 4475, 310821: 4476, 207214: 4477,
+    222015: 4478, 148010: 4479, 88806: 4480, 12007943: 4481, 9523541: 4482,
+    7039139: 4483, 5382871: 4484, 4554737: 4485, 2898469: 4486, 2070335: 4487,
+    1242201: 4488, 828134: 4489, 8909119: 4490, 6585001: 4491, 5035589: 4492,
+    4260883: 4493, 2711471: 4494, 1936765: 4495, 1162059: 4496, 774706: 4497,
+    5222587: 4498, 3993743: 4499, 3379321: 4500, 2150477: 4501, 1536055: 4502,
+    921633: 4503, 614422: 4504, 2951897: 4505, 2497759: 4506, 1589483: 4507,
+    1135345: 4508, 681207: 4509, 454138: 4510, 1910051: 4511, 1215487: 4512,
+    868205: 4513, 520923: 4514, 347282: 4515, 1028489: 4516, 734635: 4517,
+    440781: 4518, 293854: 4519, 467495: 4520, 280497: 4521, 186998: 4522,
+    200355: 4523, 133570: 4524, 80142: 4525, 7464397: 4526, 5517163: 4527,
+    4219007: 4528, 3569929: 4529, 2271773: 4530, 1622695: 4531, 973617: 4532,
+    649078: 4533, 4375681: 4534, 3346109: 4535, 2831323: 4536, 1801751: 4537,
+    1286965: 4538, 772179: 4539, 514786: 4540, 2473211: 4541, 2092717: 4542,
+    1331729: 4543, 951235: 4544, 570741: 4545, 380494: 4546, 1600313: 4547,
+    1018381: 4548, 727415: 4549, 436449: 4550, 290966: 4551, 861707: 4552,
+    615505: 4553, 369303: 4554, 246202: 4555, 391685: 4556, 235011: 4557,
+    156674: 4558, 167865: 4559, 111910: 4560, 67146: 4561, 4093379: 4562,
+    3130231: 4563, 2648657: 4564, 1685509: 4565, 1203935: 4566, 722361: 4567,
+    481574: 4568, 2313649: 4569, 1957703: 4570, 1245811: 4571, 889865: 4572,
+    533919: 4573, 355946: 4574, 1497067: 4575, 952679: 4576, 680485: 4577,
+    408291: 4578, 272194: 4579, 806113: 4580, 575795: 4581, 345477: 4582,
+    230318: 4583, 366415: 4584, 219849: 4585, 146566: 4586, 157035: 4587,
+    104690: 4588, 62814: 4589, 1834963: 4590, 1552661: 4591, 988057: 4592,
+    705755: 4593, 423453: 4594, 282302: 4595, 1187329: 4596, 755573: 4597,
+    539695: 4598, 323817: 4599, 215878: 4600, 639331: 4601, 456665: 4602,
+    273999: 4603, 182666: 4604, 290605: 4605, 174363: 4606, 116242: 4607,
+    124545: 4608, 83030: 4609, 49818: 4610, 877591: 4611, 558467: 4612,
+    398905: 4613, 239343: 4614, 159562: 4615, 472549: 4616, 337535: 4617,
+    202521: 4618, 135014: 4619, 214795: 4620, 128877: 4621, 85918: 4622,
+    92055: 4623, 61370: 4624, 36822: 4625, 361361: 4626, 258115: 4627,
+    154869: 4628, 103246: 4629, 164255: 4630, 98553: 4631, 65702: 4632,
+    70395: 4633, 46930: 4634, 28158: 4635, 138985: 4636, 83391: 4637,
+    55594: 4638, 59565: 4639, 39710: 4640, 23826: 4641, 37905: 4642,
+    25270: 4643, 15162: 4644, 10830: 4645, 13590803: 4646, 12713977: 4647,
+    10083499: 4648, 8329847: 4649, 5699369: 4650, 4822543: 4651, 3068891: 4652,
+    2192065: 4653, 1315239: 4654, 876826: 4655, 10652251: 4656, 8448337: 4657,
+    6979061: 4658, 4775147: 4659, 4040509: 4660, 2571233: 4661, 1836595: 4662,
+    1101957: 4663, 734638: 4664, 7903283: 4665, 6528799: 4666, 4467073: 4667,
+    3779831: 4668, 2405347: 4669, 1718105: 4670, 1030863: 4671, 687242: 4672,
+    5178013: 4673, 3542851: 4674, 2997797: 4675, 1907689: 4676, 1362635: 4677,
+    817581: 4678, 545054: 4679, 2926703: 4680, 2476441: 4681, 1575917: 4682,
+    1125655: 4683, 675393: 4684, 450262: 4685, 1694407: 4686, 1078259: 4687,
+    770185: 4688, 462111: 4689, 308074: 4690, 912373: 4691, 651695: 4692,
+    391017: 4693, 260678: 4694, 414715: 4695, 248829: 4696, 165886: 4697,
+    177735: 4698, 118490: 4699, 71094: 4700, 9613007: 4701, 7624109: 4702,
+    6298177: 4703, 4309279: 4704, 3646313: 4705, 2320381: 4706, 1657415: 4707,
+    994449: 4708, 662966: 4709, 7132231: 4710, 5891843: 4711, 4031261: 4712,
+    3411067: 4713, 2170679: 4714, 1550485: 4715, 930291: 4716, 620194: 4717,
+    4672841: 4718, 3197207: 4719, 2705329: 4720, 1721573: 4721, 1229695: 4722,
+    737817: 4723, 491878: 4724, 2641171: 4725, 2234837: 4726, 1422169: 4727,
+    1015835: 4728, 609501: 4729, 406334: 4730, 1529099: 4731, 973063: 4732,
+    695045: 4733, 417027: 4734, 278018: 4735, 823361: 4736, 588115: 4737,
+    352869: 4738, 235246: 4739, 374255: 4740, 224553: 4741, 149702: 4742,
+    160395: 4743, 106930: 4744, 64158: 4745, 5975653: 4746, 4936409: 4747,
+    3377543: 4748, 2857921: 4749, 1818677: 4750, 1299055: 4751, 779433: 4752,
+    519622: 4753, 3915083: 4754, 2678741: 4755, 2266627: 4756, 1442399: 4757,
+    1030285: 4758, 618171: 4759, 412114: 4760, 2212873: 4761, 1872431: 4762,
+    1191547: 4763, 851105: 4764, 510663: 4765, 340442: 4766, 1281137: 4767,
+    815269: 4768, 582335: 4769, 349401: 4770, 232934: 4771, 689843: 4772,
+    492745: 4773, 295647: 4774, 197098: 4775, 313565: 4776, 188139: 4777,
+    125426: 4778, 134385: 4779, 89590: 4780, 53754: 4781, 3662497: 4782,
+    2505919: 4783, 2120393: 4784, 1349341: 4785, 963815: 4786, 578289: 4787,
+    385526: 4788, 2070107: 4789, 1751629: 4790, 1114673: 4791, 796195: 4792,
+    477717: 4793, 318478: 4794, 1198483: 4795, 762671: 4796, 544765: 4797,
+    326859: 4798, 217906: 4799, 645337: 4800, 460955: 4801, 276573: 4802,
+    184382: 4803, 293335: 4804, 176001: 4805, 117334: 4806, 125715: 4807,
+    83810: 4808, 50286: 4809, 1641809: 4810, 1389223: 4811, 884051: 4812,
+    631465: 4813, 378879: 4814, 252586: 4815, 950521: 4816, 604877: 4817,
+    432055: 4818, 259233: 4819, 172822: 4820, 511819: 4821, 365585: 4822,
+    219351: 4823, 146234: 4824, 232645: 4825, 139587: 4826, 93058: 4827,
+    99705: 4828, 66470: 4829, 39882: 4830, 785213: 4831, 499681: 4832,
+    356915: 4833, 214149: 4834, 142766: 4835, 422807: 4836, 302005: 4837,
+    181203: 4838, 120802: 4839, 192185: 4840, 115311: 4841, 76874: 4842,
+    82365: 4843, 54910: 4844, 32946: 4845, 289289: 4846, 206635: 4847,
+    123981: 4848, 82654: 4849, 131495: 4850, 78897: 4851, 52598: 4852,
+    56355: 4853, 37570: 4854, 22542: 4855, 111265: 4856, 66759: 4857,
+    44506: 4858, 47685: 4859, 31790: 4860, 19074: 4861, 30345: 4862,
+    20230: 4863, 12138: 4864, 8670: 4865, 7947563: 4866, 7434817: 4867,
+    5896579: 4868, 4871087: 4869, 4358341: 4870, 2820103: 4871, 1794611: 4872,
+    1281865: 4873, 769119: 4874, 512746: 4875, 6229171: 4876, 4940377: 4877,
+    4081181: 4878, 3651583: 4879, 2362789: 4880, 1503593: 4881, 1073995: 4882,
+    644397: 4883, 429598: 4884, 4621643: 4885, 3817879: 4886, 3415997: 4887,
+    2210351: 4888, 1406587: 4889, 1004705: 4890, 602823: 4891, 401882: 4892,
+    3027973: 4893, 2709239: 4894, 1753037: 4895, 1115569: 4896, 796835: 4897,
+    478101: 4898, 318734: 4899, 2238067: 4900, 1448161: 4901, 921557: 4902,
+    658255: 4903, 394953: 4904, 263302: 4905, 1295723: 4906, 824551: 4907,
+    588965: 4908, 353379: 4909, 235586: 4910, 533533: 4911, 381095: 4912,
+    228657: 4913, 152438: 4914, 242515: 4915, 145509: 4916, 97006: 4917,
+    103935: 4918, 69290: 4919, 41574: 4920, 5621447: 4921, 4458389: 4922,
+    3683017: 4923, 3295331: 4924, 2132273: 4925, 1356901: 4926, 969215: 4927,
+    581529: 4928, 387686: 4929, 4170751: 4930, 3445403: 4931, 3082729: 4932,
+    1994707: 4933, 1269359: 4934, 906685: 4935, 544011: 4936, 362674: 4937,
+    2732561: 4938, 2444923: 4939, 1582009: 4940, 1006733: 4941, 719095: 4942,
+    431457: 4943, 287638: 4944, 2019719: 4945, 1306877: 4946, 831649: 4947,
+    594035: 4948, 356421: 4949, 237614: 4950, 1169311: 4951, 744107: 4952,
+    531505: 4953, 318903: 4954, 212602: 4955, 481481: 4956, 343915: 4957,
+    206349: 4958, 137566: 4959, 218855: 4960, 131313: 4961, 87542: 4962,
+    93795: 4963, 62530: 4964, 37518: 4965, 3494413: 4966, 2886689: 4967,
+    2582827: 4968, 1671241: 4969, 1063517: 4970, 759655: 4971, 455793: 4972,
+    303862: 4973, 2289443: 4974, 2048449: 4975, 1325467: 4976, 843479: 4977,
+    602485: 4978, 361491: 4979, 240994: 4980, 1692197: 4981, 1094951: 4982,
+    696787: 4983, 497705: 4984, 298623: 4985, 199082: 4986, 979693: 4987,
+    623441: 4988, 445315: 4989, 267189: 4990, 178126: 4991, 403403: 4992,
+    288145: 4993, 172887: 4994, 115258: 4995, 183365: 4996, 110019: 4997,
+    73346: 4998, 78585: 4999, 52390: 5000, 31434: 5001, 2141737: 5002,
+    1916291: 5003, 1239953: 5004, 789061: 5005, 563615: 5006, 338169: 5007,
+    225446: 5008, 1583023: 5009, 1024309: 5010, 651833: 5011, 465595: 5012,
+    279357: 5013, 186238: 5014, 916487: 5015, 583219: 5016, 416585: 5017,
+    249951: 5018, 166634: 5019, 377377: 5020, 269555: 5021, 161733: 5022,
+    107822: 5023, 171535: 5024, 102921: 5025, 68614: 5026, 73515: 5027,
+    49010: 5028, 29406: 5029, 1255501: 5030, 812383: 5031, 516971: 5032,
+    369265: 5033, 221559: 5034, 147706: 5035, 726869: 5036, 462553: 5037,
+    330395: 5038, 198237: 5039, 132158: 5040, 299299: 5041, 213785: 5042,
+    128271: 5043, 85514: 5044, 136045: 5045, 81627: 5046, 54418: 5047,
+    58305: 5048, 38870: 5049, 23322: 5050, 600457: 5051, 382109: 5052,
+    272935: 5053, 163761: 5054, 109174: 5055, 247247: 5056, 176605: 5057,
+    105963: 5058, 70642: 5059, 112385: 5060, 67431: 5061, 44954: 5062,
+    48165: 5063, 32110: 5064, 19266: 5065, 221221: 5066, 158015: 5067,
+    94809: 5068, 63206: 5069, 100555: 5070, 60333: 5071, 40222: 5072,
+    43095: 5073, 28730: 5074, 17238: 5075, 65065: 5076, 39039: 5077,
+    26026: 5078, 27885: 5079, 18590: 5080, 11154: 5081, 17745: 5082,
+    11830: 5083, 7098: 5084, 5070: 5085, 5690267: 5086, 5323153: 5087,
+    4221811: 5088, 3487583: 5089, 3120469: 5090, 2386241: 5091, 1284899: 5092,
+    917785: 5093, 550671: 5094, 367114: 5095, 4459939: 5096, 3537193: 5097,
+    2922029: 5098, 2614447: 5099, 1999283: 5100, 1076537: 5101, 768955: 5102,
+    461373: 5103, 307582: 5104, 3308987: 5105, 2733511: 5106, 2445773: 5107,
+    1870297: 5108, 1007083: 5109, 719345: 5110, 431607: 5111, 287738: 5112,
+    2167957: 5113, 1939751: 5114, 1483339: 5115, 798721: 5116, 570515: 5117,
+    342309: 5118, 228206: 5119, 1602403: 5120, 1225367: 5121, 659813: 5122,
+    471295: 5123, 282777: 5124, 188518: 5125, 1096381: 5126, 590359: 5127,
+    421685: 5128, 253011: 5129, 168674: 5130, 451451: 5131, 322465: 5132,
+    193479: 5133, 128986: 5134, 173635: 5135, 104181: 5136, 69454: 5137,
+    74415: 5138, 49610: 5139, 29766: 5140, 4024823: 5141, 3192101: 5142,
+    2636953: 5143, 2359379: 5144, 1804231: 5145, 971509: 5146, 693935: 5147,
+    416361: 5148, 277574: 5149, 2986159: 5150, 2466827: 5151, 2207161: 5152,
+    1687829: 5153, 908831: 5154, 649165: 5155, 389499: 5156, 259666: 5157,
+    1956449: 5158, 1750507: 5159, 1338623: 5160, 720797: 5161, 514855: 5162,
+    308913: 5163, 205942: 5164, 1446071: 5165, 1105819: 5166, 595441: 5167,
+    425315: 5168, 255189: 5169, 170126: 5170, 989417: 5171, 532763: 5172,
+    380545: 5173, 228327: 5174, 152218: 5175, 407407: 5176, 291005: 5177,
+    174603: 5178, 116402: 5179, 156695: 5180, 94017: 5181, 62678: 5182,
+    67155: 5183, 44770: 5184, 26862: 5185, 2501917: 5186, 2066801: 5187,
+    1849243: 5188, 1414127: 5189, 761453: 5190, 543895: 5191, 326337: 5192,
+    217558: 5193, 1639187: 5194, 1466641: 5195, 1121549: 5196, 603911: 5197,
+    431365: 5198, 258819: 5199, 172546: 5200, 1211573: 5201, 926497: 5202,
+    498883: 5203, 356345: 5204, 213807: 5205, 142538: 5206, 828971: 5207,
+    446369: 5208, 318835: 5209, 191301: 5210, 127534: 5211, 341341: 5212,
+    243815: 5213, 146289: 5214, 97526: 5215, 131285: 5216, 78771: 5217,
+    52514: 5218, 56265: 5219, 37510: 5220, 22506: 5221, 1533433: 5222,
+    1372019: 5223, 1049191: 5224, 564949: 5225, 403535: 5226, 242121: 5227,
+    161414: 5228, 1133407: 5229, 866723: 5230, 466697: 5231, 333355: 5232,
+    200013: 5233, 133342: 5234, 775489: 5235, 417571: 5236, 298265: 5237,
+    178959: 5238, 119306: 5239, 319319: 5240, 228085: 5241, 136851: 5242,
+    91234: 5243, 122815: 5244, 73689: 5245, 49126: 5246, 52635: 5247,
+    35090: 5248, 21054: 5249, 898909: 5250, 687401: 5251, 370139: 5252,
+    264385: 5253, 158631: 5254, 105754: 5255, 615043: 5256, 331177: 5257,
+    236555: 5258, 141933: 5259, 94622: 5260, 253253: 5261, 180895: 5262,
+    108537: 5263, 72358: 5264, 97405: 5265, 58443: 5266, 38962: 5267,
+    41745: 5268, 27830: 5269, 16698: 5270, 508079: 5271, 273581: 5272,
+    195415: 5273, 117249: 5274, 78166: 5275, 209209: 5276, 149435: 5277,
+    89661: 5278, 59774: 5279, 80465: 5280, 48279: 5281, 32186: 5282,
+    34485: 5283, 22990: 5284, 13794: 5285, 187187: 5286, 133705: 5287,
+    80223: 5288, 53482: 5289, 71995: 5290, 43197: 5291, 28798: 5292,
+    30855: 5293, 20570: 5294, 12342: 5295, 55055: 5296, 33033: 5297,
+    22022: 5298, 23595: 5299, 15730: 5300, 9438: 5301, 12705: 5302, 8470: 5303,
+    5082: 5304, 3630: 5305, 2304323: 5306, 2155657: 5307, 1709659: 5308,
+    1412327: 5309, 1263661: 5310, 966329: 5311, 817663: 5312, 371665: 5313,
+    222999: 5314, 148666: 5315, 1806091: 5316, 1432417: 5317, 1183301: 5318,
+    1058743: 5319, 809627: 5320, 685069: 5321, 311395: 5322, 186837: 5323,
+    124558: 5324, 1340003: 5325, 1106959: 5326, 990437: 5327, 757393: 5328,
+    640871: 5329, 291305: 5330, 174783: 5331, 116522: 5332, 877933: 5333,
+    785519: 5334, 600691: 5335, 508277: 5336, 231035: 5337, 138621: 5338,
+    92414: 5339, 648907: 5340, 496223: 5341, 419881: 5342, 190855: 5343,
+    114513: 5344, 76342: 5345, 443989: 5346, 375683: 5347, 170765: 5348,
+    102459: 5349, 68306: 5350, 287287: 5351, 130585: 5352, 78351: 5353,
+    52234: 5354, 110495: 5355, 66297: 5356, 44198: 5357, 30135: 5358,
+    20090: 5359, 12054: 5360, 1629887: 5361, 1292669: 5362, 1067857: 5363,
+    955451: 5364, 730639: 5365, 618233: 5366, 281015: 5367, 168609: 5368,
+    112406: 5369, 1209271: 5370, 998963: 5371, 893809: 5372, 683501: 5373,
+    578347: 5374, 262885: 5375, 157731: 5376, 105154: 5377, 792281: 5378,
+    708883: 5379, 542087: 5380, 458689: 5381, 208495: 5382, 125097: 5383,
+    83398: 5384, 585599: 5385, 447811: 5386, 378917: 5387, 172235: 5388,
+    103341: 5389, 68894: 5390, 400673: 5391, 339031: 5392, 154105: 5393,
+    92463: 5394, 61642: 5395, 259259: 5396, 117845: 5397, 70707: 5398,
+    47138: 5399, 99715: 5400, 59829: 5401, 39886: 5402, 27195: 5403,
+    18130: 5404, 10878: 5405, 1013173: 5406, 836969: 5407, 748867: 5408,
+    572663: 5409, 484561: 5410, 220255: 5411, 132153: 5412, 88102: 5413,
+    663803: 5414, 593929: 5415, 454181: 5416, 384307: 5417, 174685: 5418,
+    104811: 5419, 69874: 5420, 490637: 5421, 375193: 5422, 317471: 5423,
+    144305: 5424, 86583: 5425, 57722: 5426, 335699: 5427, 284053: 5428,
+    129115: 5429, 77469: 5430, 51646: 5431, 217217: 5432, 98735: 5433,
+    59241: 5434, 39494: 5435, 83545: 5436, 50127: 5437, 33418: 5438,
+    22785: 5439, 15190: 5440, 9114: 5441, 620977: 5442, 555611: 5443,
+    424879: 5444, 359513: 5445, 163415: 5446, 98049: 5447, 65366: 5448,
+    458983: 5449, 350987: 5450, 296989: 5451, 134995: 5452, 80997: 5453,
+    53998: 5454, 314041: 5455, 265727: 5456, 120785: 5457, 72471: 5458,
+    48314: 5459, 203203: 5460, 92365: 5461, 55419: 5462, 36946: 5463,
+    78155: 5464, 46893: 5465, 31262: 5466, 21315: 5467, 14210: 5468,
+    8526: 5469, 364021: 5470, 278369: 5471, 235543: 5472, 107065: 5473,
+    64239: 5474, 42826: 5475, 249067: 5476, 210749: 5477, 95795: 5478,
+    57477: 5479, 38318: 5480, 161161: 5481, 73255: 5482, 43953: 5483,
+    29302: 5484, 61985: 5485, 37191: 5486, 24794: 5487, 16905: 5488,
+    11270: 5489, 6762: 5490, 205751: 5491, 174097: 5492, 79135: 5493,
+    47481: 5494, 31654: 5495, 133133: 5496, 60515: 5497, 36309: 5498,
+    24206: 5499, 51205: 5500, 30723: 5501, 20482: 5502, 13965: 5503,
+    9310: 5504, 5586: 5505, 119119: 5506, 54145: 5507, 32487: 5508,
+    21658: 5509, 45815: 5510, 27489: 5511, 18326: 5512, 12495: 5513,
+    8330: 5514, 4998: 5515, 35035: 5516, 21021: 5517, 14014: 5518, 9555: 5519,
+    6370: 5520, 3822: 5521, 8085: 5522, 5390: 5523, 3234: 5524, 1470: 5525,
+    1175675: 5526, 1099825: 5527, 872275: 5528, 720575: 5529, 644725: 5530,
+    493025: 5531, 417175: 5532, 265475: 5533, 113775: 5534, 75850: 5535,
+    921475: 5536, 730825: 5537, 603725: 5538, 540175: 5539, 413075: 5540,
+    349525: 5541, 222425: 5542, 95325: 5543, 63550: 5544, 683675: 5545,
+    564775: 5546, 505325: 5547, 386425: 5548, 326975: 5549, 208075: 5550,
+    89175: 5551, 59450: 5552, 447925: 5553, 400775: 5554, 306475: 5555,
+    259325: 5556, 165025: 5557, 70725: 5558, 47150: 5559, 331075: 5560,
+    253175: 5561, 214225: 5562, 136325: 5563, 58425: 5564, 38950: 5565,
+    226525: 5566, 191675: 5567, 121975: 5568, 52275: 5569, 34850: 5570,
+    146575: 5571, 93275: 5572, 39975: 5573, 26650: 5574, 78925: 5575,
+    33825: 5576, 22550: 5577, 21525: 5578, 14350: 5579, 6150: 5580,
+    831575: 5581, 659525: 5582, 544825: 5583, 487475: 5584, 372775: 5585,
+    315425: 5586, 200725: 5587, 86025: 5588, 57350: 5589, 616975: 5590,
+    509675: 5591, 456025: 5592, 348725: 5593, 295075: 5594, 187775: 5595,
+    80475: 5596, 53650: 5597, 404225: 5598, 361675: 5599, 276575: 5600,
+    234025: 5601, 148925: 5602, 63825: 5603, 42550: 5604, 298775: 5605,
+    228475: 5606, 193325: 5607, 123025: 5608, 52725: 5609, 35150: 5610,
+    204425: 5611, 172975: 5612, 110075: 5613, 47175: 5614, 31450: 5615,
+    132275: 5616, 84175: 5617, 36075: 5618, 24050: 5619, 71225: 5620,
+    30525: 5621, 20350: 5622, 19425: 5623, 12950: 5624, 5550: 5625,
+    516925: 5626, 427025: 5627, 382075: 5628, 292175: 5629, 247225: 5630,
+    157325: 5631, 67425: 5632, 44950: 5633, 338675: 5634, 303025: 5635,
+    231725: 5636, 196075: 5637, 124775: 5638, 53475: 5639, 35650: 5640,
+    250325: 5641, 191425: 5642, 161975: 5643, 103075: 5644, 44175: 5645,
+    29450: 5646, 171275: 5647, 144925: 5648, 92225: 5649, 39525: 5650,
+    26350: 5651, 110825: 5652, 70525: 5653, 30225: 5654, 20150: 5655,
+    59675: 5656, 25575: 5657, 17050: 5658, 16275: 5659, 10850: 5660,
+    4650: 5661, 316825: 5662, 283475: 5663, 216775: 5664, 183425: 5665,
+    116725: 5666, 50025: 5667, 33350: 5668, 234175: 5669, 179075: 5670,
+    151525: 5671, 96425: 5672, 41325: 5673, 27550: 5674, 160225: 5675,
+    135575: 5676, 86275: 5677, 36975: 5678, 24650: 5679, 103675: 5680,
+    65975: 5681, 28275: 5682, 18850: 5683, 55825: 5684, 23925: 5685,
+    15950: 5686, 15225: 5687, 10150: 5688, 4350: 5689, 185725: 5690,
+    142025: 5691, 120175: 5692, 76475: 5693, 32775: 5694, 21850: 5695,
+    127075: 5696, 107525: 5697, 68425: 5698, 29325: 5699, 19550: 5700,
+    82225: 5701, 52325: 5702, 22425: 5703, 14950: 5704, 44275: 5705,
+    18975: 5706, 12650: 5707, 12075: 5708, 8050: 5709, 3450: 5710,
+    104975: 5711, 88825: 5712, 56525: 5713, 24225: 5714, 16150: 5715,
+    67925: 5716, 43225: 5717, 18525: 5718, 12350: 5719, 36575: 5720,
+    15675: 5721, 10450: 5722, 9975: 5723, 6650: 5724, 2850: 5725, 60775: 5726,
+    38675: 5727, 16575: 5728, 11050: 5729, 32725: 5730, 14025: 5731,
+    9350: 5732, 8925: 5733, 5950: 5734, 2550: 5735, 25025: 5736, 10725: 5737,
+    7150: 5738, 6825: 5739, 4550: 5740, 1950: 5741, 5775: 5742, 3850: 5743,
+    1650: 5744, 1050: 5745, 423243: 5746, 395937: 5747, 314019: 5748,
+    259407: 5749, 232101: 5750, 177489: 5751, 150183: 5752, 95571: 5753,
+    68265: 5754, 27306: 5755, 331731: 5756, 263097: 5757, 217341: 5758,
+    194463: 5759, 148707: 5760, 125829: 5761, 80073: 5762, 57195: 5763,
+    22878: 5764, 246123: 5765, 203319: 5766, 181917: 5767, 139113: 5768,
+    117711: 5769, 74907: 5770, 53505: 5771, 21402: 5772, 161253: 5773,
+    144279: 5774, 110331: 5775, 93357: 5776, 59409: 5777, 42435: 5778,
+    16974: 5779, 119187: 5780, 91143: 5781, 77121: 5782, 49077: 5783,
+    35055: 5784, 14022: 5785, 81549: 5786, 69003: 5787, 43911: 5788,
+    31365: 5789, 12546: 5790, 52767: 5791, 33579: 5792, 23985: 5793,
+    9594: 5794, 28413: 5795, 20295: 5796, 8118: 5797, 12915: 5798, 5166: 5799,
+    3690: 5800, 299367: 5801, 237429: 5802, 196137: 5803, 175491: 5804,
+    134199: 5805, 113553: 5806, 72261: 5807, 51615: 5808, 20646: 5809,
+    222111: 5810, 183483: 5811, 164169: 5812, 125541: 5813, 106227: 5814,
+    67599: 5815, 48285: 5816, 19314: 5817, 145521: 5818, 130203: 5819,
+    99567: 5820, 84249: 5821, 53613: 5822, 38295: 5823, 15318: 5824,
+    107559: 5825, 82251: 5826, 69597: 5827, 44289: 5828, 31635: 5829,
+    12654: 5830, 73593: 5831, 62271: 5832, 39627: 5833, 28305: 5834,
+    11322: 5835, 47619: 5836, 30303: 5837, 21645: 5838, 8658: 5839,
+    25641: 5840, 18315: 5841, 7326: 5842, 11655: 5843, 4662: 5844, 3330: 5845,
+    186093: 5846, 153729: 5847, 137547: 5848, 105183: 5849, 89001: 5850,
+    56637: 5851, 40455: 5852, 16182: 5853, 121923: 5854, 109089: 5855,
+    83421: 5856, 70587: 5857, 44919: 5858, 32085: 5859, 12834: 5860,
+    90117: 5861, 68913: 5862, 58311: 5863, 37107: 5864, 26505: 5865,
+    10602: 5866, 61659: 5867, 52173: 5868, 33201: 5869, 23715: 5870,
+    9486: 5871, 39897: 5872, 25389: 5873, 18135: 5874, 7254: 5875, 21483: 5876,
+    15345: 5877, 6138: 5878, 9765: 5879, 3906: 5880, 2790: 5881, 114057: 5882,
+    102051: 5883, 78039: 5884, 66033: 5885, 42021: 5886, 30015: 5887,
+    12006: 5888, 84303: 5889, 64467: 5890, 54549: 5891, 34713: 5892,
+    24795: 5893, 9918: 5894, 57681: 5895, 48807: 5896, 31059: 5897,
+    22185: 5898, 8874: 5899, 37323: 5900, 23751: 5901, 16965: 5902, 6786: 5903,
+    20097: 5904, 14355: 5905, 5742: 5906, 9135: 5907, 3654: 5908, 2610: 5909,
+    66861: 5910, 51129: 5911, 43263: 5912, 27531: 5913, 19665: 5914,
+    7866: 5915, 45747: 5916, 38709: 5917, 24633: 5918, 17595: 5919, 7038: 5920,
+    29601: 5921, 18837: 5922, 13455: 5923, 5382: 5924, 15939: 5925,
+    11385: 5926, 4554: 5927, 7245: 5928, 2898: 5929, 2070: 5930, 37791: 5931,
+    31977: 5932, 20349: 5933, 14535: 5934, 5814: 5935, 24453: 5936,
+    15561: 5937, 11115: 5938, 4446: 5939, 13167: 5940, 9405: 5941, 3762: 5942,
+    5985: 5943, 2394: 5944, 1710: 5945, 21879: 5946, 13923: 5947, 9945: 5948,
+    3978: 5949, 11781: 5950, 8415: 5951, 3366: 5952, 5355: 5953, 2142: 5954,
+    1530: 5955, 9009: 5956, 6435: 5957, 2574: 5958, 4095: 5959, 1638: 5960,
+    1170: 5961, 3465: 5962, 1386: 5963, 990: 5964, 630: 5965, 188108: 5966,
+    175972: 5967, 139564: 5968, 115292: 5969, 103156: 5970, 78884: 5971,
+    66748: 5972, 42476: 5973, 30340: 5974, 18204: 5975, 147436: 5976,
+    116932: 5977, 96596: 5978, 86428: 5979, 66092: 5980, 55924: 5981,
+    35588: 5982, 25420: 5983, 15252: 5984, 109388: 5985, 90364: 5986,
+    80852: 5987, 61828: 5988, 52316: 5989, 33292: 5990, 23780: 5991,
+    14268: 5992, 71668: 5993, 64124: 5994, 49036: 5995, 41492: 5996,
+    26404: 5997, 18860: 5998, 11316: 5999, 52972: 6000, 40508: 6001,
+    34276: 6002, 21812: 6003, 15580: 6004, 9348: 6005, 36244: 6006,
+    30668: 6007, 19516: 6008, 13940: 6009, 8364: 6010, 23452: 6011,
+    14924: 6012, 10660: 6013, 6396: 6014, 12628: 6015, 9020: 6016, 5412: 6017,
+    5740: 6018, 3444: 6019, 2460: 6020, 133052: 6021, 105524: 6022,
+    87172: 6023, 77996: 6024, 59644: 6025, 50468: 6026, 32116: 6027,
+    22940: 6028, 13764: 6029, 98716: 6030, 81548: 6031, 72964: 6032,
+    55796: 6033, 47212: 6034, 30044: 6035, 21460: 6036, 12876: 6037,
+    64676: 6038, 57868: 6039, 44252: 6040, 37444: 6041, 23828: 6042,
+    17020: 6043, 10212: 6044, 47804: 6045, 36556: 6046, 30932: 6047,
+    19684: 6048, 14060: 6049, 8436: 6050, 32708: 6051, 27676: 6052,
+    17612: 6053, 12580: 6054, 7548: 6055, 21164: 6056, 13468: 6057, 9620: 6058,
+    5772: 6059, 11396: 6060, 8140: 6061, 4884: 6062, 5180: 6063, 3108: 6064,
+    2220: 6065, 82708: 6066, 68324: 6067, 61132: 6068, 46748: 6069,
+    39556: 6070, 25172: 6071, 17980: 6072, 10788: 6073, 54188: 6074,
+    48484: 6075, 37076: 6076, 31372: 6077, 19964: 6078, 14260: 6079,
+    8556: 6080, 40052: 6081, 30628: 6082, 25916: 6083, 16492: 6084,
+    11780: 6085, 7068: 6086, 27404: 6087, 23188: 6088, 14756: 6089,
+    10540: 6090, 6324: 6091, 17732: 6092, 11284: 6093, 8060: 6094, 4836: 6095,
+    9548: 6096, 6820: 6097, 4092: 6098, 4340: 6099, 2604: 6100, 1860: 6101,
+    50692: 6102, 45356: 6103, 34684: 6104, 29348: 6105, 18676: 6106,
+    13340: 6107, 8004: 6108, 37468: 6109, 28652: 6110, 24244: 6111,
+    15428: 6112, 11020: 6113, 6612: 6114, 25636: 6115, 21692: 6116,
+    13804: 6117, 9860: 6118, 5916: 6119, 16588: 6120, 10556: 6121, 7540: 6122,
+    4524: 6123, 8932: 6124, 6380: 6125, 3828: 6126, 4060: 6127, 2436: 6128,
+    1740: 6129, 29716: 6130, 22724: 6131, 19228: 6132, 12236: 6133, 8740: 6134,
+    5244: 6135, 20332: 6136, 17204: 6137, 10948: 6138, 7820: 6139, 4692: 6140,
+    13156: 6141, 8372: 6142, 5980: 6143, 3588: 6144, 7084: 6145, 5060: 6146,
+    3036: 6147, 3220: 6148, 1932: 6149, 1380: 6150, 16796: 6151, 14212: 6152,
+    9044: 6153, 6460: 6154, 3876: 6155, 10868: 6156, 6916: 6157, 4940: 6158,
+    2964: 6159, 5852: 6160, 4180: 6161, 2508: 6162, 2660: 6163, 1596: 6164,
+    1140: 6165, 9724: 6166, 6188: 6167, 4420: 6168, 2652: 6169, 5236: 6170,
+    3740: 6171, 2244: 6172, 2380: 6173, 1428: 6174, 1020: 6175, 4004: 6176,
+    2860: 6177, 1716: 6178, 1820: 6179, 1092: 6180, 780: 6181, 1540: 6182,
+    924: 6183, 660: 6184, 420: 6185, 115856201: 0, 69343957: 0, 28629151: 0,
+    20511149: 0, 6436343: 0, 2476099: 0, 1419857: 0, 371293: 0, 161051: 0,
+    16807: 0, 3125: 0, 243: 0, 32: 0,
+}
+
+
+FIVE_HISTOGRAM_TABLE: array = array('H', [
+    166, 322, 310, 154, 165, 2467, 3325, 2401, 153, 321, 3314, 3303, 309, 298,
+    2335, 297, 142, 141, 164, 2466, 3324, 2400, 152, 2465, 6185, 5965, 2399,
+    3313, 5745, 3302, 2334, 2333, 140, 320, 3292, 3281, 308, 3291, 5525, 3280,
+    3270, 3269, 296, 286, 2269, 285, 2268, 2267, 284, 130, 129, 128, 163, 2464,
+    3323, 2398, 151, 2463, 6184, 5964, 2397, 3312, 5744, 3301, 2332, 2331, 139,
+    2462, 6183, 5963, 2396, 6182, 1608, 5962, 5743, 5742, 2330, 3290, 5524,
+    3279, 5523, 5522, 3268, 2266, 2265, 2264, 127, 319, 3259, 3248, 307, 3258,
+    5305, 3247, 3237, 3236, 295, 3257, 5304, 3246, 5303, 5302, 3235, 3226,
+    3225, 3224, 283, 274, 2203, 273, 2202, 2201, 272, 2200, 2199, 2198, 271,
+    118, 117, 116, 115, 162, 2461, 3322, 2395, 150, 2460, 6181, 5961, 2394,
+    3311, 5741, 3300, 2329, 2328, 138, 2459, 6180, 5960, 2393, 6179, 7462,
+    5959, 5740, 5739, 2327, 3289, 5521, 3278, 5520, 5519, 3267, 2263, 2262,
+    2261, 126, 2458, 6178, 5958, 2392, 6177, 7461, 5957, 5738, 5737, 2326,
+    6176, 7460, 5956, 7459, 1607, 5736, 5518, 5517, 5516, 2260, 3256, 5301,
+    3245, 5300, 5299, 3234, 5298, 5297, 5296, 3223, 2197, 2196, 2195, 2194,
+    114, 318, 3215, 3204, 306, 3214, 5085, 3203, 3193, 3192, 294, 3213, 5084,
+    3202, 5083, 5082, 3191, 3182, 3181, 3180, 282, 3212, 5081, 3201, 5080,
+    5079, 3190, 5078, 5077, 5076, 3179, 3171, 3170, 3169, 3168, 270, 262, 2137,
+    261, 2136, 2135, 260, 2134, 2133, 2132, 259, 2131, 2130, 2129, 2128, 258,
+    106, 105, 104, 103, 102, 161, 2457, 3321, 2391, 149, 2456, 6175, 5955,
+    2390, 3310, 5735, 3299, 2325, 2324, 137, 2455, 6174, 5954, 2389, 6173,
+    7458, 5953, 5734, 5733, 2323, 3288, 5515, 3277, 5514, 5513, 3266, 2259,
+    2258, 2257, 125, 2454, 6172, 5952, 2388, 6171, 7457, 5951, 5732, 5731,
+    2322, 6170, 7456, 5950, 7455, 7454, 5730, 5512, 5511, 5510, 2256, 3255,
+    5295, 3244, 5294, 5293, 3233, 5292, 5291, 5290, 3222, 2193, 2192, 2191,
+    2190, 113, 2453, 6169, 5949, 2387, 6168, 7453, 5948, 5729, 5728, 2321,
+    6167, 7452, 5947, 7451, 7450, 5727, 5509, 5508, 5507, 2255, 6166, 7449,
+    5946, 7448, 7447, 5726, 7446, 7445, 1606, 5506, 5289, 5288, 5287, 5286,
+    2189, 3211, 5075, 3200, 5074, 5073, 3189, 5072, 5071, 5070, 3178, 5069,
+    5068, 5067, 5066, 3167, 2127, 2126, 2125, 2124, 2123, 101, 317, 3160, 3149,
+    305, 3159, 4865, 3148, 3138, 3137, 293, 3158, 4864, 3147, 4863, 4862, 3136,
+    3127, 3126, 3125, 281, 3157, 4861, 3146, 4860, 4859, 3135, 4858, 4857,
+    4856, 3124, 3116, 3115, 3114, 3113, 269, 3156, 4855, 3145, 4854, 4853,
+    3134, 4852, 4851, 4850, 3123, 4849, 4848, 4847, 4846, 3112, 3105, 3104,
+    3103, 3102, 3101, 257, 250, 2071, 249, 2070, 2069, 248, 2068, 2067, 2066,
+    247, 2065, 2064, 2063, 2062, 246, 2061, 2060, 2059, 2058, 2057, 245, 94,
+    93, 92, 91, 90, 89, 160, 2452, 3320, 2386, 148, 2451, 6165, 5945, 2385,
+    3309, 5725, 3298, 2320, 2319, 136, 2450, 6164, 5944, 2384, 6163, 7444,
+    5943, 5724, 5723, 2318, 3287, 5505, 3276, 5504, 5503, 3265, 2254, 2253,
+    2252, 124, 2449, 6162, 5942, 2383, 6161, 7443, 5941, 5722, 5721, 2317,
+    6160, 7442, 5940, 7441, 7440, 5720, 5502, 5501, 5500, 2251, 3254, 5285,
+    3243, 5284, 5283, 3232, 5282, 5281, 5280, 3221, 2188, 2187, 2186, 2185,
+    112, 2448, 6159, 5939, 2382, 6158, 7439, 5938, 5719, 5718, 2316, 6157,
+    7438, 5937, 7437, 7436, 5717, 5499, 5498, 5497, 2250, 6156, 7435, 5936,
+    7434, 7433, 5716, 7432, 7431, 7430, 5496, 5279, 5278, 5277, 5276, 2184,
+    3210, 5065, 3199, 5064, 5063, 3188, 5062, 5061, 5060, 3177, 5059, 5058,
+    5057, 5056, 3166, 2122, 2121, 2120, 2119, 2118, 100, 2447, 6155, 5935,
+    2381, 6154, 7429, 5934, 5715, 5714, 2315, 6153, 7428, 5933, 7427, 7426,
+    5713, 5495, 5494, 5493, 2249, 6152, 7425, 5932, 7424, 7423, 5712, 7422,
+    7421, 7420, 5492, 5275, 5274, 5273, 5272, 2183, 6151, 7419, 5931, 7418,
+    7417, 5711, 7416, 7415, 7414, 5491, 7413, 7412, 7411, 1605, 5271, 5055,
+    5054, 5053, 5052, 5051, 2117, 3155, 4845, 3144, 4844, 4843, 3133, 4842,
+    4841, 4840, 3122, 4839, 4838, 4837, 4836, 3111, 4835, 4834, 4833, 4832,
+    4831, 3100, 2056, 2055, 2054, 2053, 2052, 2051, 88, 316, 3094, 3083, 304,
+    3093, 4645, 3082, 3072, 3071, 292, 3092, 4644, 3081, 4643, 4642, 3070,
+    3061, 3060, 3059, 280, 3091, 4641, 3080, 4640, 4639, 3069, 4638, 4637,
+    4636, 3058, 3050, 3049, 3048, 3047, 268, 3090, 4635, 3079, 4634, 4633,
+    3068, 4632, 4631, 4630, 3057, 4629, 4628, 4627, 4626, 3046, 3039, 3038,
+    3037, 3036, 3035, 256, 3089, 4625, 3078, 4624, 4623, 3067, 4622, 4621,
+    4620, 3056, 4619, 4618, 4617, 4616, 3045, 4615, 4614, 4613, 4612, 4611,
+    3034, 3028, 3027, 3026, 3025, 3024, 3023, 244, 238, 2005, 237, 2004, 2003,
+    236, 2002, 2001, 2000, 235, 1999, 1998, 1997, 1996, 234, 1995, 1994, 1993,
+    1992, 1991, 233, 1990, 1989, 1988, 1987, 1986, 1985, 232, 82, 81, 80, 79,
+    78, 77, 76, 159, 2446, 3319, 2380, 147, 2445, 6150, 5930, 2379, 3308, 5710,
+    3297, 2314, 2313, 135, 2444, 6149, 5929, 2378, 6148, 7410, 5928, 5709,
+    5708, 2312, 3286, 5490, 3275, 5489, 5488, 3264, 2248, 2247, 2246, 123,
+    2443, 6147, 5927, 2377, 6146, 7409, 5926, 5707, 5706, 2311, 6145, 7408,
+    5925, 7407, 7406, 5705, 5487, 5486, 5485, 2245, 3253, 5270, 3242, 5269,
+    5268, 3231, 5267, 5266, 5265, 3220, 2182, 2181, 2180, 2179, 111, 2442,
+    6144, 5924, 2376, 6143, 7405, 5923, 5704, 5703, 2310, 6142, 7404, 5922,
+    7403, 7402, 5702, 5484, 5483, 5482, 2244, 6141, 7401, 5921, 7400, 7399,
+    5701, 7398, 7397, 7396, 5481, 5264, 5263, 5262, 5261, 2178, 3209, 5050,
+    3198, 5049, 5048, 3187, 5047, 5046, 5045, 3176, 5044, 5043, 5042, 5041,
+    3165, 2116, 2115, 2114, 2113, 2112, 99, 2441, 6140, 5920, 2375, 6139, 7395,
+    5919, 5700, 5699, 2309, 6138, 7394, 5918, 7393, 7392, 5698, 5480, 5479,
+    5478, 2243, 6137, 7391, 5917, 7390, 7389, 5697, 7388, 7387, 7386, 5477,
+    5260, 5259, 5258, 5257, 2177, 6136, 7385, 5916, 7384, 7383, 5696, 7382,
+    7381, 7380, 5476, 7379, 7378, 7377, 7376, 5256, 5040, 5039, 5038, 5037,
+    5036, 2111, 3154, 4830, 3143, 4829, 4828, 3132, 4827, 4826, 4825, 3121,
+    4824, 4823, 4822, 4821, 3110, 4820, 4819, 4818, 4817, 4816, 3099, 2050,
+    2049, 2048, 2047, 2046, 2045, 87, 2440, 6135, 5915, 2374, 6134, 7375, 5914,
+    5695, 5694, 2308, 6133, 7374, 5913, 7373, 7372, 5693, 5475, 5474, 5473,
+    2242, 6132, 7371, 5912, 7370, 7369, 5692, 7368, 7367, 7366, 5472, 5255,
+    5254, 5253, 5252, 2176, 6131, 7365, 5911, 7364, 7363, 5691, 7362, 7361,
+    7360, 5471, 7359, 7358, 7357, 7356, 5251, 5035, 5034, 5033, 5032, 5031,
+    2110, 6130, 7355, 5910, 7354, 7353, 5690, 7352, 7351, 7350, 5470, 7349,
+    7348, 7347, 7346, 5250, 7345, 7344, 7343, 7342, 1604, 5030, 4815, 4814,
+    4813, 4812, 4811, 4810, 2044, 3088, 4610, 3077, 4609, 4608, 3066, 4607,
+    4606, 4605, 3055, 4604, 4603, 4602, 4601, 3044, 4600, 4599, 4598, 4597,
+    4596, 3033, 4595, 4594, 4593, 4592, 4591, 4590, 3022, 1984, 1983, 1982,
+    1981, 1980, 1979, 1978, 75, 315, 3017, 3006, 303, 3016, 4425, 3005, 2995,
+    2994, 291, 3015, 4424, 3004, 4423, 4422, 2993, 2984, 2983, 2982, 279, 3014,
+    4421, 3003, 4420, 4419, 2992, 4418, 4417, 4416, 2981, 2973, 2972, 2971,
+    2970, 267, 3013, 4415, 3002, 4414, 4413, 2991, 4412, 4411, 4410, 2980,
+    4409, 4408, 4407, 4406, 2969, 2962, 2961, 2960, 2959, 2958, 255, 3012,
+    4405, 3001, 4404, 4403, 2990, 4402, 4401, 4400, 2979, 4399, 4398, 4397,
+    4396, 2968, 4395, 4394, 4393, 4392, 4391, 2957, 2951, 2950, 2949, 2948,
+    2947, 2946, 243, 3011, 4390, 3000, 4389, 4388, 2989, 4387, 4386, 4385,
+    2978, 4384, 4383, 4382, 4381, 2967, 4380, 4379, 4378, 4377, 4376, 2956,
+    4375, 4374, 4373, 4372, 4371, 4370, 2945, 2940, 2939, 2938, 2937, 2936,
+    2935, 2934, 231, 226, 1939, 225, 1938, 1937, 224, 1936, 1935, 1934, 223,
+    1933, 1932, 1931, 1930, 222, 1929, 1928, 1927, 1926, 1925, 221, 1924, 1923,
+    1922, 1921, 1920, 1919, 220, 1918, 1917, 1916, 1915, 1914, 1913, 1912, 219,
+    70, 69, 68, 67, 66, 65, 64, 63, 158, 2439, 3318, 2373, 146, 2438, 6129,
+    5909, 2372, 3307, 5689, 3296, 2307, 2306, 134, 2437, 6128, 5908, 2371,
+    6127, 7341, 5907, 5688, 5687, 2305, 3285, 5469, 3274, 5468, 5467, 3263,
+    2241, 2240, 2239, 122, 2436, 6126, 5906, 2370, 6125, 7340, 5905, 5686,
+    5685, 2304, 6124, 7339, 5904, 7338, 7337, 5684, 5466, 5465, 5464, 2238,
+    3252, 5249, 3241, 5248, 5247, 3230, 5246, 5245, 5244, 3219, 2175, 2174,
+    2173, 2172, 110, 2435, 6123, 5903, 2369, 6122, 7336, 5902, 5683, 5682,
+    2303, 6121, 7335, 5901, 7334, 7333, 5681, 5463, 5462, 5461, 2237, 6120,
+    7332, 5900, 7331, 7330, 5680, 7329, 7328, 7327, 5460, 5243, 5242, 5241,
+    5240, 2171, 3208, 5029, 3197, 5028, 5027, 3186, 5026, 5025, 5024, 3175,
+    5023, 5022, 5021, 5020, 3164, 2109, 2108, 2107, 2106, 2105, 98, 2434, 6119,
+    5899, 2368, 6118, 7326, 5898, 5679, 5678, 2302, 6117, 7325, 5897, 7324,
+    7323, 5677, 5459, 5458, 5457, 2236, 6116, 7322, 5896, 7321, 7320, 5676,
+    7319, 7318, 7317, 5456, 5239, 5238, 5237, 5236, 2170, 6115, 7316, 5895,
+    7315, 7314, 5675, 7313, 7312, 7311, 5455, 7310, 7309, 7308, 7307, 5235,
+    5019, 5018, 5017, 5016, 5015, 2104, 3153, 4809, 3142, 4808, 4807, 3131,
+    4806, 4805, 4804, 3120, 4803, 4802, 4801, 4800, 3109, 4799, 4798, 4797,
+    4796, 4795, 3098, 2043, 2042, 2041, 2040, 2039, 2038, 86, 2433, 6114, 5894,
+    2367, 6113, 7306, 5893, 5674, 5673, 2301, 6112, 7305, 5892, 7304, 7303,
+    5672, 5454, 5453, 5452, 2235, 6111, 7302, 5891, 7301, 7300, 5671, 7299,
+    7298, 7297, 5451, 5234, 5233, 5232, 5231, 2169, 6110, 7296, 5890, 7295,
+    7294, 5670, 7293, 7292, 7291, 5450, 7290, 7289, 7288, 7287, 5230, 5014,
+    5013, 5012, 5011, 5010, 2103, 6109, 7286, 5889, 7285, 7284, 5669, 7283,
+    7282, 7281, 5449, 7280, 7279, 7278, 7277, 5229, 7276, 7275, 7274, 7273,
+    7272, 5009, 4794, 4793, 4792, 4791, 4790, 4789, 2037, 3087, 4589, 3076,
+    4588, 4587, 3065, 4586, 4585, 4584, 3054, 4583, 4582, 4581, 4580, 3043,
+    4579, 4578, 4577, 4576, 4575, 3032, 4574, 4573, 4572, 4571, 4570, 4569,
+    3021, 1977, 1976, 1975, 1974, 1973, 1972, 1971, 74, 2432, 6108, 5888, 2366,
+    6107, 7271, 5887, 5668, 5667, 2300, 6106, 7270, 5886, 7269, 7268, 5666,
+    5448, 5447, 5446, 2234, 6105, 7267, 5885, 7266, 7265, 5665, 7264, 7263,
+    7262, 5445, 5228, 5227, 5226, 5225, 2168, 6104, 7261, 5884, 7260, 7259,
+    5664, 7258, 7257, 7256, 5444, 7255, 7254, 7253, 7252, 5224, 5008, 5007,
+    5006, 5005, 5004, 2102, 6103, 7251, 5883, 7250, 7249, 5663, 7248, 7247,
+    7246, 5443, 7245, 7244, 7243, 7242, 5223, 7241, 7240, 7239, 7238, 7237,
+    5003, 4788, 4787, 4786, 4785, 4784, 4783, 2036, 6102, 7236, 5882, 7235,
+    7234, 5662, 7233, 7232, 7231, 5442, 7230, 7229, 7228, 7227, 5222, 7226,
+    7225, 7224, 7223, 7222, 5002, 7221, 7220, 7219, 7218, 7217, 1603, 4782,
+    4568, 4567, 4566, 4565, 4564, 4563, 4562, 1970, 3010, 4369, 2999, 4368,
+    4367, 2988, 4366, 4365, 4364, 2977, 4363, 4362, 4361, 4360, 2966, 4359,
+    4358, 4357, 4356, 4355, 2955, 4354, 4353, 4352, 4351, 4350, 4349, 2944,
+    4348, 4347, 4346, 4345, 4344, 4343, 4342, 2933, 1911, 1910, 1909, 1908,
+    1907, 1906, 1905, 1904, 62, 314, 2929, 2918, 302, 2928, 4205, 2917, 2907,
+    2906, 290, 2927, 4204, 2916, 4203, 4202, 2905, 2896, 2895, 2894, 278, 2926,
+    4201, 2915, 4200, 4199, 2904, 4198, 4197, 4196, 2893, 2885, 2884, 2883,
+    2882, 266, 2925, 4195, 2914, 4194, 4193, 2903, 4192, 4191, 4190, 2892,
+    4189, 4188, 4187, 4186, 2881, 2874, 2873, 2872, 2871, 2870, 254, 2924,
+    4185, 2913, 4184, 4183, 2902, 4182, 4181, 4180, 2891, 4179, 4178, 4177,
+    4176, 2880, 4175, 4174, 4173, 4172, 4171, 2869, 2863, 2862, 2861, 2860,
+    2859, 2858, 242, 2923, 4170, 2912, 4169, 4168, 2901, 4167, 4166, 4165,
+    2890, 4164, 4163, 4162, 4161, 2879, 4160, 4159, 4158, 4157, 4156, 2868,
+    4155, 4154, 4153, 4152, 4151, 4150, 2857, 2852, 2851, 2850, 2849, 2848,
+    2847, 2846, 230, 2922, 4149, 2911, 4148, 4147, 2900, 4146, 4145, 4144,
+    2889, 4143, 4142, 4141, 4140, 2878, 4139, 4138, 4137, 4136, 4135, 2867,
+    4134, 4133, 4132, 4131, 4130, 4129, 2856, 4128, 4127, 4126, 4125, 4124,
+    4123, 4122, 2845, 2841, 2840, 2839, 2838, 2837, 2836, 2835, 2834, 218, 214,
+    1873, 213, 1872, 1871, 212, 1870, 1869, 1868, 211, 1867, 1866, 1865, 1864,
+    210, 1863, 1862, 1861, 1860, 1859, 209, 1858, 1857, 1856, 1855, 1854, 1853,
+    208, 1852, 1851, 1850, 1849, 1848, 1847, 1846, 207, 1845, 1844, 1843, 1842,
+    1841, 1840, 1839, 1838, 206, 58, 57, 56, 55, 54, 53, 52, 51, 50, 157, 2431,
+    3317, 2365, 145, 2430, 6101, 5881, 2364, 3306, 5661, 3295, 2299, 2298, 133,
+    2429, 6100, 5880, 2363, 6099, 7216, 5879, 5660, 5659, 2297, 3284, 5441,
+    3273, 5440, 5439, 3262, 2233, 2232, 2231, 121, 2428, 6098, 5878, 2362,
+    6097, 7215, 5877, 5658, 5657, 2296, 6096, 7214, 5876, 7213, 7212, 5656,
+    5438, 5437, 5436, 2230, 3251, 5221, 3240, 5220, 5219, 3229, 5218, 5217,
+    5216, 3218, 2167, 2166, 2165, 2164, 109, 2427, 6095, 5875, 2361, 6094,
+    7211, 5874, 5655, 5654, 2295, 6093, 7210, 5873, 7209, 7208, 5653, 5435,
+    5434, 5433, 2229, 6092, 7207, 5872, 7206, 7205, 5652, 7204, 7203, 7202,
+    5432, 5215, 5214, 5213, 5212, 2163, 3207, 5001, 3196, 5000, 4999, 3185,
+    4998, 4997, 4996, 3174, 4995, 4994, 4993, 4992, 3163, 2101, 2100, 2099,
+    2098, 2097, 97, 2426, 6091, 5871, 2360, 6090, 7201, 5870, 5651, 5650, 2294,
+    6089, 7200, 5869, 7199, 7198, 5649, 5431, 5430, 5429, 2228, 6088, 7197,
+    5868, 7196, 7195, 5648, 7194, 7193, 7192, 5428, 5211, 5210, 5209, 5208,
+    2162, 6087, 7191, 5867, 7190, 7189, 5647, 7188, 7187, 7186, 5427, 7185,
+    7184, 7183, 7182, 5207, 4991, 4990, 4989, 4988, 4987, 2096, 3152, 4781,
+    3141, 4780, 4779, 3130, 4778, 4777, 4776, 3119, 4775, 4774, 4773, 4772,
+    3108, 4771, 4770, 4769, 4768, 4767, 3097, 2035, 2034, 2033, 2032, 2031,
+    2030, 85, 2425, 6086, 5866, 2359, 6085, 7181, 5865, 5646, 5645, 2293, 6084,
+    7180, 5864, 7179, 7178, 5644, 5426, 5425, 5424, 2227, 6083, 7177, 5863,
+    7176, 7175, 5643, 7174, 7173, 7172, 5423, 5206, 5205, 5204, 5203, 2161,
+    6082, 7171, 5862, 7170, 7169, 5642, 7168, 7167, 7166, 5422, 7165, 7164,
+    7163, 7162, 5202, 4986, 4985, 4984, 4983, 4982, 2095, 6081, 7161, 5861,
+    7160, 7159, 5641, 7158, 7157, 7156, 5421, 7155, 7154, 7153, 7152, 5201,
+    7151, 7150, 7149, 7148, 7147, 4981, 4766, 4765, 4764, 4763, 4762, 4761,
+    2029, 3086, 4561, 3075, 4560, 4559, 3064, 4558, 4557, 4556, 3053, 4555,
+    4554, 4553, 4552, 3042, 4551, 4550, 4549, 4548, 4547, 3031, 4546, 4545,
+    4544, 4543, 4542, 4541, 3020, 1969, 1968, 1967, 1966, 1965, 1964, 1963, 73,
+    2424, 6080, 5860, 2358, 6079, 7146, 5859, 5640, 5639, 2292, 6078, 7145,
+    5858, 7144, 7143, 5638, 5420, 5419, 5418, 2226, 6077, 7142, 5857, 7141,
+    7140, 5637, 7139, 7138, 7137, 5417, 5200, 5199, 5198, 5197, 2160, 6076,
+    7136, 5856, 7135, 7134, 5636, 7133, 7132, 7131, 5416, 7130, 7129, 7128,
+    7127, 5196, 4980, 4979, 4978, 4977, 4976, 2094, 6075, 7126, 5855, 7125,
+    7124, 5635, 7123, 7122, 7121, 5415, 7120, 7119, 7118, 7117, 5195, 7116,
+    7115, 7114, 7113, 7112, 4975, 4760, 4759, 4758, 4757, 4756, 4755, 2028,
+    6074, 7111, 5854, 7110, 7109, 5634, 7108, 7107, 7106, 5414, 7105, 7104,
+    7103, 7102, 5194, 7101, 7100, 7099, 7098, 7097, 4974, 7096, 7095, 7094,
+    7093, 7092, 7091, 4754, 4540, 4539, 4538, 4537, 4536, 4535, 4534, 1962,
+    3009, 4341, 2998, 4340, 4339, 2987, 4338, 4337, 4336, 2976, 4335, 4334,
+    4333, 4332, 2965, 4331, 4330, 4329, 4328, 4327, 2954, 4326, 4325, 4324,
+    4323, 4322, 4321, 2943, 4320, 4319, 4318, 4317, 4316, 4315, 4314, 2932,
+    1903, 1902, 1901, 1900, 1899, 1898, 1897, 1896, 61, 2423, 6073, 5853, 2357,
+    6072, 7090, 5852, 5633, 5632, 2291, 6071, 7089, 5851, 7088, 7087, 5631,
+    5413, 5412, 5411, 2225, 6070, 7086, 5850, 7085, 7084, 5630, 7083, 7082,
+    7081, 5410, 5193, 5192, 5191, 5190, 2159, 6069, 7080, 5849, 7079, 7078,
+    5629, 7077, 7076, 7075, 5409, 7074, 7073, 7072, 7071, 5189, 4973, 4972,
+    4971, 4970, 4969, 2093, 6068, 7070, 5848, 7069, 7068, 5628, 7067, 7066,
+    7065, 5408, 7064, 7063, 7062, 7061, 5188, 7060, 7059, 7058, 7057, 7056,
+    4968, 4753, 4752, 4751, 4750, 4749, 4748, 2027, 6067, 7055, 5847, 7054,
+    7053, 5627, 7052, 7051, 7050, 5407, 7049, 7048, 7047, 7046, 5187, 7045,
+    7044, 7043, 7042, 7041, 4967, 7040, 7039, 7038, 7037, 7036, 7035, 4747,
+    4533, 4532, 4531, 4530, 4529, 4528, 4527, 1961, 6066, 7034, 5846, 7033,
+    7032, 5626, 7031, 7030, 7029, 5406, 7028, 7027, 7026, 7025, 5186, 7024,
+    7023, 7022, 7021, 7020, 4966, 7019, 7018, 7017, 7016, 7015, 7014, 4746,
+    7013, 7012, 7011, 7010, 7009, 7008, 1602, 4526, 4313, 4312, 4311, 4310,
+    4309, 4308, 4307, 4306, 1895, 2921, 4121, 2910, 4120, 4119, 2899, 4118,
+    4117, 4116, 2888, 4115, 4114, 4113, 4112, 2877, 4111, 4110, 4109, 4108,
+    4107, 2866, 4106, 4105, 4104, 4103, 4102, 4101, 2855, 4100, 4099, 4098,
+    4097, 4096, 4095, 4094, 2844, 4093, 4092, 4091, 4090, 4089, 4088, 4087,
+    4086, 2833, 1837, 1836, 1835, 1834, 1833, 1832, 1831, 1830, 1829, 49, 313,
+    2830, 2819, 301, 2829, 3985, 2818, 2808, 2807, 289, 2828, 3984, 2817, 3983,
+    3982, 2806, 2797, 2796, 2795, 277, 2827, 3981, 2816, 3980, 3979, 2805,
+    3978, 3977, 3976, 2794, 2786, 2785, 2784, 2783, 265, 2826, 3975, 2815,
+    3974, 3973, 2804, 3972, 3971, 3970, 2793, 3969, 3968, 3967, 3966, 2782,
+    2775, 2774, 2773, 2772, 2771, 253, 2825, 3965, 2814, 3964, 3963, 2803,
+    3962, 3961, 3960, 2792, 3959, 3958, 3957, 3956, 2781, 3955, 3954, 3953,
+    3952, 3951, 2770, 2764, 2763, 2762, 2761, 2760, 2759, 241, 2824, 3950,
+    2813, 3949, 3948, 2802, 3947, 3946, 3945, 2791, 3944, 3943, 3942, 3941,
+    2780, 3940, 3939, 3938, 3937, 3936, 2769, 3935, 3934, 3933, 3932, 3931,
+    3930, 2758, 2753, 2752, 2751, 2750, 2749, 2748, 2747, 229, 2823, 3929,
+    2812, 3928, 3927, 2801, 3926, 3925, 3924, 2790, 3923, 3922, 3921, 3920,
+    2779, 3919, 3918, 3917, 3916, 3915, 2768, 3914, 3913, 3912, 3911, 3910,
+    3909, 2757, 3908, 3907, 3906, 3905, 3904, 3903, 3902, 2746, 2742, 2741,
+    2740, 2739, 2738, 2737, 2736, 2735, 217, 2822, 3901, 2811, 3900, 3899,
+    2800, 3898, 3897, 3896, 2789, 3895, 3894, 3893, 3892, 2778, 3891, 3890,
+    3889, 3888, 3887, 2767, 3886, 3885, 3884, 3883, 3882, 3881, 2756, 3880,
+    3879, 3878, 3877, 3876, 3875, 3874, 2745, 3873, 3872, 3871, 3870, 3869,
+    3868, 3867, 3866, 2734, 2731, 2730, 2729, 2728, 2727, 2726, 2725, 2724,
+    2723, 205, 202, 1807, 201, 1806, 1805, 200, 1804, 1803, 1802, 199, 1801,
+    1800, 1799, 1798, 198, 1797, 1796, 1795, 1794, 1793, 197, 1792, 1791, 1790,
+    1789, 1788, 1787, 196, 1786, 1785, 1784, 1783, 1782, 1781, 1780, 195, 1779,
+    1778, 1777, 1776, 1775, 1774, 1773, 1772, 194, 1771, 1770, 1769, 1768,
+    1767, 1766, 1765, 1764, 1763, 193, 46, 45, 44, 43, 42, 41, 40, 39, 38, 37,
+    156, 2422, 3316, 2356, 144, 2421, 6065, 5845, 2355, 3305, 5625, 3294, 2290,
+    2289, 132, 2420, 6064, 5844, 2354, 6063, 7007, 5843, 5624, 5623, 2288,
+    3283, 5405, 3272, 5404, 5403, 3261, 2224, 2223, 2222, 120, 2419, 6062,
+    5842, 2353, 6061, 7006, 5841, 5622, 5621, 2287, 6060, 7005, 5840, 7004,
+    7003, 5620, 5402, 5401, 5400, 2221, 3250, 5185, 3239, 5184, 5183, 3228,
+    5182, 5181, 5180, 3217, 2158, 2157, 2156, 2155, 108, 2418, 6059, 5839,
+    2352, 6058, 7002, 5838, 5619, 5618, 2286, 6057, 7001, 5837, 7000, 6999,
+    5617, 5399, 5398, 5397, 2220, 6056, 6998, 5836, 6997, 6996, 5616, 6995,
+    6994, 6993, 5396, 5179, 5178, 5177, 5176, 2154, 3206, 4965, 3195, 4964,
+    4963, 3184, 4962, 4961, 4960, 3173, 4959, 4958, 4957, 4956, 3162, 2092,
+    2091, 2090, 2089, 2088, 96, 2417, 6055, 5835, 2351, 6054, 6992, 5834, 5615,
+    5614, 2285, 6053, 6991, 5833, 6990, 6989, 5613, 5395, 5394, 5393, 2219,
+    6052, 6988, 5832, 6987, 6986, 5612, 6985, 6984, 6983, 5392, 5175, 5174,
+    5173, 5172, 2153, 6051, 6982, 5831, 6981, 6980, 5611, 6979, 6978, 6977,
+    5391, 6976, 6975, 6974, 6973, 5171, 4955, 4954, 4953, 4952, 4951, 2087,
+    3151, 4745, 3140, 4744, 4743, 3129, 4742, 4741, 4740, 3118, 4739, 4738,
+    4737, 4736, 3107, 4735, 4734, 4733, 4732, 4731, 3096, 2026, 2025, 2024,
+    2023, 2022, 2021, 84, 2416, 6050, 5830, 2350, 6049, 6972, 5829, 5610, 5609,
+    2284, 6048, 6971, 5828, 6970, 6969, 5608, 5390, 5389, 5388, 2218, 6047,
+    6968, 5827, 6967, 6966, 5607, 6965, 6964, 6963, 5387, 5170, 5169, 5168,
+    5167, 2152, 6046, 6962, 5826, 6961, 6960, 5606, 6959, 6958, 6957, 5386,
+    6956, 6955, 6954, 6953, 5166, 4950, 4949, 4948, 4947, 4946, 2086, 6045,
+    6952, 5825, 6951, 6950, 5605, 6949, 6948, 6947, 5385, 6946, 6945, 6944,
+    6943, 5165, 6942, 6941, 6940, 6939, 6938, 4945, 4730, 4729, 4728, 4727,
+    4726, 4725, 2020, 3085, 4525, 3074, 4524, 4523, 3063, 4522, 4521, 4520,
+    3052, 4519, 4518, 4517, 4516, 3041, 4515, 4514, 4513, 4512, 4511, 3030,
+    4510, 4509, 4508, 4507, 4506, 4505, 3019, 1960, 1959, 1958, 1957, 1956,
+    1955, 1954, 72, 2415, 6044, 5824, 2349, 6043, 6937, 5823, 5604, 5603, 2283,
+    6042, 6936, 5822, 6935, 6934, 5602, 5384, 5383, 5382, 2217, 6041, 6933,
+    5821, 6932, 6931, 5601, 6930, 6929, 6928, 5381, 5164, 5163, 5162, 5161,
+    2151, 6040, 6927, 5820, 6926, 6925, 5600, 6924, 6923, 6922, 5380, 6921,
+    6920, 6919, 6918, 5160, 4944, 4943, 4942, 4941, 4940, 2085, 6039, 6917,
+    5819, 6916, 6915, 5599, 6914, 6913, 6912, 5379, 6911, 6910, 6909, 6908,
+    5159, 6907, 6906, 6905, 6904, 6903, 4939, 4724, 4723, 4722, 4721, 4720,
+    4719, 2019, 6038, 6902, 5818, 6901, 6900, 5598, 6899, 6898, 6897, 5378,
+    6896, 6895, 6894, 6893, 5158, 6892, 6891, 6890, 6889, 6888, 4938, 6887,
+    6886, 6885, 6884, 6883, 6882, 4718, 4504, 4503, 4502, 4501, 4500, 4499,
+    4498, 1953, 3008, 4305, 2997, 4304, 4303, 2986, 4302, 4301, 4300, 2975,
+    4299, 4298, 4297, 4296, 2964, 4295, 4294, 4293, 4292, 4291, 2953, 4290,
+    4289, 4288, 4287, 4286, 4285, 2942, 4284, 4283, 4282, 4281, 4280, 4279,
+    4278, 2931, 1894, 1893, 1892, 1891, 1890, 1889, 1888, 1887, 60, 2414, 6037,
+    5817, 2348, 6036, 6881, 5816, 5597, 5596, 2282, 6035, 6880, 5815, 6879,
+    6878, 5595, 5377, 5376, 5375, 2216, 6034, 6877, 5814, 6876, 6875, 5594,
+    6874, 6873, 6872, 5374, 5157, 5156, 5155, 5154, 2150, 6033, 6871, 5813,
+    6870, 6869, 5593, 6868, 6867, 6866, 5373, 6865, 6864, 6863, 6862, 5153,
+    4937, 4936, 4935, 4934, 4933, 2084, 6032, 6861, 5812, 6860, 6859, 5592,
+    6858, 6857, 6856, 5372, 6855, 6854, 6853, 6852, 5152, 6851, 6850, 6849,
+    6848, 6847, 4932, 4717, 4716, 4715, 4714, 4713, 4712, 2018, 6031, 6846,
+    5811, 6845, 6844, 5591, 6843, 6842, 6841, 5371, 6840, 6839, 6838, 6837,
+    5151, 6836, 6835, 6834, 6833, 6832, 4931, 6831, 6830, 6829, 6828, 6827,
+    6826, 4711, 4497, 4496, 4495, 4494, 4493, 4492, 4491, 1952, 6030, 6825,
+    5810, 6824, 6823, 5590, 6822, 6821, 6820, 5370, 6819, 6818, 6817, 6816,
+    5150, 6815, 6814, 6813, 6812, 6811, 4930, 6810, 6809, 6808, 6807, 6806,
+    6805, 4710, 6804, 6803, 6802, 6801, 6800, 6799, 6798, 4490, 4277, 4276,
+    4275, 4274, 4273, 4272, 4271, 4270, 1886, 2920, 4085, 2909, 4084, 4083,
+    2898, 4082, 4081, 4080, 2887, 4079, 4078, 4077, 4076, 2876, 4075, 4074,
+    4073, 4072, 4071, 2865, 4070, 4069, 4068, 4067, 4066, 4065, 2854, 4064,
+    4063, 4062, 4061, 4060, 4059, 4058, 2843, 4057, 4056, 4055, 4054, 4053,
+    4052, 4051, 4050, 2832, 1828, 1827, 1826, 1825, 1824, 1823, 1822, 1821,
+    1820, 48, 2413, 6029, 5809, 2347, 6028, 6797, 5808, 5589, 5588, 2281, 6027,
+    6796, 5807, 6795, 6794, 5587, 5369, 5368, 5367, 2215, 6026, 6793, 5806,
+    6792, 6791, 5586, 6790, 6789, 6788, 5366, 5149, 5148, 5147, 5146, 2149,
+    6025, 6787, 5805, 6786, 6785, 5585, 6784, 6783, 6782, 5365, 6781, 6780,
+    6779, 6778, 5145, 4929, 4928, 4927, 4926, 4925, 2083, 6024, 6777, 5804,
+    6776, 6775, 5584, 6774, 6773, 6772, 5364, 6771, 6770, 6769, 6768, 5144,
+    6767, 6766, 6765, 6764, 6763, 4924, 4709, 4708, 4707, 4706, 4705, 4704,
+    2017, 6023, 6762, 5803, 6761, 6760, 5583, 6759, 6758, 6757, 5363, 6756,
+    6755, 6754, 6753, 5143, 6752, 6751, 6750, 6749, 6748, 4923, 6747, 6746,
+    6745, 6744, 6743, 6742, 4703, 4489, 4488, 4487, 4486, 4485, 4484, 4483,
+    1951, 6022, 6741, 5802, 6740, 6739, 5582, 6738, 6737, 6736, 5362, 6735,
+    6734, 6733, 6732, 5142, 6731, 6730, 6729, 6728, 6727, 4922, 6726, 6725,
+    6724, 6723, 6722, 6721, 4702, 6720, 6719, 6718, 6717, 6716, 6715, 6714,
+    4482, 4269, 4268, 4267, 4266, 4265, 4264, 4263, 4262, 1885, 6021, 6713,
+    5801, 6712, 6711, 5581, 6710, 6709, 6708, 5361, 6707, 6706, 6705, 6704,
+    5141, 6703, 6702, 6701, 6700, 6699, 4921, 6698, 6697, 6696, 6695, 6694,
+    6693, 4701, 6692, 6691, 6690, 6689, 6688, 6687, 6686, 4481, 6685, 6684,
+    6683, 6682, 6681, 6680, 6679, 1601, 4261, 4049, 4048, 4047, 4046, 4045,
+    4044, 4043, 4042, 4041, 1819, 2821, 3865, 2810, 3864, 3863, 2799, 3862,
+    3861, 3860, 2788, 3859, 3858, 3857, 3856, 2777, 3855, 3854, 3853, 3852,
+    3851, 2766, 3850, 3849, 3848, 3847, 3846, 3845, 2755, 3844, 3843, 3842,
+    3841, 3840, 3839, 3838, 2744, 3837, 3836, 3835, 3834, 3833, 3832, 3831,
+    3830, 2733, 3829, 3828, 3827, 3826, 3825, 3824, 3823, 3822, 3821, 2722,
+    1762, 1761, 1760, 1759, 1758, 1757, 1756, 1755, 1754, 1753, 36, 312, 2720,
+    2709, 300, 2719, 3765, 2708, 2698, 2697, 288, 2718, 3764, 2707, 3763, 3762,
+    2696, 2687, 2686, 2685, 276, 2717, 3761, 2706, 3760, 3759, 2695, 3758,
+    3757, 3756, 2684, 2676, 2675, 2674, 2673, 264, 2716, 3755, 2705, 3754,
+    3753, 2694, 3752, 3751, 3750, 2683, 3749, 3748, 3747, 3746, 2672, 2665,
+    2664, 2663, 2662, 2661, 252, 2715, 3745, 2704, 3744, 3743, 2693, 3742,
+    3741, 3740, 2682, 3739, 3738, 3737, 3736, 2671, 3735, 3734, 3733, 3732,
+    3731, 2660, 2654, 2653, 2652, 2651, 2650, 2649, 240, 2714, 3730, 2703,
+    3729, 3728, 2692, 3727, 3726, 3725, 2681, 3724, 3723, 3722, 3721, 2670,
+    3720, 3719, 3718, 3717, 3716, 2659, 3715, 3714, 3713, 3712, 3711, 3710,
+    2648, 2643, 2642, 2641, 2640, 2639, 2638, 2637, 228, 2713, 3709, 2702,
+    3708, 3707, 2691, 3706, 3705, 3704, 2680, 3703, 3702, 3701, 3700, 2669,
+    3699, 3698, 3697, 3696, 3695, 2658, 3694, 3693, 3692, 3691, 3690, 3689,
+    2647, 3688, 3687, 3686, 3685, 3684, 3683, 3682, 2636, 2632, 2631, 2630,
+    2629, 2628, 2627, 2626, 2625, 216, 2712, 3681, 2701, 3680, 3679, 2690,
+    3678, 3677, 3676, 2679, 3675, 3674, 3673, 3672, 2668, 3671, 3670, 3669,
+    3668, 3667, 2657, 3666, 3665, 3664, 3663, 3662, 3661, 2646, 3660, 3659,
+    3658, 3657, 3656, 3655, 3654, 2635, 3653, 3652, 3651, 3650, 3649, 3648,
+    3647, 3646, 2624, 2621, 2620, 2619, 2618, 2617, 2616, 2615, 2614, 2613,
+    204, 2711, 3645, 2700, 3644, 3643, 2689, 3642, 3641, 3640, 2678, 3639,
+    3638, 3637, 3636, 2667, 3635, 3634, 3633, 3632, 3631, 2656, 3630, 3629,
+    3628, 3627, 3626, 3625, 2645, 3624, 3623, 3622, 3621, 3620, 3619, 3618,
+    2634, 3617, 3616, 3615, 3614, 3613, 3612, 3611, 3610, 2623, 3609, 3608,
+    3607, 3606, 3605, 3604, 3603, 3602, 3601, 2612, 2610, 2609, 2608, 2607,
+    2606, 2605, 2604, 2603, 2602, 2601, 192, 190, 1741, 189, 1740, 1739, 188,
+    1738, 1737, 1736, 187, 1735, 1734, 1733, 1732, 186, 1731, 1730, 1729, 1728,
+    1727, 185, 1726, 1725, 1724, 1723, 1722, 1721, 184, 1720, 1719, 1718, 1717,
+    1716, 1715, 1714, 183, 1713, 1712, 1711, 1710, 1709, 1708, 1707, 1706, 182,
+    1705, 1704, 1703, 1702, 1701, 1700, 1699, 1698, 1697, 181, 1696, 1695,
+    1694, 1693, 1692, 1691, 1690, 1689, 1688, 1687, 180, 34, 33, 32, 31, 30,
+    29, 28, 27, 26, 25, 24, 155, 2412, 3315, 2346, 143, 2411, 6020, 5800, 2345,
+    3304, 5580, 3293, 2280, 2279, 131, 2410, 6019, 5799, 2344, 6018, 1609,
+    5798, 5579, 5578, 2278, 3282, 5360, 3271, 5359, 5358, 3260, 2214, 2213,
+    2212, 119, 2409, 6017, 5797, 2343, 6016, 6678, 5796, 5577, 5576, 2277,
+    6015, 6677, 5795, 6676, 6675, 5575, 5357, 5356, 5355, 2211, 3249, 5140,
+    3238, 5139, 5138, 3227, 5137, 5136, 5135, 3216, 2148, 2147, 2146, 2145,
+    107, 2408, 6014, 5794, 2342, 6013, 6674, 5793, 5574, 5573, 2276, 6012,
+    6673, 5792, 6672, 6671, 5572, 5354, 5353, 5352, 2210, 6011, 6670, 5791,
+    6669, 6668, 5571, 6667, 6666, 6665, 5351, 5134, 5133, 5132, 5131, 2144,
+    3205, 4920, 3194, 4919, 4918, 3183, 4917, 4916, 4915, 3172, 4914, 4913,
+    4912, 4911, 3161, 2082, 2081, 2080, 2079, 2078, 95, 2407, 6010, 5790, 2341,
+    6009, 6664, 5789, 5570, 5569, 2275, 6008, 6663, 5788, 6662, 6661, 5568,
+    5350, 5349, 5348, 2209, 6007, 6660, 5787, 6659, 6658, 5567, 6657, 6656,
+    6655, 5347, 5130, 5129, 5128, 5127, 2143, 6006, 6654, 5786, 6653, 6652,
+    5566, 6651, 6650, 6649, 5346, 6648, 6647, 6646, 6645, 5126, 4910, 4909,
+    4908, 4907, 4906, 2077, 3150, 4700, 3139, 4699, 4698, 3128, 4697, 4696,
+    4695, 3117, 4694, 4693, 4692, 4691, 3106, 4690, 4689, 4688, 4687, 4686,
+    3095, 2016, 2015, 2014, 2013, 2012, 2011, 83, 2406, 6005, 5785, 2340, 6004,
+    6644, 5784, 5565, 5564, 2274, 6003, 6643, 5783, 6642, 6641, 5563, 5345,
+    5344, 5343, 2208, 6002, 6640, 5782, 6639, 6638, 5562, 6637, 6636, 6635,
+    5342, 5125, 5124, 5123, 5122, 2142, 6001, 6634, 5781, 6633, 6632, 5561,
+    6631, 6630, 6629, 5341, 6628, 6627, 6626, 6625, 5121, 4905, 4904, 4903,
+    4902, 4901, 2076, 6000, 6624, 5780, 6623, 6622, 5560, 6621, 6620, 6619,
+    5340, 6618, 6617, 6616, 6615, 5120, 6614, 6613, 6612, 6611, 6610, 4900,
+    4685, 4684, 4683, 4682, 4681, 4680, 2010, 3084, 4480, 3073, 4479, 4478,
+    3062, 4477, 4476, 4475, 3051, 4474, 4473, 4472, 4471, 3040, 4470, 4469,
+    4468, 4467, 4466, 3029, 4465, 4464, 4463, 4462, 4461, 4460, 3018, 1950,
+    1949, 1948, 1947, 1946, 1945, 1944, 71, 2405, 5999, 5779, 2339, 5998, 6609,
+    5778, 5559, 5558, 2273, 5997, 6608, 5777, 6607, 6606, 5557, 5339, 5338,
+    5337, 2207, 5996, 6605, 5776, 6604, 6603, 5556, 6602, 6601, 6600, 5336,
+    5119, 5118, 5117, 5116, 2141, 5995, 6599, 5775, 6598, 6597, 5555, 6596,
+    6595, 6594, 5335, 6593, 6592, 6591, 6590, 5115, 4899, 4898, 4897, 4896,
+    4895, 2075, 5994, 6589, 5774, 6588, 6587, 5554, 6586, 6585, 6584, 5334,
+    6583, 6582, 6581, 6580, 5114, 6579, 6578, 6577, 6576, 6575, 4894, 4679,
+    4678, 4677, 4676, 4675, 4674, 2009, 5993, 6574, 5773, 6573, 6572, 5553,
+    6571, 6570, 6569, 5333, 6568, 6567, 6566, 6565, 5113, 6564, 6563, 6562,
+    6561, 6560, 4893, 6559, 6558, 6557, 6556, 6555, 6554, 4673, 4459, 4458,
+    4457, 4456, 4455, 4454, 4453, 1943, 3007, 4260, 2996, 4259, 4258, 2985,
+    4257, 4256, 4255, 2974, 4254, 4253, 4252, 4251, 2963, 4250, 4249, 4248,
+    4247, 4246, 2952, 4245, 4244, 4243, 4242, 4241, 4240, 2941, 4239, 4238,
+    4237, 4236, 4235, 4234, 4233, 2930, 1884, 1883, 1882, 1881, 1880, 1879,
+    1878, 1877, 59, 2404, 5992, 5772, 2338, 5991, 6553, 5771, 5552, 5551, 2272,
+    5990, 6552, 5770, 6551, 6550, 5550, 5332, 5331, 5330, 2206, 5989, 6549,
+    5769, 6548, 6547, 5549, 6546, 6545, 6544, 5329, 5112, 5111, 5110, 5109,
+    2140, 5988, 6543, 5768, 6542, 6541, 5548, 6540, 6539, 6538, 5328, 6537,
+    6536, 6535, 6534, 5108, 4892, 4891, 4890, 4889, 4888, 2074, 5987, 6533,
+    5767, 6532, 6531, 5547, 6530, 6529, 6528, 5327, 6527, 6526, 6525, 6524,
+    5107, 6523, 6522, 6521, 6520, 6519, 4887, 4672, 4671, 4670, 4669, 4668,
+    4667, 2008, 5986, 6518, 5766, 6517, 6516, 5546, 6515, 6514, 6513, 5326,
+    6512, 6511, 6510, 6509, 5106, 6508, 6507, 6506, 6505, 6504, 4886, 6503,
+    6502, 6501, 6500, 6499, 6498, 4666, 4452, 4451, 4450, 4449, 4448, 4447,
+    4446, 1942, 5985, 6497, 5765, 6496, 6495, 5545, 6494, 6493, 6492, 5325,
+    6491, 6490, 6489, 6488, 5105, 6487, 6486, 6485, 6484, 6483, 4885, 6482,
+    6481, 6480, 6479, 6478, 6477, 4665, 6476, 6475, 6474, 6473, 6472, 6471,
+    6470, 4445, 4232, 4231, 4230, 4229, 4228, 4227, 4226, 4225, 1876, 2919,
+    4040, 2908, 4039, 4038, 2897, 4037, 4036, 4035, 2886, 4034, 4033, 4032,
+    4031, 2875, 4030, 4029, 4028, 4027, 4026, 2864, 4025, 4024, 4023, 4022,
+    4021, 4020, 2853, 4019, 4018, 4017, 4016, 4015, 4014, 4013, 2842, 4012,
+    4011, 4010, 4009, 4008, 4007, 4006, 4005, 2831, 1818, 1817, 1816, 1815,
+    1814, 1813, 1812, 1811, 1810, 47, 2403, 5984, 5764, 2337, 5983, 6469, 5763,
+    5544, 5543, 2271, 5982, 6468, 5762, 6467, 6466, 5542, 5324, 5323, 5322,
+    2205, 5981, 6465, 5761, 6464, 6463, 5541, 6462, 6461, 6460, 5321, 5104,
+    5103, 5102, 5101, 2139, 5980, 6459, 5760, 6458, 6457, 5540, 6456, 6455,
+    6454, 5320, 6453, 6452, 6451, 6450, 5100, 4884, 4883, 4882, 4881, 4880,
+    2073, 5979, 6449, 5759, 6448, 6447, 5539, 6446, 6445, 6444, 5319, 6443,
+    6442, 6441, 6440, 5099, 6439, 6438, 6437, 6436, 6435, 4879, 4664, 4663,
+    4662, 4661, 4660, 4659, 2007, 5978, 6434, 5758, 6433, 6432, 5538, 6431,
+    6430, 6429, 5318, 6428, 6427, 6426, 6425, 5098, 6424, 6423, 6422, 6421,
+    6420, 4878, 6419, 6418, 6417, 6416, 6415, 6414, 4658, 4444, 4443, 4442,
+    4441, 4440, 4439, 4438, 1941, 5977, 6413, 5757, 6412, 6411, 5537, 6410,
+    6409, 6408, 5317, 6407, 6406, 6405, 6404, 5097, 6403, 6402, 6401, 6400,
+    6399, 4877, 6398, 6397, 6396, 6395, 6394, 6393, 4657, 6392, 6391, 6390,
+    6389, 6388, 6387, 6386, 4437, 4224, 4223, 4222, 4221, 4220, 4219, 4218,
+    4217, 1875, 5976, 6385, 5756, 6384, 6383, 5536, 6382, 6381, 6380, 5316,
+    6379, 6378, 6377, 6376, 5096, 6375, 6374, 6373, 6372, 6371, 4876, 6370,
+    6369, 6368, 6367, 6366, 6365, 4656, 6364, 6363, 6362, 6361, 6360, 6359,
+    6358, 4436, 6357, 6356, 6355, 6354, 6353, 6352, 6351, 6350, 4216, 4004,
+    4003, 4002, 4001, 4000, 3999, 3998, 3997, 3996, 1809, 2820, 3820, 2809,
+    3819, 3818, 2798, 3817, 3816, 3815, 2787, 3814, 3813, 3812, 3811, 2776,
+    3810, 3809, 3808, 3807, 3806, 2765, 3805, 3804, 3803, 3802, 3801, 3800,
+    2754, 3799, 3798, 3797, 3796, 3795, 3794, 3793, 2743, 3792, 3791, 3790,
+    3789, 3788, 3787, 3786, 3785, 2732, 3784, 3783, 3782, 3781, 3780, 3779,
+    3778, 3777, 3776, 2721, 1752, 1751, 1750, 1749, 1748, 1747, 1746, 1745,
+    1744, 1743, 35, 2402, 5975, 5755, 2336, 5974, 6349, 5754, 5535, 5534, 2270,
+    5973, 6348, 5753, 6347, 6346, 5533, 5315, 5314, 5313, 2204, 5972, 6345,
+    5752, 6344, 6343, 5532, 6342, 6341, 6340, 5312, 5095, 5094, 5093, 5092,
+    2138, 5971, 6339, 5751, 6338, 6337, 5531, 6336, 6335, 6334, 5311, 6333,
+    6332, 6331, 6330, 5091, 4875, 4874, 4873, 4872, 4871, 2072, 5970, 6329,
+    5750, 6328, 6327, 5530, 6326, 6325, 6324, 5310, 6323, 6322, 6321, 6320,
+    5090, 6319, 6318, 6317, 6316, 6315, 4870, 4655, 4654, 4653, 4652, 4651,
+    4650, 2006, 5969, 6314, 5749, 6313, 6312, 5529, 6311, 6310, 6309, 5309,
+    6308, 6307, 6306, 6305, 5089, 6304, 6303, 6302, 6301, 6300, 4869, 6299,
+    6298, 6297, 6296, 6295, 6294, 4649, 4435, 4434, 4433, 4432, 4431, 4430,
+    4429, 1940, 5968, 6293, 5748, 6292, 6291, 5528, 6290, 6289, 6288, 5308,
+    6287, 6286, 6285, 6284, 5088, 6283, 6282, 6281, 6280, 6279, 4868, 6278,
+    6277, 6276, 6275, 6274, 6273, 4648, 6272, 6271, 6270, 6269, 6268, 6267,
+    6266, 4428, 4215, 4214, 4213, 4212, 4211, 4210, 4209, 4208, 1874, 5967,
+    6265, 5747, 6264, 6263, 5527, 6262, 6261, 6260, 5307, 6259, 6258, 6257,
+    6256, 5087, 6255, 6254, 6253, 6252, 6251, 4867, 6250, 6249, 6248, 6247,
+    6246, 6245, 4647, 6244, 6243, 6242, 6241, 6240, 6239, 6238, 4427, 6237,
+    6236, 6235, 6234, 6233, 6232, 6231, 6230, 4207, 3995, 3994, 3993, 3992,
+    3991, 3990, 3989, 3988, 3987, 1808, 5966, 6229, 5746, 6228, 6227, 5526,
+    6226, 6225, 6224, 5306, 6223, 6222, 6221, 6220, 5086, 6219, 6218, 6217,
+    6216, 6215, 4866, 6214, 6213, 6212, 6211, 6210, 6209, 4646, 6208, 6207,
+    6206, 6205, 6204, 6203, 6202, 4426, 6201, 6200, 6199, 6198, 6197, 6196,
+    6195, 6194, 4206, 6193, 6192, 6191, 6190, 6189, 6188, 6187, 6186, 1600,
+    3986, 3775, 3774, 3773, 3772, 3771, 3770, 3769, 3768, 3767, 3766, 1742,
+    2710, 3600, 2699, 3599, 3598, 2688, 3597, 3596, 3595, 2677, 3594, 3593,
+    3592, 3591, 2666, 3590, 3589, 3588, 3587, 3586, 2655, 3585, 3584, 3583,
+    3582, 3581, 3580, 2644, 3579, 3578, 3577, 3576, 3575, 3574, 3573, 2633,
+    3572, 3571, 3570, 3569, 3568, 3567, 3566, 3565, 2622, 3564, 3563, 3562,
+    3561, 3560, 3559, 3558, 3557, 3556, 2611, 3555, 3554, 3553, 3552, 3551,
+    3550, 3549, 3548, 3547, 3546, 2600, 1686, 1685, 1684, 1683, 1682, 1681,
+    1680, 1679, 1678, 1677, 1676, 23, 311, 2599, 2588, 299, 2598, 3545, 2587,
+    2577, 2576, 287, 2597, 3544, 2586, 3543, 3542, 2575, 2566, 2565, 2564, 275,
+    2596, 3541, 2585, 3540, 3539, 2574, 3538, 3537, 3536, 2563, 2555, 2554,
+    2553, 2552, 263, 2595, 3535, 2584, 3534, 3533, 2573, 3532, 3531, 3530,
+    2562, 3529, 3528, 3527, 3526, 2551, 2544, 2543, 2542, 2541, 2540, 251,
+    2594, 3525, 2583, 3524, 3523, 2572, 3522, 3521, 3520, 2561, 3519, 3518,
+    3517, 3516, 2550, 3515, 3514, 3513, 3512, 3511, 2539, 2533, 2532, 2531,
+    2530, 2529, 2528, 239, 2593, 3510, 2582, 3509, 3508, 2571, 3507, 3506,
+    3505, 2560, 3504, 3503, 3502, 3501, 2549, 3500, 3499, 3498, 3497, 3496,
+    2538, 3495, 3494, 3493, 3492, 3491, 3490, 2527, 2522, 2521, 2520, 2519,
+    2518, 2517, 2516, 227, 2592, 3489, 2581, 3488, 3487, 2570, 3486, 3485,
+    3484, 2559, 3483, 3482, 3481, 3480, 2548, 3479, 3478, 3477, 3476, 3475,
+    2537, 3474, 3473, 3472, 3471, 3470, 3469, 2526, 3468, 3467, 3466, 3465,
+    3464, 3463, 3462, 2515, 2511, 2510, 2509, 2508, 2507, 2506, 2505, 2504,
+    215, 2591, 3461, 2580, 3460, 3459, 2569, 3458, 3457, 3456, 2558, 3455,
+    3454, 3453, 3452, 2547, 3451, 3450, 3449, 3448, 3447, 2536, 3446, 3445,
+    3444, 3443, 3442, 3441, 2525, 3440, 3439, 3438, 3437, 3436, 3435, 3434,
+    2514, 3433, 3432, 3431, 3430, 3429, 3428, 3427, 3426, 2503, 2500, 2499,
+    2498, 2497, 2496, 2495, 2494, 2493, 2492, 203, 2590, 3425, 2579, 3424,
+    3423, 2568, 3422, 3421, 3420, 2557, 3419, 3418, 3417, 3416, 2546, 3415,
+    3414, 3413, 3412, 3411, 2535, 3410, 3409, 3408, 3407, 3406, 3405, 2524,
+    3404, 3403, 3402, 3401, 3400, 3399, 3398, 2513, 3397, 3396, 3395, 3394,
+    3393, 3392, 3391, 3390, 2502, 3389, 3388, 3387, 3386, 3385, 3384, 3383,
+    3382, 3381, 2491, 2489, 2488, 2487, 2486, 2485, 2484, 2483, 2482, 2481,
+    2480, 191, 2589, 3380, 2578, 3379, 3378, 2567, 3377, 3376, 3375, 2556,
+    3374, 3373, 3372, 3371, 2545, 3370, 3369, 3368, 3367, 3366, 2534, 3365,
+    3364, 3363, 3362, 3361, 3360, 2523, 3359, 3358, 3357, 3356, 3355, 3354,
+    3353, 2512, 3352, 3351, 3350, 3349, 3348, 3347, 3346, 3345, 2501, 3344,
+    3343, 3342, 3341, 3340, 3339, 3338, 3337, 3336, 2490, 3335, 3334, 3333,
+    3332, 3331, 3330, 3329, 3328, 3327, 3326, 2479, 2478, 2477, 2476, 2475,
+    2474, 2473, 2472, 2471, 2470, 2469, 2468, 179, 178, 1675, 177, 1674, 1673,
+    176, 1672, 1671, 1670, 175, 1669, 1668, 1667, 1666, 174, 1665, 1664, 1663,
+    1662, 1661, 173, 1660, 1659, 1658, 1657, 1656, 1655, 172, 1654, 1653, 1652,
+    1651, 1650, 1649, 1648, 171, 1647, 1646, 1645, 1644, 1643, 1642, 1641,
+    1640, 170, 1639, 1638, 1637, 1636, 1635, 1634, 1633, 1632, 1631, 169, 1630,
+    1629, 1628, 1627, 1626, 1625, 1624, 1623, 1622, 1621, 168, 1620, 1619,
+    1618, 1617, 1616, 1615, 1614, 1613, 1612, 1611, 1610, 167, 22, 21, 20, 19,
+    18, 17, 16, 15, 14, 13, 12, 11, 0,
+])
+
+
+FCP_FLUSH_TABLE: array = _dense({
+    7680: 14, 3840: 15, 1920: 16, 960: 17, 480: 18, 240: 19, 120: 20, 60: 21,
+    30: 22, 15: 23, 4103: 24, 7424: 181, 7296: 182, 7232: 183, 7200: 184,
+    7184: 185, 7176: 186, 7172: 187, 7170: 188, 7169: 189, 6912: 190,
+    6784: 191, 6720: 192, 6688: 193, 6672: 194, 6664: 195, 6660: 196,
+    6658: 197, 6657: 198, 6528: 199, 6464: 200, 6432: 201, 6416: 202,
+    6408: 203, 6404: 204, 6402: 205, 6401: 206, 6336: 207, 6304: 208,
+    6288: 209, 6280: 210, 6276: 211, 6274: 212, 6273: 213, 6240: 214,
+    6224: 215, 6216: 216, 6212: 217, 6210: 218, 6209: 219, 6192: 220,
+    6184: 221, 6180: 222, 6178: 223, 6177: 224, 6168: 225, 6164: 226,
+    6162: 227, 6161: 228, 6156: 229, 6154: 230, 6153: 231, 6150: 232,
+    6149: 233, 6147: 234, 5888: 235, 5760: 236, 5696: 237, 5664: 238,
+    5648: 239, 5640: 240, 5636: 241, 5634: 242, 5633: 243, 5504: 244,
+    5440: 245, 5408: 246, 5392: 247, 5384: 248, 5380: 249, 5378: 250,
+    5377: 251, 5312: 252, 5280: 253, 5264: 254, 5256: 255, 5252: 256,
+    5250: 257, 5249: 258, 5216: 259, 5200: 260, 5192: 261, 5188: 262,
+    5186: 263, 5185: 264, 5168: 265, 5160: 266, 5156: 267, 5154: 268,
+    5153: 269, 5144: 270, 5140: 271, 5138: 272, 5137: 273, 5132: 274,
+    5130: 275, 5129: 276, 5126: 277, 5125: 278, 5123: 279, 4992: 280,
+    4928: 281, 4896: 282, 4880: 283, 4872: 284, 4868: 285, 4866: 286,
+    4865: 287, 4800: 288, 4768: 289, 4752: 290, 4744: 291, 4740: 292,
+    4738: 293, 4737: 294, 4704: 295, 4688: 296, 4680: 297, 4676: 298,
+    4674: 299, 4673: 300, 4656: 301, 4648: 302, 4644: 303, 4642: 304,
+    4641: 305, 4632: 306, 4628: 307, 4626: 308, 4625: 309, 4620: 310,
+    4618: 311, 4617: 312, 4614: 313, 4613: 314, 4611: 315, 4544: 316,
+    4512: 317, 4496: 318, 4488: 319, 4484: 320, 4482: 321, 4481: 322,
+    4448: 323, 4432: 324, 4424: 325, 4420: 326, 4418: 327, 4417: 328,
+    4400: 329, 4392: 330, 4388: 331, 4386: 332, 4385: 333, 4376: 334,
+    4372: 335, 4370: 336, 4369: 337, 4364: 338, 4362: 339, 4361: 340,
+    4358: 341, 4357: 342, 4355: 343, 4320: 344, 4304: 345, 4296: 346,
+    4292: 347, 4290: 348, 4289: 349, 4272: 350, 4264: 351, 4260: 352,
+    4258: 353, 4257: 354, 4248: 355, 4244: 356, 4242: 357, 4241: 358,
+    4236: 359, 4234: 360, 4233: 361, 4230: 362, 4229: 363, 4227: 364,
+    4208: 365, 4200: 366, 4196: 367, 4194: 368, 4193: 369, 4184: 370,
+    4180: 371, 4178: 372, 4177: 373, 4172: 374, 4170: 375, 4169: 376,
+    4166: 377, 4165: 378, 4163: 379, 4152: 380, 4148: 381, 4146: 382,
+    4145: 383, 4140: 384, 4138: 385, 4137: 386, 4134: 387, 4133: 388,
+    4131: 389, 4124: 390, 4122: 391, 4121: 392, 4118: 393, 4117: 394,
+    4115: 395, 4110: 396, 4109: 397, 4107: 398, 3712: 399, 3648: 400,
+    3616: 401, 3600: 402, 3592: 403, 3588: 404, 3586: 405, 3585: 406,
+    3456: 407, 3392: 408, 3360: 409, 3344: 410, 3336: 411, 3332: 412,
+    3330: 413, 3329: 414, 3264: 415, 3232: 416, 3216: 417, 3208: 418,
+    3204: 419, 3202: 420, 3201: 421, 3168: 422, 3152: 423, 3144: 424,
+    3140: 425, 3138: 426, 3137: 427, 3120: 428, 3112: 429, 3108: 430,
+    3106: 431, 3105: 432, 3096: 433, 3092: 434, 3090: 435, 3089: 436,
+    3084: 437, 3082: 438, 3081: 439, 3078: 440, 3077: 441, 3075: 442,
+    2944: 443, 2880: 444, 2848: 445, 2832: 446, 2824: 447, 2820: 448,
+    2818: 449, 2817: 450, 2752: 451, 2720: 452, 2704: 453, 2696: 454,
+    2692: 455, 2690: 456, 2689: 457, 2656: 458, 2640: 459, 2632: 460,
+    2628: 461, 2626: 462, 2625: 463, 2608: 464, 2600: 465, 2596: 466,
+    2594: 467, 2593: 468, 2584: 469, 2580: 470, 2578: 471, 2577: 472,
+    2572: 473, 2570: 474, 2569: 475, 2566: 476, 2565: 477, 2563: 478,
+    2496: 479, 2464: 480, 2448: 481, 2440: 482, 2436: 483, 2434: 484,
+    2433: 485, 2400: 486, 2384: 487, 2376: 488, 2372: 489, 2370: 490,
+    2369: 491, 2352: 492, 2344: 493, 2340: 494, 2338: 495, 2337: 496,
+    2328: 497, 2324: 498, 2322: 499, 2321: 500, 2316: 501, 2314: 502,
+    2313: 503, 2310: 504, 2309: 505, 2307: 506, 2272: 507, 2256: 508,
+    2248: 509, 2244: 510, 2242: 511, 2241: 512, 2224: 513, 2216: 514,
+    2212: 515, 2210: 516, 2209: 517, 2200: 518, 2196: 519, 2194: 520,
+    2193: 521, 2188: 522, 2186: 523, 2185: 524, 2182: 525, 2181: 526,
+    2179: 527, 2160: 528, 2152: 529, 2148: 530, 2146: 531, 2145: 532,
+    2136: 533, 2132: 534, 2130: 535, 2129: 536, 2124: 537, 2122: 538,
+    2121: 539, 2118: 540, 2117: 541, 2115: 542, 2104: 543, 2100: 544,
+    2098: 545, 2097: 546, 2092: 547, 2090: 548, 2089: 549, 2086: 550,
+    2085: 551, 2083: 552, 2076: 553, 2074: 554, 2073: 555, 2070: 556,
+    2069: 557, 2067: 558, 2062: 559, 2061: 560, 2059: 561, 2055: 562,
+    1856: 563, 1824: 564, 1808: 565, 1800: 566, 1796: 567, 1794: 568,
+    1793: 569, 1728: 570, 1696: 571, 1680: 572, 1672: 573, 1668: 574,
+    1666: 575, 1665: 576, 1632: 577, 1616: 578, 1608: 579, 1604: 580,
+    1602: 581, 1601: 582, 1584: 583, 1576: 584, 1572: 585, 1570: 586,
+    1569: 587, 1560: 588, 1556: 589, 1554: 590, 1553: 591, 1548: 592,
+    1546: 593, 1545: 594, 1542: 595, 1541: 596, 1539: 597, 1472: 598,
+    1440: 599, 1424: 600, 1416: 601, 1412: 602, 1410: 603, 1409: 604,
+    1376: 605, 1360: 606, 1352: 607, 1348: 608, 1346: 609, 1345: 610,
+    1328: 611, 1320: 612, 1316: 613, 1314: 614, 1313: 615, 1304: 616,
+    1300: 617, 1298: 618, 1297: 619, 1292: 620, 1290: 621, 1289: 622,
+    1286: 623, 1285: 624, 1283: 625, 1248: 626, 1232: 627, 1224: 628,
+    1220: 629, 1218: 630, 1217: 631, 1200: 632, 1192: 633, 1188: 634,
+    1186: 635, 1185: 636, 1176: 637, 1172: 638, 1170: 639, 1169: 640,
+    1164: 641, 1162: 642, 1161: 643, 1158: 644, 1157: 645, 1155: 646,
+    1136: 647, 1128: 648, 1124: 649, 1122: 650, 1121: 651, 1112: 652,
+    1108: 653, 1106: 654, 1105: 655, 1100: 656, 1098: 657, 1097: 658,
+    1094: 659, 1093: 660, 1091: 661, 1080: 662, 1076: 663, 1074: 664,
+    1073: 665, 1068: 666, 1066: 667, 1065: 668, 1062: 669, 1061: 670,
+    1059: 671, 1052: 672, 1050: 673, 1049: 674, 1046: 675, 1045: 676,
+    1043: 677, 1038: 678, 1037: 679, 1035: 680, 1031: 681, 928: 682, 912: 683,
+    904: 684, 900: 685, 898: 686, 897: 687, 864: 688, 848: 689, 840: 690,
+    836: 691, 834: 692, 833: 693, 816: 694, 808: 695, 804: 696, 802: 697,
+    801: 698, 792: 699, 788: 700, 786: 701, 785: 702, 780: 703, 778: 704,
+    777: 705, 774: 706, 773: 707, 771: 708, 736: 709, 720: 710, 712: 711,
+    708: 712, 706: 713, 705: 714, 688: 715, 680: 716, 676: 717, 674: 718,
+    673: 719, 664: 720, 660: 721, 658: 722, 657: 723, 652: 724, 650: 725,
+    649: 726, 646: 727, 645: 728, 643: 729, 624: 730, 616: 731, 612: 732,
+    610: 733, 609: 734, 600: 735, 596: 736, 594: 737, 593: 738, 588: 739,
+    586: 740, 585: 741, 582: 742, 581: 743, 579: 744, 568: 745, 564: 746,
+    562: 747, 561: 748, 556: 749, 554: 750, 553: 751, 550: 752, 549: 753,
+    547: 754, 540: 755, 538: 756, 537: 757, 534: 758, 533: 759, 531: 760,
+    526: 761, 525: 762, 523: 763, 519: 764, 464: 765, 456: 766, 452: 767,
+    450: 768, 449: 769, 432: 770, 424: 771, 420: 772, 418: 773, 417: 774,
+    408: 775, 404: 776, 402: 777, 401: 778, 396: 779, 394: 780, 393: 781,
+    390: 782, 389: 783, 387: 784, 368: 785, 360: 786, 356: 787, 354: 788,
+    353: 789, 344: 790, 340: 791, 338: 792, 337: 793, 332: 794, 330: 795,
+    329: 796, 326: 797, 325: 798, 323: 799, 312: 800, 308: 801, 306: 802,
+    305: 803, 300: 804, 298: 805, 297: 806, 294: 807, 293: 808, 291: 809,
+    284: 810, 282: 811, 281: 812, 278: 813, 277: 814, 275: 815, 270: 816,
+    269: 817, 267: 818, 263: 819, 232: 820, 228: 821, 226: 822, 225: 823,
+    216: 824, 212: 825, 210: 826, 209: 827, 204: 828, 202: 829, 201: 830,
+    198: 831, 197: 832, 195: 833, 184: 834, 180: 835, 178: 836, 177: 837,
+    172: 838, 170: 839, 169: 840, 166: 841, 165: 842, 163: 843, 156: 844,
+    154: 845, 153: 846, 150: 847, 149: 848, 147: 849, 142: 850, 141: 851,
+    139: 852, 135: 853, 116: 854, 114: 855, 113: 856, 108: 857, 106: 858,
+    105: 859, 102: 860, 101: 861, 99: 862, 92: 863, 90: 864, 89: 865, 86: 866,
+    85: 867, 83: 868, 78: 869, 77: 870, 75: 871, 71: 872, 58: 873, 57: 874,
+    54: 875, 53: 876, 51: 877, 46: 878, 45: 879, 43: 880, 39: 881, 29: 882,
+    27: 883, 23: 884,
+}, 8192)
+
+
+FCP_UNIQUE_TABLE: array = _dense({
+    7680: 885, 3840: 886, 1920: 887, 960: 888, 480: 889, 240: 890, 120: 891,
+    60: 892, 30: 893, 15: 894, 4103: 895, 7424: 1910, 7296: 1911, 7232: 1912,
+    7200: 1913, 7184: 1914, 7176: 1915, 7172: 1916, 7170: 1917, 7169: 1918,
+    6912: 1919, 6784: 1920, 6720: 1921, 6688: 1922, 6672: 1923, 6664: 1924,
+    6660: 1925, 6658: 1926, 6657: 1927, 6528: 1928, 6464: 1929, 6432: 1930,
+    6416: 1931, 6408: 1932, 6404: 1933, 6402: 1934, 6401: 1935, 6336: 1936,
+    6304: 1937, 6288: 1938, 6280: 1939, 6276: 1940, 6274: 1941, 6273: 1942,
+    6240: 1943, 6224: 1944, 6216: 1945, 6212: 1946, 6210: 1947, 6209: 1948,
+    6192: 1949, 6184: 1950, 6180: 1951, 6178: 1952, 6177: 1953, 6168: 1954,
+    6164: 1955, 6162: 1956, 6161: 1957, 6156: 1958, 6154: 1959, 6153: 1960,
+    6150: 1961, 6149: 1962, 6147: 1963, 5888: 1964, 5760: 1965, 5696: 1966,
+    5664: 1967, 5648: 1968, 5640: 1969, 5636: 1970, 5634: 1971, 5633: 1972,
+    5504: 1973, 5440: 1974, 5408: 1975, 5392: 1976, 5384: 1977, 5380: 1978,
+    5378: 1979, 5377: 1980, 5312: 1981, 5280: 1982, 5264: 1983, 5256: 1984,
+    5252: 1985, 5250: 1986, 5249: 1987, 5216: 1988, 5200: 1989, 5192: 1990,
+    5188: 1991, 5186: 1992, 5185: 1993, 5168: 1994, 5160: 1995, 5156: 1996,
+    5154: 1997, 5153: 1998, 5144: 1999, 5140: 2000, 5138: 2001, 5137: 2002,
+    5132: 2003, 5130: 2004, 5129: 2005, 5126: 2006, 5125: 2007, 5123: 2008,
+    4992: 2009, 4928: 2010, 4896: 2011, 4880: 2012, 4872: 2013, 4868: 2014,
+    4866: 2015, 4865: 2016, 4800: 2017, 4768: 2018, 4752: 2019, 4744: 2020,
+    4740: 2021, 4738: 2022, 4737: 2023, 4704: 2024, 4688: 2025, 4680: 2026,
+    4676: 2027, 4674: 2028, 4673: 2029, 4656: 2030, 4648: 2031, 4644: 2032,
+    4642: 2033, 4641: 2034, 4632: 2035, 4628: 2036, 4626: 2037, 4625: 2038,
+    4620: 2039, 4618: 2040, 4617: 2041, 4614: 2042, 4613: 2043, 4611: 2044,
+    4544: 2045, 4512: 2046, 4496: 2047, 4488: 2048, 4484: 2049, 4482: 2050,
+    4481: 2051, 4448: 2052, 4432: 2053, 4424: 2054, 4420: 2055, 4418: 2056,
+    4417: 2057, 4400: 2058, 4392: 2059, 4388: 2060, 4386: 2061, 4385: 2062,
+    4376: 2063, 4372: 2064, 4370: 2065, 4369: 2066, 4364: 2067, 4362: 2068,
+    4361: 2069, 4358: 2070, 4357: 2071, 4355: 2072, 4320: 2073, 4304: 2074,
+    4296: 2075, 4292: 2076, 4290: 2077, 4289: 2078, 4272: 2079, 4264: 2080,
+    4260: 2081, 4258: 2082, 4257: 2083, 4248: 2084, 4244: 2085, 4242: 2086,
+    4241: 2087, 4236: 2088, 4234: 2089, 4233: 2090, 4230: 2091, 4229: 2092,
+    4227: 2093, 4208: 2094, 4200: 2095, 4196: 2096, 4194: 2097, 4193: 2098,
+    4184: 2099, 4180: 2100, 4178: 2101, 4177: 2102, 4172: 2103, 4170: 2104,
+    4169: 2105, 4166: 2106, 4165: 2107, 4163: 2108, 4152: 2109, 4148: 2110,
+    4146: 2111, 4145: 2112, 4140: 2113, 4138: 2114, 4137: 2115, 4134: 2116,
+    4133: 2117, 4131: 2118, 4124: 2119, 4122: 2120, 4121: 2121, 4118: 2122,
+    4117: 2123, 4115: 2124, 4110: 2125, 4109: 2126, 4107: 2127, 3712: 2128,
+    3648: 2129, 3616: 2130, 3600: 2131, 3592: 2132, 3588: 2133, 3586: 2134,
+    3585: 2135, 3456: 2136, 3392: 2137, 3360: 2138, 3344: 2139, 3336: 2140,
+    3332: 2141, 3330: 2142, 3329: 2143, 3264: 2144, 3232: 2145, 3216: 2146,
+    3208: 2147, 3204: 2148, 3202: 2149, 3201: 2150, 3168: 2151, 3152: 2152,
+    3144: 2153, 3140: 2154, 3138: 2155, 3137: 2156, 3120: 2157, 3112: 2158,
+    3108: 2159, 3106: 2160, 3105: 2161, 3096: 2162, 3092: 2163, 3090: 2164,
+    3089: 2165, 3084: 2166, 3082: 2167, 3081: 2168, 3078: 2169, 3077: 2170,
+    3075: 2171, 2944: 2172, 2880: 2173, 2848: 2174, 2832: 2175, 2824: 2176,
+    2820: 2177, 2818: 2178, 2817: 2179, 2752: 2180, 2720: 2181, 2704: 2182,
+    2696: 2183, 2692: 2184, 2690: 2185, 2689: 2186, 2656: 2187, 2640: 2188,
+    2632: 2189, 2628: 2190, 2626: 2191, 2625: 2192, 2608: 2193, 2600: 2194,
+    2596: 2195, 2594: 2196, 2593: 2197, 2584: 2198, 2580: 2199, 2578: 2200,
+    2577: 2201, 2572: 2202, 2570: 2203, 2569: 2204, 2566: 2205, 2565: 2206,
+    2563: 2207, 2496: 2208, 2464: 2209, 2448: 2210, 2440: 2211, 2436: 2212,
+    2434: 2213, 2433: 2214, 2400: 2215, 2384: 2216, 2376: 2217, 2372: 2218,
+    2370: 2219, 2369: 2220, 2352: 2221, 2344: 2222, 2340: 2223, 2338: 2224,
+    2337: 2225, 2328: 2226, 2324: 2227, 2322: 2228, 2321: 2229, 2316: 2230,
+    2314: 2231, 2313: 2232, 2310: 2233, 2309: 2234, 2307: 2235, 2272: 2236,
+    2256: 2237, 2248: 2238, 2244: 2239, 2242: 2240, 2241: 2241, 2224: 2242,
+    2216: 2243, 2212: 2244, 2210: 2245, 2209: 2246, 2200: 2247, 2196: 2248,
+    2194: 2249, 2193: 2250, 2188: 2251, 2186: 2252, 2185: 2253, 2182: 2254,
+    2181: 2255, 2179: 2256, 2160: 2257, 2152: 2258, 2148: 2259, 2146: 2260,
+    2145: 2261, 2136: 2262, 2132: 2263, 2130: 2264, 2129: 2265, 2124: 2266,
+    2122: 2267, 2121: 2268, 2118: 2269, 2117: 2270, 2115: 2271, 2104: 2272,
+    2100: 2273, 2098: 2274, 2097: 2275, 2092: 2276, 2090: 2277, 2089: 2278,
+    2086: 2279, 2085: 2280, 2083: 2281, 2076: 2282, 2074: 2283, 2073: 2284,
+    2070: 2285, 2069: 2286, 2067: 2287, 2062: 2288, 2061: 2289, 2059: 2290,
+    2055: 2291, 1856: 2292, 1824: 2293, 1808: 2294, 1800: 2295, 1796: 2296,
+    1794: 2297, 1793: 2298, 1728: 2299, 1696: 2300, 1680: 2301, 1672: 2302,
+    1668: 2303, 1666: 2304, 1665: 2305, 1632: 2306, 1616: 2307, 1608: 2308,
+    1604: 2309, 1602: 2310, 1601: 2311, 1584: 2312, 1576: 2313, 1572: 2314,
+    1570: 2315, 1569: 2316, 1560: 2317, 1556: 2318, 1554: 2319, 1553: 2320,
+    1548: 2321, 1546: 2322, 1545: 2323, 1542: 2324, 1541: 2325, 1539: 2326,
+    1472: 2327, 1440: 2328, 1424: 2329, 1416: 2330, 1412: 2331, 1410: 2332,
+    1409: 2333, 1376: 2334, 1360: 2335, 1352: 2336, 1348: 2337, 1346: 2338,
+    1345: 2339, 1328: 2340, 1320: 2341, 1316: 2342, 1314: 2343, 1313: 2344,
+    1304: 2345, 1300: 2346, 1298: 2347, 1297: 2348, 1292: 2349, 1290: 2350,
+    1289: 2351, 1286: 2352, 1285: 2353, 1283: 2354, 1248: 2355, 1232: 2356,
+    1224: 2357, 1220: 2358, 1218: 2359, 1217: 2360, 1200: 2361, 1192: 2362,
+    1188: 2363, 1186: 2364, 1185: 2365, 1176: 2366, 1172: 2367, 1170: 2368,
+    1169: 2369, 1164: 2370, 1162: 2371, 1161: 2372, 1158: 2373, 1157: 2374,
+    1155: 2375, 1136: 2376, 1128: 2377, 1124: 2378, 1122: 2379, 1121: 2380,
+    1112: 2381, 1108: 2382, 1106: 2383, 1105: 2384, 1100: 2385, 1098: 2386,
+    1097: 2387, 1094: 2388, 1093: 2389, 1091: 2390, 1080: 2391, 1076: 2392,
+    1074: 2393, 1073: 2394, 1068: 2395, 1066: 2396, 1065: 2397, 1062: 2398,
+    1061: 2399, 1059: 2400, 1052: 2401, 1050: 2402, 1049: 2403, 1046: 2404,
+    1045: 2405, 1043: 2406, 1038: 2407, 1037: 2408, 1035: 2409, 1031: 2410,
+    928: 2411, 912: 2412, 904: 2413, 900: 2414, 898: 2415, 897: 2416,
+    864: 2417, 848: 2418, 840: 2419, 836: 2420, 834: 2421, 833: 2422,
+    816: 2423, 808: 2424, 804: 2425, 802: 2426, 801: 2427, 792: 2428,
+    788: 2429, 786: 2430, 785: 2431, 780: 2432, 778: 2433, 777: 2434,
+    774: 2435, 773: 2436, 771: 2437, 736: 2438, 720: 2439, 712: 2440,
+    708: 2441, 706: 2442, 705: 2443, 688: 2444, 680: 2445, 676: 2446,
+    674: 2447, 673: 2448, 664: 2449, 660: 2450, 658: 2451, 657: 2452,
+    652: 2453, 650: 2454, 649: 2455, 646: 2456, 645: 2457, 643: 2458,
+    624: 2459, 616: 2460, 612: 2461, 610: 2462, 609: 2463, 600: 2464,
+    596: 2465, 594: 2466, 593: 2467, 588: 2468, 586: 2469, 585: 2470,
+    582: 2471, 581: 2472, 579: 2473, 568: 2474, 564: 2475, 562: 2476,
+    561: 2477, 556: 2478, 554: 2479, 553: 2480, 550: 2481, 549: 2482,
+    547: 2483, 540: 2484, 538: 2485, 537: 2486, 534: 2487, 533: 2488,
+    531: 2489, 526: 2490, 525: 2491, 523: 2492, 519: 2493, 464: 2494,
+    456: 2495, 452: 2496, 450: 2497, 449: 2498, 432: 2499, 424: 2500,
+    420: 2501, 418: 2502, 417: 2503, 408: 2504, 404: 2505, 402: 2506,
+    401: 2507, 396: 2508, 394: 2509, 393: 2510, 390: 2511, 389: 2512,
+    387: 2513, 368: 2514, 360: 2515, 356: 2516, 354: 2517, 353: 2518,
+    344: 2519, 340: 2520, 338: 2521, 337: 2522, 332: 2523, 330: 2524,
+    329: 2525, 326: 2526, 325: 2527, 323: 2528, 312: 2529, 308: 2530,
+    306: 2531, 305: 2532, 300: 2533, 298: 2534, 297: 2535, 294: 2536,
+    293: 2537, 291: 2538, 284: 2539, 282: 2540, 281: 2541, 278: 2542,
+    277: 2543, 275: 2544, 270: 2545, 269: 2546, 267: 2547, 263: 2548,
+    232: 2549, 228: 2550, 226: 2551, 225: 2552, 216: 2553, 212: 2554,
+    210: 2555, 209: 2556, 204: 2557, 202: 2558, 201: 2559, 198: 2560,
+    197: 2561, 195: 2562, 184: 2563, 180: 2564, 178: 2565, 177: 2566,
+    172: 2567, 170: 2568, 169: 2569, 166: 2570, 165: 2571, 163: 2572,
+    156: 2573, 154: 2574, 153: 2575, 150: 2576, 149: 2577, 147: 2578,
+    142: 2579, 141: 2580, 139: 2581, 135: 2582, 116: 2583, 114: 2584,
+    113: 2585, 108: 2586, 106: 2587, 105: 2588, 102: 2589, 101: 2590, 99: 2591,
+    92: 2592, 90: 2593, 89: 2594, 86: 2595, 85: 2596, 83: 2597, 78: 2598,
+    77: 2599, 75: 2600, 71: 2601, 58: 2602, 57: 2603, 54: 2604, 53: 2605,
+    51: 2606, 46: 2607, 45: 2608, 43: 2609, 39: 2610, 29: 2611, 27: 2612,
+    23: 2613,
+}, 8192)
+
+
+FCP_UNSUITED_MODULUS: int = 46251
+FCP_UNSUITED_TABLE: array = _dense({
+    2825761: 1, 1874161: 2, 923521: 3, 707281: 4, 279841: 5, 130321: 6,
+    83521: 7, 28561: 8, 14641: 9, 2401: 10, 625: 11, 81: 12, 16: 13,
+    2550077: 25, 2136551: 26, 1998709: 27, 1585183: 28, 1309499: 29,
+    1171657: 30, 895973: 31, 758131: 32, 482447: 33, 344605: 34, 206763: 35,
+    137842: 36, 2076773: 37, 1570243: 38, 1468937: 39, 1165019: 40, 962407: 41,
+    861101: 42, 658489: 43, 557183: 44, 354571: 45, 253265: 46, 151959: 47,
+    101306: 48, 1221431: 49, 1102267: 50, 863939: 51, 685193: 52, 566029: 53,
+    506447: 54, 387283: 55, 327701: 56, 208537: 57, 148955: 58, 89373: 59,
+    59582: 60, 999949: 61, 902393: 62, 756059: 63, 560947: 64, 463391: 65,
+    414613: 66, 317057: 67, 268279: 68, 170723: 69, 121945: 70, 73167: 71,
+    48778: 72, 498847: 73, 450179: 74, 377177: 75, 352843: 76, 231173: 77,
+    206839: 78, 158171: 79, 133837: 80, 85169: 81, 60835: 82, 36501: 83,
+    24334: 84, 281219: 85, 253783: 86, 212629: 87, 198911: 88, 157757: 89,
+    116603: 90, 89167: 91, 75449: 92, 48013: 93, 34295: 94, 20577: 95,
+    13718: 96, 201433: 97, 181781: 98, 152303: 99, 142477: 100, 112999: 101,
+    93347: 102, 63869: 103, 54043: 104, 34391: 105, 24565: 106, 14739: 107,
+    9826: 108, 90077: 109, 81289: 110, 68107: 111, 63713: 112, 50531: 113,
+    41743: 114, 37349: 115, 24167: 116, 15379: 117, 10985: 118, 6591: 119,
+    4394: 120, 54571: 121, 49247: 122, 41261: 123, 38599: 124, 30613: 125,
+    25289: 126, 22627: 127, 17303: 128, 9317: 129, 6655: 130, 3993: 131,
+    2662: 132, 14063: 133, 12691: 134, 10633: 135, 9947: 136, 7889: 137,
+    6517: 138, 5831: 139, 4459: 140, 3773: 141, 1715: 142, 1029: 143, 686: 144,
+    5125: 145, 4625: 146, 3875: 147, 3625: 148, 2875: 149, 2375: 150,
+    2125: 151, 1625: 152, 1375: 153, 875: 154, 375: 155, 250: 156, 1107: 157,
+    999: 158, 837: 159, 783: 160, 621: 161, 513: 162, 459: 163, 351: 164,
+    297: 165, 189: 166, 135: 167, 54: 168, 328: 169, 296: 170, 248: 171,
+    232: 172, 184: 173, 152: 174, 136: 175, 104: 176, 88: 177, 56: 178,
+    40: 179, 24: 180, 2301289: 896, 1615441: 897, 1413721: 898, 889249: 899,
+    606841: 900, 485809: 901, 284089: 902, 203401: 903, 82369: 904, 42025: 905,
+    15129: 906, 6724: 907, 1315609: 908, 1151329: 909, 724201: 910,
+    494209: 911, 395641: 912, 231361: 913, 165649: 914, 67081: 915, 34225: 916,
+    12321: 917, 5476: 918, 808201: 919, 508369: 920, 346921: 921, 277729: 922,
+    162409: 923, 116281: 924, 47089: 925, 24025: 926, 8649: 927, 3844: 928,
+    444889: 929, 303601: 930, 243049: 931, 142129: 932, 101761: 933,
+    41209: 934, 21025: 935, 7569: 936, 3364: 937, 190969: 938, 152881: 939,
+    89401: 940, 64009: 941, 25921: 942, 13225: 943, 4761: 944, 2116: 945,
+    104329: 946, 61009: 947, 43681: 948, 17689: 949, 9025: 950, 3249: 951,
+    1444: 952, 48841: 953, 34969: 954, 14161: 955, 7225: 956, 2601: 957,
+    1156: 958, 20449: 959, 8281: 960, 4225: 961, 1521: 962, 676: 963,
+    5929: 964, 3025: 965, 1089: 966, 484: 967, 1225: 968, 441: 969, 196: 970,
+    225: 971, 100: 972, 36: 973, 1928107: 1052, 1803713: 1053, 1430531: 1054,
+    1181743: 1055, 1057349: 1056, 808561: 1057, 684167: 1058, 435379: 1059,
+    310985: 1060, 186591: 1061, 124394: 1062, 1511219: 1063, 1198553: 1064,
+    990109: 1065, 885887: 1066, 677443: 1067, 573221: 1068, 364777: 1069,
+    260555: 1070, 156333: 1071, 104222: 1072, 1121227: 1073, 926231: 1074,
+    828733: 1075, 633737: 1076, 536239: 1077, 341243: 1078, 243745: 1079,
+    146247: 1080, 97498: 1081, 734597: 1082, 657271: 1083, 502619: 1084,
+    425293: 1085, 270641: 1086, 193315: 1087, 115989: 1088, 77326: 1089,
+    542963: 1090, 415207: 1091, 351329: 1092, 223573: 1093, 159695: 1094,
+    95817: 1095, 63878: 1096, 371501: 1097, 314347: 1098, 200039: 1099,
+    142885: 1100, 85731: 1101, 57154: 1102, 240383: 1103, 152971: 1104,
+    109265: 1105, 65559: 1106, 43706: 1107, 129437: 1108, 92455: 1109,
+    55473: 1110, 36982: 1111, 58835: 1112, 35301: 1113, 23534: 1114,
+    25215: 1115, 16810: 1116, 10086: 1117, 1739999: 1118, 1627741: 1119,
+    1290967: 1120, 1066451: 1121, 954193: 1122, 729677: 1123, 617419: 1124,
+    392903: 1125, 280645: 1126, 168387: 1127, 112258: 1128, 1230731: 1129,
+    976097: 1130, 806341: 1131, 721463: 1132, 551707: 1133, 466829: 1134,
+    297073: 1135, 212195: 1136, 127317: 1137, 84878: 1138, 913123: 1139,
+    754319: 1140, 674917: 1141, 516113: 1142, 436711: 1143, 277907: 1144,
+    198505: 1145, 119103: 1146, 79402: 1147, 598253: 1148, 535279: 1149,
+    409331: 1150, 346357: 1151, 220409: 1152, 157435: 1153, 94461: 1154,
+    62974: 1155, 442187: 1156, 338143: 1157, 286121: 1158, 182077: 1159,
+    130055: 1160, 78033: 1161, 52022: 1162, 302549: 1163, 256003: 1164,
+    162911: 1165, 116365: 1166, 69819: 1167, 46546: 1168, 195767: 1169,
+    124579: 1170, 88985: 1171, 53391: 1172, 35594: 1173, 105413: 1174,
+    75295: 1175, 45177: 1176, 30118: 1177, 47915: 1178, 28749: 1179,
+    19166: 1180, 20535: 1181, 13690: 1182, 8214: 1183, 1457837: 1184,
+    1142629: 1185, 906223: 1186, 748619: 1187, 669817: 1188, 512213: 1189,
+    433411: 1190, 275807: 1191, 197005: 1192, 118203: 1193, 78802: 1194,
+    1031153: 1195, 817811: 1196, 675583: 1197, 604469: 1198, 462241: 1199,
+    391127: 1200, 248899: 1201, 177785: 1202, 106671: 1203, 71114: 1204,
+    640987: 1205, 529511: 1206, 473773: 1207, 362297: 1208, 306559: 1209,
+    195083: 1210, 139345: 1211, 83607: 1212, 55738: 1213, 419957: 1214,
+    375751: 1215, 287339: 1216, 243133: 1217, 154721: 1218, 110515: 1219,
+    66309: 1220, 44206: 1221, 310403: 1222, 237367: 1223, 200849: 1224,
+    127813: 1225, 91295: 1226, 54777: 1227, 36518: 1228, 212381: 1229,
+    179707: 1230, 114359: 1231, 81685: 1232, 49011: 1233, 32674: 1234,
+    137423: 1235, 87451: 1236, 62465: 1237, 37479: 1238, 24986: 1239,
+    73997: 1240, 52855: 1241, 31713: 1242, 21142: 1243, 33635: 1244,
+    20181: 1245, 13454: 1246, 14415: 1247, 9610: 1248, 5766: 1249,
+    1275797: 1250, 1068911: 1251, 793063: 1252, 655139: 1253, 586177: 1254,
+    448253: 1255, 379291: 1256, 241367: 1257, 172405: 1258, 103443: 1259,
+    68962: 1260, 964627: 1261, 715691: 1262, 591223: 1263, 528989: 1264,
+    404521: 1265, 342287: 1266, 217819: 1267, 155585: 1268, 93351: 1269,
+    62234: 1270, 599633: 1271, 495349: 1272, 443207: 1273, 338923: 1274,
+    286781: 1275, 182497: 1276, 130355: 1277, 78213: 1278, 52142: 1279,
+    367517: 1280, 328831: 1281, 251459: 1282, 212773: 1283, 135401: 1284,
+    96715: 1285, 58029: 1286, 38686: 1287, 271643: 1288, 207727: 1289,
+    175769: 1290, 111853: 1291, 79895: 1292, 47937: 1293, 31958: 1294,
+    185861: 1295, 157267: 1296, 100079: 1297, 71485: 1298, 42891: 1299,
+    28594: 1300, 120263: 1301, 76531: 1302, 54665: 1303, 32799: 1304,
+    21866: 1305, 64757: 1306, 46255: 1307, 27753: 1308, 18502: 1309,
+    29435: 1310, 17661: 1311, 11774: 1312, 12615: 1313, 8410: 1314, 5046: 1315,
+    802493: 1316, 672359: 1317, 628981: 1318, 412091: 1319, 368713: 1320,
+    281957: 1321, 238579: 1322, 151823: 1323, 108445: 1324, 65067: 1325,
+    43378: 1326, 606763: 1327, 567617: 1328, 371887: 1329, 332741: 1330,
+    254449: 1331, 215303: 1332, 137011: 1333, 97865: 1334, 58719: 1335,
+    39146: 1336, 475571: 1337, 311581: 1338, 278783: 1339, 213187: 1340,
+    180389: 1341, 114793: 1342, 81995: 1343, 49197: 1344, 32798: 1345,
+    291479: 1346, 260797: 1347, 199433: 1348, 168751: 1349, 107387: 1350,
+    76705: 1351, 46023: 1352, 30682: 1353, 170867: 1354, 130663: 1355,
+    110561: 1356, 70357: 1357, 50255: 1358, 30153: 1359, 20102: 1360,
+    116909: 1361, 98923: 1362, 62951: 1363, 44965: 1364, 26979: 1365,
+    17986: 1366, 75647: 1367, 48139: 1368, 34385: 1369, 20631: 1370,
+    13754: 1371, 40733: 1372, 29095: 1373, 17457: 1374, 11638: 1375,
+    18515: 1376, 11109: 1377, 7406: 1378, 7935: 1379, 5290: 1380, 3174: 1381,
+    547637: 1382, 458831: 1383, 429229: 1384, 340423: 1385, 251617: 1386,
+    192413: 1387, 162811: 1388, 103607: 1389, 74005: 1390, 44403: 1391,
+    29602: 1392, 414067: 1393, 387353: 1394, 307211: 1395, 227069: 1396,
+    173641: 1397, 146927: 1398, 93499: 1399, 66785: 1400, 40071: 1401,
+    26714: 1402, 324539: 1403, 257393: 1404, 190247: 1405, 145483: 1406,
+    123101: 1407, 78337: 1408, 55955: 1409, 33573: 1410, 22382: 1411,
+    240787: 1412, 177973: 1413, 136097: 1414, 115159: 1415, 73283: 1416,
+    52345: 1417, 31407: 1418, 20938: 1419, 141151: 1420, 107939: 1421,
+    91333: 1422, 58121: 1423, 41515: 1424, 24909: 1425, 16606: 1426,
+    79781: 1427, 67507: 1428, 42959: 1429, 30685: 1430, 18411: 1431,
+    12274: 1432, 51623: 1433, 32851: 1434, 23465: 1435, 14079: 1436,
+    9386: 1437, 27797: 1438, 19855: 1439, 11913: 1440, 7942: 1441, 12635: 1442,
+    7581: 1443, 5054: 1444, 5415: 1445, 3610: 1446, 2166: 1447, 438413: 1448,
+    367319: 1449, 343621: 1450, 272527: 1451, 225131: 1452, 154037: 1453,
+    130339: 1454, 82943: 1455, 59245: 1456, 35547: 1457, 23698: 1458,
+    331483: 1459, 310097: 1460, 245939: 1461, 203167: 1462, 139009: 1463,
+    117623: 1464, 74851: 1465, 53465: 1466, 32079: 1467, 21386: 1468,
+    259811: 1469, 206057: 1470, 170221: 1471, 116467: 1472, 98549: 1473,
+    62713: 1474, 44795: 1475, 26877: 1476, 17918: 1477, 192763: 1478,
+    159239: 1479, 108953: 1480, 92191: 1481, 58667: 1482, 41905: 1483,
+    25143: 1484, 16762: 1485, 126293: 1486, 86411: 1487, 73117: 1488,
+    46529: 1489, 33235: 1490, 19941: 1491, 13294: 1492, 71383: 1493,
+    60401: 1494, 38437: 1495, 27455: 1496, 16473: 1497, 10982: 1498,
+    41327: 1499, 26299: 1500, 18785: 1501, 11271: 1502, 7514: 1503,
+    22253: 1504, 15895: 1505, 9537: 1506, 6358: 1507, 10115: 1508, 6069: 1509,
+    4046: 1510, 4335: 1511, 2890: 1512, 1734: 1513, 256373: 1514, 214799: 1515,
+    200941: 1516, 159367: 1517, 131651: 1518, 117793: 1519, 76219: 1520,
+    48503: 1521, 34645: 1522, 20787: 1523, 13858: 1524, 193843: 1525,
+    181337: 1526, 143819: 1527, 118807: 1528, 106301: 1529, 68783: 1530,
+    43771: 1531, 31265: 1532, 18759: 1533, 12506: 1534, 151931: 1535,
+    120497: 1536, 99541: 1537, 89063: 1538, 57629: 1539, 36673: 1540,
+    26195: 1541, 15717: 1542, 10478: 1543, 112723: 1544, 93119: 1545,
+    83317: 1546, 53911: 1547, 34307: 1548, 24505: 1549, 14703: 1550,
+    9802: 1551, 73853: 1552, 66079: 1553, 42757: 1554, 27209: 1555,
+    19435: 1556, 11661: 1557, 7774: 1558, 54587: 1559, 35321: 1560,
+    22477: 1561, 16055: 1562, 9633: 1563, 6422: 1564, 31603: 1565, 20111: 1566,
+    14365: 1567, 8619: 1568, 5746: 1569, 13013: 1570, 9295: 1571, 5577: 1572,
+    3718: 1573, 5915: 1574, 3549: 1575, 2366: 1576, 2535: 1577, 1690: 1578,
+    1014: 1579, 183557: 1580, 153791: 1581, 143869: 1582, 114103: 1583,
+    94259: 1584, 84337: 1585, 64493: 1586, 34727: 1587, 24805: 1588,
+    14883: 1589, 9922: 1590, 138787: 1591, 129833: 1592, 102971: 1593,
+    85063: 1594, 76109: 1595, 58201: 1596, 31339: 1597, 22385: 1598,
+    13431: 1599, 8954: 1600, 108779: 1601, 86273: 1602, 71269: 1603,
+    63767: 1604, 48763: 1605, 26257: 1606, 18755: 1607, 11253: 1608,
+    7502: 1609, 80707: 1610, 66671: 1611, 59653: 1612, 45617: 1613,
+    24563: 1614, 17545: 1615, 10527: 1616, 7018: 1617, 52877: 1618,
+    47311: 1619, 36179: 1620, 19481: 1621, 13915: 1622, 8349: 1623, 5566: 1624,
+    39083: 1625, 29887: 1626, 16093: 1627, 11495: 1628, 6897: 1629, 4598: 1630,
+    26741: 1631, 14399: 1632, 10285: 1633, 6171: 1634, 4114: 1635, 11011: 1636,
+    7865: 1637, 4719: 1638, 3146: 1639, 4235: 1640, 2541: 1641, 1694: 1642,
+    1815: 1643, 1210: 1644, 726: 1645, 74333: 1646, 62279: 1647, 58261: 1648,
+    46207: 1649, 38171: 1650, 34153: 1651, 26117: 1652, 22099: 1653,
+    10045: 1654, 6027: 1655, 4018: 1656, 56203: 1657, 52577: 1658, 41699: 1659,
+    34447: 1660, 30821: 1661, 23569: 1662, 19943: 1663, 9065: 1664, 5439: 1665,
+    3626: 1666, 44051: 1667, 34937: 1668, 28861: 1669, 25823: 1670,
+    19747: 1671, 16709: 1672, 7595: 1673, 4557: 1674, 3038: 1675, 32683: 1676,
+    26999: 1677, 24157: 1678, 18473: 1679, 15631: 1680, 7105: 1681, 4263: 1682,
+    2842: 1683, 21413: 1684, 19159: 1685, 14651: 1686, 12397: 1687, 5635: 1688,
+    3381: 1689, 2254: 1690, 15827: 1691, 12103: 1692, 10241: 1693, 4655: 1694,
+    2793: 1695, 1862: 1696, 10829: 1697, 9163: 1698, 4165: 1699, 2499: 1700,
+    1666: 1701, 7007: 1702, 3185: 1703, 1911: 1704, 1274: 1705, 2695: 1706,
+    1617: 1707, 1078: 1708, 735: 1709, 490: 1710, 294: 1711, 37925: 1712,
+    31775: 1713, 29725: 1714, 23575: 1715, 19475: 1716, 17425: 1717,
+    13325: 1718, 11275: 1719, 7175: 1720, 3075: 1721, 2050: 1722, 28675: 1723,
+    26825: 1724, 21275: 1725, 17575: 1726, 15725: 1727, 12025: 1728,
+    10175: 1729, 6475: 1730, 2775: 1731, 1850: 1732, 22475: 1733, 17825: 1734,
+    14725: 1735, 13175: 1736, 10075: 1737, 8525: 1738, 5425: 1739, 2325: 1740,
+    1550: 1741, 16675: 1742, 13775: 1743, 12325: 1744, 9425: 1745, 7975: 1746,
+    5075: 1747, 2175: 1748, 1450: 1749, 10925: 1750, 9775: 1751, 7475: 1752,
+    6325: 1753, 4025: 1754, 1725: 1755, 1150: 1756, 8075: 1757, 6175: 1758,
+    5225: 1759, 3325: 1760, 1425: 1761, 950: 1762, 5525: 1763, 4675: 1764,
+    2975: 1765, 1275: 1766, 850: 1767, 3575: 1768, 2275: 1769, 975: 1770,
+    650: 1771, 1925: 1772, 825: 1773, 550: 1774, 525: 1775, 350: 1776,
+    150: 1777, 13653: 1778, 11439: 1779, 10701: 1780, 8487: 1781, 7011: 1782,
+    6273: 1783, 4797: 1784, 4059: 1785, 2583: 1786, 1845: 1787, 738: 1788,
+    10323: 1789, 9657: 1790, 7659: 1791, 6327: 1792, 5661: 1793, 4329: 1794,
+    3663: 1795, 2331: 1796, 1665: 1797, 666: 1798, 8091: 1799, 6417: 1800,
+    5301: 1801, 4743: 1802, 3627: 1803, 3069: 1804, 1953: 1805, 1395: 1806,
+    558: 1807, 6003: 1808, 4959: 1809, 4437: 1810, 3393: 1811, 2871: 1812,
+    1827: 1813, 1305: 1814, 522: 1815, 3933: 1816, 3519: 1817, 2691: 1818,
+    2277: 1819, 1449: 1820, 1035: 1821, 414: 1822, 2907: 1823, 2223: 1824,
+    1881: 1825, 1197: 1826, 855: 1827, 342: 1828, 1989: 1829, 1683: 1830,
+    1071: 1831, 765: 1832, 306: 1833, 1287: 1834, 819: 1835, 585: 1836,
+    234: 1837, 693: 1838, 495: 1839, 198: 1840, 315: 1841, 126: 1842, 90: 1843,
+    6068: 1844, 5084: 1845, 4756: 1846, 3772: 1847, 3116: 1848, 2788: 1849,
+    2132: 1850, 1804: 1851, 1148: 1852, 820: 1853, 492: 1854, 4588: 1855,
+    4292: 1856, 3404: 1857, 2812: 1858, 2516: 1859, 1924: 1860, 1628: 1861,
+    1036: 1862, 740: 1863, 444: 1864, 3596: 1865, 2852: 1866, 2356: 1867,
+    2108: 1868, 1612: 1869, 1364: 1870, 868: 1871, 620: 1872, 372: 1873,
+    2668: 1874, 2204: 1875, 1972: 1876, 1508: 1877, 1276: 1878, 812: 1879,
+    580: 1880, 348: 1881, 1748: 1882, 1564: 1883, 1196: 1884, 1012: 1885,
+    644: 1886, 460: 1887, 276: 1888, 1292: 1889, 988: 1890, 836: 1891,
+    532: 1892, 380: 1893, 228: 1894, 884: 1895, 748: 1896, 476: 1897,
+    340: 1898, 204: 1899, 572: 1900, 364: 1901, 260: 1902, 156: 1903,
+    308: 1904, 220: 1905, 132: 1906, 140: 1907, 84: 1908, 60: 1909,
+}, FCP_UNSUITED_MODULUS)
+
+
+TCP_FLUSH_TABLE: array = _dense({
+    7168: 1, 3584: 2, 1792: 3, 896: 4, 448: 5, 224: 6, 112: 7, 56: 8, 28: 9,
+    14: 10, 7: 11, 4099: 12, 6656: 38, 6400: 39, 6272: 40, 6208: 41, 6176: 42,
+    6160: 43, 6152: 44, 6148: 45, 6146: 46, 6145: 47, 5632: 48, 5376: 49,
+    5248: 50, 5184: 51, 5152: 52, 5136: 53, 5128: 54, 5124: 55, 5122: 56,
+    5121: 57, 4864: 58, 4736: 59, 4672: 60, 4640: 61, 4624: 62, 4616: 63,
+    4612: 64, 4610: 65, 4609: 66, 4480: 67, 4416: 68, 4384: 69, 4368: 70,
+    4360: 71, 4356: 72, 4354: 73, 4353: 74, 4288: 75, 4256: 76, 4240: 77,
+    4232: 78, 4228: 79, 4226: 80, 4225: 81, 4192: 82, 4176: 83, 4168: 84,
+    4164: 85, 4162: 86, 4161: 87, 4144: 88, 4136: 89, 4132: 90, 4130: 91,
+    4129: 92, 4120: 93, 4116: 94, 4114: 95, 4113: 96, 4108: 97, 4106: 98,
+    4105: 99, 4102: 100, 4101: 101, 3328: 102, 3200: 103, 3136: 104, 3104: 105,
+    3088: 106, 3080: 107, 3076: 108, 3074: 109, 3073: 110, 2816: 111,
+    2688: 112, 2624: 113, 2592: 114, 2576: 115, 2568: 116, 2564: 117,
+    2562: 118, 2561: 119, 2432: 120, 2368: 121, 2336: 122, 2320: 123,
+    2312: 124, 2308: 125, 2306: 126, 2305: 127, 2240: 128, 2208: 129,
+    2192: 130, 2184: 131, 2180: 132, 2178: 133, 2177: 134, 2144: 135,
+    2128: 136, 2120: 137, 2116: 138, 2114: 139, 2113: 140, 2096: 141,
+    2088: 142, 2084: 143, 2082: 144, 2081: 145, 2072: 146, 2068: 147,
+    2066: 148, 2065: 149, 2060: 150, 2058: 151, 2057: 152, 2054: 153,
+    2053: 154, 2051: 155, 1664: 156, 1600: 157, 1568: 158, 1552: 159,
+    1544: 160, 1540: 161, 1538: 162, 1537: 163, 1408: 164, 1344: 165,
+    1312: 166, 1296: 167, 1288: 168, 1284: 169, 1282: 170, 1281: 171,
+    1216: 172, 1184: 173, 1168: 174, 1160: 175, 1156: 176, 1154: 177,
+    1153: 178, 1120: 179, 1104: 180, 1096: 181, 1092: 182, 1090: 183,
+    1089: 184, 1072: 185, 1064: 186, 1060: 187, 1058: 188, 1057: 189,
+    1048: 190, 1044: 191, 1042: 192, 1041: 193, 1036: 194, 1034: 195,
+    1033: 196, 1030: 197, 1029: 198, 1027: 199, 832: 200, 800: 201, 784: 202,
+    776: 203, 772: 204, 770: 205, 769: 206, 704: 207, 672: 208, 656: 209,
+    648: 210, 644: 211, 642: 212, 641: 213, 608: 214, 592: 215, 584: 216,
+    580: 217, 578: 218, 577: 219, 560: 220, 552: 221, 548: 222, 546: 223,
+    545: 224, 536: 225, 532: 226, 530: 227, 529: 228, 524: 229, 522: 230,
+    521: 231, 518: 232, 517: 233, 515: 234, 416: 235, 400: 236, 392: 237,
+    388: 238, 386: 239, 385: 240, 352: 241, 336: 242, 328: 243, 324: 244,
+    322: 245, 321: 246, 304: 247, 296: 248, 292: 249, 290: 250, 289: 251,
+    280: 252, 276: 253, 274: 254, 273: 255, 268: 256, 266: 257, 265: 258,
+    262: 259, 261: 260, 259: 261, 208: 262, 200: 263, 196: 264, 194: 265,
+    193: 266, 176: 267, 168: 268, 164: 269, 162: 270, 161: 271, 152: 272,
+    148: 273, 146: 274, 145: 275, 140: 276, 138: 277, 137: 278, 134: 279,
+    133: 280, 131: 281, 104: 282, 100: 283, 98: 284, 97: 285, 88: 286, 84: 287,
+    82: 288, 81: 289, 76: 290, 74: 291, 73: 292, 70: 293, 69: 294, 67: 295,
+    52: 296, 50: 297, 49: 298, 44: 299, 42: 300, 41: 301, 38: 302, 37: 303,
+    35: 304, 26: 305, 25: 306, 22: 307, 21: 308, 19: 309, 13: 310, 11: 311,
+}, 8192)
+
+
+TCP_UNIQUE_TABLE: array = _dense({
+    7168: 26, 3584: 27, 1792: 28, 896: 29, 448: 30, 224: 31, 112: 32, 56: 33,
+    28: 34, 14: 35, 7: 36, 4099: 37, 6656: 468, 6400: 469, 6272: 470,
+    6208: 471, 6176: 472, 6160: 473, 6152: 474, 6148: 475, 6146: 476,
+    6145: 477, 5632: 478, 5376: 479, 5248: 480, 5184: 481, 5152: 482,
+    5136: 483, 5128: 484, 5124: 485, 5122: 486, 5121: 487, 4864: 488,
+    4736: 489, 4672: 490, 4640: 491, 4624: 492, 4616: 493, 4612: 494,
+    4610: 495, 4609: 496, 4480: 497, 4416: 498, 4384: 499, 4368: 500,
+    4360: 501, 4356: 502, 4354: 503, 4353: 504, 4288: 505, 4256: 506,
+    4240: 507, 4232: 508, 4228: 509, 4226: 510, 4225: 511, 4192: 512,
+    4176: 513, 4168: 514, 4164: 515, 4162: 516, 4161: 517, 4144: 518,
+    4136: 519, 4132: 520, 4130: 521, 4129: 522, 4120: 523, 4116: 524,
+    4114: 525, 4113: 526, 4108: 527, 4106: 528, 4105: 529, 4102: 530,
+    4101: 531, 3328: 532, 3200: 533, 3136: 534, 3104: 535, 3088: 536,
+    3080: 537, 3076: 538, 3074: 539, 3073: 540, 2816: 541, 2688: 542,
+    2624: 543, 2592: 544, 2576: 545, 2568: 546, 2564: 547, 2562: 548,
+    2561: 549, 2432: 550, 2368: 551, 2336: 552, 2320: 553, 2312: 554,
+    2308: 555, 2306: 556, 2305: 557, 2240: 558, 2208: 559, 2192: 560,
+    2184: 561, 2180: 562, 2178: 563, 2177: 564, 2144: 565, 2128: 566,
+    2120: 567, 2116: 568, 2114: 569, 2113: 570, 2096: 571, 2088: 572,
+    2084: 573, 2082: 574, 2081: 575, 2072: 576, 2068: 577, 2066: 578,
+    2065: 579, 2060: 580, 2058: 581, 2057: 582, 2054: 583, 2053: 584,
+    2051: 585, 1664: 586, 1600: 587, 1568: 588, 1552: 589, 1544: 590,
+    1540: 591, 1538: 592, 1537: 593, 1408: 594, 1344: 595, 1312: 596,
+    1296: 597, 1288: 598, 1284: 599, 1282: 600, 1281: 601, 1216: 602,
+    1184: 603, 1168: 604, 1160: 605, 1156: 606, 1154: 607, 1153: 608,
+    1120: 609, 1104: 610, 1096: 611, 1092: 612, 1090: 613, 1089: 614,
+    1072: 615, 1064: 616, 1060: 617, 1058: 618, 1057: 619, 1048: 620,
+    1044: 621, 1042: 622, 1041: 623, 1036: 624, 1034: 625, 1033: 626,
+    1030: 627, 1029: 628, 1027: 629, 832: 630, 800: 631, 784: 632, 776: 633,
+    772: 634, 770: 635, 769: 636, 704: 637, 672: 638, 656: 639, 648: 640,
+    644: 641, 642: 642, 641: 643, 608: 644, 592: 645, 584: 646, 580: 647,
+    578: 648, 577: 649, 560: 650, 552: 651, 548: 652, 546: 653, 545: 654,
+    536: 655, 532: 656, 530: 657, 529: 658, 524: 659, 522: 660, 521: 661,
+    518: 662, 517: 663, 515: 664, 416: 665, 400: 666, 392: 667, 388: 668,
+    386: 669, 385: 670, 352: 671, 336: 672, 328: 673, 324: 674, 322: 675,
+    321: 676, 304: 677, 296: 678, 292: 679, 290: 680, 289: 681, 280: 682,
+    276: 683, 274: 684, 273: 685, 268: 686, 266: 687, 265: 688, 262: 689,
+    261: 690, 259: 691, 208: 692, 200: 693, 196: 694, 194: 695, 193: 696,
+    176: 697, 168: 698, 164: 699, 162: 700, 161: 701, 152: 702, 148: 703,
+    146: 704, 145: 705, 140: 706, 138: 707, 137: 708, 134: 709, 133: 710,
+    131: 711, 104: 712, 100: 713, 98: 714, 97: 715, 88: 716, 84: 717, 82: 718,
+    81: 719, 76: 720, 74: 721, 73: 722, 70: 723, 69: 724, 67: 725, 52: 726,
+    50: 727, 49: 728, 44: 729, 42: 730, 41: 731, 38: 732, 37: 733, 35: 734,
+    26: 735, 25: 736, 22: 737, 21: 738, 19: 739, 13: 740, 11: 741,
+}, 8192)
+
+
+TCP_UNSUITED_MODULUS: int = 1943
+TCP_UNSUITED_TABLE: array = _dense({
+    68921: 13, 50653: 14, 29791: 15, 24389: 16, 12167: 17, 6859: 18, 4913: 19,
+    2197: 20, 1331: 21, 343: 22, 125: 23, 27: 24, 8: 25, 62197: 312,
+    52111: 313, 48749: 314, 38663: 315, 31939: 316, 28577: 317, 21853: 318,
+    18491: 319, 11767: 320, 8405: 321, 5043: 322, 3362: 323, 56129: 324,
+    42439: 325, 39701: 326, 31487: 327, 26011: 328, 23273: 329, 17797: 330,
+    15059: 331, 9583: 332, 6845: 333, 4107: 334, 2738: 335, 39401: 336,
+    35557: 337, 27869: 338, 22103: 339, 18259: 340, 16337: 341, 12493: 342,
+    10571: 343, 6727: 344, 4805: 345, 2883: 346, 1922: 347, 34481: 348,
+    31117: 349, 26071: 350, 19343: 351, 15979: 352, 14297: 353, 10933: 354,
+    9251: 355, 5887: 356, 4205: 357, 2523: 358, 1682: 359, 21689: 360,
+    19573: 361, 16399: 362, 15341: 363, 10051: 364, 8993: 365, 6877: 366,
+    5819: 367, 3703: 368, 2645: 369, 1587: 370, 1058: 371, 14801: 372,
+    13357: 373, 11191: 374, 10469: 375, 8303: 376, 6137: 377, 4693: 378,
+    3971: 379, 2527: 380, 1805: 381, 1083: 382, 722: 383, 11849: 384,
+    10693: 385, 8959: 386, 8381: 387, 6647: 388, 5491: 389, 3757: 390,
+    3179: 391, 2023: 392, 1445: 393, 867: 394, 578: 395, 6929: 396, 6253: 397,
+    5239: 398, 4901: 399, 3887: 400, 3211: 401, 2873: 402, 1859: 403,
+    1183: 404, 845: 405, 507: 406, 338: 407, 4961: 408, 4477: 409, 3751: 410,
+    3509: 411, 2783: 412, 2299: 413, 2057: 414, 1573: 415, 847: 416, 605: 417,
+    363: 418, 242: 419, 2009: 420, 1813: 421, 1519: 422, 1421: 423, 1127: 424,
+    931: 425, 833: 426, 637: 427, 539: 428, 245: 429, 147: 430, 98: 431,
+    1025: 432, 925: 433, 775: 434, 725: 435, 575: 436, 475: 437, 425: 438,
+    325: 439, 275: 440, 175: 441, 75: 442, 50: 443, 369: 444, 333: 445,
+    279: 446, 261: 447, 207: 448, 171: 449, 153: 450, 117: 451, 99: 452,
+    63: 453, 45: 454, 18: 455, 164: 456, 148: 457, 124: 458, 116: 459, 92: 460,
+    76: 461, 68: 462, 52: 463, 44: 464, 28: 465, 20: 466, 12: 467,
+}, TCP_UNSUITED_MODULUS)
@@ -1,19 +1,50 @@
 """
-Treys: A pure Python poker hand evaluation library
+Treys: A Python poker hand evaluation library, with an optional C extension
 """
 
-from setuptools import setup, find_packages
+import os
+import sys
+
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class build_py_with_tables(build_py):
+    """
+    Regenerates the precomputed lookup tables in quads/_tables.py and
+    quads/_ceval_tables.h before the package is built, see
+    tools/gen_tables.py
+    """
+
+    def run(self) -> None:
+        root = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, os.path.join(root, 'tools'))
+        from gen_tables import write_c_tables, write_tables
+
+        write_tables(os.path.join(root, 'quads', '_tables.py'))
+        write_c_tables(os.path.join(root, 'quads', '_ceval_tables.h'))
+        super().run()
 
 
 setup(
     name='quads',
     version='0.1.8',
-    description='Quads is a pure Python poker hand evaluation library',
+    description='Quads is a Python poker hand evaluation library, with an optional C extension',
     long_description=open('README.rst').read(),
     author='Will Drevo, Mark Saindon, Imran Hendley, Enkhist',
     url='https://github.com/enkhist/quads',
     license='MIT',
     packages=find_packages(include=['quads', 'quads.*']),
+    cmdclass={'build_py': build_py_with_tables},
+    # without a compiler the build skips it and everything runs in Python
+    ext_modules=[
+        Extension('quads._ceval', ['quads/_ceval.c'],
+                  depends=['quads/_ceval_tables.h'], optional=True),
+    ],
+    extras_require={
+        'batch': ['numpy'],
+        'jit': ['numba', 'numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -0,0 +1,164 @@
+"""
+Checks that every implementation of the Five ranking agrees: the pure
+Python Evaluator, the C extension in quads/_ceval.c, the numba kernels in
+quads/Five/_jit.py and the NumPy batch in quads/Five/_batch.py. The ones
+not built or installed are skipped.
+
+Every 5 card hand is ranked, then random and flush heavy 6 and 7 card
+hands against the best of their 5 card subsets, then hands holding 5 cards
+of one rank, which rank 0 everywhere. Run from the repository root after
+changing a kernel or a lookup table:
+
+    $ python tools/check_kernels.py
+
+Build the C extension with CFLAGS=-U__SSE2__ to check its scalar path too.
+"""
+import itertools
+import os
+import random
+import sys
+from typing import Callable, Iterable, Iterator, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quads.card import Card  # noqa: E402
+from quads.Five.evaluator import Evaluator, _load_jit  # noqa: E402
+
+try:
+    from quads import _ceval
+except ImportError:
+    _ceval = None
+
+try:
+    import numpy as np
+    from quads.Five import _batch
+except ImportError:
+    np = None
+
+
+DECK = [Card.new(rank + suit) for rank in Card.STR_RANKS for suit in 'shdc']
+
+# random hands of each size, and as many drawn from 2 suits only, most of
+# which hold 5 or more cards of one suit
+SAMPLES = 20000
+CHUNK = 100000
+
+Ranker = Callable[[list[tuple[int, ...]]], list[int]]
+
+
+def rankers(size: int) -> list[tuple[str, Ranker]]:
+    """
+    Every available implementation ranking a list of hands of size cards
+    """
+    evaluator = Evaluator()
+    found: list[tuple[str, Ranker]] = []
+    if size == 5:
+        found.append(("python _rank5", lambda hands: [evaluator._rank5(*h) for h in hands]))
+    else:
+        found.append(("python _evaluate_pool",
+                      lambda hands: [evaluator._evaluate_pool(h) for h in hands]))
+
+    if _ceval is not None:
+        found.append(("C eval7", lambda hands: [_ceval.eval7(h) for h in hands]))
+        found.append(("C eval_cards", lambda hands: [_ceval.eval_cards(*h) for h in hands]))
+        if size == 5:
+            found.append(("C eval5", lambda hands: [_ceval.eval5(*h) for h in hands]))
+
+    if np is not None:
+        jit = _load_jit()
+        if jit is not None:
+            found.append(("numba evaluate_batch", lambda hands: jit.evaluate_batch(
+                np.array(hands, dtype=np.uint32)).tolist()))
+        found.append(("numpy evaluate_batch", lambda hands: _batch.evaluate_batch(
+            np.array(hands, dtype=np.uint32)).tolist()))
+    return found
+
+
+def best_subset(evaluator: Evaluator, hand: Sequence[int]) -> int:
+    """
+    The rank of a hand as the best of its 5 card subsets, which takes no
+    shortcut for flushes
+    """
+    return min(evaluator._rank5(*sub) for sub in itertools.combinations(hand, 5))
+
+
+def chunks(hands: Iterable[tuple[int, ...]]) -> Iterator[list[tuple[int, ...]]]:
+    """
+    Splits hands into lists of at most CHUNK
+    """
+    hands = iter(hands)
+    while True:
+        chunk = list(itertools.islice(hands, CHUNK))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check(title: str, size: int, hands: Iterable[tuple[int, ...]],
+          expected: Callable[[tuple[int, ...]], int]) -> bool:
+    """
+    Ranks hands of size cards with every implementation against expected,
+    printing the first mismatches of each
+    """
+    found = rankers(size)
+    mismatches: dict[str, list[str]] = {name: [] for name, _ in found}
+    count = 0
+    for chunk in chunks(hands):
+        count += len(chunk)
+        ranks = [expected(h) for h in chunk]
+        for name, rank in found:
+            for hand, got, want in zip(chunk, rank(chunk), ranks):
+                if got != want and len(mismatches[name]) < 5:
+                    mismatches[name].append("{} ranked {} not {}".format(
+                        Card.ints_to_pretty_str(list(hand)), got, want))
+
+    print("{} ({}):".format(title, count))
+    for name, _ in found:
+        print("    {:24}{}".format(name, "FAILED" if mismatches[name] else "ok"))
+        for mismatch in mismatches[name]:
+            print("        " + mismatch)
+    return not any(mismatches.values())
+
+
+def five_of_a_rank(size: int, rng: random.Random) -> list[tuple[int, ...]]:
+    """
+    Hands holding 5 cards of one rank, the spade repeated, for every rank
+    """
+    hands = []
+    for rank in Card.STR_RANKS:
+        cards = [Card.new(rank + 's')] + [Card.new(rank + suit) for suit in 'shdc']
+        others = [c for c in DECK if Card.get_rank_int(c) != Card.get_rank_int(cards[0])]
+        hands.append(tuple(cards + rng.sample(others, size - 5)))
+    return hands
+
+
+def main() -> int:
+    evaluator = Evaluator()
+    rng = random.Random(0)
+    two_suits = [Card.new(rank + suit) for rank in Card.STR_RANKS for suit in 'sh']
+
+    # the reference ranks every 5 card hand exactly once
+    ranks = {evaluator._rank5(*h) for h in itertools.combinations(DECK, 5)}
+    passed = ranks == set(range(1, 7463))
+    print("5 card reference ranks cover 1 to 7462: {}".format("ok" if passed else "FAILED"))
+
+    passed &= check("every 5 card hand", 5, itertools.combinations(DECK, 5),
+                    lambda h: evaluator._rank5(*h))
+    for size in (6, 7):
+        passed &= check("random {} card hands".format(size), size,
+                        (tuple(rng.sample(DECK, size)) for _ in range(SAMPLES)),
+                        lambda h: best_subset(evaluator, h))
+        passed &= check("{} cards of 2 suits".format(size), size,
+                        (tuple(rng.sample(two_suits, size)) for _ in range(SAMPLES)),
+                        lambda h: best_subset(evaluator, h))
+    for size in (5, 6, 7):
+        passed &= check("{} cards holding 5 of one rank".format(size), size,
+                        five_of_a_rank(size, rng), lambda h: 0)
+
+    print("all implementations agree" if passed else "implementations DISAGREE")
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Generates quads/_tables.py, the lookup tables of every evaluator written
+out as literals so that constructing an Evaluator doesn't recalculate them,
+and quads/_ceval_tables.h, the Five tables as C arrays for quads/_ceval.c.
+
+Run from the repository root after changing any LookupTable:
+
+    $ python tools/gen_tables.py
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quads._common_lookup import histogram_offsets, histogram_table  # noqa: E402
+from quads.Five.lookup import LookupTable as FiveLookupTable  # noqa: E402
+from quads.FCP.lookup import LookupTable as FCPLookupTable    # noqa: E402
+from quads.TCP.lookup import LookupTable as TCPLookupTable    # noqa: E402
+
+
+# rank mask tables are laid out densely over every 13 bit rank mask
+RANK_MASKS = 1 << 13
+
+# (prefix, lookup table, whether to also lay out the prime products densely)
+TABLES = [
+    ('FIVE', FiveLookupTable, False),
+    ('FCP', FCPLookupTable, True),
+    ('TCP', TCPLookupTable, True),
+]
+
+HEADER = '''"""
+Precomputed lookup tables for the Five, FCP and TCP evaluators.
+
+Generated by tools/gen_tables.py, do not edit by hand.
+"""
+from array import array
+
+
+def _dense(table: dict[int, int], modulus: int) -> array:
+    """
+    Lays a lookup table out as an array indexed by key % modulus
+    """
+    dense = array('H', bytes(2 * modulus))
+    for key, rank in table.items():
+        dense[key % modulus] = rank
+    return dense
+'''
+
+C_HEADER = '''/*
+ * Precomputed lookup tables for quads/_ceval.c, see quads/_tables.py and
+ * quads/Five/_jit.py.
+ *
+ * Generated by tools/gen_tables.py, do not edit by hand.
+ */
+#include <stdint.h>
+'''
+
+LINE_LENGTH = 79
+
+
+def format_items(table: dict[int, int]) -> list[str]:
+    """
+    Formats the items of a lookup table for a dict literal, as many
+    entries per line as will fit
+    """
+    lines = []
+    line = "   "
+    for key, rank in table.items():
+        item = " {}: {},".format(key, rank)
+        if len(line) + len(item) > LINE_LENGTH:
+            lines.append(line)
+            line = "   "
+        line += item
+    lines.append(line)
+    return lines
+
+
+def format_table(name: str, table: dict[int, int]) -> str:
+    """
+    Formats a lookup table as a dict literal
+    """
+    lines = ["{}: dict[int, int] = {{".format(name)]
+    lines += format_items(table)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def format_dense_table(name: str, table: dict[int, int], size: str) -> str:
+    """
+    Formats a lookup table laid out densely over size slots
+    """
+    lines = ["{}_TABLE: array = _dense({{".format(name)]
+    lines += format_items(table)
+    lines.append("}}, {})".format(size))
+    return "\n".join(lines) + "\n"
+
+
+def format_values(values: list[int]) -> list[str]:
+    """
+    Formats a list of integers for an array literal, as many per line as
+    will fit
+    """
+    lines = []
+    line = "   "
+    for value in values:
+        item = " {},".format(value)
+        if len(line) + len(item) > LINE_LENGTH:
+            lines.append(line)
+            line = "   "
+        line += item
+    lines.append(line)
+    return lines
+
+
+def format_array(name: str, values: list[int]) -> str:
+    """
+    Formats a list of ranks as an array('H') literal
+    """
+    lines = ["{}: array = array('H', [".format(name)]
+    lines += format_values(values)
+    lines.append("])")
+    return "\n".join(lines) + "\n"
+
+
+def format_c_array(name: str, ctype: str, values: list[int]) -> str:
+    """
+    Formats a list of integers as a static const C array
+    """
+    lines = ["static const {} {}[{}] = {{".format(ctype, name, len(values))]
+    lines += format_values(values)
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def find_modulus(keys: list[int]) -> int:
+    """
+    Finds the smallest modulus under which no two keys collide, making
+    key % modulus a perfect hash into a dense table
+    """
+    modulus = len(keys)
+    while True:
+        slots = set()
+        for key in keys:
+            slot = key % modulus
+            if slot in slots:
+                break
+            slots.add(slot)
+        else:
+            return modulus
+        modulus += 1
+
+
+def write_tables(filepath: str) -> None:
+    """
+    Calculates every lookup table and writes them to filepath
+    """
+    chunks = [HEADER]
+    for prefix, lookup_table, dense in TABLES:
+        table = lookup_table(precomputed=False)
+        size = str(RANK_MASKS)
+        chunks.append(format_dense_table(prefix + "_FLUSH", table.flush_lookup, size))
+        chunks.append(format_dense_table(prefix + "_UNIQUE", table.unique_lookup, size))
+
+        name = prefix + "_UNSUITED"
+        if dense:
+            modulus = find_modulus(list(table.unsuited_lookup))
+            chunks.append("{}_MODULUS: int = {}\n".format(name, modulus)
+                          + format_dense_table(name, table.unsuited_lookup, name + "_MODULUS"))
+        else:
+            chunks.append(format_table(name, table.unsuited_lookup))
+            # the numba kernels key the Five multiples on their rank histogram
+            chunks.append(format_array(prefix + "_HISTOGRAM_TABLE", histogram_table(
+                table.unique_lookup, table.unsuited_lookup)))
+
+    with open(filepath, 'w') as f:
+        f.write("\n\n".join(chunks))
+
+
+def write_c_tables(filepath: str) -> None:
+    """
+    Calculates the Five lookup tables and writes them to filepath as a C
+    header, the multiples keyed on their rank histogram
+    """
+    table = FiveLookupTable(precomputed=False)
+    flush_table = [table.flush_lookup.get(mask, 0) for mask in range(RANK_MASKS)]
+    unique_table = [table.unique_lookup.get(mask, 0) for mask in range(RANK_MASKS)]
+    offsets = [q for r in histogram_offsets() for k in r for q in k]
+
+    chunks = [
+        C_HEADER,
+        format_c_array("FIVE_FLUSH_TABLE", "uint16_t", flush_table),
+        format_c_array("FIVE_UNIQUE_TABLE", "uint16_t", unique_table),
+        "/* offsets[rank][cards left][count], flattened */\n"
+        + format_c_array("HISTOGRAM_OFFSETS", "uint16_t", offsets),
+        format_c_array("HISTOGRAM_TABLE", "uint16_t",
+                       histogram_table(table.unique_lookup, table.unsuited_lookup)),
+    ]
+    with open(filepath, 'w') as f:
+        f.write("\n".join(chunks))
+
+
+if __name__ == '__main__':
+    write_tables(os.path.join(ROOT, 'quads', '_tables.py'))
+    write_c_tables(os.path.join(ROOT, 'quads', '_ceval_tables.h'))